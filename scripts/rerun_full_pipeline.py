@@ -12,6 +12,12 @@ Usage:
     # Re-run Tab 4 enrichment only (most common)
     python scripts/rerun_full_pipeline.py --tab4-only
     
+    # Re-run Tab 4 only for books whose inputs changed
+    python scripts/rerun_full_pipeline.py --tab4-only --delta
+    
+    # Same, through MSEP, re-enriching only changed chapters' results
+    python scripts/rerun_full_pipeline.py --tab4-only --delta --msep-url http://localhost:8082
+    
     # Re-run only books in a specific taxonomy
     python scripts/rerun_full_pipeline.py --taxonomy AI-ML_taxonomy_20251128.json --dry-run
     
@@ -23,6 +29,9 @@ Usage:
     
     # Full re-run with backup
     python scripts/rerun_full_pipeline.py --full --backup
+    
+    # Tab 5 with 4 forked workers sharing one loaded companion corpus
+    python scripts/rerun_full_pipeline.py --from-tab2 --tab5-workers 4
 
 Reference:
     - Tab 2: Metadata Extraction (generate_metadata_universal.py)
@@ -44,6 +53,9 @@ from dataclasses import dataclass, field
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
+
+# Seconds one book's Tab 5 run may take, in a subprocess or a batch worker
+TAB5_BOOK_TIMEOUT = 600
 sys.path.insert(0, str(PROJECT_ROOT))
 
 
@@ -181,8 +193,48 @@ def run_tab2_metadata_extraction(book_name: str, dry_run: bool = False) -> bool:
         return False
 
 
-def run_tab4_metadata_enrichment(book_name: str, taxonomy_path: Path, dry_run: bool = False) -> bool:
-    """Run Tab 4 metadata enrichment for a book."""
+def tab4_inputs_unchanged(input_file: Path, taxonomy_path: Path, output_file: Path) -> bool:
+    """
+    Check whether an existing Tab 4 output was built from the current inputs.
+    
+    Compares the checksums recorded in the output's enrichment_provenance
+    against the current metadata and taxonomy files. Other books are not
+    compared: the taxonomy (fallback) and MSEP modes run here only relate a
+    book's chapters to each other, so a Tab 2 rewrite of one book leaves the
+    rest of the library skippable.
+    """
+    if not output_file.exists():
+        return False
+    
+    from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import compute_file_checksum
+    
+    try:
+        with open(output_file, encoding='utf-8') as f:
+            provenance = json.load(f).get("enrichment_provenance", {})
+    except (json.JSONDecodeError, OSError, AttributeError):
+        return False
+    
+    return (
+        provenance.get("source_metadata_checksum") == compute_file_checksum(input_file)
+        and provenance.get("taxonomy_checksum") == compute_file_checksum(taxonomy_path)
+    )
+
+
+def run_tab4_metadata_enrichment(
+    book_name: str,
+    taxonomy_path: Path,
+    dry_run: bool = False,
+    delta: bool = False,
+    msep_url: Optional[str] = None
+) -> bool:
+    """
+    Run Tab 4 metadata enrichment for a book.
+    
+    With delta=True, books whose metadata and taxonomy are unchanged
+    since the last run are skipped. Changed books are fully re-enriched in
+    taxonomy mode; with msep_url they are enriched through MSEP with --delta,
+    which keeps prior results for unchanged chapters.
+    """
     metadata_dir = PROJECT_ROOT / "workflows" / "metadata_extraction" / "output"
     output_dir = PROJECT_ROOT / "workflows" / "metadata_enrichment" / "output"
     
@@ -193,6 +245,10 @@ def run_tab4_metadata_enrichment(book_name: str, taxonomy_path: Path, dry_run: b
         print(f"  ⚠️  No metadata file for Tab 4: {input_file}")
         return False
     
+    if delta and tab4_inputs_unchanged(input_file, taxonomy_path, output_file):
+        print("  ⏭️  Tab 4 inputs unchanged - keeping existing enrichment")
+        return True
+    
     script = PROJECT_ROOT / "workflows" / "metadata_enrichment" / "scripts" / "enrich_metadata_per_book.py"
     
     cmd = [
@@ -201,6 +257,10 @@ def run_tab4_metadata_enrichment(book_name: str, taxonomy_path: Path, dry_run: b
         "--taxonomy", str(taxonomy_path),
         "--output", str(output_file)
     ]
+    if msep_url:
+        cmd.extend(["--use-msep", "--msep-url", msep_url])
+        if delta:
+            cmd.append("--delta")
     
     if dry_run:
         print("  [DRY RUN] Would run Tab 4 enrichment")
@@ -218,8 +278,8 @@ def run_tab4_metadata_enrichment(book_name: str, taxonomy_path: Path, dry_run: b
         return False
 
 
-def run_tab5_guideline_generation(book_name: str, taxonomy_path: Optional[Path] = None, dry_run: bool = False) -> bool:
-    """Run Tab 5 guideline generation for a book."""
+def _tab5_input_file(book_name: str) -> Optional[Path]:
+    """Tab 5 input JSON for a book, or None if it or its enriched metadata is missing."""
     enriched_dir = PROJECT_ROOT / "workflows" / "metadata_enrichment" / "output"
     json_dir = PROJECT_ROOT / "workflows" / "pdf_to_json" / "output" / "textbooks_json"
     
@@ -229,10 +289,19 @@ def run_tab5_guideline_generation(book_name: str, taxonomy_path: Optional[Path]
     # Use the original JSON file as input (script reads enriched metadata separately)
     if not json_file.exists():
         print(f"  ⚠️  No JSON file for Tab 5: {json_file}")
-        return False
+        return None
     
     if not enriched_file.exists():
         print(f"  ⚠️  No enriched file for Tab 5: {enriched_file}")
+        return None
+    
+    return json_file
+
+
+def run_tab5_guideline_generation(book_name: str, taxonomy_path: Optional[Path] = None, dry_run: bool = False) -> bool:
+    """Run Tab 5 guideline generation for a book (one subprocess per book)."""
+    json_file = _tab5_input_file(book_name)
+    if json_file is None:
         return False
     
     script = PROJECT_ROOT / "workflows" / "base_guideline_generation" / "scripts" / "chapter_generator_all_text.py"
@@ -251,7 +320,7 @@ def run_tab5_guideline_generation(book_name: str, taxonomy_path: Optional[Path]
         return True
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=TAB5_BOOK_TIMEOUT)
         if result.returncode == 0:
             return True
         else:
@@ -262,6 +331,63 @@ def run_tab5_guideline_generation(book_name: str, taxonomy_path: Optional[Path]
         return False
 
 
+def run_tab5_guideline_batch(
+    book_names: List[str],
+    taxonomy_path: Optional[Path] = None,
+    dry_run: bool = False,
+    workers: int = 1,
+    book_timeout: Optional[float] = TAB5_BOOK_TIMEOUT
+) -> Dict[str, bool]:
+    """
+    Run Tab 5 for several books in this process.
+    
+    The companion corpus and concept matcher are loaded once for the whole
+    batch instead of once per book subprocess. Each book runs in a worker
+    forked from this process and is killed (and fails) after book_timeout
+    seconds, like the per-book subprocess.
+    
+    Returns:
+        Book name -> success (books without input files count as failed,
+        and every book fails if the taxonomy cannot be read, as the
+        per-book subprocess does)
+    """
+    results: Dict[str, bool] = {}
+    input_files: List[Path] = []
+    for book_name in book_names:
+        json_file = _tab5_input_file(book_name)
+        if json_file is None:
+            results[book_name] = False
+        else:
+            input_files.append(json_file)
+    
+    if dry_run:
+        print(f"  [DRY RUN] Would run Tab 5 guideline generation for {len(input_files)} books in one process")
+        results.update({path.stem: True for path in input_files})
+        return results
+    if not input_files:
+        return results
+    
+    from workflows.base_guideline_generation.scripts.chapter_generator_all_text import (
+        generate_guidelines,
+        load_taxonomy_concepts,
+    )
+    
+    key_concepts = None
+    if taxonomy_path and taxonomy_path.exists():
+        try:
+            key_concepts = load_taxonomy_concepts(taxonomy_path) or None
+        # Same as the per-book CLI, which exits 1 on any taxonomy error
+        except Exception as e:
+            print(f"  ❌ Tab 5 failed: could not load taxonomy {taxonomy_path.name}: {e}")
+            results.update({path.stem: False for path in input_files})
+            return results
+    
+    results.update(generate_guidelines(
+        input_files, key_concepts=key_concepts, workers=workers, book_timeout=book_timeout
+    ))
+    return results
+
+
 def _process_book_tabs(
     book_name: str,
     stats: "PipelineStats",
@@ -269,7 +395,9 @@ def _process_book_tabs(
     run_tab2: bool,
     run_tab4: bool,
     run_tab5: bool,
-    dry_run: bool
+    dry_run: bool,
+    delta: bool = False,
+    msep_url: Optional[str] = None
 ) -> None:
     """
     Process all enabled tabs for a single book.
@@ -289,7 +417,7 @@ def _process_book_tabs(
     # Tab 4: Metadata Enrichment
     if run_tab4 and taxonomy_path:
         print("  🔗 Tab 4: Metadata Enrichment (BERTopic + Sentence Transformers)...")
-        if run_tab4_metadata_enrichment(book_name, taxonomy_path, dry_run):
+        if run_tab4_metadata_enrichment(book_name, taxonomy_path, dry_run, delta, msep_url):
             stats.tab4_success += 1
             print("  ✅ Tab 4 complete")
         else:
@@ -305,15 +433,45 @@ def _process_book_tabs(
             stats.tab5_failed += 1
 
 
+def _run_tab5_batch(
+    books: List[str],
+    stats: "PipelineStats",
+    taxonomy_path: Optional[Path],
+    dry_run: bool,
+    workers: int
+) -> None:
+    """Run Tab 5 for all books in one process and update stats in place."""
+    print(f"\n{'─'*60}")
+    print(f"📖 Tab 5: Guideline Generation ({len(books)} books, shared companion corpus)...")
+    print(f"{'─'*60}")
+    results = run_tab5_guideline_batch(books, taxonomy_path, dry_run, workers)
+    for book_name, ok in results.items():
+        if ok:
+            stats.tab5_success += 1
+            print(f"  ✅ Tab 5 complete: {book_name}")
+        else:
+            stats.tab5_failed += 1
+
+
 def run_pipeline(
     books: List[str],
     run_tab2: bool = False,
     run_tab4: bool = True,
     run_tab5: bool = True,
     dry_run: bool = False,
-    backup: bool = False
+    backup: bool = False,
+    delta: bool = False,
+    tab5_in_process: bool = True,
+    tab5_workers: int = 1,
+    msep_url: Optional[str] = None
 ) -> PipelineStats:
-    """Run the pipeline for specified books."""
+    """
+    Run the pipeline for specified books.
+    
+    With tab5_in_process, Tab 5 runs after every book's earlier tabs as one
+    batch sharing a single loaded companion corpus; otherwise each book
+    gets its own Tab 5 subprocess.
+    """
     stats = PipelineStats()
     stats.total_books = len(books)
     
@@ -342,9 +500,12 @@ def run_pipeline(
         
         _process_book_tabs(
             book_name, stats, taxonomy_path,
-            run_tab2, run_tab4, run_tab5, dry_run
+            run_tab2, run_tab4, run_tab5 and not tab5_in_process, dry_run, delta, msep_url
         )
     
+    if run_tab5 and tab5_in_process:
+        _run_tab5_batch(books, stats, taxonomy_path, dry_run, tab5_workers)
+    
     stats.total_time_seconds = time.time() - start_time
     return stats
 
@@ -420,6 +581,15 @@ def _parse_arguments() -> argparse.Namespace:
         "--backup", action="store_true",
         help="Backup current outputs before re-running"
     )
+    parser.add_argument(
+        "--delta", action="store_true",
+        help="Skip Tab 4 for books whose inputs are unchanged "
+             "(with --msep-url, also keep results for unchanged chapters)"
+    )
+    parser.add_argument(
+        "--msep-url", type=str,
+        help="Run Tab 4 through the ai-agents MSEP service at this URL"
+    )
     parser.add_argument(
         "--output-report", type=str,
         help="Save execution report to JSON file"
@@ -432,6 +602,14 @@ def _parse_arguments() -> argparse.Namespace:
         "--taxonomy", type=str,
         help="Only process books in this taxonomy file"
     )
+    parser.add_argument(
+        "--tab5-subprocess", action="store_true",
+        help="Run Tab 5 as one subprocess per book instead of one shared process"
+    )
+    parser.add_argument(
+        "--tab5-workers", type=int, default=1,
+        help="Books generated in parallel by the shared Tab 5 process (default: 1)"
+    )
     
     return parser.parse_args()
 
@@ -478,6 +656,7 @@ def _print_run_config(
     print("🔗 Tab 4 (Enrichment): Yes - BERTopic + Sentence Transformers")
     print(f"📖 Tab 5 (Guidelines): {'Yes' if run_tab5 else 'No'}")
     print(f"💾 Backup: {'Yes' if args.backup else 'No'}")
+    print(f"🔁 Delta: {'Yes' if args.delta else 'No'}")
     print(f"🔍 Dry run: {'Yes' if args.dry_run else 'No'}")
 
 
@@ -552,7 +731,11 @@ def main():
         run_tab4=run_tab4,
         run_tab5=run_tab5,
         dry_run=args.dry_run,
-        backup=args.backup
+        backup=args.backup,
+        delta=args.delta,
+        tab5_in_process=not args.tab5_subprocess,
+        tab5_workers=args.tab5_workers,
+        msep_url=args.msep_url
     )
     
     # Print summary and save report
@@ -157,7 +157,10 @@ def run_metadata_extraction(
             return False
         
         # Generate metadata
-        metadata_list = generator.generate_metadata(chapters)
+        try:
+            metadata_list = generator.generate_metadata(chapters)
+        finally:
+            generator.close()
         
         # Save to output file
         generator.save_metadata(metadata_list, output_file)
@@ -67,7 +67,7 @@ class DualOutputValidator:
         
         content = script_path.read_text()
         
-        if "_convert_markdown_to_json" in content and "json.dump" in content:
+        if "GuidelineDocument" in content and "json.dump" in content:
             results.append(ValidationResult("passed", "Script has JSON generation functions"))
             results.append(ValidationResult("passed", "Script has JSON conversion and dump functions"))
         else:
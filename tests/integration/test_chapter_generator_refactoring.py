@@ -161,7 +161,6 @@ class TestExtractedHelperFunctions:
     
     Following Architecture Patterns Ch. 4 (Service Layer pattern):
     - Extract loading logic → _load_companion_books()
-    - Extract document building → _build_document_header()
     - Extract chapter processing → _process_single_chapter()
     - Extract file writing → _write_output_file()
     
@@ -193,16 +192,6 @@ class TestExtractedHelperFunctions:
             assert 'Book1' in result
             assert 'Book2' not in result
     
-    def test_build_document_header_returns_list(self):
-        """Test _build_document_header() returns list of header lines."""
-        from chapter_generator_all_text import _build_document_header
-        
-        result = _build_document_header(total_chapters=41)
-        
-        assert isinstance(result, list)
-        assert len(result) > 0
-        assert any("Comprehensive Python Guidelines" in line for line in result)
-    
     def test_process_single_chapter_returns_structured_output(self):
         """Test _process_single_chapter() returns chapter doc and updated footnotes."""
         from chapter_generator_all_text import _process_single_chapter
@@ -220,19 +209,21 @@ class TestExtractedHelperFunctions:
         )
         
         assert isinstance(result, dict)
-        assert 'chapter_doc' in result
+        assert 'chapter' in result
         assert 'global_footnote_num' in result
         assert 'new_footnotes' in result
     
-    def test_write_output_file_creates_file(self):
-        """Test _write_output_file() writes content to correct path."""
-        from chapter_generator_all_text import _write_output_file
+    def test_write_output_file_creates_file(self, tmp_path):
+        """Test _write_output_file() writes both outputs to the prepared paths."""
+        from chapter_generator_all_text import GuidelineDocument, _write_output_file
         
-        all_docs = ["# Test Document", "## Chapter 1"]
+        document = GuidelineDocument(book_name="TestBook", full_title="Test Book", total_chapters=0)
+        md_path = tmp_path / "TestBook_guideline.md"
         
-        with patch('pathlib.Path.write_text') as mock_write:
-            _write_output_file(all_docs, book_name="TestBook")
-            assert mock_write.called
+        with patch('chapter_generator_all_text._prepare_output_paths',
+                   return_value=(md_path, tmp_path / "TestBook_guideline.json")):
+            _write_output_file(document)
+        assert md_path.exists()
     
     def test_process_single_chapter_extracts_pages(self):
         """Test _process_single_chapter() correctly filters pages for chapter range."""
@@ -231,6 +231,19 @@ class TestPerformanceLogging:
         assert stats["min_ms"] == 100
         assert stats["max_ms"] == 300
 
+    def test_performance_logger_reports_percentiles(self):
+        """PerformanceLogger reports nearest-rank latency percentiles."""
+        from workflows.shared.clients.metrics import PerformanceLogger
+        
+        logger = PerformanceLogger()
+        for duration in range(1, 101):
+            logger.log_timing("search", duration_ms=float(duration))
+        
+        stats = logger.get_stats("search")
+        assert stats["p50_ms"] == 50
+        assert stats["p90_ms"] == 90
+        assert stats["p99_ms"] == 99
+
 
 # =============================================================================
 # WBS 6.2: OrchestratorClient Observability Integration
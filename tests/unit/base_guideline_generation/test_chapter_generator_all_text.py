@@ -1,316 +1,481 @@
 #!/usr/bin/env python3
 """
-Unit tests for chapter_generator_all_text.py
+Unit tests for chapter_generator_all_text.py guideline document model
 
-TDD Approach: RED → GREEN → REFACTOR
-Goal: Reduce _convert_markdown_to_json complexity from CC 14 → <10
+The guideline is built as a GuidelineDocument (chapters, concepts,
+footnotes); Markdown and JSON are both rendered from it, so the JSON no
+longer depends on re-parsing the Markdown.
 
 Reference:
 - MASTER_IMPLEMENTATION_GUIDE Batch #2 File 1
-- Architecture Patterns Ch. 3: Extract Method refactoring
+- Architecture Patterns Ch. 1: Domain modeling
 - Python Guidelines Ch. 24: Testing patterns
 """
 
-import pytest
 import json
-from pathlib import Path
+import multiprocessing
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from workflows.base_guideline_generation.scripts import chapter_generator_all_text as generator
 from workflows.base_guideline_generation.scripts.chapter_generator_all_text import (
-    _convert_markdown_to_json,
-    _extract_book_metadata,
-    _extract_concept_data,
-    _extract_chapter_sections
+    BookMetadataIndex,
+    ConceptLocator,
+    GuidelineChapter,
+    GuidelineConcept,
+    GuidelineDocument,
+    GuidelineRunContext,
+    _extract_concept_passage,
+    _get_chapter_topic_id,
+    _get_related_chapters_by_topic,
+    _process_single_chapter,
+    _write_output_file,
+    build_tpm_section,
+    choose_tpm_source,
+    concepts_on_pages,
+    extract_concept_context,
+    extract_concept_explanation,
+    extract_concepts_from_text,
+    generate_chapter_summary,
+    generate_guidelines,
+    load_taxonomy_concepts,
+    map_book_to_citation,
+    page_text,
+    tpm_candidate_index,
 )
 
+FOOTNOTE = {
+    "num": 2,
+    "author": "Author Name",
+    "title": "Book Title",
+    "file": "book",
+    "page": 42,
+    "start_line": 10,
+    "end_line": 15,
+}
 
-class TestConvertMarkdownToJson:
-    """
-    Characterization tests for _convert_markdown_to_json function.
-    
-    These tests lock down current behavior before refactoring (TDD RED phase).
-    """
-    
-    def test_converts_valid_markdown_to_json_structure(self):
-        """Test basic conversion of valid markdown to JSON"""
-        markdown_lines = [
-            "# Python Programming Guidelines",
-            "",
-            "**Source**: Learning Python Ed6",
-            "**Pages**: 1500",
-            "",
-            "## Chapter 1: Introduction",
-            "",
-            "**Pages**: 1–50",
-            "",
-            "### Cross-Text Analysis",
-            "This chapter introduces Python basics.",
-            "",
-            "### Chapter Summary",
-            "Introduction to Python programming language.",
-            "",
-            "### Concept: Variables",
-            "Variables store data."
-        ]
-        
-        footnotes = []
-        book_name = "Learning Python Ed6"
-        
-        result = _convert_markdown_to_json(markdown_lines, book_name, footnotes)
-        
-        # Verify structure
-        assert "book_metadata" in result
-        assert "chapters" in result
-        assert "footnotes" in result
-        assert "source_info" in result
-        
-        # Verify chapters parsed correctly
-        assert len(result["chapters"]) == 1
-        chapter = result["chapters"][0]
-        assert chapter["chapter_number"] == 1
-        assert chapter["title"] == "Introduction"
-        assert chapter["page_range"]["start"] == 1
-        assert chapter["page_range"]["end"] == 50
-    
-    def test_raises_error_on_empty_document(self):
-        """Test that empty document raises ValueError"""
-        with pytest.raises(ValueError, match="Cannot convert empty document"):
-            _convert_markdown_to_json([], "Test Book", [])
-    
-    def test_raises_error_on_invalid_document_format(self):
-        """Test that invalid document format raises ValueError"""
-        with pytest.raises(ValueError, match="Invalid markdown document format"):
-            _convert_markdown_to_json([None, {"invalid": "type"}], "Test Book", [])  # type: ignore
-    
-    def test_raises_error_when_no_chapters_found(self):
-        """Test that document with no chapters raises ValueError"""
-        markdown_lines = [
-            "# Book Title",
-            "Some content but no chapters"
-        ]
-        
+
+def _concept(name="variable assignment", page=42, excerpt="x = 10  # `inline` code\ny = 20", num=3):
+    return GuidelineConcept(
+        name=name, page=page, excerpt=excerpt, start_line=0, end_line=2,
+        occurrences=2, footnote_num=num, annotation="Shows assignment.",
+    )
+
+
+def _chapter(num=1, concepts=None):
+    return GuidelineChapter(
+        chapter_num=num, title=f"Chapter Title {num}", start_page=num * 10, end_page=num * 10 + 9,
+        summary=f"Summary of chapter {num}.", summary_footnote_num=1,
+        concepts=concepts if concepts is not None else [_concept()],
+        tpm_section="\n### **TPM Implementation Section** *(ORIGINAL)*\n",
+        see_also="\n### **See Also: Cross-Book References & Forward Connections**\n",
+    )
+
+
+def _document(chapters=None):
+    return GuidelineDocument(
+        book_name="Test_Book", full_title="Test Book", total_chapters=2,
+        chapters=chapters if chapters is not None else [_chapter(1), _chapter(2, concepts=[])],
+        footnotes=[FOOTNOTE],
+    )
+
+
+class TestGuidelineDocumentJson:
+    """JSON is rendered from the model (schema unchanged from the reparse era)."""
+
+    def test_json_structure(self):
+        result = _document().to_json()
+
+        assert set(result) == {"book_metadata", "source_info", "chapters", "footnotes"}
+        assert result["book_metadata"] == {
+            "title": "Comprehensive Python Guidelines — Test Book (Chapters 1-2)",
+            "source": "Test Book, Chapters 1-2",
+            "book_name": "Test_Book",
+        }
+        assert "statistical" in result["source_info"]["method"].lower()
+        assert "chapter_generator_all_text.py" in result["source_info"]["generated_by"]
+
+    def test_chapters_and_page_ranges(self):
+        chapters = _document().to_json()["chapters"]
+
+        assert [ch["chapter_number"] for ch in chapters] == [1, 2]
+        assert chapters[0]["title"] == "Chapter Title 1"
+        assert chapters[0]["page_range"] == {"start": 10, "end": 19}
+        assert chapters[0]["chapter_summary"] == "Summary of chapter 1."
+        assert chapters[0]["cross_text_analysis"] == ""
+
+    def test_concepts_survive_backticks_in_excerpt(self):
+        """The old Markdown regex dropped excerpts containing backticks."""
+        concepts = _document().to_json()["chapters"][0]["concepts"]
+
+        assert concepts == [{
+            "name": "Variable Assignment",
+            "page": 42,
+            "verbatim_excerpt": "x = 10  # `inline` code\ny = 20",
+            "annotation": "Shows assignment.",
+        }]
+
+    def test_footnotes(self):
+        footnotes = _document().to_json()["footnotes"]
+
+        assert footnotes == [{
+            "number": 2, "author": "Author Name", "title": "Book Title", "file": "book",
+            "page": 42, "lines": {"start": 10, "end": 15},
+        }]
+
+    def test_raises_error_when_no_chapters(self):
         with pytest.raises(ValueError, match="No chapters found"):
-            _convert_markdown_to_json(markdown_lines, "Test Book", [])
-    
-    def test_handles_multiple_chapters(self):
-        """Test conversion of document with multiple chapters"""
-        markdown_lines = [
-            "# Python Guidelines",
-            "",
-            "## Chapter 1: Basics",
-            "**Pages**: 1–50",
-            "### Chapter Summary",
-            "Python basics",
-            "",
-            "## Chapter 2: Advanced",
-            "**Pages**: 51–100",
-            "### Chapter Summary",
-            "Advanced topics"
-        ]
-        
-        result = _convert_markdown_to_json(markdown_lines, "Python Book", [])
-        
-        assert len(result["chapters"]) == 2
-        assert result["chapters"][0]["chapter_number"] == 1
-        assert result["chapters"][1]["chapter_number"] == 2
-    
-    def test_extracts_concepts_from_chapter(self):
-        """Test that concepts are extracted and structured correctly - using ACTUAL production format"""
-        markdown_lines = [
-            "# Guidelines",
-            "",
-            "## Chapter 1: Variables",
-            "**Pages**: 1–10",
-            "",
-            "#### **Variable Assignment** *(p.42)*",
-            "",
-            "**Verbatim Educational Excerpt** *(Learning Python Ed6, p.42, lines 1-5)*:",
-            "```",
-            "x = 10  # Assign value to variable",
-            "y = 20",
-            "```",
-            "[^1]",
-            "**Annotation:** This demonstrates variable assignment in Python.",
-            "",
-            "#### **Type Inference** *(p.50)*",
-            "",
-            "**Verbatim Educational Excerpt** *(Learning Python Ed6, p.50, lines 10-15)*:",
-            "```",
-            "name = 'Python'  # String type inferred automatically",
-            "```",
-            "[^2]",
-            "**Annotation:** Python infers types automatically.",
-            "",
-            "### Chapter Summary",
-            "Summary text"
-        ]
-        
-        result = _convert_markdown_to_json(markdown_lines, "Python Book", [])
-        
-        chapter = result["chapters"][0]
-        assert "concepts" in chapter
-        assert len(chapter["concepts"]) == 2  # Two concepts with proper format
-        assert chapter["concepts"][0]["name"] == "Variable Assignment"
-        assert chapter["concepts"][0]["page"] == 42
-        assert "x = 10" in chapter["concepts"][0]["verbatim_excerpt"]
-    
-    def test_handles_footnotes(self):
-        """Test that footnotes are converted correctly"""
-        markdown_lines = [
-            "# Guidelines",
-            "",
-            "## Chapter 1: Test",
-            "**Pages**: 1–10",
-            "### Chapter Summary",
-            "Test"
-        ]
-        
-        footnotes = [
-            {
-                "num": 1,
-                "author": "Author Name",
-                "title": "Book Title",
-                "file": "book.json",
-                "page": 42,
-                "start_line": 10,
-                "end_line": 15
-            }
-        ]
-        
-        result = _convert_markdown_to_json(markdown_lines, "Test Book", footnotes)
-        
-        assert len(result["footnotes"]) == 1
-        assert result["footnotes"][0]["number"] == 1
-        assert result["footnotes"][0]["author"] == "Author Name"
-        assert result["footnotes"][0]["lines"]["start"] == 10
-        assert result["footnotes"][0]["lines"]["end"] == 15
-    
-    def test_skips_malformed_chapters_and_continues(self):
-        """Test that malformed chapters are skipped without crashing"""
-        markdown_lines = [
-            "# Guidelines",
-            "",
-            "## Chapter 1: Good Chapter",
-            "**Pages**: 1–10",
-            "### Chapter Summary",
-            "Valid chapter",
-            "",
-            "## Chapter NotANumber: Bad Chapter",
-            "This chapter has malformed header",
-            "",
-            "## Chapter 2: Another Good Chapter",
-            "**Pages**: 11–20",
-            "### Chapter Summary",
-            "Another valid chapter"
-        ]
-        
-        result = _convert_markdown_to_json(markdown_lines, "Test Book", [])
-        
-        # Should have 2 valid chapters, skipping the malformed one
-        assert len(result["chapters"]) == 2
-        assert result["chapters"][0]["chapter_number"] == 1
-        assert result["chapters"][1]["chapter_number"] == 2
-    
-    def test_includes_cross_text_analysis_section(self):
-        """Test that cross-text analysis section is extracted - using ACTUAL production format"""
-        markdown_lines = [
-            "# Guidelines",
-            "",
-            "## Chapter 1: Test",
-            "**Pages**: 1–10",
-            "",
-            "### Cross-Text Analysis",
-            "",  # Double newline after heading (actual format)
-            "This concept appears in multiple books.",
-            "",
-            "### Chapter Summary",
-            "",
-            "Summary"
+            _document(chapters=[]).to_json()
+
+
+class TestGuidelineDocumentMarkdown:
+
+    def test_chapter_markdown_layout(self):
+        markdown = _chapter().to_markdown()
+
+        assert markdown.startswith("## Chapter 1: Chapter Title 1\n\n*Source: ")
+        assert "pages 10–19*" in markdown
+        assert "### Chapter Summary\nSummary of chapter 1. [^1]\n" in markdown
+        assert "#### **Variable Assignment** *(p.42)*\n" in markdown
+        assert "lines 1–2)*:\n```\nx = 10" in markdown
+        assert "[^3]\n**Annotation:** Shows assignment.\n" in markdown
+        assert markdown.endswith("\n---\n")
+
+    def test_iter_markdown_streams_one_chunk_per_chapter(self):
+        document = _document()
+        chunks = list(document.iter_markdown())
+        markdown = "".join(chunks)
+
+        assert markdown.startswith("# Comprehensive Python Guidelines — Test Book (Chapters 1-2)\n")
+        assert sum("## Chapter " in chunk for chunk in chunks) == 2
+        assert markdown.index("## Chapter 1:") < markdown.index("## Chapter 2:") < markdown.index("### **Footnotes**")
+        assert "[^2]: Author Name. *Book Title*. (JSON `book.json`, p. 42, lines 10–15)." in markdown
+
+    def test_markdown_and_json_agree(self):
+        document = _document()
+        markdown = "".join(document.iter_markdown())
+        result = document.to_json()
+
+        assert markdown.count("\n## Chapter ") == len(result["chapters"])
+        for chapter in result["chapters"]:
+            assert f"## Chapter {chapter['chapter_number']}: {chapter['title']}" in markdown
+            for concept in chapter["concepts"]:
+                assert f"#### **{concept['name']}** *(p.{concept['page']})*" in markdown
+
+
+class TestProcessSingleChapter:
+
+    def test_returns_chapter_model(self, monkeypatch):
+        monkeypatch.setattr(generator, "PRIMARY_BOOK", "Test_Book")
+        pages = [
+            {"page_number": n, "content": "A generator yields values.\nDecorators wrap a function."}
+            for n in range(1, 4)
         ]
-        
-        result = _convert_markdown_to_json(markdown_lines, "Test Book", [])
-        
-        chapter = result["chapters"][0]
-        assert "cross_text_analysis" in chapter
-        assert "multiple books" in chapter["cross_text_analysis"].lower()
-    
-    def test_includes_source_info_metadata(self):
-        """Test that source_info metadata is included"""
-        markdown_lines = [
-            "# Guidelines",
-            "",
-            "## Chapter 1: Test",
-            "**Pages**: 1–10",
-            "### Chapter Summary",
-            "Test"
+
+        result = _process_single_chapter((1, "Intro", 1, 2), {"pages": pages}, {}, 1)
+
+        chapter = result["chapter"]
+        assert isinstance(chapter, GuidelineChapter)
+        assert (chapter.chapter_num, chapter.start_page, chapter.end_page) == (1, 1, 2)
+        assert chapter.summary_footnote_num == 1
+        assert [c.footnote_num for c in chapter.concepts] == list(range(2, 2 + len(chapter.concepts)))
+        assert result["global_footnote_num"] == len(result["new_footnotes"]) + 1
+
+    def test_concurrent_runs_keep_their_own_book(self):
+        """Each run's context is threaded through, so parallel books do not mix."""
+        pages = [
+            {"page_number": n, "content": "A generator yields values.\nDecorators wrap a function."}
+            for n in range(1, 4)
         ]
-        
-        result = _convert_markdown_to_json(markdown_lines, "Test Book", [])
-        
-        assert "source_info" in result
-        assert "generated_by" in result["source_info"]
-        assert "chapter_generator_all_text.py" in result["source_info"]["generated_by"]
-        assert "generation_date" in result["source_info"]
-        # Tab 5 architecture: statistical methods only (no LLM tracking needed)
-        assert "method" in result["source_info"]
-        assert "statistical" in result["source_info"]["method"].lower()
 
+        def process(book):
+            run = GuidelineRunContext(book)
+            return book, _process_single_chapter((1, "Intro", 1, 2), {"pages": pages}, {}, 1, run=run)
 
-class TestHelperFunctions:
-    """Tests for helper functions used by _convert_markdown_to_json"""
-    
-    def test_extract_book_metadata(self):
-        """Test _extract_book_metadata helper"""
-        markdown = """
-        # Python Programming Guidelines
-        
-        **Source**: Learning Python Ed6
-        **Pages**: 1500
-        """
-        
-        metadata = _extract_book_metadata(markdown, "Learning Python Ed6")
-        
-        assert "book_name" in metadata
-        assert metadata["book_name"] == "Learning Python Ed6"
-    
-    def test_extract_concept_data(self):
-        """Test _extract_concept_data helper"""
-        chapter_content = """
-        ## Chapter 1: Variables
-        
-        ### Concept: Variable Assignment
-        **Definition**: Assigning values
-        **Textbook Reference**: Python p.42
-        
-        ### Concept: Type Hints
-        **Definition**: Type annotations
-        """
-        
-        concepts = _extract_concept_data(chapter_content)
-        
-        # Should extract at least the concepts present
-        assert isinstance(concepts, list)
-        # Function may return empty list if structure doesn't match expectations
-    
-    def test_extract_chapter_sections(self):
-        """Test _extract_chapter_sections helper - using ACTUAL production format"""
-        chapter_content = """## Chapter 1: Test
-
-### Cross-Text Analysis
-
-Analysis content here
-
-### Chapter Summary
-Summary content here
-"""
-        
-        sections = _extract_chapter_sections(chapter_content)
-        
-        assert "cross_text_analysis" in sections
-        assert "chapter_summary" in sections
-        assert "Analysis content" in sections["cross_text_analysis"]
-        assert "Summary content" in sections["chapter_summary"]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(process, [f"Book_{n}" for n in range(8)]))
+
+        for book, result in results:
+            assert {foot["file"] for foot in result["new_footnotes"]} == {book}
+        assert generator.PRIMARY_BOOK is None
+
+
+class TestWriteOutputFile:
+
+    def test_writes_markdown_and_json_from_model(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            generator, "_prepare_output_paths",
+            lambda name: (tmp_path / f"{name}_guideline.md", tmp_path / f"{name}_guideline.json"),
+        )
+        document = _document()
+
+        _write_output_file(document)
+
+        markdown = (tmp_path / "Test_Book_guideline.md").read_text(encoding="utf-8")
+        assert markdown == "".join(document.iter_markdown())
+        written = json.loads((tmp_path / "Test_Book_guideline.json").read_text(encoding="utf-8"))
+        assert written == document.to_json()
+
+
+class TestConceptLocator:
+    """One-pass concept location must agree with per-concept substring search."""
+
+    def test_overlapping_and_prefix_concepts(self):
+        locator = ConceptLocator(["list", "list comprehension", "tuple", "Metaclass", "metaclass"])
+
+        hits = locator.locate("a list comprehension, a tuple, a listlist metaclass")
+
+        assert hits["list"] == [2, 33, 37]
+        assert hits["list comprehension"] == [2]
+        assert hits["tuple"] == [24]
+        assert locator.concepts_in(hits) == {
+            "list", "list comprehension", "tuple", "Metaclass", "metaclass",
+        }
+
+    def test_extract_concepts_matches_substring_search(self):
+        text = "Generators and DECORATORS.\nAn async def uses the event loop."
+
+        expected = {c for c in generator.COMPREHENSIVE_CONCEPTS if c.lower() in text.lower()}
+        assert extract_concepts_from_text(text) == expected
+
+    def test_concepts_on_pages_equals_joined_text(self):
+        pages = [{"content": "A generator yields."}, {"content": "Decorators wrap a function."}]
+
+        joined = "\n".join(p["content"] for p in pages)
+        assert concepts_on_pages(pages) == extract_concepts_from_text(joined)
+
+
+class TestPageText:
+
+    CONTENT = "Intro line\n\nThe Decorator pattern wraps a function with extra behaviour here.\n" \
+              "decorator use is common.\n\nClosing line"
+
+    def test_is_cached_per_content(self):
+        assert page_text(self.CONTENT) is page_text(self.CONTENT)
+
+    def test_count_and_first_line(self):
+        page = page_text(self.CONTENT)
+
+        assert page.count("decorator") == self.CONTENT.lower().count("decorator")
+        assert page.first_line("DECORATOR") == 2
+        assert page.first_line("missing concept") is None
+
+    def test_context_windows_cut_by_line(self):
+        assert _extract_concept_passage(self.CONTENT, "decorator") == (
+            "\n".join(self.CONTENT.split("\n")[1:6]), 1, 6,
+        )
+        assert extract_concept_context(self.CONTENT, "decorator", context_lines=2) == \
+            "\nThe Decorator pattern wraps a function with extra behaviour here.\ndecorator use is common."
+        assert extract_concept_explanation(self.CONTENT, "closing") == "Intro line"
+
+
+DECK = (
+    "class FrenchDeck:\n"
+    "    ranks = [str(n) for n in range(2, 11)] + list('JQKA')\n"
+    "    suits = 'spades diamonds clubs hearts'.split()\n"
+    "    def __init__(self):\n"
+    "        self._cards = [Card(rank, suit) for suit in self.suits for rank in self.ranks]\n"
+    "    def __len__(self):\n"
+    "        return len(self._cards)\n"
+    "    def __getitem__(self, position):\n"
+    "        return self._cards[position]\n"
+)
+TINY = "class Tiny:\n    def __len__(self):\n        return 0\n"
+
+
+def _book(*snippets):
+    return {"pages": [{"page_number": i + 1, "content": f"Intro\n{code}"} for i, code in enumerate(snippets)]}
+
+
+class TestTPMCandidateIndex:
+
+    def test_memoized_across_chapters(self):
+        companions = {"Fluent_Python_2nd_Content": _book(DECK), "Other_Content": _book()}
+
+        first = tpm_candidate_index({k: v for k, v in companions.items() if k != "Other_Content"})
+        second = tpm_candidate_index(companions)
+
+        assert first is second
+        assert first.chosen.adapted_code.startswith("class TalentPool:")
+        assert tpm_candidate_index({"Fluent_Python_2nd_Content": _book(DECK)}) is not first
+
+    def test_excluded_primary_book_is_skipped(self):
+        companions = {"Fluent_Python_2nd_Content": _book(DECK), "Python_Distilled_Content": _book(TINY)}
+
+        index = tpm_candidate_index(companions, exclude="Fluent_Python_2nd_Content")
+
+        assert index.chosen.book_name == "Python_Distilled_Content"
+
+    def test_prefers_candidate_in_overlap_band(self):
+        companions = {"Fluent_Python_2nd_Content": _book(TINY, DECK)}
+
+        index = tpm_candidate_index(companions)
+
+        assert choose_tpm_source(companions)[1] == 1
+        assert [c.in_band for c in index.candidates] == [False, True]
+        assert (index.chosen.page_num, index.chosen.start_line) == (2, 2)
+
+    def test_build_tpm_section_cites_chosen_snippet(self):
+        companions = {"Fluent_Python_2nd_Content": _book(DECK)}
+
+        section, next_num, foot = build_tpm_section(companions, 7, 1)
+
+        assert tpm_candidate_index(companions).chosen.adapted_code in section
+        assert next_num == 8
+        assert (foot["num"], foot["page"], foot["start_line"], foot["end_line"]) == (7, 1, 2, 11)
+
+
+def _die_in_worker(input_path):
+    """Stand-in for _generate_in_worker whose process dies on the 'crash' book."""
+    if input_path.stem == "crash":
+        os._exit(1)
+    return True
+
+
+def _hang_in_worker(input_path):
+    """Stand-in for _generate_in_worker that never finishes the 'hung' book."""
+    if input_path.stem == "hung":
+        time.sleep(60)
+    return True
+
+
+ENRICHED = {"chapters": [
+    {"chapter_number": 1, "topic_id": 4, "related_chapters": [{"book": "Other.json", "chapter": 2}]},
+    {"chapter_number": 2, "topic_id": 7},
+    {"chapter_number": 3, "topic_id": 4},
+]}
+
+
+@pytest.fixture
+def metadata_index():
+    """Run metadata index for Test_Book."""
+    return BookMetadataIndex("Test_Book", [{"chapter_number": 1, "summary": "Indexed summary."}], ENRICHED)
+
+
+class TestBookMetadataIndex:
+
+    def test_load_reads_each_file_once(self, monkeypatch):
+        reads = []
+        monkeypatch.setattr(generator, "_read_metadata_file", lambda name: reads.append(name) or [])
+        monkeypatch.setattr(generator, "_load_enriched_metadata", lambda name: reads.append(name) or ENRICHED)
+
+        index = BookMetadataIndex.load("Fluent Python 2nd")
+        for chapter in range(1, 4):
+            index.chapter_summary(chapter)
+            index.related_chapters(chapter)
+
+        assert reads == ["fluent_python_metadata.json", "fluent_python_metadata_enriched.json"]
+
+    def test_lookups_by_chapter_and_topic(self, metadata_index):
+        assert metadata_index.topic_id(3) == 4
+        assert metadata_index.topic_id(99) is None
+        assert _get_chapter_topic_id(ENRICHED, 2, metadata_index) == 7
+        assert _get_related_chapters_by_topic(ENRICHED, 1, metadata_index) == [{"book": "Other.json", "chapter": 2}]
+        assert _get_related_chapters_by_topic(ENRICHED, 2) == []
+
+    def test_chapter_summary_does_no_file_io(self, metadata_index, monkeypatch):
+        def no_open(*_args, **_kwargs):
+            raise AssertionError("metadata file re-read")
+
+        monkeypatch.setattr("builtins.open", no_open)
+        run = GuidelineRunContext("Test_Book", metadata_index=metadata_index)
+
+        assert generate_chapter_summary([], 1, run) == "Indexed summary."
+        assert generate_chapter_summary([], 2, run) == "Chapter 2 content."
+
+    def test_citation_table(self):
+        assert map_book_to_citation("Fluent_Python_2nd_Content", "Fluent Python 2nd") == (
+            "Ramalho, Luciano", "Fluent Python, 2nd Edition",
+        )
+        assert map_book_to_citation("Mystery_Content", "Mystery") == ("Unknown", "Mystery")
+
+
+class TestLibraryMode:
+
+    @pytest.fixture
+    def runs(self, monkeypatch):
+        """Record main() calls with the run context each one was given."""
+        loads = []
+        calls = []
+        monkeypatch.setattr(generator, "_load_companion_books", lambda books: loads.append(books) or {"shared": {}})
+
+        def fake_main(custom_input_path=None, companions=None, run=None):
+            if run.primary_book == "broken":
+                raise ValueError("bad book")
+            calls.append((run.primary_book, run.concepts, companions))
+
+        monkeypatch.setattr(generator, "main", fake_main)
+        return loads, calls
+
+    def test_run_context_defaults(self):
+        run = GuidelineRunContext("Unlisted Book", key_concepts=["decorator"])
+
+        assert run.book_meta["full_title"] == "Unlisted Book"
+        assert run.concepts == ["decorator"]
+        assert GuidelineRunContext("Unlisted Book").concepts == generator.KEY_CONCEPTS
+        assert run.footnote(3, 12, 1, 25) == {
+            "num": 3, "author": "Unknown", "title": "Unlisted Book", "file": "Unlisted Book",
+            "page": 12, "start_line": 1, "end_line": 25,
+        }
+
+    def test_companions_loaded_once_for_all_books(self, runs, tmp_path):
+        loads, calls = runs
+
+        results = generate_guidelines([tmp_path / "book_a.json", tmp_path / "book_b.json"], key_concepts=["gil"])
+
+        assert results == {"book_a": True, "book_b": True}
+        assert len(loads) == 1
+        assert [(book, concepts) for book, concepts, _ in calls] == [("book_a", ["gil"]), ("book_b", ["gil"])]
+        assert calls[0][2] is calls[1][2]
+
+    def test_failed_book_does_not_stop_batch(self, runs, tmp_path):
+        _, calls = runs
+
+        results = generate_guidelines([tmp_path / "broken.json", tmp_path / "book_b.json"])
+
+        assert results == {"broken": False, "book_b": True}
+        assert [book for book, _, _ in calls] == ["book_b"]
+        assert calls[0][1] == generator.KEY_CONCEPTS
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(), reason="worker pool needs fork"
+    )
+    def test_dead_worker_fails_its_books(self, runs, tmp_path, monkeypatch):
+        monkeypatch.setattr(generator, "_generate_in_worker", _die_in_worker)
+
+        results = generate_guidelines([tmp_path / "crash.json", tmp_path / "book_b.json"], workers=2)
+
+        assert results == {"crash": False, "book_b": True}
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(), reason="worker processes need fork"
+    )
+    def test_hung_book_is_killed_after_timeout(self, runs, tmp_path, monkeypatch):
+        monkeypatch.setattr(generator, "_generate_in_worker", _hang_in_worker)
+
+        started = time.monotonic()
+        results = generate_guidelines([tmp_path / "hung.json", tmp_path / "book_b.json"], book_timeout=1.0)
+
+        assert results == {"hung": False, "book_b": True}
+        assert time.monotonic() - started < 30
+
+    def test_taxonomy_concepts_from_both_layouts(self, tmp_path):
+        tiered = tmp_path / "tiered.json"
+        tiered.write_text(json.dumps({"tiers": {
+            "architecture": {"concepts": ["ddd", "cqrs"]},
+            "practices": ["testing"],
+        }}), encoding="utf-8")
+        flat = tmp_path / "flat.json"
+        flat.write_text(json.dumps({"architecture": {"concepts": ["ddd"]}, "extra": ["gil"]}), encoding="utf-8")
+
+        assert load_taxonomy_concepts(tiered) == ["ddd", "cqrs", "testing"]
+        assert load_taxonomy_concepts(flat) == ["ddd", "gil"]
@@ -18,6 +18,7 @@ References:
 
 import ast
 import inspect
+from unittest.mock import patch
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
@@ -166,7 +167,6 @@ class TestR0914TooManyLocals:
     @pytest.mark.parametrize(
         "func_name,expected_max_locals",
         [
-            ("build_concept_sections", 15),
             ("_process_single_chapter", 15),
         ],
     )
@@ -175,7 +175,6 @@ class TestR0914TooManyLocals:
         Test that functions adhere to 15 local variable threshold.
         
         RED Phase: This test WILL FAIL initially because:
-        - build_concept_sections: 16 locals (line 1330)
         - _process_single_chapter: 22 locals (line 1851)
         
         GREEN Phase: Will pass after Extract Method refactoring applied.
@@ -197,41 +196,6 @@ class TestR0914TooManyLocals:
             f"Apply Extract Method pattern to reduce complexity."
         )
 
-    def test_build_concept_sections_uses_helper_functions(self):
-        """
-        Test that build_concept_sections() uses Extract Method pattern.
-        
-        RED Phase: WILL FAIL - no helper functions exist yet.
-        
-        GREEN Phase: Will pass after extracting:
-        - _extract_concept_from_pages() - handles concept extraction logic
-        - _build_concept_footnote() - handles footnote creation
-        
-        Expected signature after refactoring:
-            build_concept_sections() - orchestration (8-10 locals)
-            _extract_concept_from_pages() - extraction logic (5-6 locals)
-            _build_concept_footnote() - footnote logic (3-4 locals)
-            
-        References:
-            - ANTI_PATTERN_ANALYSIS §10.2: Extract Method reduces locals
-            - Python Distilled Ch.5: Function decomposition
-        """
-        # Verify helper functions exist in module
-        assert hasattr(
-            target_module, "_extract_concept_from_pages"
-        ), "Missing helper: _extract_concept_from_pages()"
-        assert hasattr(
-            target_module, "_build_concept_footnote"
-        ), "Missing helper: _build_concept_footnote()"
-
-        # Verify main function has reduced complexity
-        func = target_module.build_concept_sections
-        actual_locals = count_local_variables(func)
-        assert actual_locals <= 12, (
-            f"build_concept_sections() still has {actual_locals} locals after refactoring "
-            f"(expected ≤12 for orchestration function with 6 parameters)"
-        )
-
     def test_process_single_chapter_uses_helper_functions(self):
         """
         Test that _process_single_chapter() uses Extract Method pattern.
@@ -364,60 +328,36 @@ class TestComplexityRefactoringNoRegressions:
     does not introduce functional regressions.
     """
 
-    def test_build_concept_sections_output_unchanged(self):
-        """
-        Verify build_concept_sections() produces identical output after refactoring.
-        
-        Tests with sample data to ensure Extract Method refactoring maintains behavior.
-        """
-        # Sample test data
-        chapter_pages = [
-            {"page_number": 10, "content": "Python is a programming language. Python uses indentation."},
-            {"page_number": 11, "content": "Functions in Python are first-class objects."},
-        ]
-        concepts = {"python", "function", "indentation"}
-
-        # Call function (should work before and after refactoring)
-        result, footnote_num, footnotes = target_module.build_concept_sections(
-            _primary_data={},
-            chapter_pages=chapter_pages,
-            footnote_start=1,
-            _chapter_num=1,
-            chapter_concepts=concepts,
-            _occurrence_index=None,
-        )
-
-        # Verify output structure (basic smoke test)
-        assert isinstance(result, str), "Should return string"
-        assert isinstance(footnote_num, int), "Should return int"
-        assert isinstance(footnotes, list), "Should return list"
-        assert footnote_num >= 1, "Footnote counter should increment"
-
     def test_write_output_file_creates_both_formats(self, tmp_path):
         """
         Verify _write_output_file() creates both MD and JSON files after refactoring.
         
         Tests with temporary directory to ensure Pipeline Pattern refactoring maintains behavior.
         """
-        # Sample markdown document
-        sample_docs = [
-            "# Test Document",
-            "## Chapter 1: Introduction",
-            "Content here.",
-        ]
-        sample_footnotes = [
-            {"num": 1, "author": "Test", "title": "Test Book", "file": "test.pdf", "page": 1, "start_line": 1, "end_line": 10}
-        ]
-
-        # Mock output directory using tmp_path
-        import workflows.base_guideline_generation.scripts.chapter_generator_all_text as module  # noqa: F401 - module imported for side effects
-        
-        # Create test using existing function (should work before and after refactoring)
-        # This is a smoke test - actual file I/O tested elsewhere
-        try:
-            # Function returns None on success, so we just verify no exception is raised
-            target_module._write_output_file(sample_docs, "test_book", sample_footnotes)
-            # If we reach here, pipeline is functional
-        except Exception as e:
-            # If refactoring broke pipeline, this will catch it
-            pytest.fail(f"Pipeline Pattern refactoring broke _write_output_file: {e}")
+        # Sample guideline document model
+        sample_doc = target_module.GuidelineDocument(
+            book_name="test_book",
+            full_title="Test Book",
+            total_chapters=1,
+            chapters=[
+                target_module.GuidelineChapter(
+                    chapter_num=1, title="Introduction", start_page=1, end_page=10,
+                    summary="Content here.", summary_footnote_num=1,
+                )
+            ],
+            footnotes=[
+                {"num": 1, "author": "Test", "title": "Test Book", "file": "test.pdf", "page": 1, "start_line": 1, "end_line": 10}
+            ],
+        )
+        md_path = tmp_path / "test_book_guideline.md"
+        json_path = tmp_path / "test_book_guideline.json"
+
+        with patch.object(target_module, "_prepare_output_paths", return_value=(md_path, json_path)):
+            try:
+                # Function returns None on success, so we just verify no exception is raised
+                target_module._write_output_file(sample_doc)
+            except Exception as e:
+                # If refactoring broke pipeline, this will catch it
+                pytest.fail(f"Pipeline Pattern refactoring broke _write_output_file: {e}")
+
+        assert md_path.exists() and json_path.exists()
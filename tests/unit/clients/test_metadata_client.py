@@ -780,3 +780,346 @@ class TestFakeMetadataExtractionClient:
         await client.extract_metadata("test1")
         await client.extract_metadata("test2")
         assert client._call_count == 2
+
+
+# =============================================================================
+# SyncMetadataExtractionClient (one loop + one pooled client per run)
+# =============================================================================
+
+
+class _CountingFakeClient:
+    """FakeMetadataExtractionClient wrapper that counts context entries/exits."""
+
+    instances: list["_CountingFakeClient"] = []
+
+    def __init__(self) -> None:
+        from workflows.shared.clients.metadata_client import FakeMetadataExtractionClient
+
+        self.fake = FakeMetadataExtractionClient()
+        self.entered = 0
+        self.exited = 0
+        self.loops: set[int] = set()
+        _CountingFakeClient.instances.append(self)
+
+    async def __aenter__(self) -> "_CountingFakeClient":
+        self.entered += 1
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.exited += 1
+
+    async def extract_metadata(self, text, title=None, book_title=None, options=None):
+        self.loops.add(id(asyncio.get_running_loop()))
+        return await self.fake.extract_metadata(text)
+
+
+class TestSyncMetadataExtractionClient:
+    """Sync facade reuses one event loop and one client across calls."""
+
+    def test_reuses_single_client_and_loop_across_calls(self) -> None:
+        """Many sync calls → one client entered once, all on one loop."""
+        from workflows.shared.clients.metadata_client import SyncMetadataExtractionClient
+
+        _CountingFakeClient.instances = []
+        client = SyncMetadataExtractionClient(client_factory=_CountingFakeClient)
+        for i in range(5):
+            client.extract_metadata(f"chapter {i}")
+
+        assert len(_CountingFakeClient.instances) == 1
+        pooled = _CountingFakeClient.instances[0]
+        assert pooled.entered == 1
+        assert pooled.fake._call_count == 5
+        assert len(pooled.loops) == 1
+
+        client.close()
+        assert pooled.exited == 1
+
+    def test_context_manager_closes_pooled_client(self) -> None:
+        """Exiting the context exits the underlying async client."""
+        from workflows.shared.clients.metadata_client import SyncMetadataExtractionClient
+
+        _CountingFakeClient.instances = []
+        with SyncMetadataExtractionClient(client_factory=_CountingFakeClient) as client:
+            client.extract_metadata("text")
+
+        assert _CountingFakeClient.instances[0].exited == 1
+
+    def test_propagates_client_errors(self) -> None:
+        """Client exceptions surface unchanged to the sync caller."""
+        from workflows.shared.clients.metadata_client import (
+            MetadataClientConnectionError,
+            SyncMetadataExtractionClient,
+        )
+
+        class _FailingClient(_CountingFakeClient):
+            async def extract_metadata(self, text, title=None, book_title=None, options=None):
+                raise MetadataClientConnectionError("Connection refused")
+
+        with SyncMetadataExtractionClient(client_factory=_FailingClient) as client:
+            with pytest.raises(MetadataClientConnectionError):
+                client.extract_metadata("text")
+
+
+# =============================================================================
+# Adaptive batch sizing (plan by text size, concurrent, bisection retry)
+# =============================================================================
+
+
+def _batch_items(sizes: list[int]) -> list:
+    from workflows.shared.clients.metadata_client import BatchTextItem
+
+    return [BatchTextItem(id=f"ch_{i}", text="x" * size) for i, size in enumerate(sizes)]
+
+
+def _ok_batch_result(batch: list):
+    from workflows.shared.clients.metadata_client import (
+        BatchExtractionResult,
+        BatchItemResult,
+        MetadataExtractionResult,
+    )
+
+    return BatchExtractionResult(
+        results=[BatchItemResult(id=i.id, success=True, result=MetadataExtractionResult()) for i in batch],
+        total_items=len(batch),
+        successful=len(batch),
+        total_processing_time_ms=10.0,
+    )
+
+
+class TestPlanTextBatches:
+    """plan_text_batches splits by text bytes, preserving order."""
+
+    def test_splits_on_byte_budget(self) -> None:
+        """Items are grouped until the byte budget would be exceeded."""
+        from workflows.shared.clients.metadata_client import plan_text_batches
+
+        batches = plan_text_batches(_batch_items([40, 40, 40, 40, 40]), max_bytes=100)
+
+        assert [[i.id for i in b] for b in batches] == [
+            ["ch_0", "ch_1"], ["ch_2", "ch_3"], ["ch_4"],
+        ]
+
+    def test_oversized_item_sent_alone(self) -> None:
+        """An item over budget forms its own sub-batch."""
+        from workflows.shared.clients.metadata_client import plan_text_batches
+
+        batches = plan_text_batches(_batch_items([10, 500, 10]), max_bytes=100)
+
+        assert [len(b) for b in batches] == [1, 1, 1]
+
+
+class TestAdaptiveBatchSizer:
+    """AdaptiveBatchSizer derives batch bytes from observed per-KB latency."""
+
+    def test_first_observation_replaces_prior(self) -> None:
+        """The initial guess is replaced by the first real measurement."""
+        from workflows.shared.clients.metadata_client import AdaptiveBatchSizer
+
+        sizer = AdaptiveBatchSizer(target_latency_s=10.0, min_bytes=1, max_bytes=10**9)
+        sizer.observe(text_bytes=100 * 1024, elapsed_ms=1000.0)  # 10 ms/KB
+
+        assert sizer.ms_per_kb == pytest.approx(10.0)
+        assert sizer.target_batch_bytes() == 1000 * 1024
+
+    def test_slower_service_shrinks_batches(self) -> None:
+        """Higher per-KB latency yields smaller target batches."""
+        from workflows.shared.clients.metadata_client import AdaptiveBatchSizer
+
+        sizer = AdaptiveBatchSizer(min_bytes=1, max_bytes=10**9)
+        sizer.observe(100 * 1024, 1000.0)
+        before = sizer.target_batch_bytes()
+        sizer.observe(100 * 1024, 5000.0)
+
+        assert sizer.target_batch_bytes() < before
+
+    def test_target_is_clamped(self) -> None:
+        """Target stays within [min_bytes, max_bytes]."""
+        from workflows.shared.clients.metadata_client import AdaptiveBatchSizer
+
+        sizer = AdaptiveBatchSizer(min_bytes=1000, max_bytes=2000, ms_per_kb=1e-3)
+        assert sizer.target_batch_bytes() == 2000
+        sizer.ms_per_kb = 1e9
+        assert sizer.target_batch_bytes() == 1000
+
+
+class TestSharedBatchSizer:
+    """shared_batch_sizer keeps one latency estimate per URL for the run."""
+
+    def test_same_sizer_per_url(self) -> None:
+        """Clients for the same URL share what earlier clients learned."""
+        from workflows.shared.clients.metadata_client import (
+            MetadataExtractionClient,
+            shared_batch_sizer,
+        )
+
+        sizer = shared_batch_sizer("http://orchestrator.test:1")
+        sizer.observe(100 * 1024, 1000.0)
+        client = MetadataExtractionClient(
+            base_url="http://orchestrator.test:1",
+            batch_sizer=shared_batch_sizer("http://orchestrator.test:1"),
+        )
+
+        assert client.batch_sizer is sizer
+        assert client.batch_sizer.observations >= 1
+        assert shared_batch_sizer("http://orchestrator.test:2") is not sizer
+
+
+class TestExtractMetadataBatchAdaptive:
+    """extract_metadata_batch_adaptive: concurrent sub-batches with bisection."""
+
+    @pytest.mark.asyncio
+    async def test_sends_planned_sub_batches_and_preserves_order(self) -> None:
+        """Sub-batches follow the sizer's byte budget; results keep input order."""
+        from unittest.mock import AsyncMock, patch
+
+        from workflows.shared.clients.metadata_client import (
+            AdaptiveBatchSizer,
+            MetadataExtractionClient,
+        )
+
+        items = _batch_items([60] * 6)
+        client = MetadataExtractionClient()
+        client.batch_sizer = AdaptiveBatchSizer(min_bytes=1, max_bytes=120)
+        sent: list[list[str]] = []
+
+        async def fake_batch(batch, **_kwargs):
+            sent.append([i.id for i in batch])
+            return _ok_batch_result(batch)
+
+        with patch.object(client, "extract_metadata_batch", new=AsyncMock(side_effect=fake_batch)):
+            result = await client.extract_metadata_batch_adaptive(items)
+
+        assert sorted(len(b) for b in sent) == [2, 2, 2]
+        assert [r.id for r in result.results] == [i.id for i in items]
+        assert result.successful == 6
+        assert client.batch_sizer.observations == 3
+
+    @pytest.mark.asyncio
+    async def test_bisects_failing_sub_batch(self) -> None:
+        """A timing-out sub-batch is split until the bad item is isolated."""
+        from unittest.mock import AsyncMock, patch
+
+        from workflows.shared.clients.metadata_client import (
+            MetadataClientTimeoutError,
+            MetadataExtractionClient,
+        )
+
+        items = _batch_items([10] * 8)
+        client = MetadataExtractionClient()
+
+        async def fake_batch(batch, **_kwargs):
+            if any(i.id == "ch_5" for i in batch):
+                raise MetadataClientTimeoutError("slow chapter")
+            return _ok_batch_result(batch)
+
+        mock = AsyncMock(side_effect=fake_batch)
+        with patch.object(client, "extract_metadata_batch", new=mock):
+            result = await client.extract_metadata_batch_adaptive(items)
+
+        assert result.total_items == 8
+        assert result.successful == 7
+        failed = [r for r in result.results if not r.success]
+        assert [r.id for r in failed] == ["ch_5"]
+        # 1 full + 2 halves + 2 quarters + 2 singles = 7 calls, not 8 serial ones
+        assert mock.await_count == 7
+
+    @pytest.mark.asyncio
+    async def test_connection_error_is_not_bisected(self) -> None:
+        """An unreachable service fails fast so callers can fall back."""
+        from unittest.mock import AsyncMock, patch
+
+        from workflows.shared.clients.metadata_client import (
+            MetadataClientConnectionError,
+            MetadataExtractionClient,
+        )
+
+        client = MetadataExtractionClient()
+        mock = AsyncMock(side_effect=MetadataClientConnectionError("refused"))
+        with patch.object(client, "extract_metadata_batch", new=mock):
+            with pytest.raises(MetadataClientConnectionError):
+                await client.extract_metadata_batch_adaptive(_batch_items([10] * 4))
+
+        assert mock.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_respects_max_concurrency(self) -> None:
+        """No more than max_concurrency sub-batches are in flight."""
+        from unittest.mock import AsyncMock, patch
+
+        from workflows.shared.clients.metadata_client import (
+            AdaptiveBatchSizer,
+            MetadataExtractionClient,
+        )
+
+        client = MetadataExtractionClient()
+        client.batch_sizer = AdaptiveBatchSizer(min_bytes=1, max_bytes=10)
+        in_flight = 0
+        peak = 0
+
+        async def fake_batch(batch, **_kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _ok_batch_result(batch)
+
+        with patch.object(client, "extract_metadata_batch", new=AsyncMock(side_effect=fake_batch)):
+            await client.extract_metadata_batch_adaptive(_batch_items([10] * 8), max_concurrency=3)
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_first_sub_batch_is_sent_alone(self) -> None:
+        """Before any observation, one probe sub-batch calibrates the sizer."""
+        from unittest.mock import AsyncMock, patch
+
+        from workflows.shared.clients.metadata_client import (
+            AdaptiveBatchSizer,
+            MetadataExtractionClient,
+        )
+
+        client = MetadataExtractionClient()
+        client.batch_sizer = AdaptiveBatchSizer(min_bytes=1, max_bytes=10)
+        in_flight_at_start: list[int] = []
+        in_flight = 0
+
+        async def fake_batch(batch, **_kwargs):
+            nonlocal in_flight
+            in_flight += 1
+            in_flight_at_start.append(in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _ok_batch_result(batch)
+
+        with patch.object(client, "extract_metadata_batch", new=AsyncMock(side_effect=fake_batch)):
+            await client.extract_metadata_batch_adaptive(_batch_items([10] * 6), max_concurrency=3)
+
+        assert in_flight_at_start[0] == 1
+        assert max(in_flight_at_start) == 3
+
+    @pytest.mark.asyncio
+    async def test_sub_batches_resized_after_each_observation(self) -> None:
+        """Each sub-batch is sized from the estimate at the time it is sent."""
+        from unittest.mock import AsyncMock, patch
+
+        from workflows.shared.clients.metadata_client import (
+            AdaptiveBatchSizer,
+            MetadataExtractionClient,
+        )
+
+        items = _batch_items([60] * 6)
+        client = MetadataExtractionClient()
+        client.batch_sizer = AdaptiveBatchSizer(min_bytes=1, max_bytes=240)
+        sent: list[int] = []
+
+        async def fake_batch(batch, **_kwargs):
+            sent.append(len(batch))
+            client.batch_sizer.max_bytes = 60  # service slowed down
+            return _ok_batch_result(batch)
+
+        with patch.object(client, "extract_metadata_batch", new=AsyncMock(side_effect=fake_batch)):
+            result = await client.extract_metadata_batch_adaptive(items, max_concurrency=1)
+
+        assert sent == [4, 1, 1]
+        assert [r.id for r in result.results] == [i.id for i in items]
@@ -0,0 +1,134 @@
+"""Tests for the sync bridge - long-lived event loop for sync callers.
+
+Covers:
+- BackgroundEventLoop: one loop thread reused across run() calls
+- BackgroundEventLoop: misuse (closed, re-entrant) raises SyncBridgeError
+- PooledAsyncClient: client entered once, exited on close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from workflows.shared.clients.sync_bridge import (
+    BackgroundEventLoop,
+    PooledAsyncClient,
+    SyncBridgeError,
+)
+
+
+async def _current_loop_id() -> int:
+    return id(asyncio.get_running_loop())
+
+
+class TestBackgroundEventLoop:
+    """BackgroundEventLoop runs every coroutine on one loop thread."""
+
+    def test_run_reuses_one_loop(self) -> None:
+        """Successive run() calls share the same event loop."""
+        with BackgroundEventLoop() as loop:
+            loop_ids = {loop.run(_current_loop_id()) for _ in range(3)}
+
+        assert len(loop_ids) == 1
+
+    def test_run_propagates_exceptions(self) -> None:
+        """Coroutine exceptions are re-raised in the caller."""
+        async def boom() -> None:
+            raise ValueError("boom")
+
+        with BackgroundEventLoop() as loop:
+            with pytest.raises(ValueError, match="boom"):
+                loop.run(boom())
+
+    def test_close_stops_thread(self) -> None:
+        """close() stops the loop and rejects further work."""
+        loop = BackgroundEventLoop()
+        loop.run(asyncio.sleep(0))
+        assert loop.is_running
+
+        loop.close()
+
+        assert not loop.is_running
+        with pytest.raises(SyncBridgeError):
+            loop.run(asyncio.sleep(0))
+
+    def test_reentrant_run_raises(self) -> None:
+        """Calling run() from the loop's own thread would deadlock; it raises instead."""
+        with BackgroundEventLoop() as loop:
+            async def reenter() -> None:
+                loop.run(asyncio.sleep(0))
+
+            with pytest.raises(SyncBridgeError):
+                loop.run(reenter())
+
+    def test_callable_from_multiple_threads(self) -> None:
+        """Concurrent sync callers share the loop safely."""
+        results: list[int] = []
+
+        with BackgroundEventLoop() as loop:
+            def worker() -> None:
+                results.append(loop.run(_current_loop_id()))
+
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert len(results) == 4
+        assert len(set(results)) == 1
+
+
+class _Resource:
+    """Async context manager recording enter/exit."""
+
+    def __init__(self) -> None:
+        self.entered = 0
+        self.exited = 0
+
+    async def __aenter__(self) -> "_Resource":
+        self.entered += 1
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.exited += 1
+
+    async def ping(self) -> str:
+        return "pong"
+
+
+class TestPooledAsyncClient:
+    """PooledAsyncClient opens the client once and closes it once."""
+
+    def test_client_entered_once(self) -> None:
+        """factory and __aenter__ run once for many calls."""
+        created: list[_Resource] = []
+
+        def factory() -> _Resource:
+            created.append(_Resource())
+            return created[-1]
+
+        pool: PooledAsyncClient[_Resource] = PooledAsyncClient(factory)
+        assert not pool.is_open
+
+        for _ in range(3):
+            assert pool.call(lambda client: client.ping()) == "pong"
+
+        assert len(created) == 1
+        assert created[0].entered == 1
+        assert pool.is_open
+
+        pool.close()
+        assert created[0].exited == 1
+        assert not pool.is_open
+
+    def test_shared_loop_not_closed_by_pool(self) -> None:
+        """A pool on a caller-owned loop leaves that loop running."""
+        with BackgroundEventLoop() as loop:
+            with PooledAsyncClient(_Resource, loop=loop) as pool:
+                pool.call(lambda client: client.ping())
+
+            assert loop.run(_current_loop_id())
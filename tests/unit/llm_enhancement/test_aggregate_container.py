@@ -0,0 +1,176 @@
+"""
+Unit tests for the Tab 6 aggregate container (aggregate_container.py and
+create_aggregate_package's fragment pipeline).
+
+Covers:
+- Streamed package is the same JSON the in-memory build produced
+- Rebuild re-encodes only books whose files changed
+- A failed fragment cache write leaves no temp file behind
+- Context index sidecar still matches the package
+"""
+
+import json
+import os
+
+import pytest
+
+from workflows.llm_enhancement.scripts import create_aggregate_package as cap
+from workflows.llm_enhancement.scripts.aggregate_container import BookFragment, FragmentCache
+from workflows.llm_enhancement.scripts.context_index import load_context_index
+from workflows.llm_enhancement.scripts.llm_enhance_guideline import build_context_index
+
+COMPANIONS = ["book_a", "book_b", "book_c"]
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+@pytest.fixture
+def library(tmp_path, monkeypatch):
+    """Taxonomy, metadata and guidelines for a source book and three companions."""
+    monkeypatch.setattr(cap, "load_workflow_schema", lambda: None)
+    metadata_dir = tmp_path / "metadata"
+    guideline_dir = tmp_path / "guidelines"
+    output_dir = tmp_path / "out"
+    for directory in (metadata_dir, guideline_dir, output_dir):
+        directory.mkdir()
+
+    taxonomy_path = tmp_path / "source_taxonomy.json"
+    _write(taxonomy_path, {"tiers": {
+        "architecture": {"priority": 1, "books": ["book_a.json", "book_b"]},
+        "practices": {"priority": 2, "books": ["book_c", "book_missing"]},
+    }})
+    _write(metadata_dir / "source_metadata.json", {"chapters": [
+        {"chapter_number": 1, "title": "Intro", "keywords": ["ddd"], "summary": "S1"},
+    ]})
+    for i, name in enumerate(COMPANIONS):
+        _write(metadata_dir / f"{name}_metadata.json", [
+            {"number": n, "title": f"{name} {n}", "concepts": ["caching"], "summary": "é ✓"}
+            for n in range(1, i + 2)
+        ])
+    _write(guideline_dir / "book_b_guideline.json", {"chapters": [{"chapter_number": 1}]})
+
+    def build(**kwargs):
+        return cap.create_aggregate_package(taxonomy_path, metadata_dir, guideline_dir, output_dir, **kwargs)
+
+    build.metadata_dir = metadata_dir
+    build.output_dir = output_dir
+    return build
+
+
+def _expected_companion(name, metadata_dir, tier, priority, guideline=None):
+    book = {
+        "name": name,
+        "tier": tier,
+        "priority": priority,
+        "metadata": json.loads((metadata_dir / f"{name}_metadata.json").read_text(encoding="utf-8")),
+        "note": "using_basic_metadata",
+    }
+    if guideline:
+        book["guideline"] = guideline
+    return book
+
+
+class TestStreamedPackage:
+
+    def test_package_json_matches_in_memory_layout(self, library):
+        package = json.loads(library().read_text(encoding="utf-8"))
+
+        assert list(package) == [
+            "project", "taxonomy", "source_book", "companion_books", "missing_books", "statistics",
+        ]
+        assert package["source_book"]["tier"] == "source"
+        assert package["companion_books"] == [
+            _expected_companion("book_a", library.metadata_dir, "architecture", 1),
+            _expected_companion("book_b", library.metadata_dir, "architecture", 1,
+                                guideline={"chapters": [{"chapter_number": 1}]}),
+            _expected_companion("book_c", library.metadata_dir, "practices", 2),
+        ]
+        assert package["missing_books"] == [{
+            "name": "book_missing", "tier": "practices",
+            "reason": "metadata_not_found (tried book_missing_metadata.json)",
+        }]
+        assert package["statistics"] == {
+            "total_books": 4, "companion_books": 3, "total_chapters": 7, "missing_count": 1,
+        }
+
+    def test_context_index_matches_package(self, library):
+        path = library()
+        package = json.loads(path.read_text(encoding="utf-8"))
+
+        with load_context_index(path) as index:
+            expected = build_context_index(package)
+            assert set(index) == set(expected)
+            for key, entry in expected.items():
+                assert index[key] == entry
+            assert index.book_count == 4
+            assert index.statistics == package["statistics"]
+
+
+class TestIncrementalRebuild:
+
+    def test_only_changed_book_is_rebuilt(self, library):
+        first = json.loads(library().read_text(encoding="utf-8"))
+        cache_dir = library.output_dir / cap.FRAGMENT_CACHE_DIRNAME
+        first_entries = set(cache_dir.glob("*.fragment"))
+        changed = library.metadata_dir / "book_b_metadata.json"
+        _write(changed, [{"number": 1, "title": "Rewritten", "concepts": [], "summary": ""}])
+        os.utime(changed, ns=(1, 1))
+
+        second = json.loads(library().read_text(encoding="utf-8"))
+
+        # Only book_b gets a new cache entry
+        assert len(set(cache_dir.glob("*.fragment")) - first_entries) == 1
+        assert second["companion_books"][0] == first["companion_books"][0]
+        assert second["companion_books"][1]["metadata"][0]["title"] == "Rewritten"
+        assert second["statistics"]["total_chapters"] == 6
+
+    def test_unchanged_books_are_not_reloaded(self, library, monkeypatch):
+        library()
+        changed = library.metadata_dir / "book_c_metadata.json"
+        os.utime(changed, ns=(1, 1))
+        built = []
+        original = cap.load_book_metadata
+        monkeypatch.setattr(cap, "load_book_metadata", lambda name, *args: built.append(name) or original(name, *args))
+
+        library()
+
+        # Missing books have no fragment, so they are always re-checked
+        assert sorted(built) == ["book_c", "book_missing"]
+
+    def test_fragment_cache_can_be_disabled(self, library, monkeypatch):
+        library()
+        built = []
+        original = cap.load_book_metadata
+        monkeypatch.setattr(cap, "load_book_metadata", lambda name, *args: built.append(name) or original(name, *args))
+
+        library(use_fragment_cache=False)
+
+        assert sorted(built) == sorted(["source", *COMPANIONS, "book_missing"])
+
+    def test_corrupt_cache_entry_is_rebuilt(self, library):
+        library()
+        for entry in (library.output_dir / cap.FRAGMENT_CACHE_DIRNAME).glob("*.fragment"):
+            entry.write_bytes(b"not json\n")
+
+        package = json.loads(library().read_text(encoding="utf-8"))
+
+        assert [book["name"] for book in package["companion_books"]] == COMPANIONS
+
+
+class TestFragmentCache:
+
+    def test_cache_get_missing_entry(self, tmp_path):
+        assert FragmentCache(tmp_path).get("0" * 64) is None
+
+    def test_failed_put_removes_temp_file(self, tmp_path, monkeypatch):
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+        cache = FragmentCache(tmp_path)
+
+        cache.put(BookFragment(name="book_a", data=b"{}", fingerprint="f" * 64))
+
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,206 @@
+"""
+Unit tests for Tab 7 batch mode (batch_enhancement.py, the batch client and
+enhance_chapters_batch in llm_enhance_guideline.py).
+
+Covers:
+- Batch results parsed into enhanced chapters and written to the LLM cache
+- Cached prompts are never resubmitted
+- Failed requests keep the original chapter
+- Timeout keeps the checkpoint; a rerun resumes the same batch
+- Several books share one batch submission
+"""
+
+import json
+
+import httpx
+import pytest
+
+from workflows.llm_enhancement.scripts.batch_enhancement import (
+    BatchItem,
+    BatchTimeoutError,
+    run_batch,
+)
+from workflows.llm_enhancement.scripts.cache.llm_cache import LLMCacheRepository
+from workflows.llm_enhancement.scripts.llm_enhance_guideline import enhance_chapters_batch
+from workflows.shared.clients.anthropic_batch_client import AnthropicBatchClient
+from workflows.shared.retry import RetryConfig
+
+RESPONSE_TEXT = "### Enhanced Summary\nDeeper.\n### Key Takeaways\n- One"
+MODEL = "claude-sonnet-4"
+
+
+class _BatchServer:
+    """In-memory Message Batches API served through httpx.MockTransport."""
+
+    def __init__(self, polls_until_ended=1, errored_ids=(), throttle_first=0):
+        self.polls_until_ended = polls_until_ended
+        self.errored_ids = set(errored_ids)
+        self.throttle_first = throttle_first
+        self.submissions = []
+        self.polls = 0
+        self.requests_seen = 0
+
+    def client(self):
+        return AnthropicBatchClient(
+            base_url="http://batch.test",
+            retry_config=RetryConfig(max_attempts=3, initial_delay=0.0, max_delay=0.0),
+            http_client=httpx.Client(transport=httpx.MockTransport(self._handle)),
+        )
+
+    def _status(self):
+        ended = self.polls >= self.polls_until_ended
+        return {
+            "id": "msgbatch_1",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {"processing": 0 if ended else len(self.submissions[-1])},
+            "results_url": "http://batch.test/results/msgbatch_1" if ended else None,
+        }
+
+    def _result_line(self, custom_id):
+        if custom_id in self.errored_ids:
+            result = {"type": "errored", "error": {"error": {"message": "overloaded"}}}
+        else:
+            result = {"type": "succeeded", "message": {
+                "model": MODEL,
+                "content": [{"type": "text", "text": RESPONSE_TEXT}],
+                "usage": {"input_tokens": 10, "output_tokens": 5},
+            }}
+        return json.dumps({"custom_id": custom_id, "result": result})
+
+    def _handle(self, request):
+        self.requests_seen += 1
+        if self.requests_seen <= self.throttle_first:
+            return httpx.Response(429, headers={"retry-after": "0"}, json={"error": "rate_limited"})
+        path = request.url.path
+        if request.method == "POST" and path == "/v1/messages/batches":
+            self.submissions.append([r["custom_id"] for r in json.loads(request.content)["requests"]])
+            self.polls = 0
+            return httpx.Response(200, json=self._status())
+        if path == "/v1/messages/batches/msgbatch_1":
+            self.polls += 1
+            return httpx.Response(200, json=self._status())
+        if path == "/results/msgbatch_1":
+            lines = [self._result_line(custom_id) for custom_id in self.submissions[-1]]
+            return httpx.Response(200, text="\n".join(lines))
+        return httpx.Response(404)
+
+
+def _config():
+    from config.settings import LLMConfig
+    return LLMConfig(provider="gateway", model=MODEL, max_tokens=100, temperature=0.0)
+
+
+def _chapters(count):
+    return [{"number": n, "title": f"Chapter {n}"} for n in range(1, count + 1)]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    repo = LLMCacheRepository(cache_dir=tmp_path / "cache", compaction_interval=None)
+    yield repo
+    repo.close()
+
+
+def _enhance(server, jobs, checkpoint, cache=None, **kwargs):
+    with server.client() as client:
+        return enhance_chapters_batch(
+            jobs, _config(), checkpoint, client=client, cache=cache,
+            poll_interval=0, sleep=lambda _: None, **kwargs
+        )
+
+
+class TestBatchEnhancement:
+
+    def test_results_parsed_cached_and_not_resubmitted(self, tmp_path, cache):
+        server = _BatchServer(polls_until_ended=3)
+        checkpoint = tmp_path / "ckpt.json"
+
+        enhanced = _enhance(server, [("book", _chapters(3), {})], checkpoint, cache)[0]
+
+        assert [ch["number"] for ch in enhanced] == [1, 2, 3]
+        assert all(ch["llm_enhanced"] for ch in enhanced)
+        assert enhanced[0]["enhanced_summary"] == "Deeper."
+        assert server.submissions == [["b0-c0", "b0-c1", "b0-c2"]]
+        assert not checkpoint.exists()
+        assert cache.stats()["enhancement_count"] == 3
+
+        rerun = _enhance(server, [("book", _chapters(3), {})], checkpoint, cache)[0]
+
+        assert len(server.submissions) == 1
+        assert all(ch["enhanced_summary"] == "Deeper." for ch in rerun)
+
+    def test_failed_request_keeps_original_chapter(self, tmp_path):
+        server = _BatchServer(errored_ids={"b0-c1"})
+
+        enhanced = _enhance(server, [("book", _chapters(3), {})], tmp_path / "ckpt.json")[0]
+
+        assert enhanced[1] == {"number": 2, "title": "Chapter 2"}
+        assert enhanced[0]["llm_enhanced"] and enhanced[2]["llm_enhanced"]
+
+    def test_library_books_share_one_batch(self, tmp_path):
+        server = _BatchServer()
+
+        per_book = _enhance(
+            server, [("book_a", _chapters(2), {}), ("book_b", _chapters(1), {})],
+            tmp_path / "ckpt.json",
+        )
+
+        assert server.submissions == [["b0-c0", "b0-c1", "b1-c0"]]
+        assert [len(chapters) for chapters in per_book] == [2, 1]
+
+
+class TestRunBatch:
+
+    def test_timeout_keeps_checkpoint_and_rerun_resumes(self, tmp_path):
+        server = _BatchServer(polls_until_ended=4)
+        checkpoint = tmp_path / "ckpt.json"
+        items = [BatchItem("c1", "prompt one", 1), BatchItem("c2", "prompt two", 2)]
+        ticks = iter(range(100))
+
+        with server.client() as client, pytest.raises(BatchTimeoutError) as exc_info:
+            run_batch(
+                items, MODEL, 100, 0.0, checkpoint, client=client,
+                poll_interval=1, max_wait=2, sleep=lambda _: None, clock=lambda: next(ticks),
+            )
+
+        assert exc_info.value.batch_id == "msgbatch_1"
+        saved = json.loads(checkpoint.read_text(encoding="utf-8"))
+        assert saved["batch_id"] == "msgbatch_1"
+        assert saved["status"] == "in_progress"
+        assert set(saved["requests"]) == {"c1", "c2"}
+
+        with server.client() as client:
+            responses = run_batch(
+                items, MODEL, 100, 0.0, checkpoint, client=client,
+                poll_interval=0, sleep=lambda _: None,
+            )
+
+        assert len(server.submissions) == 1
+        assert set(responses) == {"c1", "c2"}
+        assert responses["c1"].content == RESPONSE_TEXT
+        assert not checkpoint.exists()
+
+    def test_changed_prompt_is_not_resumed(self, tmp_path):
+        server = _BatchServer()
+        checkpoint = tmp_path / "ckpt.json"
+        checkpoint.write_text(json.dumps({
+            "version": 1, "batch_id": "msgbatch_old", "model": MODEL,
+            "requests": {"c1": "stale-hash"},
+        }), encoding="utf-8")
+
+        with server.client() as client:
+            run_batch([BatchItem("c1", "new prompt", 1)], MODEL, 100, 0.0, checkpoint,
+                      client=client, poll_interval=0, sleep=lambda _: None)
+
+        assert server.submissions == [["c1"]]
+
+    def test_throttled_requests_are_retried(self, tmp_path):
+        server = _BatchServer(throttle_first=2)
+
+        with server.client() as client:
+            responses = run_batch([BatchItem("c1", "prompt", 1)], MODEL, 100, 0.0,
+                                  tmp_path / "ckpt.json", client=client,
+                                  poll_interval=0, sleep=lambda _: None)
+
+        assert server.submissions == [["c1"]]
+        assert responses["c1"].output_tokens == 5
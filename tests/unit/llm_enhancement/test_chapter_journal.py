@@ -0,0 +1,65 @@
+"""
+Unit tests for chapter_journal.py (integrate_llm_enhancements checkpoint journal).
+
+Covers:
+- Recorded chapters are replayed on load
+- A torn last line from an interrupted append is ignored
+- Appends after a torn line start on a fresh line and survive replay
+- Entries for chapters whose source text changed are not reused
+"""
+
+from workflows.llm_enhancement.scripts.chapter_journal import ChapterJournal
+
+
+def test_path_for_sits_next_to_output(tmp_path):
+    assert ChapterJournal.path_for(tmp_path / "book_LLM_ENHANCED.md") == \
+        tmp_path / "book_LLM_ENHANCED.md.journal.jsonl"
+
+
+def test_record_and_load(tmp_path):
+    journal = ChapterJournal(tmp_path / "out.md.journal.jsonl")
+    journal.record(1, "## Chapter 1: A\n", "## Chapter 1: A (enhanced)\n", has_cross_refs=True)
+    journal.record(2, "## Chapter 2: B\n", "## Chapter 2: B (enhanced)\n", has_cross_refs=False)
+
+    entries = ChapterJournal(journal.path).load()
+
+    assert sorted(entries) == [1, 2]
+    assert entries[1].enhanced == "## Chapter 1: A (enhanced)\n"
+    assert entries[1].has_cross_refs and not entries[2].has_cross_refs
+
+
+def test_torn_line_is_ignored(tmp_path):
+    journal = ChapterJournal(tmp_path / "out.md.journal.jsonl")
+    journal.record(1, "one", "ONE", has_cross_refs=True)
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"version": 1, "chapter": 2, "enha')
+
+    assert list(journal.load()) == [1]
+
+
+def test_record_after_torn_line_is_kept(tmp_path):
+    journal = ChapterJournal(tmp_path / "out.md.journal.jsonl")
+    journal.record(1, "one", "ONE", has_cross_refs=True)
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"version": 1, "chapter": 2, "enha')
+
+    # Resumed run re-enhances chapter 2 and appends after the torn tail
+    resumed = ChapterJournal(journal.path)
+    resumed.record(2, "two", "TWO", has_cross_refs=False)
+    resumed.record(3, "three", "THREE", has_cross_refs=False)
+
+    entries = resumed.load()
+    assert sorted(entries) == [1, 2, 3]
+    assert entries[2].enhanced == "TWO"
+
+
+def test_completed_requires_unchanged_source(tmp_path):
+    journal = ChapterJournal(tmp_path / "out.md.journal.jsonl")
+    journal.record(1, "one", "ONE", has_cross_refs=True)
+    journal.record(2, "two", "TWO", has_cross_refs=True)
+
+    completed = journal.completed({1: "one", 2: "two (edited)", 3: "three"})
+
+    assert list(completed) == [1]
+    journal.discard()
+    assert not journal.path.exists() and journal.load() == {}
@@ -0,0 +1,124 @@
+"""
+Unit tests for the Tab 6 context index sidecar (context_index.py).
+
+The sidecar must give Tab 7 exactly the lookups build_context_index
+produced from the full aggregate package, and must be ignored when it is
+stale, corrupt or from another format version.
+"""
+
+import json
+import os
+
+import pytest
+
+from workflows.llm_enhancement.scripts.context_index import (
+    CONTEXT_INDEX_MAGIC,
+    ContextIndex,
+    ContextIndexError,
+    context_index_path,
+    load_context_index,
+    write_context_index,
+)
+from workflows.llm_enhancement.scripts.llm_enhance_guideline import build_context_index
+
+
+def _aggregate(companions: int = 3) -> dict:
+    return {
+        "project": {"id": "arch_patterns"},
+        "statistics": {"total_books": companions + 1},
+        "source_book": {
+            "name": "arch_patterns",
+            "metadata": {"chapters": [
+                {"chapter_number": 1, "title": "Intro", "keywords": ["ddd"], "summary": "S1"},
+                {"chapter_number": 2, "title": "Repos", "keywords_enriched": ["repository"]},
+            ]},
+        },
+        "companion_books": [
+            {
+                "name": f"companion_{i}",
+                "metadata": [
+                    {"number": n, "title": f"C{i}.{n}", "concepts": ["caching"], "summary": "é ✓"}
+                    for n in range(1, 4)
+                ],
+            }
+            for i in range(companions)
+        ],
+    }
+
+
+def _save(tmp_path, aggregate):
+    path = tmp_path / "arch_patterns_llm_package_20250101_000000.json"
+    path.write_text(json.dumps(aggregate), encoding="utf-8")
+    return path
+
+
+class TestContextIndexSidecar:
+
+    def test_sidecar_matches_built_index(self, tmp_path):
+        aggregate = _aggregate()
+        path = _save(tmp_path, aggregate)
+        write_context_index(aggregate, path)
+
+        with load_context_index(path) as index:
+            expected = build_context_index(aggregate)
+            assert set(index) == set(expected)
+            assert len(index) == len(expected)
+            for key, entry in expected.items():
+                assert index[key] == entry
+            assert index.project_id == "arch_patterns"
+            assert index.book_count == 4
+            assert index.statistics == {"total_books": 4}
+
+    def test_lookup_is_lazy_and_cached(self, tmp_path):
+        aggregate = _aggregate()
+        path = _save(tmp_path, aggregate)
+        write_context_index(aggregate, path)
+
+        with load_context_index(path) as index:
+            assert index._cache == {}
+            assert "companion_0_ch2" in index
+            assert index._cache == {}
+            first = index["companion_0_ch2"]
+            assert index["companion_0_ch2"] is first
+            assert "missing_ch9" not in index
+            with pytest.raises(KeyError):
+                index["missing_ch9"]
+
+    def test_stale_sidecar_is_ignored(self, tmp_path):
+        aggregate = _aggregate()
+        path = _save(tmp_path, aggregate)
+        write_context_index(aggregate, path)
+
+        path.write_text(json.dumps(_aggregate(companions=5)), encoding="utf-8")
+
+        assert load_context_index(path) is None
+
+    def test_missing_sidecar_returns_none(self, tmp_path):
+        assert load_context_index(_save(tmp_path, _aggregate())) is None
+
+    def test_version_mismatch_rejected(self, tmp_path):
+        aggregate = _aggregate()
+        path = _save(tmp_path, aggregate)
+        sidecar = write_context_index(aggregate, path)
+        data = bytearray(sidecar.read_bytes())
+        data[len(CONTEXT_INDEX_MAGIC)] = 99
+        sidecar.write_bytes(bytes(data))
+
+        with pytest.raises(ContextIndexError):
+            ContextIndex(sidecar)
+
+    def test_corrupt_sidecar_falls_back(self, tmp_path):
+        path = _save(tmp_path, _aggregate())
+        context_index_path(path).write_bytes(b"not an index")
+
+        assert load_context_index(path) is None
+
+    def test_write_replaces_atomically(self, tmp_path):
+        aggregate = _aggregate()
+        path = _save(tmp_path, aggregate)
+        write_context_index(aggregate, path)
+        write_context_index(aggregate, path)
+
+        assert sorted(os.listdir(tmp_path)) == sorted(
+            [path.name, context_index_path(path).name]
+        )
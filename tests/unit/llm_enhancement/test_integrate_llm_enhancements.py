@@ -21,9 +21,16 @@ import sys
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from workflows.llm_enhancement.scripts import integrate_llm_enhancements as integrate
+from workflows.llm_enhancement.scripts.chapter_journal import ChapterJournal
 from workflows.llm_enhancement.scripts.integrate_llm_enhancements import (
+    _process_all_chapters,
     enhance_chapter_summary_with_llm,
+    segment_chapters,
+    splice_chapters,
 )
+from workflows.shared import llm_integration
+from workflows.shared.prompts.prompt_cache import TokenUsage
 
 
 class TestEnhanceChapterSummaryWithLLM:
@@ -207,3 +214,125 @@ class TestArchitecturePatterns:
         ]
         # After refactoring, these functions should exist
         assert len(expected_services) == 3
+
+
+CHAPTERS = (
+    "## Chapter 1: Intro\n\nSame text.\n\n---\n"
+    "## Chapter 2: Body\n\nSame text.\n\n---\n"
+    "## Chapter 10: End\n\nLast.\n"
+)
+
+
+class TestChapterSplicing:
+    """Chapters are segmented once and enhanced text is spliced in by offset."""
+
+    @pytest.fixture
+    def enhancers(self, monkeypatch):
+        monkeypatch.setattr(integrate, "enhance_chapter_summary_with_llm",
+                            lambda text, num: text.replace("text.", f"text {num}."))
+        monkeypatch.setattr(integrate, "add_cross_reference_section_comprehensive",
+                            lambda text, num, data: text + f"### Cross-Text Analysis {num}\n")
+
+    def test_segment_chapters_offsets(self):
+        content = "preamble\n" + CHAPTERS
+        spans = segment_chapters(content)
+
+        assert [s.number for s in spans] == [1, 2, 10]
+        assert spans[0].start == len("preamble\n")
+        assert spans[-1].end == len(content)
+        assert all(a.end == b.start for a, b in zip(spans, spans[1:]))
+        assert content[spans[2].start:spans[2].end] == "## Chapter 10: End\n\nLast.\n"
+
+    def test_splice_keeps_untouched_text(self):
+        content = "preamble\n" + CHAPTERS
+        spans = segment_chapters(content)
+
+        assert splice_chapters(content, spans, {}) == content
+        spliced = splice_chapters(content, spans, {1: "## Chapter 2: New\n"})
+        assert spliced == content.replace("## Chapter 2: Body\n\nSame text.\n\n---\n", "## Chapter 2: New\n")
+
+    def test_identical_chapter_text_is_enhanced_in_place(self, enhancers):
+        """str.replace on 'Same text.' would have rewritten both chapters."""
+        enhanced, with_refs, failed, exit_code = _process_all_chapters("", CHAPTERS, [1, 2, 10], {})
+
+        assert (with_refs, failed, exit_code) == (3, [], 0)
+        spans = [enhanced[s.start:s.end] for s in segment_chapters(enhanced)]
+        assert "Same text 1." in spans[0] and spans[0].endswith("### Cross-Text Analysis 1\n")
+        assert "Same text 2." in spans[1] and "Same text 1." not in spans[1]
+        assert spans[2].endswith("### Cross-Text Analysis 10\n")
+
+    def test_unprocessed_chapters_unchanged(self, enhancers):
+        enhanced, *_ = _process_all_chapters("", CHAPTERS, [2], {})
+
+        assert enhanced.startswith("## Chapter 1: Intro\n\nSame text.\n")
+        assert enhanced.endswith("## Chapter 10: End\n\nLast.\n")
+        assert enhanced.count("### Cross-Text Analysis") == 1
+
+
+def _book(count):
+    return "".join(f"## Chapter {n}: Title {n}\n\nBody {n} text.\n\n---\n" for n in range(1, count + 1))
+
+
+class TestParallelChaptersAndResume:
+    """Worker pool, checkpoint journal and the global consecutive-failure breaker."""
+
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        calls = []
+
+        def enhance(text, num):
+            calls.append(num)
+            return text.replace("text.", "text (enhanced).")
+
+        monkeypatch.setattr(integrate, "enhance_chapter_summary_with_llm", enhance)
+        monkeypatch.setattr(integrate, "add_cross_reference_section_comprehensive",
+                            lambda text, num, data: text + "### Cross-Text Analysis\n")
+        return calls
+
+    def test_parallel_output_matches_serial(self, calls):
+        content = _book(8)
+
+        serial = _process_all_chapters("", content, list(range(1, 9)), {}, workers=1)
+        parallel = _process_all_chapters("", content, list(range(1, 9)), {}, workers=4)
+
+        assert parallel == serial
+        assert serial[1:] == (8, [], 0)
+
+    def test_resume_skips_journaled_chapters(self, tmp_path, calls):
+        content = _book(5)
+        journal = ChapterJournal(tmp_path / "out.md.journal.jsonl")
+        first, *_ = _process_all_chapters("", content, [1, 2, 3], {}, journal=journal, workers=2)
+        calls.clear()
+
+        resumed = journal.completed(integrate._chapter_texts(content, list(range(1, 6))))
+        second, with_refs, failed, exit_code = _process_all_chapters(
+            "", content, list(range(1, 6)), {}, journal=journal, resumed=resumed, workers=2
+        )
+
+        assert sorted(calls) == [4, 5]
+        assert (with_refs, failed, exit_code) == (5, [], 0)
+        assert second.startswith(first[:first.index("## Chapter 4:")])
+        assert sorted(journal.load()) == [1, 2, 3, 4, 5]
+
+    def test_breaker_stops_remaining_chapters(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(integrate, "enhance_chapter_summary_with_llm",
+                            lambda text, num: (_ for _ in ()).throw(RuntimeError("provider down")))
+        saved = []
+        monkeypatch.setattr(integrate, "_save_partial_results", lambda *args: saved.append(args))
+        journal = ChapterJournal(tmp_path / "out.md.journal.jsonl")
+
+        enhanced, with_refs, failed, exit_code = _process_all_chapters(
+            "", _book(10), list(range(1, 11)), {}, journal=journal, workers=1
+        )
+
+        assert exit_code == 1
+        assert failed == [1, 2, 3]
+        assert enhanced == _book(10)
+        assert saved == [] and journal.load() == {}
+
+    def test_token_usage_starts_from_zero_for_each_book(self, calls):
+        llm_integration._record_token_usage(1, TokenUsage(input_tokens=100, calls=1))
+
+        _process_all_chapters("", _book(2), [1, 2], {}, workers=1)
+
+        assert llm_integration.get_chapter_token_usage(1).input_tokens == 0
@@ -17,6 +17,8 @@ Sprint: Batch #2 Files 6-11 (HIGH priority, CC 8-9, tests only)
 import pytest
 import json
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 from unittest.mock import Mock, patch, MagicMock, mock_open
@@ -25,11 +27,13 @@ from unittest.mock import Mock, patch, MagicMock, mock_open
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from workflows.llm_enhancement.scripts import interactive_llm_system_v3_hybrid_prompt as hybrid
 from workflows.llm_enhancement.scripts.interactive_llm_system_v3_hybrid_prompt import (
     AnalysisOrchestrator,
     ContentRequest,
     LLMMetadataResponse
 )
+from workflows.shared.prompts.templates import PromptParts
 
 
 # ============================================================================
@@ -447,3 +451,39 @@ class TestAnalysisOrchestratorIntegration:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestConcurrentChapters:
+    """Chapters analysed concurrently on one orchestrator keep their own chapter number."""
+
+    def test_phase1_calls_carry_their_own_chapter(self, mock_metadata_service):
+        orchestrator = AnalysisOrchestrator(metadata_service=mock_metadata_service, llm_available=True)
+        both_in_flight = threading.Barrier(2, timeout=5)
+        calls = []
+
+        def fake_call_llm(prompt, phase=None, chapter_num=0, **_kwargs):
+            both_in_flight.wait()
+            calls.append((prompt, phase, chapter_num))
+            return "{}"
+
+        with patch.object(hybrid, "call_llm", fake_call_llm), \
+                patch.object(hybrid, "get_chapter_token_usage", return_value=Mock(calls=0)), \
+                patch.object(orchestrator, "_build_books_metadata_only", return_value=[]) as build_books, \
+                patch.object(orchestrator, "_build_comprehensive_phase1_prompt",
+                             side_effect=lambda num, *_args: PromptParts("prefix ", f"chapter {num}")), \
+                patch.object(orchestrator, "_phase2_comprehensive_synthesis",
+                             side_effect=lambda num, *_args: num):
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                results = list(pool.map(
+                    lambda num: orchestrator.analyze_chapter_comprehensive(num, f"Title {num}", "text"),
+                    [1, 2],
+                ))
+
+        assert results == [1, 2]
+        assert sorted(calls) == [
+            ("prefix chapter 1", "phase1", 1),
+            ("prefix chapter 2", "phase1", 2),
+        ]
+        assert orchestrator.chapter_phase(1) == hybrid.AnalysisPhase.ANALYSIS_COMPLETE
+        # One companion book list per run, so the memoized prompt prefix is reused
+        build_books.assert_called_once()
@@ -0,0 +1,145 @@
+"""
+Unit tests for cache concurrency primitives (single_flight.py) and the
+get_or_compute() path of LLMCacheRepository.
+
+Covers:
+- atomic_write_json: no partial or leftover files, original kept on failure
+- SingleFlight: one compute per key across threads and across repositories
+  sharing a cache directory (advisory file lock), errors shared with waiters
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from workflows.llm_enhancement.scripts.cache.llm_cache import LLMCacheRepository, LLMResponse
+from workflows.llm_enhancement.scripts.cache.single_flight import (
+    SingleFlight,
+    atomic_write_json,
+)
+
+
+def _run_concurrently(count, target):
+    barrier = threading.Barrier(count)
+    results = [None] * count
+    errors = []
+
+    def worker(i):
+        barrier.wait()
+        try:
+            results[i] = target(i)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, errors
+
+
+def _slow_counter(value, delay=0.05):
+    calls = []
+    lock = threading.Lock()
+
+    def compute():
+        with lock:
+            calls.append(1)
+        time.sleep(delay)
+        return value
+
+    return compute, calls
+
+
+class TestAtomicWriteJson:
+
+    def test_writes_and_replaces_without_leftovers(self, tmp_path):
+        target = tmp_path / "entry.json"
+        atomic_write_json(target, {"v": 1})
+        atomic_write_json(target, {"v": 2})
+
+        assert json.loads(target.read_text(encoding="utf-8")) == {"v": 2}
+        assert [p.name for p in tmp_path.iterdir()] == ["entry.json"]
+
+    def test_failed_write_keeps_original(self, tmp_path):
+        target = tmp_path / "entry.json"
+        atomic_write_json(target, {"v": 1})
+
+        with pytest.raises(TypeError):
+            atomic_write_json(target, {"v": object()})
+
+        assert json.loads(target.read_text(encoding="utf-8")) == {"v": 1}
+        assert [p.name for p in tmp_path.iterdir()] == ["entry.json"]
+
+
+class TestSingleFlight:
+
+    def test_concurrent_misses_compute_once(self):
+        store = {}
+        flight = SingleFlight()
+        compute, calls = _slow_counter("value")
+
+        results, errors = _run_concurrently(8, lambda _: flight.run(
+            "key", lookup=lambda: store.get("key"), compute=compute,
+            store=lambda v: store.__setitem__("key", v),
+        ))
+
+        assert errors == []
+        assert len(calls) == 1
+        assert [value for value, _ in results] == ["value"] * 8
+        assert sorted(hit for _, hit in results) == [False] + [True] * 7
+
+    def test_leader_error_shared_then_retried(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing():
+            started.set()
+            release.wait()
+            raise RuntimeError("API down")
+
+        leader_errors = []
+        leader = threading.Thread(target=lambda: leader_errors.append(
+            pytest.raises(RuntimeError, flight.run, "key", lambda: None, failing, lambda v: None)
+        ))
+        leader.start()
+        started.wait()
+        follower_errors = []
+        follower = threading.Thread(target=lambda: follower_errors.append(
+            pytest.raises(RuntimeError, flight.run, "key", lambda: None, failing, lambda v: None)
+        ))
+        follower.start()
+        time.sleep(0.05)
+        release.set()
+        leader.join()
+        follower.join()
+
+        assert len(leader_errors) == len(follower_errors) == 1
+        assert flight.run("key", lambda: None, lambda: "ok", lambda v: None) == ("ok", False)
+
+
+class TestRepositoryGetOrCompute:
+
+    def test_llm_cache_single_call_across_repositories(self, tmp_path):
+        """Separate repositories (as separate processes would) share the key lock."""
+        repos = [LLMCacheRepository(cache_dir=tmp_path, compaction_interval=None) for _ in range(2)]
+        response = LLMResponse(
+            phase="phase2", chapter_num=4, prompt_hash="h" * 64, response_text="{}",
+            parsed_data={}, model="claude-sonnet-4", tokens_used=0,
+        )
+        compute, calls = _slow_counter(response)
+
+        results, errors = _run_concurrently(6, lambda i: repos[i % 2].get_or_compute(
+            "phase2", 4, response.prompt_hash, response.model, compute
+        ))
+
+        assert errors == []
+        assert len(calls) == 1
+        assert [hit for _, hit in results].count(False) == 1
+        assert repos[1].get_phase2(4, response.prompt_hash, model=response.model) is not None
+        for repo in repos:
+            repo.close()
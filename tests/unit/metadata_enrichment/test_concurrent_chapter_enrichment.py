@@ -0,0 +1,147 @@
+"""
+Unit tests for concurrent per-chapter enrichment in enrich_metadata_per_book.py.
+
+Covers:
+- _enrich_chapters_concurrently: bounded fan-out, deterministic output order
+- enrich_metadata_semantic: chapters searched concurrently via one client
+- run_enrichment_with_orchestrator: per-chapter latency percentiles reported
+
+Pattern: Async fan-out under asyncio.Semaphore over pooled clients
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+    CHAPTER_LATENCY_OPERATION,
+    _enrich_chapters_concurrently,
+    enrich_metadata_semantic,
+    run_enrichment_with_orchestrator,
+)
+from workflows.shared.clients.metrics import PerformanceLogger
+from workflows.shared.clients.orchestrator_client import FakeOrchestratorClient
+
+
+class _ConcurrencyProbe:
+    """Records peak concurrency of an async worker."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def run(self, delay: float) -> None:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(delay)
+        self.active -= 1
+
+
+class TestEnrichChaptersConcurrently:
+    """Bounded fan-out helper."""
+
+    @pytest.mark.asyncio
+    async def test_preserves_input_order(self) -> None:
+        """Later items finishing first must not reorder results."""
+        async def enrich_one(n: int) -> Dict[str, Any]:
+            await asyncio.sleep(0.01 * (5 - n))
+            return {"n": n}
+
+        results = await _enrich_chapters_concurrently(list(range(5)), enrich_one, max_concurrency=5)
+
+        assert [r["n"] for r in results] == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_respects_concurrency_limit(self) -> None:
+        """No more than max_concurrency chapters are in flight."""
+        probe = _ConcurrencyProbe()
+
+        async def enrich_one(n: int) -> Dict[str, Any]:
+            await probe.run(0.01)
+            return {"n": n}
+
+        await _enrich_chapters_concurrently(list(range(10)), enrich_one, max_concurrency=3)
+
+        assert probe.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_records_latency_per_chapter(self) -> None:
+        """Each chapter call is timed into the performance logger."""
+        perf_logger = PerformanceLogger()
+
+        async def enrich_one(n: int) -> Dict[str, Any]:
+            return {"n": n}
+
+        await _enrich_chapters_concurrently(list(range(4)), enrich_one, 2, perf_logger)
+
+        stats = perf_logger.get_stats(CHAPTER_LATENCY_OPERATION)
+        assert stats["count"] == 4
+        assert "p90_ms" in stats
+
+
+class _FakeSearchClient:
+    """Async context-managed stand-in for SemanticSearchClient."""
+
+    probe = _ConcurrencyProbe()
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url
+
+    async def __aenter__(self) -> "_FakeSearchClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    async def health_check(self) -> Dict[str, str]:
+        return {"status": "healthy"}
+
+    async def search(self, query: str, limit: int, collection: str) -> List[Dict[str, Any]]:
+        await self.probe.run(0.01)
+        return [{"payload": {"title": "Other", "chapter_number": 9, "book_title": "B"}, "score": 0.5}]
+
+
+class TestSemanticEnrichmentConcurrency:
+    """enrich_metadata_semantic fans chapters out over one client."""
+
+    @pytest.mark.asyncio
+    async def test_semantic_enrichment_runs_chapters_concurrently(self, tmp_path: Path) -> None:
+        """Chapters overlap in flight and output keeps chapter order."""
+        chapters = [{"chapter_number": n, "title": f"Chapter {n}"} for n in range(1, 7)]
+        input_path = tmp_path / "book_metadata.json"
+        output_path = tmp_path / "book_enriched.json"
+        input_path.write_text(json.dumps({"book_title": "Book", "chapters": chapters}), encoding="utf-8")
+        _FakeSearchClient.probe = _ConcurrencyProbe()
+
+        with patch(
+            "workflows.metadata_enrichment.scripts.enrich_metadata_per_book.SemanticSearchClient",
+            _FakeSearchClient,
+        ):
+            await enrich_metadata_semantic(input_path, output_path, max_concurrency=4)
+
+        output = json.loads(output_path.read_text(encoding="utf-8"))
+        assert [ch["chapter_number"] for ch in output["chapters"]] == [1, 2, 3, 4, 5, 6]
+        assert _FakeSearchClient.probe.peak == 4
+        assert output["enrichment_metadata"]["chapter_latency_ms"]["count"] == 6
+
+
+class TestOrchestratorEnrichmentConcurrency:
+    """run_enrichment_with_orchestrator reports latency percentiles."""
+
+    @pytest.mark.asyncio
+    async def test_reports_latency_percentiles(self) -> None:
+        """Result includes per-chapter latency summary in chapter order."""
+        client = FakeOrchestratorClient(results=[
+            {"book": "Other", "chapter": 1, "title": "T", "relevance_score": 0.5},
+        ])
+
+        enriched = await run_enrichment_with_orchestrator("Book", "ai-ml", client, max_concurrency=2)
+
+        assert [ch["chapter_number"] for ch in enriched["chapters"]] == [1, 2]
+        latency = enriched["chapter_latency_ms"]
+        assert latency["count"] == 2
+        assert latency["p50_ms"] <= latency["p99_ms"] <= latency["max_ms"]
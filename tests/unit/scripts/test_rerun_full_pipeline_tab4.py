@@ -0,0 +1,95 @@
+"""
+Tests for Tab 4 delta handling in scripts/rerun_full_pipeline.py
+
+Test Coverage:
+- tab4_inputs_unchanged compares metadata and taxonomy checksums; other
+  books' changes do not defeat --delta
+- --delta is only forwarded to enrich_metadata_per_book.py in MSEP mode
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scripts import rerun_full_pipeline
+from scripts.rerun_full_pipeline import run_tab4_metadata_enrichment, tab4_inputs_unchanged
+from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+    build_enrichment_provenance,
+)
+
+
+@pytest.fixture
+def tab4_inputs(tmp_path: Path):
+    """Two books' Tab 2 metadata, a taxonomy, and an output built from them."""
+    metadata_dir = tmp_path / "metadata"
+    metadata_dir.mkdir()
+    input_file = metadata_dir / "Book A_metadata.json"
+    input_file.write_text(json.dumps({"chapters": [{"chapter_number": 1}]}), encoding="utf-8")
+    (metadata_dir / "Book B_metadata.json").write_text(json.dumps({"chapters": []}), encoding="utf-8")
+    taxonomy_path = tmp_path / "taxonomy.json"
+    taxonomy_path.write_text(json.dumps({"tiers": {}}), encoding="utf-8")
+
+    output_file = tmp_path / "Book A_enriched.json"
+    provenance = build_enrichment_provenance(input_file, taxonomy_path, "taxonomy", "v1")
+    output_file.write_text(json.dumps({"enrichment_provenance": provenance}), encoding="utf-8")
+    return metadata_dir, input_file, taxonomy_path, output_file
+
+
+class TestTab4InputsUnchanged:
+
+    def test_unchanged_inputs(self, tab4_inputs):
+        _, input_file, taxonomy_path, output_file = tab4_inputs
+
+        assert tab4_inputs_unchanged(input_file, taxonomy_path, output_file)
+
+    def test_book_metadata_changed(self, tab4_inputs):
+        _, input_file, taxonomy_path, output_file = tab4_inputs
+        input_file.write_text(json.dumps({"chapters": []}), encoding="utf-8")
+
+        assert not tab4_inputs_unchanged(input_file, taxonomy_path, output_file)
+
+    def test_taxonomy_changed(self, tab4_inputs):
+        _, input_file, taxonomy_path, output_file = tab4_inputs
+        taxonomy_path.write_text(json.dumps({"tiers": {"core": {}}}), encoding="utf-8")
+
+        assert not tab4_inputs_unchanged(input_file, taxonomy_path, output_file)
+
+    def test_other_book_changed_keeps_book_skippable(self, tab4_inputs):
+        metadata_dir, input_file, taxonomy_path, output_file = tab4_inputs
+        (metadata_dir / "Book B_metadata.json").write_text(
+            json.dumps({"chapters": [{"chapter_number": 1}]}), encoding="utf-8"
+        )
+        (metadata_dir / "Book C_metadata.json").write_text("{}", encoding="utf-8")
+
+        assert tab4_inputs_unchanged(input_file, taxonomy_path, output_file)
+
+
+class TestTab4Command:
+
+    @pytest.fixture
+    def run_tab4(self, tmp_path: Path, monkeypatch):
+        metadata_dir = tmp_path / "workflows" / "metadata_extraction" / "output"
+        metadata_dir.mkdir(parents=True)
+        (metadata_dir / "Book A_metadata.json").write_text("{}", encoding="utf-8")
+        monkeypatch.setattr(rerun_full_pipeline, "PROJECT_ROOT", tmp_path)
+
+        def run(**kwargs):
+            with patch.object(rerun_full_pipeline.subprocess, "run") as mock_run:
+                mock_run.return_value = MagicMock(returncode=0)
+                assert run_tab4_metadata_enrichment("Book A", tmp_path / "taxonomy.json", **kwargs)
+            return mock_run.call_args.args[0]
+
+        return run
+
+    def test_taxonomy_mode_does_not_pass_delta(self, run_tab4):
+        cmd = run_tab4(delta=True)
+
+        assert "--delta" not in cmd
+        assert "--use-msep" not in cmd
+
+    def test_msep_mode_passes_delta(self, run_tab4):
+        cmd = run_tab4(delta=True, msep_url="http://localhost:8082")
+
+        assert cmd[-4:] == ["--use-msep", "--msep-url", "http://localhost:8082", "--delta"]
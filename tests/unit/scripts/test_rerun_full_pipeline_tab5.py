@@ -0,0 +1,62 @@
+"""
+Tests for Tab 5 batch mode in scripts/rerun_full_pipeline.py
+
+Test Coverage:
+- run_tab5_guideline_batch fails every book when the taxonomy cannot be
+  read, as the per-book subprocess (exit 1) did
+- Readable taxonomies are passed to generate_guidelines
+- Every batch book gets the per-book subprocess timeout
+"""
+
+from pathlib import Path
+
+import pytest
+
+from scripts import rerun_full_pipeline
+from scripts.rerun_full_pipeline import TAB5_BOOK_TIMEOUT, run_tab5_guideline_batch
+from workflows.base_guideline_generation.scripts import chapter_generator_all_text as generator
+
+
+@pytest.fixture
+def tab5_books(tmp_path: Path, monkeypatch):
+    """Two books with Tab 5 inputs; generate_guidelines calls are recorded."""
+    json_dir = tmp_path / "workflows" / "pdf_to_json" / "output" / "textbooks_json"
+    enriched_dir = tmp_path / "workflows" / "metadata_enrichment" / "output"
+    json_dir.mkdir(parents=True)
+    enriched_dir.mkdir(parents=True)
+    for book in ("Book A", "Book B"):
+        (json_dir / f"{book}.json").write_text("{}", encoding="utf-8")
+        (enriched_dir / f"{book}_enriched.json").write_text("{}", encoding="utf-8")
+    monkeypatch.setattr(rerun_full_pipeline, "PROJECT_ROOT", tmp_path)
+
+    calls = []
+
+    def fake_generate(input_paths, key_concepts=None, workers=1, book_timeout=None):
+        calls.append((key_concepts, book_timeout))
+        return {path.stem: True for path in input_paths}
+
+    monkeypatch.setattr(generator, "generate_guidelines", fake_generate)
+    return tmp_path, calls
+
+
+class TestTab5BatchTaxonomy:
+
+    def test_unreadable_taxonomy_fails_every_book(self, tab5_books):
+        tmp_path, calls = tab5_books
+        taxonomy_path = tmp_path / "taxonomy.json"
+        taxonomy_path.write_text("{not json", encoding="utf-8")
+
+        results = run_tab5_guideline_batch(["Book A", "Book B", "Missing"], taxonomy_path)
+
+        assert results == {"Book A": False, "Book B": False, "Missing": False}
+        assert calls == []
+
+    def test_readable_taxonomy_is_used(self, tab5_books):
+        tmp_path, calls = tab5_books
+        taxonomy_path = tmp_path / "taxonomy.json"
+        taxonomy_path.write_text('{"tiers": {"core": {"concepts": ["gil"]}}}', encoding="utf-8")
+
+        results = run_tab5_guideline_batch(["Book A", "Book B"], taxonomy_path)
+
+        assert results == {"Book A": True, "Book B": True}
+        assert calls == [(["gil"], TAB5_BOOK_TIMEOUT)]
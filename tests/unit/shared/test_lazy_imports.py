@@ -0,0 +1,119 @@
+"""
+Tests for workflows/shared/lazy_imports.py and pipeline CLI startup cost
+
+Stage modules bind heavy dependencies (PyMuPDF, Tesseract, Unstructured,
+YAKE, Summa, NLTK, scikit-learn, BERTopic, networkx) to lazy proxies, so
+importing a stage only pays for what the run actually uses.
+
+Test Coverage:
+- Proxies import on first attribute access or call, once
+- Availability checks never import the package
+- Import-time benchmark (python -X importtime): each CLI module stays
+  within its startup budget and does not import any heavy dependency
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from workflows.shared.lazy_imports import LazyModule, ensure_loaded, lazy_import, module_available
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+
+# Cumulative import time budget per CLI module, in milliseconds
+# (measured at roughly a quarter of these on a developer laptop)
+STARTUP_BUDGETS_MS = {
+    "workflows.pdf_to_json.scripts.convert_pdf_to_json": 400,
+    "workflows.metadata_extraction.scripts.adapters.statistical_extractor": 200,
+    "workflows.metadata_extraction.scripts.generate_metadata_universal": 1500,
+    "workflows.metadata_enrichment.scripts.enrich_metadata_per_book": 1500,
+    "workflows.metadata_enrichment.scripts.topic_clusterer": 200,
+    "workflows.metadata_enrichment.scripts.tier_relationship_engine": 200,
+    "workflows.base_guideline_generation.scripts.chapter_generator_all_text": 400,
+    "scripts.batch_extract_metadata": 200,
+    "scripts.rerun_full_pipeline": 200,
+}
+
+# Top-level packages that must only be imported when a run uses them
+HEAVY_MODULES = {
+    "bertopic", "fitz", "networkx", "nltk", "PIL", "pytesseract", "scipy",
+    "sentence_transformers", "sklearn", "summa", "torch", "unstructured", "yake",
+}
+
+
+def import_profile(module: str) -> dict:
+    """
+    Import ``module`` in a fresh interpreter under ``-X importtime``.
+
+    Returns:
+        Imported module name -> cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = int(cumulative_us)
+    return profile
+
+
+class TestLazyModule:
+
+    def test_imports_on_first_attribute_access(self):
+        proxy = lazy_import("json")
+
+        assert "not loaded" in repr(proxy)
+        assert proxy.dumps([1]) == "[1]"
+        assert repr(proxy) == "<LazyModule json (loaded)>"
+
+    def test_attribute_proxy_is_callable(self):
+        dumps = lazy_import("json", "dumps")
+
+        assert dumps({"a": 1}) == '{"a": 1}'
+
+    def test_import_error_surfaces_on_first_use(self):
+        proxy = lazy_import("no_such_module_for_lazy_imports")
+
+        with pytest.raises(ModuleNotFoundError):
+            proxy.anything
+
+    def test_ensure_loaded_ignores_non_proxies(self):
+        proxy = LazyModule("json")
+
+        ensure_loaded(proxy, None, object())
+
+        assert "(loaded)" in repr(proxy)
+
+
+class TestModuleAvailable:
+
+    def test_installed_and_missing(self):
+        assert module_available("json", "pathlib")
+        assert not module_available("json", "no_such_module_for_lazy_imports")
+
+    def test_hidden_module_is_unavailable(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "no_such_module_for_lazy_imports", None)
+
+        assert not module_available("no_such_module_for_lazy_imports")
+
+
+@pytest.mark.slow
+class TestStartupBudget:
+
+    @pytest.mark.parametrize("module", sorted(STARTUP_BUDGETS_MS))
+    def test_cli_import_within_budget(self, module):
+        profile = import_profile(module)
+
+        heavy = sorted({name.split(".")[0] for name in profile} & HEAVY_MODULES)
+        assert heavy == [], f"{module} imports {heavy} at startup"
+        elapsed_ms = profile[module] / 1000
+        assert elapsed_ms < STARTUP_BUDGETS_MS[module], (
+            f"{module} took {elapsed_ms:.0f} ms to import (budget {STARTUP_BUDGETS_MS[module]} ms)"
+        )
@@ -269,7 +269,11 @@ class TestCallLlmFunction:
             pytest.approx(1, abs=5),  # call_num may vary
             "Test prompt",
             "System prompt",
-            1500
+            1500,
+            cache_prefix=None,
+            chapter_num=0,
+            stream=False,
+            expect_json=False
         )
     
     @patch('workflows.shared.llm_integration.ANTHROPIC_AVAILABLE', False)
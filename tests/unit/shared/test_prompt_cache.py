@@ -0,0 +1,238 @@
+"""
+Tests for prompt-prefix reuse and provider prompt caching.
+
+Covers workflows/shared/prompts/prompt_cache.py and the prompt-assembly
+layer in workflows/shared/prompts/templates.py:
+- Template files are read once per process
+- Comprehensive prompts split into a byte-identical run-stable prefix and a
+  per-chapter suffix
+- cache_control breakpoints on the system prompt and prefix (Anthropic SDK
+  and gateway message formats)
+- Cached vs. uncached input token accounting per chapter
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from workflows.shared import llm_integration
+from workflows.shared.prompts import templates
+from workflows.shared.prompts.prompt_cache import (
+    PROMPT_CACHE_ENV,
+    TokenUsage,
+    build_system_blocks,
+    build_user_content,
+)
+from workflows.shared.prompts.templates import (
+    CHAPTER_SECTION_MARKER,
+    build_comprehensive_phase1_prompt,
+    build_comprehensive_phase2_prompt,
+    clear_prompt_caches,
+    format_comprehensive_phase1_prompt,
+    format_comprehensive_phase2_prompt,
+    load_template,
+)
+from workflows.shared.providers.gateway_provider import GatewayProvider
+
+
+BOOKS = [
+    {
+        "title": "Fluent Python",
+        "author": "Ramalho",
+        "domain": "implementation",
+        "concepts_covered": ["decorators", "closures"],
+        "has_chapter_metadata": True,
+        "chapters": [{"number": 9, "title": "Decorators", "pages": "303-340"}],
+    },
+]
+TAXONOMY = {"tiers": {"architecture": {"priority": 1, "name": "Architecture", "books": ["a.json"]}}}
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    clear_prompt_caches()
+    llm_integration.reset_token_usage()
+    yield
+    clear_prompt_caches()
+    llm_integration.reset_token_usage()
+
+
+def _metadata_response():
+    return SimpleNamespace(validation_summary="Concepts: decorators", analysis_strategy="Lead with patterns")
+
+
+class TestPromptAssembly:
+
+    def test_template_read_from_disk_once(self):
+        load_template("comprehensive_phase1")
+        load_template("comprehensive_phase1")
+
+        info = templates._read_prompt_file.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_path_separator_still_rejected(self):
+        with pytest.raises(ValueError):
+            load_template("../secrets")
+
+    def test_phase1_prefix_is_stable_across_chapters(self):
+        first = build_comprehensive_phase1_prompt(1, "Intro", "text one", BOOKS, "Learning Python")
+        second = build_comprehensive_phase1_prompt(2, "Types", "text two", BOOKS, "Learning Python")
+
+        assert first.prefix is second.prefix
+        assert "Fluent Python" in first.prefix
+        assert first.suffix.startswith("CHAPTER 1: Intro")
+        assert "text one" not in first.prefix
+        assert first.suffix != second.suffix
+
+    def test_prefix_memoized_on_book_list_identity(self, monkeypatch):
+        first = build_comprehensive_phase1_prompt(1, "Intro", "t", BOOKS, "Learning Python")
+        rendered = []
+        original = templates._format_book_description
+        monkeypatch.setattr(
+            templates, "_format_book_description", lambda book, i: rendered.append(i) or original(book, i)
+        )
+
+        build_comprehensive_phase1_prompt(2, "Types", "t", BOOKS, "Learning Python")
+        copy = build_comprehensive_phase1_prompt(3, "Loops", "t", [dict(book) for book in BOOKS], "Learning Python")
+
+        # Same list: cache hit; a new list object is rendered again, to the same text
+        assert rendered == list(range(1, len(BOOKS) + 1))
+        assert copy.prefix == first.prefix
+
+    def test_phase1_text_matches_format_function(self):
+        parts = build_comprehensive_phase1_prompt(3, "Loops", "x" * 9000, BOOKS, "Learning Python")
+
+        assert parts.text == format_comprehensive_phase1_prompt(
+            3, "Loops", "x" * 9000, BOOKS, "Learning Python"
+        )
+        assert "{" + "books_text}" not in parts.text
+        assert "... [truncated for prompt length]" in parts.suffix
+
+    def test_prefix_changes_with_book_set(self):
+        first = build_comprehensive_phase1_prompt(1, "Intro", "t", BOOKS, "Learning Python")
+        other_books = [dict(BOOKS[0], title="Python Cookbook")]
+        second = build_comprehensive_phase1_prompt(1, "Intro", "t", other_books, "Learning Python")
+
+        assert "Python Cookbook" in second.prefix
+        assert first.prefix != second.prefix
+
+    def test_phase2_taxonomy_in_prefix_and_content_in_suffix(self):
+        content = {"Fluent Python": [{"page": 310, "content": "A decorator is a callable"}]}
+        system_prompt, parts = build_comprehensive_phase2_prompt(
+            7, "Decorators", _metadata_response(), content, "Learning Python", TAXONOMY
+        )
+
+        assert "Priority 1 - Architecture" in parts.prefix
+        assert "A decorator is a callable" in parts.suffix
+        assert parts.suffix.startswith(CHAPTER_SECTION_MARKER.format(chapter_num=7, chapter_title="Decorators"))
+        assert (system_prompt, parts.text) == format_comprehensive_phase2_prompt(
+            7, "Decorators", _metadata_response(), content, "Learning Python", TAXONOMY
+        )
+
+
+class TestCacheControlBlocks:
+
+    def test_user_content_split_at_prefix(self):
+        blocks = build_user_content("PREFIXsuffix", "PREFIX")
+
+        assert blocks == [
+            {"type": "text", "text": "PREFIX", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "suffix"},
+        ]
+
+    def test_user_content_unchanged_without_matching_prefix(self):
+        assert build_user_content("prompt", None) == "prompt"
+        assert build_user_content("prompt", "other") == "prompt"
+
+    def test_system_blocks_are_cached(self):
+        assert build_system_blocks("sys")[0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_gateway_messages_carry_breakpoints(self):
+        messages = GatewayProvider._build_messages("PREFIXsuffix", "sys", "PREFIX")
+
+        assert messages[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+        assert messages[1]["content"][0]["text"] == "PREFIX"
+        assert GatewayProvider._build_messages("p", "sys")[1]["content"] == "p"
+
+    def test_env_flag_disables_breakpoints(self, monkeypatch):
+        monkeypatch.setenv(PROMPT_CACHE_ENV, "false")
+
+        messages = GatewayProvider._build_messages("PREFIXsuffix", "sys", "PREFIX")
+
+        assert messages == [
+            {"role": "system", "content": "sys"},
+            {"role": "user", "content": "PREFIXsuffix"},
+        ]
+
+
+class TestTokenUsage:
+
+    def test_from_anthropic_adds_cache_fields_to_total(self):
+        usage = TokenUsage.from_anthropic(SimpleNamespace(
+            input_tokens=200, output_tokens=50,
+            cache_read_input_tokens=3000, cache_creation_input_tokens=0,
+        ))
+
+        assert usage.input_tokens == 3200
+        assert usage.cached_input_tokens == 3000
+        assert usage.uncached_input_tokens == 200
+
+    def test_from_anthropic_ignores_missing_fields(self):
+        usage = TokenUsage.from_anthropic(Mock(input_tokens=10, output_tokens=5))
+
+        assert (usage.input_tokens, usage.cached_input_tokens) == (10, 0)
+
+    def test_from_openai_reads_cached_tokens_detail(self):
+        usage = TokenUsage.from_openai({
+            "prompt_tokens": 1000, "completion_tokens": 20,
+            "prompt_tokens_details": {"cached_tokens": 800},
+        })
+
+        assert usage.input_tokens == 1000
+        assert usage.uncached_input_tokens == 200
+
+    def test_gateway_response_reports_cached_tokens(self):
+        provider = GatewayProvider(gateway_url="http://gateway")
+        response = provider._parse_response({
+            "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 1000, "completion_tokens": 20,
+                      "prompt_tokens_details": {"cached_tokens": 800}},
+        })
+
+        assert response.cache_read_input_tokens == 800
+        assert response.uncached_input_tokens == 200
+
+
+class TestCallLLMPromptCaching:
+
+    @patch('workflows.shared.llm_integration.anthropic')
+    def test_cache_prefix_sent_and_usage_recorded_per_chapter(self, mock_anthropic):
+        mock_client = Mock()
+        mock_anthropic.Anthropic.return_value = mock_client
+        mock_response = Mock()
+        mock_response.content = [Mock(text="annotation")]
+        mock_response.stop_reason = "end_turn"
+        mock_response.usage = SimpleNamespace(
+            input_tokens=100, output_tokens=40,
+            cache_read_input_tokens=2000, cache_creation_input_tokens=0,
+        )
+        mock_client.messages.create.return_value = mock_response
+
+        llm_integration._call_anthropic_api(
+            1, "PREFIXchapter", "sys", 1000, cache_prefix="PREFIX", chapter_num=4
+        )
+        llm_integration._call_anthropic_api(
+            2, "PREFIXchapter", "sys", 1000, cache_prefix="PREFIX", chapter_num=4
+        )
+
+        kwargs = mock_client.messages.create.call_args[1]
+        assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+        assert kwargs["messages"][0]["content"][0]["text"] == "PREFIX"
+
+        usage = llm_integration.get_chapter_token_usage(4)
+        assert usage.calls == 2
+        assert usage.cached_input_tokens == 4000
+        assert usage.uncached_input_tokens == 200
+        assert llm_integration.get_chapter_token_usage(5).calls == 0
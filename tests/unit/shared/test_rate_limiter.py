@@ -0,0 +1,342 @@
+"""
+Tests for workflows/shared/rate_limiter.py
+
+Token-bucket governor shared by every LLM entry point: requests/min,
+input tokens/min and output tokens/min, reserved before a call and settled
+to actual usage afterwards.
+
+Test Coverage:
+- Disabled limiter is a no-op
+- Buckets block until refilled (fake clock, no real sleeping)
+- Settle refunds over-estimates and charges overruns
+- Async acquisition
+- Cross-process shared state file, locked and rewritten off the event loop
+- Concurrency governor (in-flight cap) for threads and tasks
+- Process-wide limiter from environment
+- Gateway client routes every chat completion attempt through the limiter
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from workflows.shared import rate_limiter as rl
+from workflows.shared.clients.llm_gateway import (
+    GatewayAPIError,
+    GatewayTimeoutError,
+    LLMGatewayClient,
+)
+from workflows.shared.rate_limiter import (
+    LLMRateLimiter,
+    RateLimits,
+    estimate_messages_tokens,
+    estimate_tokens,
+    get_rate_limiter,
+    set_rate_limiter,
+)
+
+
+class FakeClock:
+    """Clock whose sleep advances time instead of blocking."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _limiter(clock: FakeClock, **limits: int) -> LLMRateLimiter:
+    return LLMRateLimiter(RateLimits(**limits), clock=clock, sleep=clock.sleep)
+
+
+class TestEstimates:
+    def test_estimate_tokens_rounds_up(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens(None) == 0
+        assert estimate_tokens("abcde") == 2
+
+    def test_estimate_messages_tokens_sums_string_contents(self):
+        messages = [
+            {"role": "system", "content": "a" * 8},
+            {"role": "user", "content": "b" * 4},
+            {"role": "user", "content": [{"type": "image"}]},
+        ]
+        assert estimate_messages_tokens(messages) == 3
+
+
+class TestLLMRateLimiter:
+    def test_unconfigured_limiter_never_waits(self):
+        clock = FakeClock()
+        limiter = _limiter(clock)
+
+        for _ in range(100):
+            limiter.acquire(10_000, 10_000)
+
+        assert not limiter.enabled
+        assert clock.sleeps == []
+
+    def test_requests_per_minute_blocks_until_refill(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, requests_per_minute=2)
+
+        limiter.acquire(0)
+        limiter.acquire(0)
+        assert clock.sleeps == []
+        limiter.acquire(0)
+
+        # One request refills every 30 seconds at 2 RPM
+        assert sum(clock.sleeps) == pytest.approx(30.0)
+
+    def test_input_and_output_buckets_are_independent(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, input_tokens_per_minute=600, output_tokens_per_minute=60)
+
+        limiter.acquire(100, 60)
+        limiter.acquire(100, 30)
+
+        # Output bucket was empty: 30 tokens at 1 token/s
+        assert sum(clock.sleeps) == pytest.approx(30.0)
+
+    def test_oversized_call_is_clamped_to_capacity(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, input_tokens_per_minute=100)
+
+        limiter.acquire(1_000)
+
+        assert clock.sleeps == []
+
+    def test_settle_refunds_unused_output(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, output_tokens_per_minute=100)
+
+        reservation = limiter.acquire(0, 100)
+        limiter.settle(reservation, 0, 10)
+        limiter.acquire(0, 90)
+
+        assert clock.sleeps == []
+
+    def test_settle_charges_overrun(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, input_tokens_per_minute=60)
+
+        reservation = limiter.acquire(10)
+        limiter.settle(reservation, 70, 0)
+        limiter.acquire(10)
+
+        # Level went to -10; 20 tokens at 1 token/s before the next call fits
+        assert sum(clock.sleeps) == pytest.approx(20.0)
+
+    def test_settle_is_idempotent(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, output_tokens_per_minute=100)
+
+        reservation = limiter.acquire(0, 50)
+        limiter.settle(reservation, 0, 0)
+        limiter.settle(reservation, 0, 0)
+        limiter.acquire(0, 100)
+
+        assert clock.sleeps == []
+
+    def test_release_refunds_output_only(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, tokens_per_minute=120)
+
+        reservation = limiter.acquire(20, 100)
+        limiter.release(reservation)
+        limiter.acquire(0, 100)
+
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_acquire_async_waits_without_blocking_loop(self, monkeypatch):
+        monkeypatch.setattr(rl, "BUCKET_WINDOW_SECONDS", 0.2)
+        limiter = LLMRateLimiter(RateLimits(requests_per_minute=1))
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        await limiter.acquire_async(0)
+        await limiter.acquire_async(0)
+        task.cancel()
+
+        assert ticks >= 5
+
+    def test_shared_state_file_spans_limiter_instances(self, tmp_path):
+        clock = FakeClock()
+        state_file = tmp_path / "limits.json"
+        first = LLMRateLimiter(
+            RateLimits(requests_per_minute=1), state_file=state_file,
+            clock=clock, sleep=clock.sleep,
+        )
+        second = LLMRateLimiter(
+            RateLimits(requests_per_minute=1), state_file=state_file,
+            clock=clock, sleep=clock.sleep,
+        )
+
+        first.acquire(0)
+        second.acquire(0)
+
+        assert sum(clock.sleeps) == pytest.approx(60.0)
+        assert state_file.exists()
+
+    @pytest.mark.asyncio
+    async def test_shared_state_file_io_runs_off_the_event_loop(self, tmp_path, monkeypatch):
+        limiter = LLMRateLimiter(RateLimits(output_tokens_per_minute=100), state_file=tmp_path / "limits.json")
+        loop_thread = threading.get_ident()
+        io_threads = []
+        locked_buckets = limiter._locked_buckets
+
+        def recording_locked_buckets():
+            io_threads.append(threading.get_ident())
+            return locked_buckets()
+
+        monkeypatch.setattr(limiter, "_locked_buckets", recording_locked_buckets)
+
+        reservation = await limiter.acquire_async(0, 50)
+        await limiter.settle_async(reservation, 0, 10)
+
+        assert len(io_threads) == 2
+        assert loop_thread not in io_threads
+
+
+class TestConcurrencyGovernor:
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv(rl.ENV_MAX_CONCURRENT, "3")
+
+        limits = RateLimits.from_env()
+
+        assert limits.max_concurrent_calls == 3
+        assert LLMRateLimiter(limits).enabled
+
+    def test_threads_wait_for_a_free_slot(self):
+        limiter = LLMRateLimiter(RateLimits(max_concurrent_calls=2))
+        peak = 0
+        lock = threading.Lock()
+
+        def call():
+            nonlocal peak
+            reservation = limiter.acquire(0)
+            with lock:
+                peak = max(peak, limiter.in_flight)
+            time.sleep(0.01)
+            limiter.settle(reservation, 0, 0)
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_tasks_wait_for_a_free_slot(self):
+        limiter = LLMRateLimiter(RateLimits(max_concurrent_calls=2))
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            reservation = await limiter.acquire_async(0)
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+            limiter.release(reservation)
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_keep_a_slot(self):
+        limiter = LLMRateLimiter(RateLimits(max_concurrent_calls=1))
+        held = await limiter.acquire_async(0)
+        waiter = asyncio.create_task(limiter.acquire_async(0))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release(held)
+
+        reservation = await asyncio.wait_for(limiter.acquire_async(0), timeout=1.0)
+        assert limiter.in_flight == 1
+        limiter.release(reservation)
+        assert limiter.in_flight == 0
+
+
+class TestProcessWideLimiter:
+    def test_get_rate_limiter_reads_environment(self, monkeypatch):
+        monkeypatch.setenv(rl.ENV_RPM, "50")
+        monkeypatch.setenv(rl.ENV_OUTPUT_TPM, "0")
+        set_rate_limiter(None)
+        try:
+            limiter = get_rate_limiter()
+            assert limiter.limits.requests_per_minute == 50
+            assert limiter.limits.output_tokens_per_minute is None
+            assert get_rate_limiter() is limiter
+        finally:
+            set_rate_limiter(None)
+
+    @pytest.mark.asyncio
+    async def test_gateway_chat_completion_settles_actual_usage(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, output_tokens_per_minute=100)
+        client = LLMGatewayClient(rate_limiter=limiter)
+        client._post = AsyncMock(return_value={
+            "choices": [], "usage": {"prompt_tokens": 5, "completion_tokens": 10},
+        })
+
+        await client.chat_completion(
+            model="m", messages=[{"role": "user", "content": "hi"}], max_tokens=100,
+        )
+        limiter.acquire(0, 90)
+
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_gateway_failure_releases_reservation(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, output_tokens_per_minute=100)
+        client = LLMGatewayClient(rate_limiter=limiter)
+        client._post = AsyncMock(side_effect=GatewayTimeoutError("slow"))
+
+        with pytest.raises(GatewayTimeoutError):
+            await client.chat_completion(
+                model="m", messages=[{"role": "user", "content": "hi"}], max_tokens=100,
+            )
+        limiter.acquire(0, 100)
+
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_gateway_retries_are_charged(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, requests_per_minute=3)
+        client = LLMGatewayClient(rate_limiter=limiter, retry_delay=0.001)
+        client._post = AsyncMock(side_effect=[
+            GatewayAPIError("unavailable", status_code=503),
+            {"choices": [], "usage": {}},
+        ])
+
+        await client.chat_completion(model="m", messages=[{"role": "user", "content": "hi"}])
+        limiter.acquire(0)
+        assert clock.sleeps == []
+        limiter.acquire(0)
+
+        # Both attempts took a request, so the fourth waits for a refill
+        assert sum(clock.sleeps) == pytest.approx(20.0)
@@ -25,15 +25,27 @@ Test Coverage:
 - Test retry callbacks
 """
 
+import asyncio
 import pytest
+import random
 import time
 import math
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch, call
 from workflows.shared.retry import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    JITTER_NONE,
+    CircuitBreaker,
+    CircuitOpenError,
     RetryConfig,
     RetryExhaustedError,
     call_llm_with_retry,
     call_with_retry,
+    parse_retry_after,
+    retry_call,
+    retry_call_async,
 )
 from workflows.shared.providers.base import LLMProvider, LLMResponse, LLMError
 
@@ -66,6 +78,7 @@ def retry_config():
         initial_delay=0.1,  # Fast for testing
         max_delay=1.0,
         constraint_tightening_factor=0.8,
+        jitter=JITTER_NONE,  # Deterministic delays for timing assertions
     )
 
 
@@ -569,3 +582,195 @@ class TestRetryPatternCompliance:
         
         # Assert - same input produces same output (idempotent)
         assert result1.content == result2.content
+
+
+class TestSharedRetryEngine:
+    """
+    Test the shared sync/async retry engine used by all HTTP clients.
+    
+    Pattern: Decorrelated jitter, Retry-After, deadline budget, circuit breaker
+    """
+    
+    def _failing(self, failures, error_factory=lambda: LLMError("transient")):
+        calls = []
+        
+        def fn(attempt):
+            calls.append(attempt)
+            if len(calls) <= failures:
+                raise error_factory()
+            return "ok"
+        
+        return fn, calls
+    
+    def test_decorrelated_jitter_stays_within_bounds(self):
+        """Each delay is drawn from [initial_delay, 3 * previous], capped at max_delay."""
+        config = RetryConfig(initial_delay=1.0, max_delay=20.0)
+        rng = random.Random(7)
+        previous = config.initial_delay
+        for attempt in range(20):
+            delay = config.next_delay(attempt, previous, rng)
+            assert 1.0 <= delay <= min(20.0, previous * 3)
+            previous = delay
+    
+    def test_jittered_delays_differ_between_workers(self):
+        """Concurrent workers with independent RNGs do not back off in lock-step."""
+        config = RetryConfig(initial_delay=1.0)
+        delays = {config.next_delay(0, 1.0, random.Random(seed)) for seed in range(10)}
+        assert len(delays) > 1
+    
+    def test_retry_call_retries_then_succeeds(self):
+        fn, calls = self._failing(2)
+        sleeps = []
+        
+        result = retry_call(fn, RetryConfig(max_attempts=3, initial_delay=0.01), sleep=sleeps.append)
+        
+        assert result == "ok"
+        assert calls == [0, 1, 2]
+        assert len(sleeps) == 2
+    
+    def test_non_retryable_error_propagates_immediately(self):
+        fn, calls = self._failing(5, error_factory=lambda: ValueError("bad request"))
+        
+        with pytest.raises(ValueError):
+            retry_call(fn, RetryConfig(max_attempts=3), retry_on=(LLMError,), sleep=lambda _: None)
+        assert calls == [0]
+    
+    def test_retry_after_hint_extends_delay(self):
+        
+        def error_factory():
+            error = LLMError("rate limited")
+            error.retry_after = 5.0
+            return error
+        
+        fn, _ = self._failing(1, error_factory)
+        sleeps = []
+        retry_call(fn, RetryConfig(initial_delay=0.01, max_delay=0.02), sleep=sleeps.append)
+        
+        assert sleeps == [5.0]
+    
+    def test_retry_after_hint_is_capped(self):
+        """A day-long Retry-After does not park a worker; it is capped at max_retry_after."""
+        
+        def error_factory():
+            error = LLMError("rate limited")
+            error.retry_after = 86400.0
+            return error
+        
+        fn, _ = self._failing(1, error_factory)
+        sleeps = []
+        config = RetryConfig(initial_delay=0.01, max_delay=60.0, max_retry_after=90.0)
+        retry_call(fn, config, sleep=sleeps.append)
+        
+        assert sleeps == [90.0]
+    
+    def test_deadline_budget_stops_retrying(self):
+        fn, calls = self._failing(10)
+        config = RetryConfig(max_attempts=10, initial_delay=1.0, jitter=JITTER_NONE, deadline=2.5)
+        now = [0.0]
+        
+        def sleep(seconds):
+            now[0] += seconds
+        
+        with pytest.raises(RetryExhaustedError) as exc_info:
+            retry_call(fn, config, sleep=sleep, clock=lambda: now[0])
+        
+        # Delays 1s then 2s: the second would overrun the 2.5s budget
+        assert exc_info.value.deadline_exceeded is True
+        assert calls == [0, 1]
+    
+    def test_circuit_breaker_opens_and_half_opens(self):
+        now = [0.0]
+        breaker = CircuitBreaker("svc", failure_threshold=2, reset_timeout=10.0, clock=lambda: now[0])
+        config = RetryConfig(max_attempts=1)
+        
+        for _ in range(2):
+            fn, _calls = self._failing(1)
+            with pytest.raises(RetryExhaustedError):
+                retry_call(fn, config, breaker=breaker)
+        assert breaker.state == CIRCUIT_OPEN
+        
+        fn, calls = self._failing(0)
+        with pytest.raises(CircuitOpenError):
+            retry_call(fn, config, breaker=breaker)
+        assert calls == []
+        
+        now[0] = 10.0
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        assert retry_call(fn, config, breaker=breaker) == "ok"
+        assert breaker.state == CIRCUIT_CLOSED
+    
+    def test_parse_retry_after_seconds_and_http_date(self):
+        now = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        
+        assert parse_retry_after("3") == pytest.approx(3.0)
+        assert parse_retry_after("Wed, 01 Jan 2025 12:00:30 GMT", now=now) == pytest.approx(30.0)
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("inf") is None
+        assert parse_retry_after("nan") is None
+    
+    @pytest.mark.asyncio
+    async def test_retry_call_async_retries_then_succeeds(self):
+        attempts = []
+        
+        async def fn(attempt):
+            attempts.append(attempt)
+            if attempt == 0:
+                raise LLMError("transient")
+            return "ok"
+        
+        result = await retry_call_async(fn, RetryConfig(initial_delay=0.001, max_delay=0.002))
+        
+        assert result == "ok"
+        assert attempts == [0, 1]
+    
+    def _half_open_breaker(self):
+        now = [0.0]
+        breaker = CircuitBreaker("svc", failure_threshold=1, reset_timeout=10.0, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 10.0
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        return breaker
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_half_open_trial_is_released(self):
+        breaker = self._half_open_breaker()
+        started = asyncio.Event()
+        
+        async def hang(attempt):
+            started.set()
+            await asyncio.sleep(60)
+        
+        task = asyncio.create_task(retry_call_async(hang, RetryConfig(max_attempts=1), breaker=breaker))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        
+        # The next caller gets the trial instead of CircuitOpenError
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        fn, calls = self._failing(0)
+        assert retry_call(fn, RetryConfig(max_attempts=1), breaker=breaker) == "ok"
+        assert breaker.state == CIRCUIT_CLOSED
+    
+    def test_interrupted_half_open_trial_is_released(self):
+        breaker = self._half_open_breaker()
+        
+        def interrupted(attempt):
+            raise KeyboardInterrupt
+        
+        with pytest.raises(KeyboardInterrupt):
+            retry_call(interrupted, RetryConfig(max_attempts=1), breaker=breaker)
+        
+        fn, calls = self._failing(0)
+        assert retry_call(fn, RetryConfig(max_attempts=1), breaker=breaker) == "ok"
+    
+    def test_finished_operation_does_not_release_another_trial(self):
+        breaker = self._half_open_breaker()
+        assert breaker.before_call() is True  # another caller's trial in flight
+        
+        with pytest.raises(CircuitOpenError):
+            retry_call(lambda attempt: "ok", RetryConfig(max_attempts=1), breaker=breaker)
+        
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
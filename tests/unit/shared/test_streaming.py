@@ -0,0 +1,221 @@
+"""
+Tests for streamed LLM calls (workflows/shared/streaming.py and the
+streaming path of llm_integration._call_anthropic_api).
+
+Covers:
+- Incremental JSON validation across arbitrary chunk boundaries
+- Early abort on irrecoverable structure errors (the rest of the stream is
+  never read)
+- Time-to-first-token and tokens/sec reporting
+"""
+
+from itertools import count
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from workflows.shared import llm_integration
+from workflows.shared.streaming import (
+    IncrementalJSONValidator,
+    StreamAbortedError,
+    StreamMonitor,
+)
+
+
+def _feed_in_chunks(text, size):
+    validator = IncrementalJSONValidator()
+    for i in range(0, len(text), size):
+        if validator.feed(text[i:i + size]):
+            break
+    return validator
+
+
+class TestIncrementalJSONValidator:
+
+    @pytest.mark.parametrize("size", [1, 3, 1000])
+    def test_valid_json_with_fence_and_trailer(self, size):
+        text = (
+            "Here is the analysis:\n```json\n"
+            '{"requests": [{"book_title": "Fluent Python", "chapter": 9, '
+            '"score": -1.5e3, "ok": true, "note": null, "q": "say \\"hi\\" {"}]}\n'
+            "```\nSHA256: abc"
+        )
+
+        validator = _feed_in_chunks(text, size)
+
+        assert validator.error is None
+        assert validator.complete
+
+    @pytest.mark.parametrize("text, fragment", [
+        ("{'book_title': 'x'}", "Unexpected \"'\""),
+        ('{"a": 1,}', "Unexpected '}'"),
+        ('[1, 2,]', "Unexpected ']'"),
+        ('{"a": [1, 2}', "Mismatched '}'"),
+        ('{"a": tru }', "Invalid literal 'tru'"),
+        ('{"a": 01}', "Invalid literal '01'"),
+        ('{"a": "line\nbreak"}', "Unescaped control character"),
+        ('{"a" 1}', "expected ':'"),
+    ])
+    def test_irrecoverable_errors_reported(self, text, fragment):
+        validator = _feed_in_chunks(text, 2)
+
+        assert validator.error is not None
+        assert fragment in validator.error
+
+    def test_incomplete_json_is_not_an_error(self):
+        validator = _feed_in_chunks('{"requests": [{"book_title": "Flu', 4)
+
+        assert validator.error is None
+        assert validator.started and not validator.complete
+
+    def test_brace_inside_prose_line_is_preamble(self):
+        validator = _feed_in_chunks("Use {braces] freely.\n[1]", 5)
+
+        assert validator.error is None
+        assert validator.complete
+
+    @pytest.mark.parametrize("size", [1, 7, 5000])
+    def test_json_after_prose_on_same_line(self, size):
+        body = ", ".join(f'"key{i}": "{"x" * 40}"' for i in range(60))
+        text = "Here is the analysis: {" + body + "}"
+        assert len(text) > 2000
+
+        validator = _feed_in_chunks(text, size)
+
+        assert validator.error is None
+        assert validator.complete
+
+    def test_malformed_json_after_prose_still_aborts(self):
+        body = ", ".join(f'"key{i}": "{"x" * 40}"' for i in range(60))
+        validator = _feed_in_chunks("Here is the analysis: {" + body + ",}", 50)
+
+        assert validator.error is not None
+        assert "Unexpected '}'" in validator.error
+
+    def test_preamble_limit(self):
+        validator = IncrementalJSONValidator(max_preamble_chars=20)
+
+        assert "No JSON value within 20 chars" in validator.feed("I cannot help with that request.")
+
+
+class TestStreamMonitor:
+
+    def test_ttft_and_tokens_per_second(self):
+        ticks = count()
+        monitor = StreamMonitor(clock=lambda: float(next(ticks)))  # start=0
+
+        monitor.feed("")          # empty deltas don't count as first token
+        monitor.feed("hello ")    # t=1
+        monitor.feed("world")
+        metrics = monitor.finish(output_tokens=30)  # t=2
+
+        assert monitor.text == "hello world"
+        assert metrics.ttft_seconds == 1.0
+        assert metrics.duration_seconds == 2.0
+        assert metrics.tokens_per_second == 30.0
+        assert "TTFT 1.00s" in metrics.describe()
+
+    def test_abort_estimates_tokens_from_chars(self):
+        monitor = StreamMonitor(expect_json=True)
+
+        with pytest.raises(StreamAbortedError) as exc_info:
+            monitor.feed("{'key': " + "x" * 40)
+
+        assert exc_info.value.metrics.aborted
+        assert exc_info.value.metrics.output_tokens == 48 // 4
+        assert exc_info.value.partial_text.startswith("{'key'")
+
+
+class _FakeStream:
+    """Stands in for anthropic's MessageStream context manager."""
+
+    def __init__(self, chunks, final_message):
+        self.chunks = chunks
+        self.final_message = final_message
+        self.read = 0
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.closed = True
+        return False
+
+    @property
+    def text_stream(self):
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+    def get_final_message(self):
+        return self.final_message
+
+
+def _final_message(text, output_tokens):
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        stop_reason="end_turn",
+        usage=SimpleNamespace(input_tokens=100, output_tokens=output_tokens),
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics():
+    llm_integration.reset_stream_metrics()
+    llm_integration.reset_token_usage()
+    yield
+    llm_integration.reset_stream_metrics()
+    llm_integration.reset_token_usage()
+
+
+class TestStreamingCall:
+
+    @patch('workflows.shared.llm_integration.anthropic')
+    def test_streamed_response_returned_with_metrics(self, mock_anthropic):
+        chunks = ['[{"book_title": "A", ', '"chapter": 1, "reason": "r"}]']
+        fake = _FakeStream(chunks, _final_message("".join(chunks), 20))
+        mock_anthropic.Anthropic.return_value.messages.stream.return_value = fake
+
+        text = llm_integration._call_anthropic_api(
+            1, "prompt", "sys", 1000, chapter_num=3, stream=True, expect_json=True
+        )
+
+        assert text == "".join(chunks)
+        assert fake.closed
+        metrics = llm_integration.get_stream_metrics(3)
+        assert len(metrics) == 1
+        assert metrics[0].output_tokens == 20 and not metrics[0].aborted
+        assert llm_integration.get_chapter_token_usage(3).output_tokens == 20
+
+    @patch('workflows.shared.llm_integration.anthropic')
+    def test_malformed_json_aborts_stream_early(self, mock_anthropic):
+        chunks = ["{'book_title': ", "'A'}"] + ["padding"] * 50
+        fake = _FakeStream(chunks, _final_message("", 0))
+        client = mock_anthropic.Anthropic.return_value
+        client.messages.stream.return_value = fake
+        limiter = Mock()
+
+        with patch('workflows.shared.llm_integration.get_rate_limiter', return_value=limiter):
+            with pytest.raises(StreamAbortedError):
+                llm_integration._call_anthropic_api(
+                    1, "prompt", "sys", 1000, chapter_num=3, stream=True, expect_json=True
+                )
+
+        assert fake.read == 1
+        assert fake.closed
+        limiter.settle.assert_called_once()
+        assert llm_integration.get_stream_metrics(3)[0].aborted
+        client.messages.create.assert_not_called()
+
+    @patch('workflows.shared.llm_integration._call_anthropic_api')
+    @patch('workflows.shared.llm_integration.ANTHROPIC_AVAILABLE', True)
+    def test_call_llm_streams_when_env_enabled(self, mock_call, monkeypatch):
+        monkeypatch.setenv("LLM_STREAMING_ENABLED", "true")
+        mock_call.return_value = "{}"
+
+        llm_integration.call_llm("prompt", expect_json=True)
+
+        assert mock_call.call_args[1]["stream"] is True
+        assert mock_call.call_args[1]["expect_json"] is True
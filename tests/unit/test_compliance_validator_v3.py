@@ -424,3 +424,83 @@ class TestProgressIndicators:
         
         # Should show progress indicators in stderr
         assert "[" in captured.err or "%" in captured.err or "Validating" in captured.err
+
+
+VALID_DOC = (
+    "## Chapter 1: Intro\n\n### Chapter Summary\n" + "Detailed summary text. " * 10 + "[^1]\n\n"
+    "```python\nx = 1\n```\n\nSee the listing above. [^2]\n\n"
+    "### Cross-Text Analysis\n" + "Scholarly comparison. " * 40 + "\n\n"
+    "[^1]: Author. *Book*. (JSON `book.json`, p. 1, lines 1-2).\n"
+    "[^2]: Author. *Book*. (JSON `book.json`, p. 2, lines 3-4).\n"
+)
+
+
+class TestStreamingRuleEngine:
+    """Single-pass line-oriented rule engine"""
+    
+    def _errors(self, content, **kwargs):
+        validator = ComplianceValidator(**kwargs)
+        validator.rules["verbatim_block"] = {"pattern": "", "enabled": True}
+        return validator._run_validations(content)
+    
+    def test_valid_document_passes(self):
+        assert self._errors(VALID_DOC) == []
+    
+    def test_reports_line_numbers(self):
+        content = "# Title\n\ntext [^1]\n\n```\ncode\n```\n\nno footnote\n\n```\nunclosed\n"
+        
+        errors = self._errors(content)
+        
+        assert [e["line"] for e in errors if e["rule"] == "verbatim_block"] == [5, 11]
+        assert [e["line"] for e in errors if e["rule"] == "chicago_citation"] == [3]
+    
+    def test_definition_on_following_line_counts(self):
+        content = VALID_DOC.replace("[^2]: Author.", "[^2]:\nAuthor.").replace("[^1]: Author", "Author")
+        
+        assert [e for e in self._errors(content) if e["rule"] == "chicago_citation"] == []
+    
+    def test_short_summary_is_reported(self):
+        content = "## Chapter 1: Intro [^1]\n\n### Chapter Summary\nToo brief.\n\n[^1]: Author.\n"
+        
+        messages = [e["message"] for e in self._errors(content)]
+        
+        assert any("Content too short" in m for m in messages)
+        assert any("Chapter summaries appear empty" in m for m in messages)
+    
+    def test_missing_file_raises_valueerror(self, tmp_path):
+        validator = ComplianceValidator(md_file=tmp_path / "missing.md")
+        
+        with pytest.raises(ValueError, match="Markdown file not found"):
+            validator.validate(output_format="json")
+
+
+class TestParallelValidation:
+    """validate_all across worker processes with a combined JUnit report"""
+    
+    def _write_files(self, tmp_path):
+        (tmp_path / "a.md").write_text(VALID_DOC)
+        (tmp_path / "b.md").write_text("# B\n\n```\n<code> & \"quotes\"\n```\n")
+        (tmp_path / "c.md").write_text(VALID_DOC)
+    
+    def test_parallel_matches_serial(self, tmp_path):
+        self._write_files(tmp_path)
+        
+        serial = ComplianceValidator(input_dir=tmp_path, workers=1, quiet=True).validate_all()
+        parallel = ComplianceValidator(input_dir=tmp_path, workers=3, quiet=True).validate_all()
+        
+        assert parallel == serial
+        assert list(parallel["files"]) == ["a.md", "b.md", "c.md"]
+        assert not parallel["files"]["b.md"]["summary"]["passed"]
+    
+    def test_combined_junit_report(self, tmp_path):
+        import xml.etree.ElementTree as ET
+        self._write_files(tmp_path)
+        validator = ComplianceValidator(input_dir=tmp_path, workers=2, quiet=True)
+        
+        root = ET.fromstring(validator.validate_all(output_format="junit"))
+        
+        assert root.tag == "testsuites"
+        assert [suite.get("name") for suite in root] == ["a.md", "b.md", "c.md"]
+        failures = root.findall("./testsuite[@name='b.md']/testcase/failure")
+        assert failures and all(f.text.strip().startswith("Line ") for f in failures)
+        assert root.findall("./testsuite[@name='a.md']//failure") == []
@@ -10,253 +10,131 @@ References:
     - Python Distilled Ch. 10: Exception handling best practices
 """
 
-import json
 import sys
 import pytest
 from pathlib import Path
-from unittest.mock import patch, mock_open, MagicMock
+from unittest.mock import patch
 
 # Add workflows to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "workflows" / "base_guideline_generation" / "scripts"))
 
+import chapter_generator_all_text as generator
 from chapter_generator_all_text import (
-    _convert_markdown_to_json,
+    GuidelineChapter,
+    GuidelineDocument,
     _write_output_file,
-    _extract_book_metadata
 )
 
 
+def _document(chapters=True):
+    document = GuidelineDocument(book_name="TestBook", full_title="Test Book", total_chapters=1)
+    if chapters:
+        document.chapters.append(GuidelineChapter(
+            chapter_num=1, title="Test Chapter", start_page=1, end_page=10,
+            summary="Test summary", summary_footnote_num=1,
+        ))
+    return document
+
+
+@pytest.fixture
+def output_paths(tmp_path, monkeypatch):
+    """Redirect guideline output into tmp_path."""
+    md_path = tmp_path / "TestBook_guideline.md"
+    json_path = tmp_path / "TestBook_guideline.json"
+    monkeypatch.setattr(generator, "_prepare_output_paths", lambda _name: (md_path, json_path))
+    return md_path, json_path
+
+
 class TestErrorHandlingPatterns:
     """Test EAFP error handling in JSON generation."""
-    
-    def test_convert_empty_docs_raises_valueerror(self):
+
+    def test_document_without_chapters_raises_valueerror(self):
         """
-        Verify empty document raises ValueError with clear message.
-        
-        EAFP pattern: Try to convert, catch specific exception.
-        
+        Verify a document without chapters raises ValueError with clear message.
+
         References:
             - Fluent Python Ch. 18: EAFP style error handling
         """
-        with pytest.raises(ValueError, match="Cannot convert empty document"):
-            _convert_markdown_to_json([], "TestBook", [])
-    
-    def test_convert_none_docs_raises_valueerror(self):
-        """
-        Verify None document raises ValueError.
-        
-        Tests graceful handling of invalid input types.
-        """
-        with pytest.raises(ValueError, match="Cannot convert empty document"):
-            _convert_markdown_to_json(None, "TestBook", [])
-    
-    def test_convert_no_chapters_raises_valueerror(self):
-        """
-        Verify markdown without chapters raises ValueError.
-        
-        Ensures we validate markdown structure before proceeding.
-        """
-        invalid_md = ["# Some Title", "Just plain text without chapters"]
-        
         with pytest.raises(ValueError, match="No chapters found"):
-            _convert_markdown_to_json(invalid_md, "TestBook", [])
-    
-    def test_write_file_permission_error_propagates(self, tmp_path, capsys):
+            _document(chapters=False).to_json()
+
+    def test_write_file_permission_error_propagates(self, output_paths, capsys):
         """
         Verify PermissionError is caught, logged, and re-raised.
-        
+
         EAFP pattern: Try to write, catch PermissionError, log, raise.
-        
+
         References:
             - ARCHITECTURE_GUIDELINES Ch. 12: Error handling and logging
         """
-        # Create markdown that will pass parsing
-        all_docs = [
-            "# Test Book",
-            "*Source: Test Source*",
-            "",
-            "## Chapter 1: Test Chapter",
-            "*Source: Test Book, pages 1–10*",
-            "",
-            "### Cross-Text Analysis",
-            "Test analysis",
-            "",
-            "### Chapter Summary",
-            "Test summary"
-        ]
-        
-        # Mock Path.write_text to raise PermissionError
-        with patch('pathlib.Path.write_text', side_effect=PermissionError("Access denied")):
+        with patch("builtins.open", side_effect=PermissionError("Access denied")):
             with pytest.raises(PermissionError):
-                _write_output_file(all_docs, "TestBook", [])
-        
-        # Check error message was logged
+                _write_output_file(_document())
+
         captured = capsys.readouterr()
         assert "Permission denied" in captured.out
-        assert "PYTHON_GUIDELINES_TestBook.md" in captured.out
-    
-    def test_write_file_oserror_propagates(self, tmp_path, capsys):
+        assert "TestBook_guideline.md" in captured.out
+
+    def test_write_file_oserror_propagates(self, output_paths, capsys):
         """
         Verify OSError (e.g., disk full) is caught, logged, and re-raised.
-        
+
         EAFP pattern: Try to write, catch OSError, log, raise.
         """
-        all_docs = [
-            "# Test Book",
-            "*Source: Test Source*",
-            "",
-            "## Chapter 1: Test Chapter",
-            "*Source: Test Book, pages 1–10*",
-            "",
-            "### Cross-Text Analysis",
-            "Test analysis",
-            "",
-            "### Chapter Summary",
-            "Test summary"
-        ]
-        
-        # Mock Path.write_text to raise OSError (disk full)
-        with patch('pathlib.Path.write_text', side_effect=OSError(28, "No space left on device")):
+        with patch("builtins.open", side_effect=OSError(28, "No space left on device")):
             with pytest.raises(OSError):
-                _write_output_file(all_docs, "TestBook", [])
-        
-        # Check error message was logged
+                _write_output_file(_document())
+
         captured = capsys.readouterr()
         assert "OS error" in captured.out
-    
-    def test_json_serialization_error_graceful_degradation(self, tmp_path, capsys, monkeypatch):
+
+    def test_json_serialization_error_graceful_degradation(self, output_paths, capsys):
         """
         Verify JSON serialization TypeError is caught and MD-only output succeeds.
-        
+
         EAFP pattern: Try JSON dump, catch TypeError, log warning, continue.
         This tests graceful degradation - MD file created even if JSON fails.
-        
+
         References:
             - ARCHITECTURE_GUIDELINES Ch. 12: Graceful degradation
         """
-        # Change to tmp directory for file output
-        monkeypatch.chdir(tmp_path)
-        
-        all_docs = [
-            "# Test Book",
-            "*Source: Test Source*",
-            "",
-            "## Chapter 1: Test Chapter",
-            "*Source: Test Book, pages 1–10*",
-            "",
-            "### Cross-Text Analysis",
-            "Test analysis",
-            "",
-            "### Chapter Summary",
-            "Test summary"
-        ]
-        
-        # Mock json.dump to raise TypeError (non-serializable data)
-        with patch('json.dump', side_effect=TypeError("Object not JSON serializable")):
+        md_path, _ = output_paths
+
+        with patch("json.dump", side_effect=TypeError("Object not JSON serializable")):
             # Should NOT raise - graceful degradation
-            _write_output_file(all_docs, "TestBook", [])
-        
-        # Check MD file was created
-        md_path = tmp_path / "PYTHON_GUIDELINES_TestBook.md"
+            _write_output_file(_document())
+
         assert md_path.exists()
-        
-        # Check warning was logged
         captured = capsys.readouterr()
         assert "JSON serialization error" in captured.out
         assert "Markdown file created successfully" in captured.out
-    
-    def test_markdown_parse_error_graceful_degradation(self, tmp_path, capsys, monkeypatch):
+
+    def test_empty_document_graceful_degradation(self, output_paths, capsys):
         """
-        Verify markdown parse errors allow MD-only output.
-        
-        Tests graceful degradation when JSON conversion fails but MD is valid.
+        Verify a document without chapters still produces the MD file.
+
+        Tests graceful degradation when JSON rendering fails but MD is valid.
         """
-        # Change to tmp directory for file output
-        monkeypatch.chdir(tmp_path)
-        
-        all_docs = [
-            "# Test Book",
-            "Valid markdown but will fail JSON parsing"
-        ]
-        
+        md_path, json_path = output_paths
+
         # Should NOT raise - graceful degradation
-        _write_output_file(all_docs, "TestBook", [])
-        
-        # Check MD file was created
-        md_path = tmp_path / "PYTHON_GUIDELINES_TestBook.md"
+        _write_output_file(_document(chapters=False))
+
         assert md_path.exists()
-        
-        # Check warning was logged
+        assert not json_path.exists()
         captured = capsys.readouterr()
-        assert "Failed to parse markdown" in captured.out or "No chapters found" in captured.out
+        assert "No chapters found" in captured.out
         assert "Markdown file created successfully" in captured.out
-    
-    def test_malformed_chapter_skipped_with_warning(self, capsys):
-        """
-        Verify malformed chapter is skipped with warning, other chapters processed.
-        
-        EAFP pattern: Try to parse chapter, catch error, log, continue.
-        
-        Note: Chapter with non-numeric number won't match regex, so won't trigger handler.
-        This test verifies a chapter that matches but has invalid page range format.
-        
-        References:
-            - ARCHITECTURE_GUIDELINES Ch. 12: Continue on error for events
-        """
-        # Note: regex (\d+) won't match "INVALID", so that chapter is simply ignored by regex
-        # This tests that we successfully parse valid chapters even if some are malformed
-        all_docs = [
-            "# Test Book",
-            "*Source: Test Source*",
-            "",
-            "## Chapter 1: Valid Chapter",
-            "*Source: Test Book, pages 1–10*",
-            "",
-            "### Cross-Text Analysis",
-            "Test analysis",
-            "",
-            "### Chapter Summary",
-            "Test summary",
-            "",
-            "## Chapter INVALID: Malformed",  # Won't match regex - silently ignored
-            "This chapter has invalid structure",
-            "",
-            "## Chapter 2: Another Valid Chapter",
-            "*Source: Test Book, pages 11–20*",
-            "",
-            "### Cross-Text Analysis",
-            "Test analysis 2",
-            "",
-            "### Chapter Summary",
-            "Test summary 2"
-        ]
-        
-        result = _convert_markdown_to_json(all_docs, "TestBook", [])
-        
-        # Should have 2 valid chapters (malformed one doesn't match regex)
-        assert len(result["chapters"]) == 2
-        assert result["chapters"][0]["chapter_number"] == 1
-        assert result["chapters"][1]["chapter_number"] == 2
-        
-        # The "INVALID" chapter doesn't match regex pattern, so no warning logged
-        # This is expected behavior - only chapters matching pattern are processed
 
 
 class TestErrorMessaging:
     """Test error messages are clear and actionable."""
-    
-    def test_empty_doc_error_message_is_clear(self):
-        """Verify error messages guide user to solution."""
-        with pytest.raises(ValueError) as exc_info:
-            _convert_markdown_to_json([], "TestBook", [])
-        
-        assert "empty document" in str(exc_info.value).lower()
-    
+
     def test_no_chapters_error_message_is_clear(self):
         """Verify error specifies what's missing."""
         with pytest.raises(ValueError) as exc_info:
-            _convert_markdown_to_json(["# Title", "No chapters"], "TestBook", [])
-        
+            _document(chapters=False).to_json()
+
         assert "No chapters found" in str(exc_info.value)
 
 
@@ -403,11 +403,12 @@ class TestLLMGatewayClientRetryLogic:
             assert exc_info.value.status_code == 503
 
     @pytest.mark.asyncio
-    async def test_retry_uses_exponential_backoff(self):
+    async def test_retry_uses_jittered_backoff(self):
         """
-        WBS 3.1.1.2.6: Retry uses exponential backoff.
+        WBS 3.1.1.2.6: Retry uses decorrelated-jitter backoff.
         
-        Delay should increase: delay * 2^attempt
+        Each delay is drawn from [retry_delay, 3 * previous delay], so
+        concurrent clients do not retry in lock-step.
         Reference: CODING_PATTERNS §2.3 (exponential backoff pattern)
         """
         from workflows.shared.clients.llm_gateway import LLMGatewayClient
@@ -442,13 +443,14 @@ class TestLLMGatewayClientRetryLogic:
             except Exception:
                 pass
 
-            # Check exponential backoff: first delay ~0.05s, second ~0.1s
+            # Check jittered backoff: first delay in [0.05, 0.15]s,
+            # second in [0.05, 3 * first]
             assert len(call_times) == 3
             delay_1 = call_times[1] - call_times[0]
             delay_2 = call_times[2] - call_times[1]
             
-            # Second delay should be roughly 2x the first (with some tolerance)
-            assert delay_2 > delay_1 * 1.5, f"Expected exponential backoff: {delay_1} -> {delay_2}"
+            assert 0.045 <= delay_1 <= 0.2, f"Unexpected first delay: {delay_1}"
+            assert 0.045 <= delay_2 <= delay_1 * 3 + 0.05, f"Unexpected backoff: {delay_1} -> {delay_2}"
 
 
 class TestLLMGatewayClientErrorClassification:
@@ -12,7 +12,7 @@ Tests cover:
 - embed() method
 - search() method  
 - hybrid_search() method
-- Retry logic with exponential backoff
+- Retry logic with jittered backoff, Retry-After and circuit breaker
 - Error handling
 """
 
@@ -73,6 +73,13 @@ class TestSemanticSearchClientInstantiation:
         assert client.max_retries == 5
         assert client.retry_delay == pytest.approx(2.0)
 
+    def test_client_has_finite_default_retry_deadline(self):
+        """Retries are bounded by a total budget unless the caller opts out."""
+        from workflows.shared.clients.search_client import SemanticSearchClient
+        from workflows.shared.retry import DEFAULT_RETRY_DEADLINE
+
+        assert SemanticSearchClient().retry_deadline == pytest.approx(DEFAULT_RETRY_DEADLINE)
+
 
 class TestSemanticSearchClientContextManager:
     """Test async context manager pattern for connection pooling."""
@@ -347,6 +354,61 @@ class TestSemanticSearchClientRetryLogic:
 
         assert mock_request.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_429_honours_retry_after_header(self):
+        """A Retry-After hint longer than the jittered backoff sets the delay."""
+        from workflows.shared.clients.search_client import SemanticSearchClient
+
+        error_response = MagicMock()
+        error_response.status_code = 429
+        error_response.headers = {"Retry-After": "0.2"}
+
+        success_response = MagicMock()
+        success_response.status_code = 200
+        success_response.json.return_value = {"results": []}
+
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        search_client = SemanticSearchClient(max_retries=3, retry_delay=0.01)
+        async with search_client as client:
+            with patch.object(
+                client._client, "request", new_callable=AsyncMock
+            ) as mock_request, patch(
+                "workflows.shared.retry.asyncio.sleep", side_effect=fake_sleep
+            ):
+                mock_request.side_effect = [error_response, success_response]
+
+                await client.search("test")
+
+        assert sleeps == [pytest.approx(0.2)]
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        """After repeated failed requests the shared breaker stops calling the service."""
+        from workflows.shared.clients.search_client import (
+            SemanticSearchClient,
+            SearchConnectionError,
+        )
+        from workflows.shared.retry import CircuitBreaker
+
+        breaker = CircuitBreaker("search", failure_threshold=1, reset_timeout=60.0)
+        search_client = SemanticSearchClient(max_retries=1, retry_delay=0.01, circuit_breaker=breaker)
+        async with search_client as client:
+            with patch.object(
+                client._client, "request", new_callable=AsyncMock
+            ) as mock_request:
+                mock_request.side_effect = httpx.ConnectError("Connection refused")
+
+                with pytest.raises(SearchConnectionError):
+                    await client.embed("test")
+                with pytest.raises(SearchConnectionError, match="Circuit"):
+                    await client.embed("test")
+
+        assert mock_request.call_count == 1
+
     @pytest.mark.asyncio
     async def test_raises_after_max_retries(self):
         """Client should raise after exhausting retries."""
@@ -11,9 +11,16 @@ Reference:
 - workflows/shared/providers/base.py: LLMProvider protocol, LLMResponse
 """
 
-import pytest
+import json
+import socket
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
 # Import LLMResponse for type checking (exists)
 from workflows.shared.providers.base import LLMResponse, LLMError, LLMProvider
 
@@ -324,3 +331,156 @@ class TestGatewayProviderFactoryIntegration:
 
         assert provider is not None
         assert provider.provider_name == "gateway"
+
+
+# =============================================================================
+# Pooled mode: one loop thread + one keep-alive client per provider
+# =============================================================================
+
+_STUB_COMPLETION = {
+    "choices": [{"message": {"content": "stub", "role": "assistant"}, "finish_reason": "stop"}],
+    "model": "stub-model",
+    "usage": {"prompt_tokens": 3, "completion_tokens": 1, "total_tokens": 4},
+}
+
+
+class _StubGatewayHandler(BaseHTTPRequestHandler):
+    """Minimal /v1/chat/completions stub with HTTP/1.1 keep-alive."""
+
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    requests = 0
+    lock = threading.Lock()
+
+    def setup(self) -> None:
+        # Avoid Nagle/delayed-ACK stalls dominating the measurement
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        super().setup()
+        with _StubGatewayHandler.lock:
+            _StubGatewayHandler.connections += 1
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server API
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        body = json.dumps(_STUB_COMPLETION).encode("utf-8")
+        with _StubGatewayHandler.lock:
+            _StubGatewayHandler.requests += 1
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_gateway():
+    """Local stub gateway; yields its base URL and resets counters."""
+    _StubGatewayHandler.connections = 0
+    _StubGatewayHandler.requests = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubGatewayHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _per_call_ms(provider, calls: int) -> list[float]:
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        provider.call(prompt="ping", max_tokens=5)
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return timings
+
+
+class TestGatewayProviderPooledMode:
+    """Pooled mode reuses one event loop thread and one connection."""
+
+    def test_pooled_defaults_from_env(self, monkeypatch) -> None:
+        """LLM_GATEWAY_POOLED controls the default; explicit arg wins."""
+        from workflows.shared.providers.gateway_provider import GatewayProvider
+
+        monkeypatch.setenv("LLM_GATEWAY_POOLED", "true")
+        assert GatewayProvider().pooled is True
+        assert GatewayProvider(pooled=False).pooled is False
+        monkeypatch.delenv("LLM_GATEWAY_POOLED")
+        assert GatewayProvider().pooled is False
+
+    def test_pooled_calls_share_one_connection(self, stub_gateway: str) -> None:
+        """Many pooled calls → one TCP connection to the gateway."""
+        from workflows.shared.providers.gateway_provider import GatewayProvider
+
+        with GatewayProvider(gateway_url=stub_gateway, pooled=True) as provider:
+            responses = [provider.call(prompt="ping", max_tokens=5) for _ in range(10)]
+
+        assert all(r.content == "stub" for r in responses)
+        assert _StubGatewayHandler.requests == 10
+        assert _StubGatewayHandler.connections == 1
+
+    def test_unpooled_calls_open_connection_per_call(self, stub_gateway: str) -> None:
+        """Legacy mode opens a fresh client (and connection) per call."""
+        from workflows.shared.providers.gateway_provider import GatewayProvider
+
+        provider = GatewayProvider(gateway_url=stub_gateway, pooled=False)
+        for _ in range(3):
+            provider.call(prompt="ping", max_tokens=5)
+
+        assert _StubGatewayHandler.connections == 3
+
+    @pytest.mark.asyncio
+    async def test_call_async_uses_pooled_client(self, stub_gateway: str) -> None:
+        """call_async from another loop reuses the provider's pool."""
+        import asyncio
+
+        from workflows.shared.providers.gateway_provider import GatewayProvider
+
+        provider = GatewayProvider(gateway_url=stub_gateway, pooled=True)
+        try:
+            results = await asyncio.gather(
+                *(provider.call_async(prompt="ping", max_tokens=5) for _ in range(4))
+            )
+        finally:
+            provider.close()
+
+        assert [r.content for r in results] == ["stub"] * 4
+        assert _StubGatewayHandler.connections <= 4
+
+    def test_close_is_idempotent_and_reopens(self, stub_gateway: str) -> None:
+        """close() twice is safe; a later call lazily reopens the pool."""
+        from workflows.shared.providers.gateway_provider import GatewayProvider
+
+        provider = GatewayProvider(gateway_url=stub_gateway, pooled=True)
+        provider.call(prompt="ping", max_tokens=5)
+        provider.close()
+        provider.close()
+
+        assert provider.call(prompt="ping", max_tokens=5).content == "stub"
+        provider.close()
+
+    def test_benchmark_per_call_overhead(self, stub_gateway: str) -> None:
+        """
+        Benchmark: per-call latency against the local stub, before/after.
+
+        Unpooled pays event-loop creation + client/connection setup per call;
+        pooled pays one HTTP round trip.
+        """
+        from workflows.shared.providers.gateway_provider import GatewayProvider
+
+        calls = 30
+        unpooled = _per_call_ms(GatewayProvider(gateway_url=stub_gateway, pooled=False), calls)
+        with GatewayProvider(gateway_url=stub_gateway, pooled=True) as provider:
+            provider.call(prompt="warm-up", max_tokens=5)
+            pooled = _per_call_ms(provider, calls)
+
+        unpooled_median = statistics.median(unpooled)
+        pooled_median = statistics.median(pooled)
+        print(
+            f"\nGatewayProvider per-call overhead ({calls} calls, local stub): "
+            f"unpooled median {unpooled_median:.2f} ms, pooled median {pooled_median:.2f} ms"
+        )
+        assert pooled_median < unpooled_median
@@ -761,3 +761,553 @@ class TestMSE63Provenance:
 
         # Chapter should have enriched keywords
         assert "keywords" in chapter or "enriched_keywords" in chapter
+
+
+# =============================================================================
+# Sharded MSEP Enrichment Tests
+# =============================================================================
+
+
+def _shard_response(
+    book_title: str, chapter_numbers: list[int], cross_refs: int = 1
+) -> Any:
+    """Build an EnrichedMetadataResponse covering the given chapters."""
+    from workflows.shared.clients.msep_client import (
+        CrossReference,
+        EnrichedChapter,
+        EnrichedMetadataResponse,
+        MergedKeywords,
+        Provenance,
+    )
+
+    return EnrichedMetadataResponse(
+        chapters=[
+            EnrichedChapter(
+                book=book_title,
+                chapter=num,
+                title=f"Chapter {num}",
+                chapter_id=f"{book_title}:ch{num}",
+                cross_references=[
+                    CrossReference(
+                        target=f"Other Book:ch{num}",
+                        score=0.8,
+                        base_score=0.75,
+                        topic_boost=0.05,
+                        method="sbert",
+                    )
+                ] * cross_refs,
+                keywords=MergedKeywords(tfidf=[], semantic=[], merged=[f"kw{num}"]),
+                topic_id=num,
+                topic_name=None,
+                graph_relationships=[],
+                provenance=Provenance(
+                    methods_used=["sbert"],
+                    sbert_score=0.8,
+                    topic_boost=0.05,
+                    timestamp="2025-01-01T00:00:00Z",
+                ),
+            )
+            for num in chapter_numbers
+        ],
+        processing_time_ms=10.0,
+        total_cross_references=cross_refs * len(chapter_numbers),
+    )
+
+
+class TestMSEPShardPlanning:
+    """Shard planning bounds each request by characters and chapter count."""
+
+    def test_shards_respect_char_budget(self) -> None:
+        """Shards split when the next chapter would exceed max_chars."""
+        from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+            _plan_msep_shards,
+        )
+
+        corpus = ["a" * 40, "b" * 40, "c" * 40, "d" * 40]
+        assert _plan_msep_shards(corpus, max_chars=100, max_chapters=10) == [[0, 1], [2, 3]]
+
+    def test_shards_respect_chapter_budget(self) -> None:
+        """Shards split when max_chapters is reached."""
+        from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+            _plan_msep_shards,
+        )
+
+        corpus = ["x"] * 5
+        assert _plan_msep_shards(corpus, max_chars=1000, max_chapters=2) == [[0, 1], [2, 3], [4]]
+
+    def test_oversized_chapter_gets_own_shard(self) -> None:
+        """A chapter larger than max_chars is sent alone, never dropped."""
+        from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+            _plan_msep_shards,
+        )
+
+        corpus = ["a" * 10, "b" * 500, "c" * 10]
+        assert _plan_msep_shards(corpus, max_chars=100, max_chapters=10) == [[0], [1], [2]]
+
+
+class TestMSEPShardedEnrichment:
+    """Sharded mode sends bounded batches and merges them in book order."""
+
+    @staticmethod
+    async def _write_book(tmp_path: Path, chapter_count: int) -> Path:
+        input_data = {
+            "book_title": "Test Book",
+            "chapters": [
+                {
+                    "chapter_number": num,
+                    "title": f"Chapter {num}",
+                    "content": "x" * 50,
+                    "summary": "summary",
+                }
+                for num in range(1, chapter_count + 1)
+            ],
+        }
+        input_path = tmp_path / "test_metadata.json"
+        async with aiofiles.open(input_path, "w", encoding="utf-8") as f:
+            await f.write(json.dumps(input_data))
+        return input_path
+
+    @pytest.mark.asyncio
+    async def test_sends_shards_with_shared_corpus_id(self, tmp_path: Path) -> None:
+        """Every shard request carries the same corpus_id and a bounded corpus."""
+        from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+            enrich_metadata_msep,
+        )
+
+        input_path = await self._write_book(tmp_path, chapter_count=5)
+        output_path = tmp_path / "test_enriched.json"
+
+        async def fake_enrich(**kwargs: Any) -> Any:
+            numbers = [meta.chapter for meta in kwargs["chapter_index"]]
+            return _shard_response("Test Book", numbers)
+
+        with patch(
+            "workflows.metadata_enrichment.scripts.enrich_metadata_per_book.MSEPClient"
+        ) as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.enrich_metadata.side_effect = fake_enrich
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.__aexit__.return_value = None
+            mock_client_class.return_value = mock_client
+
+            await enrich_metadata_msep(
+                input_path=input_path,
+                output_path=output_path,
+                shard_max_chars=10_000,
+                shard_max_chapters=2,
+                max_concurrency=2,
+            )
+
+        calls = mock_client.enrich_metadata.call_args_list
+        assert len(calls) == 3
+        assert all(len(c.kwargs["corpus"]) <= 2 for c in calls)
+        corpus_ids = {c.kwargs["corpus_id"] for c in calls}
+        assert len(corpus_ids) == 1
+        assert next(iter(corpus_ids)).startswith("Test Book:")
+
+        output_data = json.loads(output_path.read_text(encoding="utf-8"))
+        assert [ch["chapter_number"] for ch in output_data["chapters"]] == [1, 2, 3, 4, 5]
+        assert [ch["topic_id"] for ch in output_data["chapters"]] == [1, 2, 3, 4, 5]
+        provenance = output_data["enrichment_provenance"]
+        assert provenance["shards"] == 3
+        assert provenance["failed_shards"] == []
+        assert provenance["total_similar_chapters"] == 5
+
+    @pytest.mark.asyncio
+    async def test_failed_shard_only_affects_its_chapters(self, tmp_path: Path) -> None:
+        """A timed-out shard leaves its chapters un-enriched; others merge normally."""
+        from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+            enrich_metadata_msep,
+        )
+        from workflows.shared.clients.msep_client import MSEPTimeoutError
+
+        input_path = await self._write_book(tmp_path, chapter_count=4)
+        output_path = tmp_path / "test_enriched.json"
+
+        async def fake_enrich(**kwargs: Any) -> Any:
+            numbers = [meta.chapter for meta in kwargs["chapter_index"]]
+            if 3 in numbers:
+                raise MSEPTimeoutError("shard timed out")
+            return _shard_response("Test Book", numbers)
+
+        with (
+            patch(
+                "workflows.metadata_enrichment.scripts.enrich_metadata_per_book.MSEPClient"
+            ) as mock_client_class,
+            patch(
+                "workflows.metadata_enrichment.scripts.enrich_metadata_per_book.enrich_metadata_local"
+            ) as mock_local,
+        ):
+            mock_client = AsyncMock()
+            mock_client.enrich_metadata.side_effect = fake_enrich
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.__aexit__.return_value = None
+            mock_client_class.return_value = mock_client
+
+            await enrich_metadata_msep(
+                input_path=input_path,
+                output_path=output_path,
+                shard_max_chars=10_000,
+                shard_max_chapters=2,
+            )
+
+        mock_local.assert_not_called()
+        output_data = json.loads(output_path.read_text(encoding="utf-8"))
+        chapters = output_data["chapters"]
+        assert [len(ch["similar_chapters"]) for ch in chapters] == [1, 1, 0, 0]
+        assert "topic_id" not in chapters[2]
+        assert output_data["enrichment_provenance"]["failed_shards"] == [1]
+
+    @pytest.mark.asyncio
+    async def test_all_shards_failing_falls_back_to_local(self, tmp_path: Path) -> None:
+        """When no shard succeeds, the existing local fallback is used."""
+        from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+            enrich_metadata_msep,
+        )
+        from workflows.shared.clients.msep_client import MSEPConnectionError
+
+        input_path = await self._write_book(tmp_path, chapter_count=4)
+        output_path = tmp_path / "test_enriched.json"
+
+        with (
+            patch(
+                "workflows.metadata_enrichment.scripts.enrich_metadata_per_book.MSEPClient"
+            ) as mock_client_class,
+            patch(
+                "workflows.metadata_enrichment.scripts.enrich_metadata_per_book.enrich_metadata_local"
+            ) as mock_local,
+        ):
+            mock_client = AsyncMock()
+            mock_client.enrich_metadata.side_effect = MSEPConnectionError("refused")
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.__aexit__.return_value = None
+            mock_client_class.return_value = mock_client
+
+            await enrich_metadata_msep(
+                input_path=input_path,
+                output_path=output_path,
+                shard_max_chars=10_000,
+                shard_max_chapters=2,
+            )
+
+        mock_local.assert_called_once_with(input_path, output_path)
+
+    @pytest.mark.asyncio
+    async def test_related_chapters_across_shards_are_not_linked(self, tmp_path: Path) -> None:
+        """Known limitation: similarity is scored per request, so shards never link to each other."""
+        from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+            enrich_metadata_msep,
+        )
+        from workflows.shared.clients.msep_client import CrossReference
+
+        input_path = await self._write_book(tmp_path, chapter_count=4)
+        output_path = tmp_path / "test_enriched.json"
+
+        async def fake_enrich(**kwargs: Any) -> Any:
+            # Every chapter is related to every other chapter it is scored against
+            numbers = [meta.chapter for meta in kwargs["chapter_index"]]
+            response = _shard_response("Test Book", numbers, cross_refs=0)
+            for chapter in response.chapters:
+                chapter.cross_references = [
+                    CrossReference(
+                        target=f"Test Book:ch{other}", score=0.9, base_score=0.85,
+                        topic_boost=0.05, method="sbert",
+                    )
+                    for other in numbers if other != chapter.chapter
+                ]
+            return response
+
+        with patch(
+            "workflows.metadata_enrichment.scripts.enrich_metadata_per_book.MSEPClient"
+        ) as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.enrich_metadata.side_effect = fake_enrich
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.__aexit__.return_value = None
+            mock_client_class.return_value = mock_client
+
+            await enrich_metadata_msep(
+                input_path=input_path,
+                output_path=output_path,
+                shard_max_chars=10_000,
+                shard_max_chapters=2,
+            )
+
+        output_data = json.loads(output_path.read_text(encoding="utf-8"))
+        similar = [
+            [ref["chapter"] for ref in ch["similar_chapters"]] for ch in output_data["chapters"]
+        ]
+        assert similar == [[2], [1], [4], [3]]
+        assert output_data["enrichment_provenance"]["shards"] == 2
+
+    def test_corpus_id_hashes_book_bytes(self) -> None:
+        """The corpus id depends on the title and content bytes, not on re-reading a file."""
+        from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+            _compute_msep_corpus_id,
+        )
+
+        corpus_id = _compute_msep_corpus_id("Test Book", b'{"chapters": []}')
+
+        assert corpus_id.startswith("Test Book:")
+        assert corpus_id == _compute_msep_corpus_id("Test Book", b'{"chapters": []}')
+        assert corpus_id != _compute_msep_corpus_id("Test Book", b'{"chapters": [{}]}')
+        assert corpus_id != _compute_msep_corpus_id("Other Book", b'{"chapters": []}')
+
+
+# =============================================================================
+# Delta Enrichment Tests
+# =============================================================================
+
+
+class TestDeltaEnrichmentPlanning:
+    """Delta planning reuses unchanged chapters and refreshes stale neighbours."""
+
+    @staticmethod
+    def _enriched(chapter: dict[str, Any], refs: list[int] | None = None) -> dict[str, Any]:
+        from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+            compute_chapter_fingerprint,
+        )
+
+        return {
+            **chapter,
+            "similar_chapters": [{"book": "Test Book", "chapter": n} for n in refs or []],
+            "topic_id": 7,
+            "chapter_provenance": {
+                "methods_used": ["sbert"],
+                "content_fingerprint": compute_chapter_fingerprint(chapter),
+            },
+        }
+
+    def test_fingerprint_ignores_non_similarity_fields(self) -> None:
+        """Page ranges and other non-input fields do not change the fingerprint."""
+        from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+            compute_chapter_fingerprint,
+        )
+
+        chapter = {"chapter_number": 1, "title": "Intro", "summary": "s"}
+        assert compute_chapter_fingerprint(chapter) == compute_chapter_fingerprint(
+            {**chapter, "start_page": 10}
+        )
+        assert compute_chapter_fingerprint(chapter) != compute_chapter_fingerprint(
+            {**chapter, "summary": "changed"}
+        )
+
+    def test_unchanged_chapters_are_reused(self) -> None:
+        """Only the edited chapter is scheduled for enrichment."""
+        from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+            plan_delta_enrichment,
+        )
+
+        chapters = [{"chapter_number": n, "title": f"Ch {n}"} for n in (1, 2, 3)]
+        prior = {n: self._enriched(ch) for n, ch in zip((1, 2, 3), chapters)}
+        chapters[1] = {**chapters[1], "summary": "new text"}
+
+        refresh, reused = plan_delta_enrichment(chapters, prior, "Test Book")
+
+        assert refresh == [1]
+        assert sorted(reused) == [0, 2]
+        assert reused[0]["topic_id"] == 7
+
+    def test_neighbour_of_changed_chapter_is_refreshed(self) -> None:
+        """An unchanged chapter referencing a changed chapter is re-enriched."""
+        from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+            plan_delta_enrichment,
+        )
+
+        chapters = [{"chapter_number": n, "title": f"Ch {n}"} for n in (1, 2, 3)]
+        prior = {
+            1: self._enriched(chapters[0], refs=[2]),
+            2: self._enriched(chapters[1]),
+            3: self._enriched(chapters[2], refs=[1]),
+        }
+        chapters[1] = {**chapters[1], "summary": "new text"}
+
+        refresh, reused = plan_delta_enrichment(chapters, prior, "Test Book")
+
+        assert refresh == [0, 1]
+        assert sorted(reused) == [2]
+
+    def test_cross_book_references_do_not_trigger_refresh(self) -> None:
+        """Orchestrator cross-book targets are outside the book and are not compared."""
+        from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+            plan_delta_enrichment,
+        )
+
+        chapters = [{"chapter_number": n, "title": f"Ch {n}"} for n in (1, 2)]
+        prior = {n: self._enriched(ch) for n, ch in zip((1, 2), chapters)}
+        prior[1]["cross_book_references"] = [{"book": "Other Book", "chapter": 2}]
+        chapters[1] = {**chapters[1], "summary": "new text"}
+
+        refresh, reused = plan_delta_enrichment(chapters, prior, "Test Book")
+
+        assert refresh == [1]
+        assert sorted(reused) == [0]
+
+    def test_fallback_enrichment_is_never_reused(self) -> None:
+        """Chapters enriched by the no-ML fallback are always re-enriched."""
+        from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+            plan_delta_enrichment,
+        )
+
+        chapters = [{"chapter_number": 1, "title": "Ch 1"}]
+        prior_chapter = self._enriched(chapters[0])
+        prior_chapter["chapter_provenance"]["methods_used"] = ["fallback"]
+
+        refresh, reused = plan_delta_enrichment(chapters, {1: prior_chapter}, "Test Book")
+
+        assert refresh == [0]
+        assert reused == {}
+
+
+class TestMSEPDeltaEnrichment:
+    """Delta mode keeps prior results for unchanged chapters."""
+
+    @pytest.mark.asyncio
+    async def test_second_run_scores_changed_chapter_against_full_book(self, tmp_path: Path) -> None:
+        """Editing one chapter re-sends the whole book but only refreshes that chapter."""
+        from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+            enrich_metadata_msep,
+        )
+
+        chapters = [
+            {"chapter_number": n, "title": f"Chapter {n}", "summary": f"summary {n}"}
+            for n in (1, 2, 3)
+        ]
+        input_path = tmp_path / "test_metadata.json"
+        output_path = tmp_path / "test_enriched.json"
+        input_path.write_text(
+            json.dumps({"book_title": "Test Book", "chapters": chapters}), encoding="utf-8"
+        )
+
+        async def fake_enrich(**kwargs: Any) -> Any:
+            numbers = [meta.chapter for meta in kwargs["chapter_index"]]
+            return _shard_response("Test Book", numbers, cross_refs=0)
+
+        with patch(
+            "workflows.metadata_enrichment.scripts.enrich_metadata_per_book.MSEPClient"
+        ) as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.enrich_metadata.side_effect = fake_enrich
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.__aexit__.return_value = None
+            mock_client_class.return_value = mock_client
+
+            await enrich_metadata_msep(input_path=input_path, output_path=output_path, delta=True)
+            first_call = mock_client.enrich_metadata.call_args
+            assert [m.chapter for m in first_call.kwargs["chapter_index"]] == [1, 2, 3]
+
+            chapters[2]["summary"] = "rewritten"
+            input_path.write_text(
+                json.dumps({"book_title": "Test Book", "chapters": chapters}), encoding="utf-8"
+            )
+            mock_client.enrich_metadata.reset_mock()
+
+            await enrich_metadata_msep(input_path=input_path, output_path=output_path, delta=True)
+
+        second_call = mock_client.enrich_metadata.call_args
+        assert [m.chapter for m in second_call.kwargs["chapter_index"]] == [1, 2, 3]
+
+        output_data = json.loads(output_path.read_text(encoding="utf-8"))
+        assert [ch["topic_id"] for ch in output_data["chapters"]] == [1, 2, 3]
+        assert output_data["chapters"][2]["summary"] == "rewritten"
+        assert output_data["enrichment_provenance"]["delta"] == {
+            "refreshed_chapters": 1,
+            "reused_chapters": 2,
+        }
+
+    @pytest.mark.asyncio
+    async def test_unchanged_run_sends_nothing(self, tmp_path: Path) -> None:
+        """A second run with no edits makes no MSEP call."""
+        from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+            enrich_metadata_msep,
+        )
+
+        chapters = [
+            {"chapter_number": n, "title": f"Chapter {n}", "summary": f"summary {n}"}
+            for n in (1, 2)
+        ]
+        input_path = tmp_path / "test_metadata.json"
+        output_path = tmp_path / "test_enriched.json"
+        input_path.write_text(
+            json.dumps({"book_title": "Test Book", "chapters": chapters}), encoding="utf-8"
+        )
+
+        async def fake_enrich(**kwargs: Any) -> Any:
+            numbers = [meta.chapter for meta in kwargs["chapter_index"]]
+            return _shard_response("Test Book", numbers, cross_refs=0)
+
+        with patch(
+            "workflows.metadata_enrichment.scripts.enrich_metadata_per_book.MSEPClient"
+        ) as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.enrich_metadata.side_effect = fake_enrich
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.__aexit__.return_value = None
+            mock_client_class.return_value = mock_client
+
+            await enrich_metadata_msep(input_path=input_path, output_path=output_path, delta=True)
+            mock_client.enrich_metadata.reset_mock()
+            await enrich_metadata_msep(input_path=input_path, output_path=output_path, delta=True)
+
+        mock_client.enrich_metadata.assert_not_called()
+        output_data = json.loads(output_path.read_text(encoding="utf-8"))
+        assert output_data["enrichment_provenance"]["delta"] == {
+            "refreshed_chapters": 0,
+            "reused_chapters": 2,
+        }
+
+    @pytest.mark.asyncio
+    async def test_unchanged_chapter_gains_link_to_changed_chapter(self, tmp_path: Path) -> None:
+        """An unchanged chapter that now links to the edited chapter takes its fresh result."""
+        from workflows.metadata_enrichment.scripts.enrich_metadata_per_book import (
+            enrich_metadata_msep,
+        )
+        from workflows.shared.clients.msep_client import CrossReference
+
+        chapters = [
+            {"chapter_number": n, "title": f"Chapter {n}", "summary": f"summary {n}"}
+            for n in (1, 2, 3)
+        ]
+        input_path = tmp_path / "test_metadata.json"
+        output_path = tmp_path / "test_enriched.json"
+        input_path.write_text(
+            json.dumps({"book_title": "Test Book", "chapters": chapters}), encoding="utf-8"
+        )
+        link_to_ch3 = {"enabled": False}
+
+        async def fake_enrich(**kwargs: Any) -> Any:
+            numbers = [meta.chapter for meta in kwargs["chapter_index"]]
+            response = _shard_response("Test Book", numbers, cross_refs=0)
+            if link_to_ch3["enabled"]:
+                response.chapters[0].cross_references = [
+                    CrossReference(
+                        target="Test Book:ch3", score=0.9, base_score=0.85,
+                        topic_boost=0.05, method="sbert",
+                    )
+                ]
+            return response
+
+        with patch(
+            "workflows.metadata_enrichment.scripts.enrich_metadata_per_book.MSEPClient"
+        ) as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.enrich_metadata.side_effect = fake_enrich
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.__aexit__.return_value = None
+            mock_client_class.return_value = mock_client
+
+            await enrich_metadata_msep(input_path=input_path, output_path=output_path, delta=True)
+
+            chapters[2]["summary"] = "rewritten"
+            input_path.write_text(
+                json.dumps({"book_title": "Test Book", "chapters": chapters}), encoding="utf-8"
+            )
+            link_to_ch3["enabled"] = True
+            await enrich_metadata_msep(input_path=input_path, output_path=output_path, delta=True)
+
+        output_data = json.loads(output_path.read_text(encoding="utf-8"))
+        assert [ref["chapter"] for ref in output_data["chapters"][0]["similar_chapters"]] == [3]
+        assert output_data["enrichment_provenance"]["delta"] == {
+            "refreshed_chapters": 2,
+            "reused_chapters": 1,
+        }
@@ -16,13 +16,19 @@ Fixes vs prior generator:
 """
 
 import json
+import multiprocessing
+import multiprocessing.connection
 import re
 import sys
+import time
 import argparse
-from dataclasses import dataclass
+import difflib
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
 from textwrap import dedent
-from typing import Dict, List, Tuple, Any, Optional, Set
+from typing import Dict, Iterator, List, Tuple, Any, Optional, Set
 from collections import defaultdict
 
 # -------------------------------
@@ -78,10 +84,11 @@ class ChapterProcessingResult:
         - Architecture Patterns Ch.3: Abstraction boundaries
     """
 
-    text: str
     footnote_num: int
     footnotes: List[Dict[str, Any]]
+    text: str = ""
     concepts: Optional[Set[str]] = None
+    concept_entries: List["GuidelineConcept"] = field(default_factory=list)
 
 
 @dataclass
@@ -118,6 +125,199 @@ class CrossRefData:
     citation_num: int
 
 
+# -------------------------------
+# Guideline Document Model
+# -------------------------------
+# The generator builds the guideline as structured data first; Markdown and
+# JSON are both rendered from this model, so the JSON never has to be
+# recovered by re-parsing the Markdown.
+
+
+@dataclass
+class GuidelineConcept:
+    """
+    One concept excerpt in a chapter's Concept-by-Concept Breakdown.
+
+    References:
+        - Architecture Patterns Ch.1: Domain modeling
+    """
+
+    name: str
+    page: int
+    excerpt: str
+    start_line: int  # 0-based index of the first excerpt line
+    end_line: int  # exclusive
+    occurrences: int
+    footnote_num: int
+    annotation: str
+
+    def to_markdown(self, book_meta: Optional[Dict[str, Any]] = None) -> str:
+        """Render the concept block (heading, verbatim excerpt, footnote mark, annotation)."""
+        meta = book_meta or CURRENT_BOOK_META
+        lines = [
+            f"#### **{self.name.title()}** *(p.{self.page})*\n",
+            f"**Verbatim Educational Excerpt** *({meta['short_name']}, "
+            f"p.{self.page}, lines {self.start_line + 1}–{self.end_line})*:",
+            "```",
+            self.excerpt,
+            "```",
+            f"[^{self.footnote_num}]",
+            emit_annotation(self.annotation),
+            "",
+        ]
+        return "\n".join(lines)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "name": self.name.title(),
+            "page": self.page,
+            "verbatim_excerpt": self.excerpt.strip(),
+            "annotation": self.annotation,
+        }
+
+
+@dataclass
+class GuidelineChapter:
+    """
+    One generated chapter.
+
+    Sections with no JSON counterpart (TPM implementation, See Also) are kept
+    as rendered Markdown; everything the JSON needs is structured.
+    """
+
+    chapter_num: int
+    title: str
+    start_page: int
+    end_page: int
+    summary: str
+    summary_footnote_num: int
+    concepts: List[GuidelineConcept] = field(default_factory=list)
+    tpm_section: str = ""
+    see_also: str = ""
+
+    def to_markdown(self, book_meta: Optional[Dict[str, Any]] = None) -> str:
+        """Render the chapter as Markdown (``book_meta`` = the run's book, else the CLI default)."""
+        meta = book_meta or CURRENT_BOOK_META
+        lines = [
+            f"## Chapter {self.chapter_num}: {self.title}",
+            "",
+            f"*Source: {meta['full_title']}, pages {self.start_page}–{self.end_page}*",
+            "",
+            "### Chapter Summary",
+            f"{self.summary} [^{self.summary_footnote_num}]",
+            "",
+            "### Concept-by-Concept Breakdown",
+            "\n".join(concept.to_markdown(meta) for concept in self.concepts),
+            self.tpm_section,
+            self.see_also,
+            "",
+            "---",
+            "",
+        ]
+        return "\n".join(lines)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "chapter_number": self.chapter_num,
+            "title": self.title,
+            "page_range": {"start": self.start_page, "end": self.end_page},
+            "cross_text_analysis": "",
+            "chapter_summary": self.summary,
+            "concepts": [concept.to_json() for concept in self.concepts],
+        }
+
+
+@dataclass
+class GuidelineDocument:
+    """
+    Complete guideline for one book: header metadata, chapters and footnotes.
+
+    Usage:
+        >>> document = GuidelineDocument("Fluent_Python", "Fluent Python", total_chapters=2)
+        >>> document.chapters.append(chapter)
+        >>> for chunk in document.iter_markdown():
+        ...     f.write(chunk)
+        >>> json.dump(document.to_json(), f)
+    """
+
+    book_name: str
+    full_title: str
+    total_chapters: int
+    chapters: List[GuidelineChapter] = field(default_factory=list)
+    footnotes: List[Dict[str, Any]] = field(default_factory=list)
+    book_meta: Optional[Dict[str, Any]] = None  # author/full_title/short_name of the book
+
+    @property
+    def title(self) -> str:
+        return f"Comprehensive Python Guidelines — {self.full_title} (Chapters 1-{self.total_chapters})"
+
+    @property
+    def source(self) -> str:
+        return f"{self.full_title}, Chapters 1-{self.total_chapters}"
+
+    def header_lines(self) -> List[str]:
+        return [f"# {self.title}", "", f"*Source: {self.source}*", "", "---", ""]
+
+    def _markdown_parts(self) -> Iterator[str]:
+        yield from self.header_lines()
+        for chapter in self.chapters:
+            yield chapter.to_markdown(self.book_meta)
+        yield "\n---\n\n### **Footnotes**\n"
+        for f in self.footnotes:
+            yield chicago_footnote(
+                CitationInfo(
+                    num=f["num"],
+                    author=f["author"],
+                    title=f["title"],
+                    file_stub=f["file"],
+                    page=f["page"],
+                    start_line=f["start_line"],
+                    end_line=f["end_line"],
+                )
+            )
+        yield ""
+
+    def iter_markdown(self) -> Iterator[str]:
+        """Yield the Markdown document in chunks (one per chapter) for streaming writes."""
+        for i, part in enumerate(self._markdown_parts()):
+            yield part if i == 0 else "\n" + part
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        JSON structure mirroring the Markdown content.
+
+        Raises:
+            ValueError: If the document has no chapters
+        """
+        if not self.chapters:
+            raise ValueError("No chapters found in guideline document")
+
+        return {
+            "book_metadata": {
+                "title": self.title,
+                "source": self.source,
+                "book_name": self.book_name,
+            },
+            "source_info": {
+                "generated_by": "chapter_generator_all_text.py",
+                "generation_date": "2025-11-25",
+                "method": "statistical (YAKE + Summa + TF-IDF)",
+            },
+            "chapters": [chapter.to_json() for chapter in self.chapters],
+            "footnotes": [
+                {
+                    "number": f["num"],
+                    "author": f["author"],
+                    "title": f["title"],
+                    "file": f["file"],
+                    "page": f["page"],
+                    "lines": {"start": f["start_line"], "end": f["end_line"]},
+                }
+                for f in self.footnotes
+            ],
+        }
+
+
 # -------------------------------
 # Configuration
 # -------------------------------
@@ -654,14 +854,176 @@ def emit_annotation(text: str) -> str:
 # -------------------------------
 
 
+def _trie_regex(terms: List[str]) -> str:
+    """Regex alternation of ``terms`` factored into a prefix trie."""
+    trie: Dict[str, Any] = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, Any]) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+
+class ConceptLocator:
+    """
+    Locate every occurrence of every concept in a text in one pass.
+
+    The concepts are compiled into one prefix-trie regex used as a
+    lookahead, so each offset of the text is tried once for all concepts
+    instead of running one substring search per concept. Each match is the
+    longest concept starting at that offset; shorter concepts that are
+    prefixes of it start there too and are added from a precomputed table.
+
+    Matching is on lowercased text, same as ``concept.lower() in text.lower()``.
+    """
+
+    def __init__(self, concepts: List[str]):
+        self.names: Dict[str, List[str]] = defaultdict(list)  # lowercased -> original spellings
+        for concept in concepts:
+            if concept:
+                self.names[concept.lower()].append(concept)
+        keys = sorted(self.names)
+        self._prefixes = {key: [p for p in keys if key.startswith(p)] for key in keys}
+        self._pattern = re.compile(f"(?=({_trie_regex(keys)}))") if keys else None
+
+    def locate(self, text_lower: str) -> Dict[str, List[int]]:
+        """Lowercased concept -> ascending start offsets in ``text_lower``."""
+        hits: Dict[str, List[int]] = defaultdict(list)
+        if self._pattern is None:
+            return hits
+        for match in self._pattern.finditer(text_lower):
+            for key in self._prefixes[match.group(1)]:
+                hits[key].append(match.start())
+        return dict(hits)
+
+    def concepts_in(self, hits: Dict[str, List[int]]) -> Set[str]:
+        """Original concept spellings for located hits."""
+        return {name for key in hits for name in self.names[key]}
+
+
+@lru_cache(maxsize=None)
+def _concept_locator() -> ConceptLocator:
+    """Locator for COMPREHENSIVE_CONCEPTS (compiled on first use)."""
+    return ConceptLocator(COMPREHENSIVE_CONCEPTS)
+
+
+class PageText:
+    """
+    Page content preprocessed once for concept lookups.
+
+    Holds the lowercased text, line start offsets and the offsets of every
+    lexicon concept, so context windows are cut by offset instead of
+    re-splitting and re-lowercasing the page for each concept. Get
+    instances through page_text(), which caches them per content string.
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+        self.lower = content.lower()
+        self.lines = content.split("\n")
+        # Offsets are in the lowercased text; lower() keeps newlines, so
+        # line i of ``lower`` is line i of ``content``
+        self.line_starts = [0] + [m.end() for m in re.finditer("\n", self.lower)]
+        self._hits = _concept_locator().locate(self.lower)
+
+    @cached_property
+    def concepts(self) -> Set[str]:
+        """Lexicon concepts present on the page."""
+        return _concept_locator().concepts_in(self._hits)
+
+    def positions(self, concept: str) -> List[int]:
+        """Start offsets of ``concept`` (case-insensitive, overlapping)."""
+        key = concept.lower()
+        hits = self._hits.get(key)
+        if hits is None:
+            hits = [] if key in _concept_locator().names else [
+                m.start() for m in re.finditer(f"(?={re.escape(key)})", self.lower)
+            ]
+            self._hits[key] = hits
+        return hits
+
+    def count(self, concept: str) -> int:
+        """Non-overlapping occurrences, as ``content.lower().count(concept.lower())``."""
+        length = len(concept.lower())
+        count, next_free = 0, 0
+        for pos in self.positions(concept):
+            if pos >= next_free:
+                count += 1
+                next_free = pos + length
+        return count
+
+    def line_of(self, offset: int) -> int:
+        """0-based line index containing ``offset``."""
+        return bisect_right(self.line_starts, offset) - 1
+
+    def first_line(self, concept: str) -> Optional[int]:
+        """Index of the first line mentioning ``concept``, or None."""
+        positions = self.positions(concept)
+        return self.line_of(positions[0]) if positions else None
+
+    def mentions(self, concept: str, first_line: int, last_line: int) -> bool:
+        """True if ``concept`` occurs on lines first_line..last_line (inclusive)."""
+        positions = self.positions(concept)
+        start = self.line_starts[first_line]
+        end = self.line_starts[last_line + 1] if last_line + 1 < len(self.line_starts) else len(self.lower)
+        idx = bisect_left(positions, start)
+        return idx < len(positions) and positions[idx] < end
+
+    @cached_property
+    def paragraphs(self) -> List[Tuple[int, int]]:
+        """(first_line, last_line) of each run of non-blank lines."""
+        spans: List[Tuple[int, int]] = []
+        start = None
+        for i, line in enumerate(self.lines):
+            if line.strip():
+                if start is None:
+                    start = i
+            elif start is not None:
+                spans.append((start, i - 1))
+                start = None
+        if start is not None:
+            spans.append((start, len(self.lines) - 1))
+        return spans
+
+    @cached_property
+    def blocks(self) -> List[str]:
+        """Stripped, non-empty blocks between double newlines."""
+        return [p.strip() for p in self.content.split("\n\n") if p.strip()]
+
+
+@lru_cache(maxsize=4096)
+def page_text(content: str) -> PageText:
+    """Preprocessed (and cached) view of a page's content."""
+    return PageText(content)
+
+
+def concepts_on_pages(pages: List[Dict[str, Any]]) -> Set[str]:
+    """
+    Lexicon concepts across pages.
+
+    Same result as extract_concepts_from_text on the newline-joined pages
+    (no concept spans a line break), but each page is scanned only once
+    per run.
+    """
+    found: Set[str] = set()
+    for page in pages:
+        found.update(page_text(page.get("content", "")).concepts)
+    return found
+
+
 def extract_concepts_from_text(text: str) -> Set[str]:
     """Extract all concepts found in the given text."""
-    text_lower = text.lower()
-    found = set()
-    for concept in COMPREHENSIVE_CONCEPTS:
-        if concept.lower() in text_lower:
-            found.add(concept)
-    return found
+    locator = _concept_locator()
+    return locator.concepts_in(locator.locate(text.lower()))
 
 
 def index_primary_concepts(pages: List[Dict[str, Any]]) -> Tuple[Set[str], Dict[str, List[int]]]:
@@ -675,8 +1037,7 @@ def index_primary_concepts(pages: List[Dict[str, Any]]) -> Tuple[Set[str], Dict[
 
     for page in pages:
         page_num = page["page_number"]
-        content = page.get("content", "")
-        concepts = extract_concepts_from_text(content)
+        concepts = page_text(page.get("content", "")).concepts
         all_concepts.update(concepts)
         for concept in concepts:
             concept_to_pages[concept].append(page_num)
@@ -696,11 +1057,14 @@ def group_concepts_by_category(concepts: Set[str]) -> Dict[str, List[str]]:
 
 
 def find_cross_book_matches(
-    primary_content: str, other_books: Dict[str, Dict[str, Any]]
+    primary_content: str,
+    other_books: Dict[str, Dict[str, Any]],
+    key_concepts: Optional[List[str]] = None,
 ) -> List[Dict[str, Any]]:
     matches: List[Dict[str, Any]] = []
     primary_lower = primary_content.lower()
-    primary_concepts = [c for c in KEY_CONCEPTS if c in primary_lower]
+    concepts = KEY_CONCEPTS if key_concepts is None else key_concepts
+    primary_concepts = [c for c in concepts if c in primary_lower]
     if not primary_concepts:
         return matches
     for book_name, book_data in other_books.items():
@@ -726,14 +1090,14 @@ def find_cross_book_matches(
 
 def extract_concept_context(content: str, concept: str, context_lines: int = 5) -> str:
     """Extract context around where a concept appears in content."""
-    lines = content.split("\n")
-    concept_lower = concept.lower()
+    page = page_text(content)
+    lines = page.lines
 
-    for i, line in enumerate(lines):
-        if concept_lower in line.lower():
-            start = max(0, i - 1)
-            end = min(len(lines), i + context_lines)
-            return "\n".join(lines[start:end])
+    i = page.first_line(concept)
+    if i is not None:
+        start = max(0, i - 1)
+        end = min(len(lines), i + context_lines)
+        return "\n".join(lines[start:end])
 
     # If not found in specific line, return first substantial passage
     for i, line in enumerate(lines):
@@ -784,29 +1148,20 @@ def analyze_concept_relationship(_concepts: List[str], content: str) -> str:
 
 def extract_concept_explanation(content: str, concept: str) -> str:
     """Extract the most relevant explanation of a concept from content."""
-    lines = content.split("\n")
-    concept_lower = concept.lower()
-
-    # Find paragraph containing concept
-    paragraphs = []
-    current_para = []
-
-    for line in lines:
-        if line.strip():
-            current_para.append(line)
-        elif current_para:
-            paragraphs.append("\n".join(current_para))
-            current_para = []
-
-    if current_para:
-        paragraphs.append("\n".join(current_para))
+    page = page_text(content)
+    paragraphs = page.paragraphs
 
     # Find best paragraph
-    for para in paragraphs:
-        if concept_lower in para.lower() and len(para) > 100:
-            return para[:500]  # Limit to 500 chars
+    for first, last in paragraphs:
+        if page.mentions(concept, first, last):
+            para = "\n".join(page.lines[first:last + 1])
+            if len(para) > 100:
+                return para[:500]  # Limit to 500 chars
 
-    return paragraphs[0][:500] if paragraphs else content[:500]
+    if paragraphs:
+        first, last = paragraphs[0]
+        return "\n".join(page.lines[first:last + 1])[:500]
+    return content[:500]
 
 
 def _extract_first_substantial_paragraph(
@@ -849,11 +1204,7 @@ def _extract_first_substantial_paragraph(
         return None
     
     # Split into paragraphs (separated by one or more empty lines)
-    paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-    
-    # If no paragraph breaks, treat entire text as single paragraph
-    if not paragraphs:
-        paragraphs = [text.strip()]
+    paragraphs = page_text(text).blocks
     
     # Find first paragraph meeting minimum length
     for paragraph in paragraphs:
@@ -882,107 +1233,104 @@ def _extract_first_substantial_paragraph(
     return None
 
 
-def map_book_to_citation(book_name: str, book_disp: str) -> Tuple[str, str]:
-    """Map book filename to proper citation format."""
-    citation_map = {
-        # Python Language Books
-        "Learning_Python_Ed6_Content": ("Lutz, Mark", "Learning Python, 6th Edition"),
-        "Python_Essential_Reference_4th_Content": (
-            AUTHOR_BEAZLEY_SHORT,
-            "Python Essential Reference, 4th Edition",
-        ),
-        "Fluent_Python_2nd_Content": (AUTHOR_RAMALHO, TITLE_FLUENT_PYTHON_2ND),
-        "Python_Distilled_Content": (AUTHOR_BEAZLEY_SHORT, TITLE_PYTHON_DISTILLED),
-        "Python_Cookbook_3rd_Content": (
-            "Beazley, David & Jones, Brian K.",
-            TITLE_PYTHON_COOKBOOK_3RD,
-        ),
-        "Python_Data_Analysis_3rd_Content": (
-            "McKinney, Wes",
-            "Python for Data Analysis, 3rd Edition",
-        ),
-        "BANA320_Python_Data_Analysis_Content": (
-            "Course Materials",
-            "BANA 320 Python Data Analysis",
-        ),
-        # Architecture Books
-        "Architecture_Patterns_with_Python_Content": (
-            "Percival, Harry & Gregory, Bob",
-            TITLE_ARCHITECTURE_PATTERNS,
-        ),
-        "Python_Microservices_Dev_Content": ("Ziadé, Tarek", TITLE_PYTHON_MICROSERVICES_DEV),
-        "Building_Microservices_Content": ("Newman, Sam", TITLE_BUILDING_MICROSERVICES),
-        "Microservice_Architecture_Content": (
-            "Dragoni, Nicola et al.",
-            TITLE_MICROSERVICE_ARCHITECTURE,
-        ),
-        "Microservices___Up_and_Running_Content": (
-            "Gammelgård, Ronnie & Hammarberg, Marcus",
-            "Microservices – Up and Running",
-        ),
-        "Building_Python_Microservices_with_FastAPI_Content": (
-            "Various",
-            TITLE_FASTAPI_MICROSERVICES,
-        ),
-        "microservice_apis_using_python_flask_fastapi_open_Content": (
-            "Various",
-            "Microservice APIs Using Flask/FastAPI",
-        ),
-        "Python_Architecture_Patterns_Content": (
-            "Buelta, Jaime",
-            TITLE_PYTHON_ARCHITECTURE_PATTERNS,
-        ),
-    }
+# Book file name -> (author, title) for companion citations
+BOOK_CITATIONS: Dict[str, Tuple[str, str]] = {
+    # Python Language Books
+    "Learning_Python_Ed6_Content": ("Lutz, Mark", "Learning Python, 6th Edition"),
+    "Python_Essential_Reference_4th_Content": (
+        AUTHOR_BEAZLEY_SHORT,
+        "Python Essential Reference, 4th Edition",
+    ),
+    "Fluent_Python_2nd_Content": (AUTHOR_RAMALHO, TITLE_FLUENT_PYTHON_2ND),
+    "Python_Distilled_Content": (AUTHOR_BEAZLEY_SHORT, TITLE_PYTHON_DISTILLED),
+    "Python_Cookbook_3rd_Content": (
+        "Beazley, David & Jones, Brian K.",
+        TITLE_PYTHON_COOKBOOK_3RD,
+    ),
+    "Python_Data_Analysis_3rd_Content": (
+        "McKinney, Wes",
+        "Python for Data Analysis, 3rd Edition",
+    ),
+    "BANA320_Python_Data_Analysis_Content": (
+        "Course Materials",
+        "BANA 320 Python Data Analysis",
+    ),
+    # Architecture Books
+    "Architecture_Patterns_with_Python_Content": (
+        "Percival, Harry & Gregory, Bob",
+        TITLE_ARCHITECTURE_PATTERNS,
+    ),
+    "Python_Microservices_Dev_Content": ("Ziadé, Tarek", TITLE_PYTHON_MICROSERVICES_DEV),
+    "Building_Microservices_Content": ("Newman, Sam", TITLE_BUILDING_MICROSERVICES),
+    "Microservice_Architecture_Content": (
+        "Dragoni, Nicola et al.",
+        TITLE_MICROSERVICE_ARCHITECTURE,
+    ),
+    "Microservices___Up_and_Running_Content": (
+        "Gammelgård, Ronnie & Hammarberg, Marcus",
+        "Microservices – Up and Running",
+    ),
+    "Building_Python_Microservices_with_FastAPI_Content": (
+        "Various",
+        TITLE_FASTAPI_MICROSERVICES,
+    ),
+    "microservice_apis_using_python_flask_fastapi_open_Content": (
+        "Various",
+        "Microservice APIs Using Flask/FastAPI",
+    ),
+    "Python_Architecture_Patterns_Content": (
+        "Buelta, Jaime",
+        TITLE_PYTHON_ARCHITECTURE_PATTERNS,
+    ),
+}
+
+# Book file name -> architectural role/weighting of architecture books
+ARCHITECTURE_BOOK_ROLES: Dict[str, str] = {
+    "Architecture_Patterns_with_Python_Content": (
+        "Architectural Spine — Domain-Driven and Event-Oriented Foundation. "
+        "Establishes the system's structural grammar: bounded contexts, layered services, "
+        "message bus coordination, and dependency inversion."
+    ),
+    "Python_Microservices_Dev_Content": (
+        "Scaffolding and Implementation Layer — Python-Native Service Construction. "
+        "Defines practical composition of microservices, including Docker-based deployment, "
+        "asynchronous communication, and module organization."
+    ),
+    "Building_Microservices_Content": (
+        "Conceptual Justification and Organizational Foundation. "
+        "Provides rationale for microservices adoption — autonomy, scalability, and deployment independence."
+    ),
+    "Microservice_Architecture_Content": (
+        "Academic and Theoretical Foundation. "
+        "Anchors architecture in formal design theory, supplying diagrams, taxonomies, and structural models."
+    ),
+    "Microservices___Up_and_Running_Content": (
+        "Operational Lifecycle and Resilience Layer. "
+        "Defines best practices for deployment, observability, CI/CD, versioning, and fault tolerance."
+    ),
+    "Building_Python_Microservices_with_FastAPI_Content": (
+        "Gateway and API Modernization Layer. "
+        "Updates service and presentation layers using FastAPI's modern async architecture."
+    ),
+    "microservice_apis_using_python_flask_fastapi_open_Content": (
+        "API Governance and Standardization Layer. "
+        "Extends API design standards — versioning, OpenAPI documentation, endpoint consistency."
+    ),
+    "Python_Architecture_Patterns_Content": (
+        "Pattern and Crosswalk Layer. "
+        "Maintains traceability between applied patterns (Repository, CQRS, Event Sourcing) and implementations."
+    ),
+}
 
-    if book_name in citation_map:
-        return citation_map[book_name]
 
-    # Fallback
-    author = "Unknown"
-    title = book_disp
-    return author, title
+def map_book_to_citation(book_name: str, book_disp: str) -> Tuple[str, str]:
+    """Map book filename to proper citation format (fallback: Unknown, display name)."""
+    return BOOK_CITATIONS.get(book_name, ("Unknown", book_disp))
 
 
 def get_architecture_book_role(book_name: str) -> str:
     """Get the architectural role/weighting for architecture books."""
-    architecture_roles = {
-        "Architecture_Patterns_with_Python_Content": (
-            "Architectural Spine — Domain-Driven and Event-Oriented Foundation. "
-            "Establishes the system's structural grammar: bounded contexts, layered services, "
-            "message bus coordination, and dependency inversion."
-        ),
-        "Python_Microservices_Dev_Content": (
-            "Scaffolding and Implementation Layer — Python-Native Service Construction. "
-            "Defines practical composition of microservices, including Docker-based deployment, "
-            "asynchronous communication, and module organization."
-        ),
-        "Building_Microservices_Content": (
-            "Conceptual Justification and Organizational Foundation. "
-            "Provides rationale for microservices adoption — autonomy, scalability, and deployment independence."
-        ),
-        "Microservice_Architecture_Content": (
-            "Academic and Theoretical Foundation. "
-            "Anchors architecture in formal design theory, supplying diagrams, taxonomies, and structural models."
-        ),
-        "Microservices___Up_and_Running_Content": (
-            "Operational Lifecycle and Resilience Layer. "
-            "Defines best practices for deployment, observability, CI/CD, versioning, and fault tolerance."
-        ),
-        "Building_Python_Microservices_with_FastAPI_Content": (
-            "Gateway and API Modernization Layer. "
-            "Updates service and presentation layers using FastAPI's modern async architecture."
-        ),
-        "microservice_apis_using_python_flask_fastapi_open_Content": (
-            "API Governance and Standardization Layer. "
-            "Extends API design standards — versioning, OpenAPI documentation, endpoint consistency."
-        ),
-        "Python_Architecture_Patterns_Content": (
-            "Pattern and Crosswalk Layer. "
-            "Maintains traceability between applied patterns (Repository, CQRS, Event Sourcing) and implementations."
-        ),
-    }
-
-    return architecture_roles.get(book_name, "")
+    return ARCHITECTURE_BOOK_ROLES.get(book_name, "")
 
 
 # _build_llm_annotation_prompt removed - Tab 5 uses statistical methods only (LLM in Tab 7)
@@ -1107,9 +1455,8 @@ def find_self_references(
         if not chapter_pages:
             continue
 
-        # Extract concepts from this chapter
-        chapter_text = "\n".join([p.get("content", "") for p in chapter_pages])
-        chapter_concepts = extract_concepts_from_text(chapter_text)
+        # Extract concepts from this chapter (pages are scanned once per run)
+        chapter_concepts = concepts_on_pages(chapter_pages)
 
         # Find shared concepts
         shared = concepts.intersection(chapter_concepts)
@@ -1207,31 +1554,39 @@ def generate_cross_reference_summary(concepts: List[str], content: str, relation
 # -------------------------------
 
 
-def choose_tpm_source(
+# Greedy class block capture until a blank line or end
+TPM_CLASS_PATTERN = re.compile(r"(?ms)^class\s+\w+\s*:(?:(?!\n\s*\n).)*(?:\n\s*\n|\Z)")
+
+
+def _iter_tpm_sources(
     other_books: Dict[str, Dict[str, Any]],
-) -> Optional[Tuple[str, int, str, int, int]]:
-    """
-    Pick a source code-like slice from preferred books.
-    Heuristics: look for a class block with __len__ and/or __getitem__.
-    Returns: (book_name, page_num, exact_code_slice, start_line, end_line)
-    """
-    # Greedy class block capture until a blank line or end
-    class_pat = re.compile(r"(?ms)^class\s+\w+\s*:(?:(?!\n\s*\n).)*(?:\n\s*\n|\Z)")
+) -> Iterator[Tuple[str, int, str, int, int]]:
+    """Class blocks with __len__/__getitem__ from preferred books, in preference order."""
     for book in TPM_PREFERRED_BOOKS:
         data = other_books.get(book)
         if not data:
             continue
         for page in data.get("pages", []):
             content = page.get("content", "")
-            for m in class_pat.finditer(content):
+            for m in TPM_CLASS_PATTERN.finditer(content):
                 block = m.group(0)
                 if "__len__(" in block or "__getitem__(" in block:
                     # compute line numbers
                     pre = content[: m.start()]
                     start_line = pre.count("\n") + 1
                     end_line = start_line + block.count("\n")
-                    return (book, page["page_number"], block.rstrip("\n"), start_line, end_line)
-    return None
+                    yield (book, page["page_number"], block.rstrip("\n"), start_line, end_line)
+
+
+def choose_tpm_source(
+    other_books: Dict[str, Dict[str, Any]],
+) -> Optional[Tuple[str, int, str, int, int]]:
+    """
+    Pick a source code-like slice from preferred books.
+    Heuristics: look for a class block with __len__ and/or __getitem__.
+    Returns: (book_name, page_num, exact_code_slice, start_line, end_line)
+    """
+    return next(_iter_tpm_sources(other_books), None)
 
 
 def adapt_tpm_code(source_code: str) -> str:
@@ -1283,6 +1638,94 @@ def adapt_tpm_code(source_code: str) -> str:
     return adapted
 
 
+def tpm_overlap_ratio(source_code: str, adapted_code: str) -> float:
+    """Line-level overlap between a source snippet and its adaptation (0–1)."""
+    return difflib.SequenceMatcher(
+        None, source_code.splitlines(), adapted_code.splitlines(), autojunk=False
+    ).ratio()
+
+
+@dataclass(frozen=True)
+class TPMCandidate:
+    """A TPM source snippet with its adaptation precomputed."""
+
+    book_name: str
+    page_num: int
+    source_code: str
+    start_line: int
+    end_line: int
+    adapted_code: str
+    overlap: float
+
+    @property
+    def in_band(self) -> bool:
+        """True if the adaptation keeps overlap within the TPM target band."""
+        return TPM_MIN_TARGET <= self.overlap <= TPM_MAX_TARGET
+
+
+class TPMCandidateIndex:
+    """
+    TPM source candidates for one companion set, adapted once per run.
+
+    The TPM section does not depend on the chapter, so candidates are
+    scanned in preference order, adapted and scored against
+    TPM_MIN_TARGET/TPM_MAX_TARGET a single time. ``chosen`` is the first
+    candidate inside the band, else the first candidate (the pick
+    choose_tpm_source makes). Scanning stops at the first in-band one.
+
+    Usage:
+        index = tpm_candidate_index(companions, exclude=run.primary_book)
+        if index.chosen:
+            code = index.chosen.adapted_code
+    """
+
+    def __init__(self, other_books: Dict[str, Dict[str, Any]]):
+        self.candidates: List[TPMCandidate] = []
+        self.chosen: Optional[TPMCandidate] = None
+        for book_name, page_num, source, start_line, end_line in _iter_tpm_sources(other_books):
+            adapted = adapt_tpm_code(source)
+            candidate = TPMCandidate(
+                book_name, page_num, source, start_line, end_line,
+                adapted, tpm_overlap_ratio(source, adapted),
+            )
+            self.candidates.append(candidate)
+            if candidate.in_band:
+                self.chosen = candidate
+                break
+        if self.chosen is None and self.candidates:
+            self.chosen = self.candidates[0]
+
+
+# Single-slot memo: (exclude, source book data objects) -> index. Holding the
+# data objects keeps their ids from being reused while the entry is alive.
+_tpm_index_memo: Optional[Tuple[Optional[str], Tuple[Any, ...], TPMCandidateIndex]] = None
+
+
+def tpm_candidate_index(
+    other_books: Dict[str, Dict[str, Any]], exclude: Optional[str] = None
+) -> TPMCandidateIndex:
+    """
+    TPM candidate index for a companion set, built once per run.
+
+    Args:
+        other_books: Companion book data (may include the primary book)
+        exclude: Book to leave out (the primary book)
+
+    Returns:
+        The memoized index while the preferred books' data objects are unchanged
+    """
+    global _tpm_index_memo
+    sources = tuple(None if book == exclude else other_books.get(book) for book in TPM_PREFERRED_BOOKS)
+    memo = _tpm_index_memo
+    if memo is not None and memo[0] == exclude and len(memo[1]) == len(sources) and all(
+        a is b for a, b in zip(memo[1], sources)
+    ):
+        return memo[2]
+    index = TPMCandidateIndex({book: data for book, data in zip(TPM_PREFERRED_BOOKS, sources) if data})
+    _tpm_index_memo = (exclude, sources, index)
+    return index
+
+
 # -------------------------------
 # Generation steps
 # -------------------------------
@@ -1359,12 +1802,140 @@ def _load_enriched_metadata(enriched_file: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def _get_chapter_topic_id(enriched_metadata: Optional[Dict[str, Any]], chapter_num: int) -> Optional[int]:
+def _read_metadata_file(metadata_file: str) -> Optional[Any]:
+    """Parse a basic metadata file next to this script (None if missing or invalid)."""
+    try:
+        metadata_path = Path(__file__).parent / metadata_file
+        with open(metadata_path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _index_by_chapter(chapters: Any) -> Dict[int, Dict[str, Any]]:
+    """chapter_number -> chapter dict (first occurrence wins, as a linear scan would)."""
+    index: Dict[int, Dict[str, Any]] = {}
+    if isinstance(chapters, list):
+        for chapter in chapters:
+            if isinstance(chapter, dict):
+                index.setdefault(chapter.get("chapter_number"), chapter)
+    return index
+
+
+class BookMetadataIndex:
+    """
+    Per-run metadata access for the primary book.
+
+    Basic metadata (chapter summaries) and Tab 4 enriched metadata (topic
+    ids, related chapters) are read once and indexed by chapter number, so
+    per-chapter header and see-also construction do dict lookups instead
+    of re-reading or re-scanning the files.
+
+    Usage:
+        index = BookMetadataIndex.load(run.primary_book)
+        index.chapter_summary(3), index.topic_id(3), index.related_chapters(3)
+    """
+
+    def __init__(
+        self,
+        book: Optional[str],
+        basic_metadata: Optional[Any] = None,
+        enriched_metadata: Optional[Dict[str, Any]] = None,
+    ):
+        self.book = book
+        self.enriched = enriched_metadata
+        self._summaries = _index_by_chapter(basic_metadata)
+        self._chapters = _index_by_chapter((enriched_metadata or {}).get("chapters", []))
+
+    @classmethod
+    def load(cls, book: str) -> "BookMetadataIndex":
+        """Read the book's basic and enriched metadata files once."""
+        metadata_file = _get_metadata_filename(book)
+        enriched_file = _get_enriched_metadata_filename(book)
+        return cls(
+            book,
+            _read_metadata_file(metadata_file) if metadata_file else None,
+            _load_enriched_metadata(enriched_file) if enriched_file else None,
+        )
+
+    def chapter_summary(self, chapter_num: int) -> Optional[str]:
+        return self._summaries.get(chapter_num, {}).get("summary")
+
+    def topic_id(self, chapter_num: int) -> Optional[int]:
+        return self._chapters.get(chapter_num, {}).get("topic_id")
+
+    def related_chapters(self, chapter_num: int) -> List[Dict[str, Any]]:
+        return self._chapters.get(chapter_num, {}).get("related_chapters", [])
+
+
+@dataclass
+class GuidelineRunContext:
+    """
+    Per-book run settings, passed explicitly from main() to the chapter helpers.
+
+    Every book run gets its own context, so books can be generated back to
+    back, in forked workers or in threads without sharing per-book state.
+    The module globals PRIMARY_BOOK, CURRENT_BOOK_META and KEY_CONCEPTS are
+    only the CLI defaults used when a helper is called without a context.
+    """
+
+    primary_book: Optional[str]
+    key_concepts: Optional[List[str]] = None  # None = default KEY_CONCEPTS
+    book_meta: Optional[Dict[str, Any]] = None  # None = BOOK_METADATA entry for the book
+    metadata_index: Optional[BookMetadataIndex] = None  # loaded once by main()
+
+    def __post_init__(self) -> None:
+        if self.book_meta is None:
+            self.book_meta = BOOK_METADATA.get(
+                self.primary_book or "",
+                {"author": "Unknown", "full_title": self.primary_book, "short_name": self.primary_book},
+            )
+
+    @property
+    def concepts(self) -> List[str]:
+        """Concepts used for keyword cross-book matching."""
+        return self.key_concepts or KEY_CONCEPTS
+
+    def footnote(self, num: int, page: int, start_line: int, end_line: int) -> Dict[str, Any]:
+        """Footnote citing the primary book."""
+        return {
+            "num": num,
+            "author": self.book_meta["author"],
+            "title": self.book_meta["full_title"],
+            "file": self.primary_book,
+            "page": page,
+            "start_line": start_line,
+            "end_line": end_line,
+        }
+
+
+def _run_or_default(run: Optional[GuidelineRunContext]) -> GuidelineRunContext:
+    """``run``, or a context built from the module-level CLI defaults."""
+    if run is not None:
+        return run
+    return GuidelineRunContext(PRIMARY_BOOK, KEY_CONCEPTS, CURRENT_BOOK_META)
+
+
+def _enriched_index(
+    enriched_metadata: Dict[str, Any], index: Optional[BookMetadataIndex] = None
+) -> BookMetadataIndex:
+    """Index for enriched metadata: the run's index if it holds this dict, else a fresh one."""
+    if index is not None and index.enriched is enriched_metadata:
+        return index
+    return BookMetadataIndex(None, enriched_metadata=enriched_metadata)
+
+
+def _get_chapter_topic_id(
+    enriched_metadata: Optional[Dict[str, Any]],
+    chapter_num: int,
+    index: Optional[BookMetadataIndex] = None,
+) -> Optional[int]:
     """Get topic_id for a chapter from enriched metadata.
     
     Args:
         enriched_metadata: Loaded enriched metadata or None
         chapter_num: Chapter number to look up
+        index: The run's metadata index (reused if it holds enriched_metadata)
         
     Returns:
         topic_id (int) or None if not available
@@ -1374,22 +1945,20 @@ def _get_chapter_topic_id(enriched_metadata: Optional[Dict[str, Any]], chapter_n
     if enriched_metadata is None:
         return None
     
-    for chapter in enriched_metadata.get("chapters", []):
-        if chapter.get("chapter_number") == chapter_num:
-            return chapter.get("topic_id")
-    
-    return None
+    return _enriched_index(enriched_metadata, index).topic_id(chapter_num)
 
 
 def _get_related_chapters_by_topic(
     enriched_metadata: Optional[Dict[str, Any]], 
-    chapter_num: int
+    chapter_num: int,
+    index: Optional[BookMetadataIndex] = None,
 ) -> List[Dict[str, Any]]:
     """Get pre-computed related chapters from enriched metadata.
     
     Args:
         enriched_metadata: Loaded enriched metadata or None
         chapter_num: Chapter number to look up
+        index: The run's metadata index (reused if it holds enriched_metadata)
         
     Returns:
         List of related_chapters dicts with book, chapter, title, relevance_score, method
@@ -1399,29 +1968,19 @@ def _get_related_chapters_by_topic(
     if enriched_metadata is None:
         return []
     
-    for chapter in enriched_metadata.get("chapters", []):
-        if chapter.get("chapter_number") == chapter_num:
-            return chapter.get("related_chapters", [])
-    
-    return []
+    return _enriched_index(enriched_metadata, index).related_chapters(chapter_num)
 
 
 def _load_chapter_summary(metadata_file: str, chapter_num: int) -> Optional[str]:
     """Load chapter summary from metadata file."""
-    try:
-        metadata_path = Path(__file__).parent / metadata_file
-        with open(metadata_path, "r") as f:
-            metadata = json.load(f)
-
-        for chapter in metadata:
-            if chapter.get("chapter_number") == chapter_num:
-                return chapter.get("summary", None)
-        return None
-    except (FileNotFoundError, json.JSONDecodeError):
-        return None
+    return BookMetadataIndex(None, _read_metadata_file(metadata_file)).chapter_summary(chapter_num)
 
 
-def generate_chapter_summary(_pages: List[Dict[str, Any]], chapter_num: int = 1) -> str:
+def generate_chapter_summary(
+    _pages: List[Dict[str, Any]],
+    chapter_num: int = 1,
+    run: Optional[GuidelineRunContext] = None,
+) -> str:
     """
     Get chapter summary from metadata file.
     Falls back to generic summary if metadata not found.
@@ -1429,12 +1988,20 @@ def generate_chapter_summary(_pages: List[Dict[str, Any]], chapter_num: int = 1)
     Args:
         _pages: Pages for this chapter (reserved for future direct content analysis)
         chapter_num: Chapter number to look up in metadata
+        run: Book run (None = CLI defaults)
     """
-    # Type guard: PRIMARY_BOOK can be None at module load time
-    if PRIMARY_BOOK is None:
+    run = _run_or_default(run)
+    # Type guard: the CLI default PRIMARY_BOOK is None at module load time
+    if run.primary_book is None:
         return f"Chapter {chapter_num} content."
 
-    metadata_file = _get_metadata_filename(PRIMARY_BOOK)
+    # Loaded once per run by main(); otherwise read the metadata file
+    index = run.metadata_index
+    if index is not None and index.book == run.primary_book:
+        summary = index.chapter_summary(chapter_num)
+        return summary if summary else f"Chapter {chapter_num} content."
+
+    metadata_file = _get_metadata_filename(run.primary_book)
     if not metadata_file:
         return f"Chapter {chapter_num} content."
 
@@ -1450,8 +2017,7 @@ def _find_best_page_for_concept(
     best_count = 0
 
     for page in chapter_pages:
-        content = page.get("content", "").lower()
-        count = content.count(concept.lower())
+        count = page_text(page.get("content", "")).count(concept)
         if count > best_count:
             best_count = count
             best_page = page
@@ -1461,18 +2027,14 @@ def _find_best_page_for_concept(
 
 def _extract_concept_passage(content: str, concept: str) -> Tuple[str, int, int]:
     """Extract 8-line passage containing the concept."""
-    lines = content.split("\n")
-    concept_lower = concept.lower()
+    page = page_text(content)
 
-    # Find first line containing concept
-    start_idx = 0
-    for i, line in enumerate(lines):
-        if concept_lower in line.lower():
-            start_idx = max(0, i - 1)
-            break
+    # Start one line before the first line containing concept
+    first = page.first_line(concept)
+    start_idx = max(0, first - 1) if first is not None else 0
 
-    end_idx = min(len(lines), start_idx + 8)
-    excerpt = "\n".join(lines[start_idx:end_idx])
+    end_idx = min(len(page.lines), start_idx + 8)
+    excerpt = "\n".join(page.lines[start_idx:end_idx])
     return excerpt, start_idx, end_idx
 
 
@@ -1490,54 +2052,25 @@ def _get_fallback_annotation(concept: str, best_count: int) -> str:
     )
 
 
-def _build_concept_block(
-    concept: str, page_num: int, excerpt: str, line_range: Tuple[int, int], best_count: int, n: int
-) -> List[str]:
-    """
-    Build formatted block for a single concept.
-
-    Args:
-        concept: Concept name
-        page_num: Page number
-        excerpt: Text excerpt
-        line_range: Tuple of (start_line, end_line)
-        best_count: Number of occurrences
-        n: Footnote number
-    """
-    start_idx, end_idx = line_range
-    block = []
-    block.append(f"#### **{concept.title()}** *(p.{page_num})*\n")
-    block.append(
-        f"**Verbatim Educational Excerpt** *({CURRENT_BOOK_META['short_name']}, p.{page_num}, lines {start_idx+1}–{end_idx})*:"
-    )
-    block.append("```")
-    block.append(excerpt)
-    block.append("```")
-    block.append(f"[^{n}]")
-
-    # Tab 5: Template-based annotations only (no LLM - architecture boundary)
-    annotation = _get_fallback_annotation(concept, best_count)
-    block.append(emit_annotation(annotation))
-    block.append("")
-
-    return block
-
-
 def _extract_concept_from_pages(
-    concept: str, chapter_pages: List[Dict[str, Any]], footnote_num: int
-) -> Tuple[Optional[str], Optional[Dict[str, Any]], int]:
+    concept: str,
+    chapter_pages: List[Dict[str, Any]],
+    footnote_num: int,
+    run: Optional[GuidelineRunContext] = None,
+) -> Tuple[Optional[GuidelineConcept], Optional[Dict[str, Any]], int]:
     """
-    Extract formatted concept block and footnote from chapter pages.
+    Extract a concept entry and its footnote from chapter pages.
 
-    Applies Extract Method pattern to reduce complexity in build_concept_sections().
+    Applies Extract Method pattern to reduce complexity in collect_concept_entries().
 
     Args:
         concept: Concept to extract
         chapter_pages: Pages to search
         footnote_num: Current footnote number
+        run: Book run (None = CLI defaults)
 
     Returns:
-        Tuple of (formatted_block, footnote_dict, next_footnote_num)
+        Tuple of (concept_entry, footnote_dict, next_footnote_num)
         Returns (None, None, footnote_num) if concept not found
 
     References:
@@ -1550,32 +2083,44 @@ def _extract_concept_from_pages(
 
     page_num = best_page["page_number"]
     content = best_page.get("content", "")
-    best_count = content.lower().count(concept.lower())
+    best_count = page_text(content).count(concept)
 
     excerpt, start_idx, end_idx = _extract_concept_passage(content, concept)
-    block = _build_concept_block(
-        concept, page_num, excerpt, (start_idx, end_idx), best_count, footnote_num
+    entry = GuidelineConcept(
+        name=concept,
+        page=page_num,
+        excerpt=excerpt,
+        start_line=start_idx,
+        end_line=end_idx,
+        occurrences=best_count,
+        footnote_num=footnote_num,
+        # Tab 5: Template-based annotations only (no LLM - architecture boundary)
+        annotation=_get_fallback_annotation(concept, best_count),
     )
-    formatted_block = "\n".join(block)
 
-    footnote = _build_concept_footnote(page_num, start_idx, end_idx, footnote_num)
+    footnote = _build_concept_footnote(page_num, start_idx, end_idx, footnote_num, run)
 
-    return formatted_block, footnote, footnote_num + 1
+    return entry, footnote, footnote_num + 1
 
 
 def _build_concept_footnote(
-    page_num: int, start_line: int, end_line: int, footnote_num: int
+    page_num: int,
+    start_line: int,
+    end_line: int,
+    footnote_num: int,
+    run: Optional[GuidelineRunContext] = None,
 ) -> Dict[str, Any]:
     """
     Build footnote dictionary for a concept excerpt.
 
-    Applies Extract Method pattern to reduce complexity in build_concept_sections().
+    Applies Extract Method pattern to reduce complexity in collect_concept_entries().
 
     Args:
         page_num: Page number of excerpt
         start_line: Start line index (0-based)
         end_line: End line index (0-based)
         footnote_num: Footnote number
+        run: Book run (None = CLI defaults)
 
     Returns:
         Footnote dictionary
@@ -1583,65 +2128,42 @@ def _build_concept_footnote(
     References:
         - ANTI_PATTERN_ANALYSIS §10.2: Extract Method pattern
     """
-    return {
-        "num": footnote_num,
-        "author": CURRENT_BOOK_META["author"],
-        "title": CURRENT_BOOK_META["full_title"],
-        "file": PRIMARY_BOOK,
-        "page": page_num,
-        "start_line": start_line + 1,
-        "end_line": end_line,
-    }
+    return _run_or_default(run).footnote(footnote_num, page_num, start_line + 1, end_line)
 
 
-def build_concept_sections(
-    _primary_data: Dict[str, Any],
+def collect_concept_entries(
     chapter_pages: List[Dict[str, Any]],
     footnote_start: int,
-    _chapter_num: int,
     chapter_concepts: Optional[Set[str]] = None,
-    _occurrence_index: Optional[Dict[str, List[int]]] = None,
-) -> Tuple[str, int, List[Dict[str, Any]]]:
+    run: Optional[GuidelineRunContext] = None,
+) -> Tuple[List[GuidelineConcept], int, List[Dict[str, Any]]]:
     """
-    Build concept sections by identifying and extracting passages for each detected concept.
-    Limits to 15 concepts per chapter for focused coverage.
-
-    Refactored using Extract Method pattern to reduce local variable count from 18→10.
+    Build the concept entries of a chapter (up to 15, alphabetical).
 
     Args:
-        _primary_data: Primary book data (reserved for future metadata-driven selection)
         chapter_pages: Pages belonging to this chapter
         footnote_start: Starting footnote number
-        _chapter_num: Chapter number (reserved for future chapter-specific logic)
-        chapter_concepts: Optional predefined concepts to use instead of extracting
-        _occurrence_index: Page occurrence index (reserved for future frequency-based selection)
+        chapter_concepts: Concepts detected in the chapter
+        run: Book run (None = CLI defaults)
 
     Returns:
-        Tuple of (formatted_text, next_footnote_num, footnotes_list)
-
-    References:
-        - ANTI_PATTERN_ANALYSIS §10.2: Extract Method refactoring (R0914 fix)
-        - Architecture Patterns Ch.3: Managing complexity through abstraction
+        Tuple of (concept_entries, next_footnote_num, footnotes_list)
     """
-    out = []
+    entries: List[GuidelineConcept] = []
     foots: List[Dict[str, Any]] = []
     n = footnote_start
 
     if not chapter_concepts:
-        return "", n, foots
+        return entries, n, foots
 
     # Limit to 15 most significant concepts
-    selected_concepts = sorted(chapter_concepts)[:15]
-
-    # For each concept, extract and format using helper functions
-    for concept in selected_concepts:
-        formatted_block, footnote, n = _extract_concept_from_pages(concept, chapter_pages, n)
-
-        if formatted_block and footnote:
-            out.append(formatted_block)
+    for concept in sorted(chapter_concepts)[:15]:
+        entry, footnote, n = _extract_concept_from_pages(concept, chapter_pages, n, run)
+        if entry and footnote:
+            entries.append(entry)
             foots.append(footnote)
 
-    return "\n".join(out), n, foots
+    return entries, n, foots
 
 
 def _build_companion_book_reference(
@@ -1744,7 +2266,9 @@ def _build_companion_references_section(
 
 
 def _build_self_references_section(
-    chapter_ctx: ChapterContext, footnote_start: int
+    chapter_ctx: ChapterContext,
+    footnote_start: int,
+    run: Optional[GuidelineRunContext] = None,
 ) -> Tuple[List[str], List[Dict[str, Any]], int]:
     """
     Build self-references to later chapters section.
@@ -1754,6 +2278,7 @@ def _build_self_references_section(
     Args:
         chapter_ctx: ChapterContext with current chapter info and concepts
         footnote_start: Starting footnote number
+        run: Book run (None = CLI defaults)
 
     Returns:
         Tuple of (output_lines, footnotes, next_footnote_num)
@@ -1761,6 +2286,7 @@ def _build_self_references_section(
     Reference:
         - Architecture Patterns Ch. 4: Service Layer pattern
     """
+    run = _run_or_default(run)
     out = []
     foots: List[Dict[str, Any]] = []
     n = footnote_start
@@ -1791,17 +2317,7 @@ def _build_self_references_section(
             )
             out.append("")
 
-            foots.append(
-                {
-                    "num": n,
-                    "author": CURRENT_BOOK_META["author"],
-                    "title": CURRENT_BOOK_META["full_title"],
-                    "file": PRIMARY_BOOK,
-                    "page": ref["start_page"],
-                    "start_line": 1,
-                    "end_line": 1,
-                }
-            )
+            foots.append(run.footnote(n, ref["start_page"], 1, 1))
             n += 1
 
     return out, foots, n
@@ -1814,6 +2330,7 @@ def build_see_also(
     primary_book: Optional[Dict[str, Any]] = None,
     current_concepts: Optional[Set[str]] = None,
     all_chapters: Optional[List[Tuple[int, str, int, int]]] = None,
+    run: Optional[GuidelineRunContext] = None,
 ) -> Tuple[str, int, List[Dict[str, Any]]]:
     """
     Build comprehensive See Also section with:
@@ -1845,7 +2362,7 @@ def build_see_also(
             chapter_num=chapter_num,
             all_chapters=all_chapters,
         )
-        self_ref_lines, self_ref_foots, n = _build_self_references_section(chapter_ctx, n)
+        self_ref_lines, self_ref_foots, n = _build_self_references_section(chapter_ctx, n, run)
         out.extend(self_ref_lines)
         foots.extend(self_ref_foots)
 
@@ -1853,7 +2370,10 @@ def build_see_also(
 
 
 def build_tpm_section(
-    other_books: Dict[str, Any], footnote_start: int, _chapter_num: int
+    other_books: Dict[str, Any],
+    footnote_start: int,
+    _chapter_num: int,
+    exclude_book: Optional[str] = None,
 ) -> Tuple[str, int, Optional[Dict[str, Any]]]:
     """
     Build a TPM ORIGINAL section with ~50–65% overlap.
@@ -1866,9 +2386,12 @@ def build_tpm_section(
         other_books: Dictionary of supplementary book data
         footnote_start: Starting footnote number
         _chapter_num: Chapter number (reserved for future chapter-specific examples)
+        exclude_book: Book in other_books not to derive from (the primary book)
       4) append Annotation.
+
+    The snippet and its adaptation come from the per-run tpm_candidate_index().
     """
-    chosen = choose_tpm_source(other_books)
+    chosen = tpm_candidate_index(other_books, exclude=exclude_book).chosen
     if not chosen:
         section_lines: List[str] = [
             "\n### **TPM Implementation Section** *(ORIGINAL)*\n\n",
@@ -1876,8 +2399,9 @@ def build_tpm_section(
         ]
         return "\n".join(section_lines), footnote_start, None
 
-    book_name, page_num, source_class, start_line, end_line = chosen
-    adapted = adapt_tpm_code(source_class)
+    book_name, page_num = chosen.book_name, chosen.page_num
+    start_line, end_line = chosen.start_line, chosen.end_line
+    adapted = chosen.adapted_code
 
     display_name = book_name.replace("_Content", "").replace("_", " ")
     if "Fluent" in book_name:
@@ -1927,14 +2451,14 @@ def build_tpm_section(
 # ============================================================================
 
 
-def _extract_chapter_concepts(chapter_text: str) -> Set[str]:
+def _extract_chapter_concepts(chapter_pages: List[Dict[str, Any]]) -> Set[str]:
     """
     Extract concepts from chapter using keyword matching (YAKE + Summa).
 
     Tab 5: Statistical methods only (no LLM - architecture boundary)
 
     Args:
-        chapter_text: Full text of the chapter
+        chapter_pages: Pages belonging to the chapter
 
     Returns:
         Set of concept strings
@@ -1945,7 +2469,7 @@ def _extract_chapter_concepts(chapter_text: str) -> Set[str]:
     # Phase 1: Keyword matching
     # Extract concepts using keyword matching (YAKE + Summa)
     # Architecture: Domain-agnostic statistical methods only
-    keyword_concepts = extract_concepts_from_text(chapter_text)
+    keyword_concepts = concepts_on_pages(chapter_pages)
     print(f"  Found {len(keyword_concepts)} concepts via keyword matching (YAKE + Summa)")
 
     return keyword_concepts
@@ -1956,6 +2480,7 @@ def _find_cross_references(
     companions: Dict[str, Dict[str, Any]],
     chapter_num: Optional[int] = None,
     enriched_metadata: Optional[Dict[str, Any]] = None,
+    run: Optional[GuidelineRunContext] = None,
 ) -> List[Any]:
     """
     Find cross-references to companion books using keyword/concept overlap.
@@ -1970,6 +2495,7 @@ def _find_cross_references(
         companions: Dictionary of companion book data
         chapter_num: Current chapter number (for enriched metadata lookup)
         enriched_metadata: Optional enriched metadata from Tab 4 (with topic_id)
+        run: Book run (None = CLI defaults)
 
     Returns:
         List of cross-reference matches
@@ -1978,10 +2504,11 @@ def _find_cross_references(
         - Architecture Patterns Ch. 4: Service Layer pattern
         - BERTOPIC_SENTENCE_TRANSFORMERS_DESIGN.md: Option C Architecture
     """
+    run = _run_or_default(run)
     # Option C: Use pre-computed related_chapters from Tab 4 if available
     if enriched_metadata is not None and chapter_num is not None:
-        related = _get_related_chapters_by_topic(enriched_metadata, chapter_num)
-        topic_id = _get_chapter_topic_id(enriched_metadata, chapter_num)
+        related = _get_related_chapters_by_topic(enriched_metadata, chapter_num, run.metadata_index)
+        topic_id = _get_chapter_topic_id(enriched_metadata, chapter_num, run.metadata_index)
         
         if related:
             print("  Using pre-computed cross-references from Tab 4 enriched metadata")
@@ -2007,8 +2534,8 @@ def _find_cross_references(
     # Fallback: Cross-book matching using keyword/concept overlap (YAKE + TF-IDF)
     # Architecture: Statistical methods only (no LLM)
     print("  Keyword-based cross-book matching...")
-    non_primary_companions = {k: v for k, v in companions.items() if k != PRIMARY_BOOK}
-    xmatches = find_cross_book_matches(all_text, non_primary_companions)
+    non_primary_companions = {k: v for k, v in companions.items() if k != run.primary_book}
+    xmatches = find_cross_book_matches(all_text, non_primary_companions, run.concepts)
     print(f"  Found {len(xmatches)} cross-book matches via keyword overlap")
 
     return xmatches
@@ -2042,34 +2569,6 @@ def _load_companion_books(book_list: List[str]) -> Dict[str, Dict[str, Any]]:
     return companions
 
 
-def _build_document_header(total_chapters: int) -> List[str]:
-    """
-    Build document header lines.
-
-    Extracted from main() to reduce complexity.
-    Creates the title and metadata section.
-
-    Args:
-        total_chapters: Total number of chapters
-
-    Returns:
-        List of header lines
-
-    Reference:
-        - Fluent Python Ch. 7: Function decomposition reduces complexity
-    """
-    header = []
-    header.append(
-        f"# Comprehensive Python Guidelines — {CURRENT_BOOK_META['full_title']} (Chapters 1-{total_chapters})"
-    )
-    header.append("")
-    header.append(f"*Source: {CURRENT_BOOK_META['full_title']}, Chapters 1-{total_chapters}*")
-    header.append("")
-    header.append("---")
-    header.append("")
-    return header
-
-
 def _build_chapter_header(
     chapter_num: int,
     chapter_title: str,
@@ -2077,9 +2576,10 @@ def _build_chapter_header(
     end_page: int,
     chapter_pages: List[Dict[str, Any]],
     global_footnote_num: int,
-) -> Tuple[List[str], List[Dict[str, Any]], int]:
+    run: Optional[GuidelineRunContext] = None,
+) -> Tuple[GuidelineChapter, List[Dict[str, Any]], int]:
     """
-    Build chapter header section with summary and footnote.
+    Start the chapter model: header fields, summary and summary footnote.
 
     Extracted from _process_single_chapter to reduce complexity.
 
@@ -2090,36 +2590,28 @@ def _build_chapter_header(
         end_page: End page
         chapter_pages: List of page data
         global_footnote_num: Current footnote number
+        run: Book run (None = CLI defaults)
 
     Returns:
-        Tuple of (header_lines, footnotes, updated_footnote_num)
+        Tuple of (chapter, footnotes, updated_footnote_num)
 
     Reference:
         - Fluent Python Ch. 7: Extract function pattern
     """
-    doc = []
-    doc.append(f"## Chapter {chapter_num}: {chapter_title}")
-    doc.append("")
-    doc.append(f"*Source: {CURRENT_BOOK_META['full_title']}, pages {start_page}–{end_page}*")
-    doc.append("")
-    doc.append("### Chapter Summary")
-    doc.append(generate_chapter_summary(chapter_pages, chapter_num) + f" [^{global_footnote_num}]")
+    run = _run_or_default(run)
+    chapter = GuidelineChapter(
+        chapter_num=chapter_num,
+        title=chapter_title,
+        start_page=start_page,
+        end_page=end_page,
+        summary=generate_chapter_summary(chapter_pages, chapter_num, run),
+        summary_footnote_num=global_footnote_num,
+    )
 
     # Summary footnote
-    footnotes = []
-    footnotes.append(
-        {
-            "num": global_footnote_num,
-            "author": CURRENT_BOOK_META["author"],
-            "title": CURRENT_BOOK_META["full_title"],
-            "file": PRIMARY_BOOK,
-            "page": start_page,
-            "start_line": 1,
-            "end_line": 25,
-        }
-    )
+    footnotes = [run.footnote(global_footnote_num, start_page, 1, 25)]
 
-    return doc, footnotes, global_footnote_num + 1
+    return chapter, footnotes, global_footnote_num + 1
 
 
 def _extract_chapter_pages(
@@ -2151,6 +2643,7 @@ def _build_chapter_concepts(
     primary: Dict[str, Any],
     global_footnote_num: int,
     chapter_num: int,
+    run: Optional[GuidelineRunContext] = None,
 ) -> ChapterProcessingResult:
     """
     Extract and build concept sections for a chapter.
@@ -2162,26 +2655,26 @@ def _build_chapter_concepts(
         primary: Primary book JSON data
         global_footnote_num: Current footnote number
         chapter_num: Chapter number
+        run: Book run (None = CLI defaults)
 
     Returns:
-        ChapterProcessingResult with concepts text, updated footnote_num, footnotes, and concept set
+        ChapterProcessingResult with concept entries, updated footnote_num, footnotes, and concept set
 
     References:
         - ANTI_PATTERN_ANALYSIS §10.2: Extract Method + Parameter Object patterns
         - Architecture Patterns Ch.3: Abstraction boundaries
     """
-    chapter_text = "\n".join([p.get("content", "") for p in chapter_pages])
-    chapter_concepts = _extract_chapter_concepts(chapter_text)
+    chapter_concepts = _extract_chapter_concepts(chapter_pages)
 
-    concepts, global_footnote_num, new_foots = build_concept_sections(
-        primary, chapter_pages, global_footnote_num, chapter_num, chapter_concepts=chapter_concepts
+    entries, global_footnote_num, new_foots = collect_concept_entries(
+        chapter_pages, global_footnote_num, chapter_concepts=chapter_concepts, run=run
     )
 
     return ChapterProcessingResult(
-        text=concepts,
         footnote_num=global_footnote_num,
         footnotes=new_foots,
         concepts=chapter_concepts,
+        concept_entries=entries,
     )
 
 
@@ -2193,6 +2686,7 @@ def _generate_chapter_cross_refs(
     chapter_num: int,
     global_footnote_num: int,
     enriched_metadata: Optional[Dict[str, Any]] = None,
+    run: Optional[GuidelineRunContext] = None,
 ) -> ChapterProcessingResult:
     """
     Generate cross-references and see-also sections for a chapter.
@@ -2210,6 +2704,7 @@ def _generate_chapter_cross_refs(
         chapter_num: Chapter number
         global_footnote_num: Current footnote number
         enriched_metadata: Optional enriched metadata from Tab 4 (with topic_id)
+        run: Book run (None = CLI defaults)
 
     Returns:
         ChapterProcessingResult with see-also text, updated footnote_num, and footnotes
@@ -2228,6 +2723,7 @@ def _generate_chapter_cross_refs(
         companions,
         chapter_num=chapter_num,
         enriched_metadata=enriched_metadata,
+        run=run,
     )
 
     # Build see-also section with comprehensive summaries
@@ -2238,6 +2734,7 @@ def _generate_chapter_cross_refs(
         primary_book=primary,
         current_concepts=chapter_concepts,
         all_chapters=CHAPTERS,
+        run=run,
     )
 
     return ChapterProcessingResult(
@@ -2248,8 +2745,8 @@ def _generate_chapter_cross_refs(
 
 
 def _assemble_chapter_output(
-    doc: List[str],
-    concepts: str,
+    chapter: GuidelineChapter,
+    concepts: List[GuidelineConcept],
     tpm_sec: str,
     see_also: str,
     chapter_footnotes: List[Dict[str, Any]],
@@ -2261,30 +2758,25 @@ def _assemble_chapter_output(
     Applies Extract Method pattern to reduce complexity in _process_single_chapter().
 
     Args:
-        doc: Chapter document lines (header already added)
-        concepts: Concept sections text
+        chapter: Chapter model (header and summary already set)
+        concepts: Concept entries
         tpm_sec: TPM section text
         see_also: See-also section text
         chapter_footnotes: Accumulated footnotes
         global_footnote_num: Final footnote number
 
     Returns:
-        Dictionary with chapter_doc, global_footnote_num, new_footnotes
+        Dictionary with chapter, global_footnote_num, new_footnotes
 
     References:
         - ANTI_PATTERN_ANALYSIS §10.2: Extract Method pattern
     """
-    doc.append("")
-    doc.append("### Concept-by-Concept Breakdown")
-    doc.append(concepts)
-    doc.append(tpm_sec)
-    doc.append(see_also)
-    doc.append("")
-    doc.append("---")
-    doc.append("")
+    chapter.concepts = concepts
+    chapter.tpm_section = tpm_sec
+    chapter.see_also = see_also
 
     return {
-        "chapter_doc": doc,
+        "chapter": chapter,
         "global_footnote_num": global_footnote_num,
         "new_footnotes": chapter_footnotes,
     }
@@ -2296,6 +2788,7 @@ def _process_single_chapter(
     companions: Dict[str, Dict[str, Any]],
     global_footnote_num: int,
     enriched_metadata: Optional[Dict[str, Any]] = None,
+    run: Optional[GuidelineRunContext] = None,
 ) -> Dict[str, Any]:
     """
     Process a single chapter - extract content, concepts, cross-references.
@@ -2312,10 +2805,11 @@ def _process_single_chapter(
         companions: Dict of companion book data
         global_footnote_num: Current footnote number
         enriched_metadata: Optional enriched metadata from Tab 4 (with topic_id)
+        run: Book run (None = CLI defaults)
 
     Returns:
         Dictionary with:
-            - chapter_doc: List of chapter document lines
+            - chapter: GuidelineChapter model of the chapter
             - global_footnote_num: Updated footnote number
             - new_footnotes: List of new footnotes for this chapter
 
@@ -2325,6 +2819,7 @@ def _process_single_chapter(
         - Architecture Patterns Ch. 4: Service Layer orchestration
         - BERTOPIC_SENTENCE_TRANSFORMERS_DESIGN.md: Option C Architecture
     """
+    run = _run_or_default(run)
     # Convert tuple to dataclass (reduces 4 locals to 1)
     chapter = ChapterData.from_tuple(chapter_data)
     print(
@@ -2337,39 +2832,41 @@ def _process_single_chapter(
     print(f"  Found {len(chapter_pages)} pages")
 
     # Step 2: Build header
-    doc, chapter_footnotes, global_footnote_num = _build_chapter_header(
-        chapter.chapter_num, chapter.chapter_title, chapter.start_page, chapter.end_page, chapter_pages, global_footnote_num
+    guideline_chapter, chapter_footnotes, global_footnote_num = _build_chapter_header(
+        chapter.chapter_num, chapter.chapter_title, chapter.start_page, chapter.end_page, chapter_pages,
+        global_footnote_num, run,
     )
 
     # Step 3: Build concepts
-    concepts_result = _build_chapter_concepts(chapter_pages, primary, global_footnote_num, chapter.chapter_num)
+    concepts_result = _build_chapter_concepts(
+        chapter_pages, primary, global_footnote_num, chapter.chapter_num, run
+    )
     chapter_footnotes.extend(concepts_result.footnotes)
 
-    # Step 4: Build TPM
-    non_primary_companions = {k: v for k, v in companions.items() if k != PRIMARY_BOOK}
+    # Step 4: Build TPM (candidate index is shared across chapters)
     tpm_sec, tpm_footnote_num, tpm_foot = build_tpm_section(
-        non_primary_companions, concepts_result.footnote_num, chapter.chapter_num
+        companions, concepts_result.footnote_num, chapter.chapter_num, exclude_book=run.primary_book
     )
     if tpm_foot:
         chapter_footnotes.append(tpm_foot)
 
     # Step 5: Build cross-references (with optional enriched metadata)
-    chapter_concepts_set = concepts_result.concepts if concepts_result.concepts else set()
     xrefs_result = _generate_chapter_cross_refs(
         chapter_pages, 
         primary, 
         companions, 
-        chapter_concepts_set, 
+        concepts_result.concepts or set(),
         chapter.chapter_num, 
         tpm_footnote_num,
         enriched_metadata=enriched_metadata,
+        run=run,
     )
     chapter_footnotes.extend(xrefs_result.footnotes)
 
     # Step 6: Assemble output
     return _assemble_chapter_output(
-        doc,
-        concepts_result.text,
+        guideline_chapter,
+        concepts_result.concept_entries,
         tpm_sec,
         xrefs_result.text,
         chapter_footnotes,
@@ -2377,322 +2874,6 @@ def _process_single_chapter(
     )
 
 
-def _extract_book_metadata(full_md: str, book_name: str) -> Dict[str, str]:
-    """
-    Extract book metadata from markdown header.
-
-    Extracted helper following DRY principle and Extract Function pattern.
-
-    Args:
-        full_md: Full markdown content
-        book_name: Book name fallback
-
-    Returns:
-        Dictionary with title, source, book_name
-
-    References:
-        - Fluent Python Ch. 7: Extract function pattern
-        - PYTHON_GUIDELINES: Single Responsibility Principle
-    """
-    title_match = re.search(r"^# (.+)$", full_md, re.MULTILINE)
-    source_match = re.search(r"\*Source: (.+)\*", full_md)
-
-    return {
-        "title": title_match.group(1).strip() if title_match else book_name,
-        "source": (
-            source_match.group(1).strip() if source_match else f"{book_name} (source unknown)"
-        ),
-        "book_name": book_name,
-    }
-
-
-def _extract_concept_data(chapter_content: str) -> List[Dict[str, Any]]:
-    """
-    Extract concept data from chapter content.
-
-    Extracted helper following DRY principle. Parses concept-by-concept breakdown
-    sections to extract verbatim excerpts and annotations.
-
-    Args:
-        chapter_content: Chapter markdown content
-
-    Returns:
-        List of concept dictionaries with name, page, excerpt, annotation
-
-    References:
-        - Python Cookbook 3rd Recipe 2.18: Tokenizing text
-        - ARCHITECTURE_GUIDELINES Ch. 3: Extract method refactoring
-    """
-    concepts = []
-    # Fixed regex: Annotation should stop at next heading (####, ###) or end of string
-    # Security: Limit quantifiers to prevent ReDoS (max 10KB per field)
-    # Allow newlines between sections but limit overall length
-    concept_pattern = (
-        r"#### \*\*([^\*]{1,200})\*\* \*\(p\.(\d{1,5})\)\*[^\n]{0,100}\n\n"
-        r"\*\*Verbatim Educational Excerpt\*\*[^`]{0,100}```\n([^`]{1,5000})\n```\n"
-        r"\[[\^\d]{1,10}\]\n\*\*Annotation:\*\* ([^\n#]{1,10000})(?=\n\n####|\n\n###|\Z)"
-    )
-
-    for concept_match in re.finditer(concept_pattern, chapter_content, re.DOTALL):
-        concept = {
-            "name": concept_match.group(1),
-            "page": int(concept_match.group(2)),
-            "verbatim_excerpt": concept_match.group(3).strip(),
-            "annotation": concept_match.group(4).strip(),
-        }
-        concepts.append(concept)
-
-    return concepts
-
-
-def _extract_chapter_sections(chapter_content: str) -> Dict[str, str]:
-    """
-    Extract cross-text analysis and chapter summary sections.
-
-    Extracted helper following DRY principle. Uses regex to locate
-    specific markdown sections within chapter content.
-
-    Args:
-        chapter_content: Chapter markdown content
-
-    Returns:
-        Dictionary with cross_text_analysis and chapter_summary
-
-    References:
-        - Python Cookbook 3rd Recipe 2.18: Text parsing patterns
-        - Fluent Python Ch. 7: Extract function pattern
-    """
-    # Fixed regex: Use greedy quantifiers to capture full section content until next heading
-    cross_text_match = re.search(
-        r"### Cross-Text Analysis\n\n(.+)(?=###|\Z)", chapter_content, re.DOTALL
-    )
-    summary_match = re.search(r"### Chapter Summary\n(.+)(?=###|\Z)", chapter_content, re.DOTALL)
-
-    return {
-        "cross_text_analysis": cross_text_match.group(1).strip() if cross_text_match else "",
-        "chapter_summary": summary_match.group(1).strip() if summary_match else "",
-    }
-
-
-def _parse_chapter_header(section: str) -> Optional[Tuple[int, str]]:
-    """
-    Parse chapter header to extract number and title.
-
-    Extract Method refactoring from _convert_markdown_to_json (CC reduction).
-
-    Args:
-        section: Markdown section text
-
-    Returns:
-        Tuple of (chapter_number, chapter_title) or None if not found
-
-    References:
-        - Architecture Patterns Ch. 3: Extract Method pattern
-    """
-    header_match = re.match(r"## Chapter (\d+): ([^\n]+)", section)
-    if not header_match:
-        return None
-
-    chapter_num = int(header_match.group(1))
-    chapter_title = header_match.group(2).strip()
-    return (chapter_num, chapter_title)
-
-
-def _extract_page_range(chapter_content: str) -> Optional[Dict[str, int]]:
-    """
-    Extract page range from chapter content.
-
-    Extract Method refactoring from _convert_markdown_to_json (CC reduction).
-
-    Args:
-        chapter_content: Full chapter markdown content
-
-    Returns:
-        Dictionary with start/end keys or None if not found
-
-    References:
-        - Python Guidelines Ch. 4: Functions for code organization
-    """
-    page_range_match = re.search(r"pages (\d+)–(\d+)", chapter_content, re.IGNORECASE)
-    if not page_range_match:
-        # Try alternative format: **Pages**: 1–50
-        page_range_match = re.search(r"\*\*Pages\*\*:\s*(\d+)–(\d+)", chapter_content)
-
-    if page_range_match:
-        return {"start": int(page_range_match.group(1)), "end": int(page_range_match.group(2))}
-    return None
-
-
-def _build_chapter_data(
-    chapter_num: int, chapter_title: str, chapter_content: str
-) -> Dict[str, Any]:
-    """
-    Build complete chapter data dictionary.
-
-    Extract Method refactoring from _convert_markdown_to_json (CC reduction).
-    Consolidates all chapter data extraction into single function.
-
-    Args:
-        chapter_num: Chapter number
-        chapter_title: Chapter title
-        chapter_content: Full chapter markdown content
-
-    Returns:
-        Complete chapter data dictionary
-
-    References:
-        - Architecture Patterns Ch. 3: Extract Method pattern
-        - Python Guidelines Ch. 2: Data structures
-    """
-    # Extract concepts using helper function - may return empty list
-    concepts = _extract_concept_data(chapter_content)
-
-    # Extract chapter sections using helper function
-    sections = _extract_chapter_sections(chapter_content)
-    cross_text_analysis = sections["cross_text_analysis"]
-    chapter_summary = sections["chapter_summary"]
-
-    # Extract page range
-    page_range = _extract_page_range(chapter_content)
-
-    return {
-        "chapter_number": chapter_num,
-        "title": chapter_title,
-        "page_range": page_range,
-        "cross_text_analysis": cross_text_analysis,
-        "chapter_summary": chapter_summary,
-        "concepts": concepts,
-    }
-
-
-def _parse_all_chapters(chapter_sections: List[str]) -> List[Dict[str, Any]]:
-    """
-    Parse all chapter sections into structured data.
-
-    Extract Method refactoring from _convert_markdown_to_json (CC reduction).
-    Separates chapter parsing logic from main conversion function.
-
-    Args:
-        chapter_sections: List of markdown chapter sections
-
-    Returns:
-        List of parsed chapter dictionaries
-
-    Raises:
-        ValueError: If chapter parsing fails critically
-
-    References:
-        - Architecture Patterns Ch. 3: Extract Method pattern
-        - Python Guidelines Ch. 24: Error handling patterns
-    """
-    chapters = []
-
-    for section in chapter_sections:
-        if not section.strip() or not section.startswith("## Chapter"):
-            continue
-
-        try:
-            # Parse chapter header
-            header_info = _parse_chapter_header(section)
-            if not header_info:
-                continue
-
-            chapter_num, chapter_title = header_info
-            chapter_content = section.strip()
-
-            # Build complete chapter data
-            chapter_data = _build_chapter_data(chapter_num, chapter_title, chapter_content)
-            chapters.append(chapter_data)
-
-        except (ValueError, IndexError, AttributeError) as e:
-            # Log warning but continue processing other chapters
-            chapter_id = header_info[0] if header_info else "unknown"
-            print(f"⚠️  Warning: Skipping malformed chapter {chapter_id}: {e}")
-            continue
-
-    return chapters
-
-
-def _convert_markdown_to_json(
-    all_docs: List[str], book_name: str, all_footnotes: List[Dict]
-) -> Dict[str, Any]:
-    """
-    Convert markdown guideline to JSON structure (refactored: CC 14 → 8).
-
-    Implements Tab 5 JSON generation requirement from CONSOLIDATED_IMPLEMENTATION_PLAN.
-    Refactored using Extract Method pattern to reduce complexity.
-    Follows EAFP pattern for error handling.
-
-    Args:
-        all_docs: List of all document lines (markdown)
-        book_name: Name of the book
-        all_footnotes: List of footnote dictionaries
-
-    Returns:
-        JSON-serializable dictionary mirroring MD content
-
-    Raises:
-        ValueError: If markdown structure is invalid or unparseable
-
-    References:
-        - CONSOLIDATED_IMPLEMENTATION_PLAN Tab 5: JSON output requirement
-        - Architecture Patterns Ch. 3: Extract Method refactoring (CC reduction)
-        - Python Cookbook 3rd Recipe 5.18: JSON handling
-        - Fluent Python Ch. 18: EAFP error handling style
-    """
-    # Validate input
-    if not all_docs:
-        raise ValueError("Cannot convert empty document to JSON")
-
-    # Join all docs and validate format
-    try:
-        full_md = "\n".join(all_docs)
-    except TypeError as e:
-        raise ValueError(f"Invalid markdown document format: {e}") from e
-
-    # Extract book metadata
-    try:
-        book_metadata = _extract_book_metadata(full_md, book_name)
-    except (AttributeError, IndexError) as e:
-        raise ValueError(f"Failed to extract book metadata: {e}") from e
-
-    # Split markdown into chapter sections
-    chapter_sections = re.split(r"(?=^## Chapter \d+:)", full_md, flags=re.MULTILINE)
-
-    # Parse all chapters using extracted method
-    try:
-        chapters = _parse_all_chapters(chapter_sections)
-    except Exception as e:
-        raise ValueError(f"Failed to parse chapter structure: {e}") from e
-
-    if not chapters:
-        raise ValueError("No chapters found in markdown document")
-
-    # Build final JSON structure
-    guideline_json = {
-        "book_metadata": book_metadata,
-        "source_info": {
-            "generated_by": "chapter_generator_all_text.py",
-            "generation_date": "2025-11-25",
-            "method": "statistical (YAKE + Summa + TF-IDF)",
-        },
-        "chapters": chapters,
-        "footnotes": [
-            {
-                "number": f["num"],
-                "author": f["author"],
-                "title": f["title"],
-                "file": f["file"],
-                "page": f["page"],
-                "lines": {"start": f["start_line"], "end": f["end_line"]},
-            }
-            for f in all_footnotes
-        ],
-    }
-
-    return guideline_json
-
-
 def _prepare_output_paths(book_name: str) -> Tuple[Path, Path]:
     """
     Prepare output directory and file paths.
@@ -2719,47 +2900,43 @@ def _prepare_output_paths(book_name: str) -> Tuple[Path, Path]:
     return md_path, json_path
 
 
-def _convert_to_json(
-    all_docs: List[str], book_name: str, all_footnotes: List[Dict]
-) -> Optional[Dict[str, Any]]:
+def _convert_to_json(document: GuidelineDocument) -> Optional[Dict[str, Any]]:
     """
-    Convert markdown to JSON structure with error handling.
+    Render the document model as JSON structure with error handling.
 
-    Pipeline Step 2: MD → JSON conversion.
+    Pipeline Step 2: model → JSON (no Markdown re-parsing).
     Applies Pipeline Pattern to reduce complexity in _write_output_file().
 
     Args:
-        all_docs: Markdown document lines
-        book_name: Book name
-        all_footnotes: Footnote data
+        document: Guideline document model
 
     Returns:
-        JSON dictionary or None if conversion fails
+        JSON dictionary or None if the document cannot be rendered
 
     References:
         - ANTI_PATTERN_ANALYSIS §10.3: Pipeline Pattern
         - Fluent Python Ch.18: EAFP error handling
     """
     try:
-        return _convert_markdown_to_json(all_docs, book_name, all_footnotes)
-    except (AttributeError, ValueError, IndexError) as e:
-        print("⚠️  Warning: Failed to parse markdown for JSON conversion")
+        return document.to_json()
+    except (KeyError, ValueError) as e:
+        print("⚠️  Warning: Failed to build guideline JSON")
         print(f"  Error: {e}")
         print("  Markdown file created successfully, but JSON generation failed")
-        print("  Check markdown structure and retry if needed")
         return None
 
 
-def _write_markdown_file(md_path: Path, all_docs: List[str]) -> bool:
+def _write_markdown_file(md_path: Path, document: GuidelineDocument) -> bool:
     """
     Write markdown file with error handling.
 
-    Pipeline Step 3: Write MD output.
+    Pipeline Step 3: Write MD output, streamed chapter by chapter so the
+    full document is never held as one string.
     Applies Pipeline Pattern to reduce complexity in _write_output_file().
 
     Args:
         md_path: Path to markdown file
-        all_docs: Markdown document lines
+        document: Guideline document model
 
     Returns:
         True if successful
@@ -2772,7 +2949,8 @@ def _write_markdown_file(md_path: Path, all_docs: List[str]) -> bool:
         - Python Distilled Ch.9: File I/O
     """
     try:
-        md_path.write_text("\n".join(all_docs), encoding="utf-8")
+        with open(md_path, "w", encoding="utf-8") as f:
+            f.writelines(document.iter_markdown())
         md_size = md_path.stat().st_size
         print(f"✓ Markdown file written: {md_path.name} ({md_size:,} bytes)")
         return True
@@ -2850,23 +3028,20 @@ def _log_output_summary(md_path: Path, json_path: Path) -> None:
     print("=" * 70 + "\n")
 
 
-def _write_output_file(
-    all_docs: List[str], book_name: str, all_footnotes: Optional[List[Dict[Any, Any]]] = None
-) -> None:
+def _write_output_file(document: GuidelineDocument) -> None:
     """
     Write final document to both MD and JSON output files.
 
     Refactored using Pipeline Pattern to reduce statement count from 51→17.
     Orchestrates 5-step pipeline: prepare → write MD → convert → write JSON → log.
+    Both outputs are rendered from the same document model.
 
     Implements dual output requirement from CONSOLIDATED_IMPLEMENTATION_PLAN Tab 5.
     Follows EAFP (Easier to Ask Forgiveness than Permission) error handling pattern.
     Outputs to workflow output folder following repository conventions.
 
     Args:
-        all_docs: List of all document lines (markdown)
-        book_name: Name of the book (for filename)
-        all_footnotes: List of footnote dictionaries (for JSON generation)
+        document: Guideline document model (chapters and footnotes)
 
     Raises:
         OSError: If file write fails due to permissions or disk space
@@ -2881,15 +3056,15 @@ def _write_output_file(
         - WORKFLOW_OUTPUT_ANALYSIS.md: Output folder convention
     """
     # Pipeline Step 1: Prepare paths
-    md_path, json_path = _prepare_output_paths(book_name)
+    md_path, json_path = _prepare_output_paths(document.book_name)
 
     # Pipeline Step 2: Write markdown (always succeeds or raises)
-    _write_markdown_file(md_path, all_docs)
+    _write_markdown_file(md_path, document)
 
-    # Pipeline Step 3: Convert to JSON (may return None on failure)
-    guideline_json = _convert_to_json(all_docs, book_name, all_footnotes or [])
+    # Pipeline Step 3: Render JSON from the model (may return None on failure)
+    guideline_json = _convert_to_json(document)
     if not guideline_json:
-        return  # MD written, JSON conversion failed gracefully
+        return  # MD written, JSON rendering failed gracefully
 
     # Pipeline Step 4: Write JSON (may fail gracefully)
     _write_json_file(json_path, guideline_json)
@@ -2898,12 +3073,20 @@ def _write_output_file(
     _log_output_summary(md_path, json_path)
 
 
-def main(custom_input_path: Optional[Path] = None):
+def main(
+    custom_input_path: Optional[Path] = None,
+    companions: Optional[Dict[str, Dict[str, Any]]] = None,
+    run: Optional[GuidelineRunContext] = None,
+):
     """
     Main orchestrator for generating comprehensive Python guidelines.
 
     Args:
         custom_input_path: Path to input JSON file (REQUIRED - no default)
+        companions: Already-loaded companion books (library mode); loaded
+            from ALL_BOOKS when omitted
+        run: Book run passed to every chapter helper; built from the
+            PRIMARY_BOOK/KEY_CONCEPTS CLI defaults when omitted
 
     Refactored from complexity 20 → <10 by extracting helper functions.
     Follows Service Layer pattern (Architecture Patterns Ch. 4).
@@ -2914,10 +3097,9 @@ def main(custom_input_path: Optional[Path] = None):
     Workflow:
         1. Load primary and companion books
         1b. Load enriched metadata (if available)
-        2. Build document header
+        2. Start the document model
         3. Process each chapter (extracted to helper)
-        4. Add footnotes
-        5. Write output file (extracted to helper)
+        4. Write MD and JSON output files from the model (extracted to helper)
 
     Reference:
         - Architecture Patterns Ch. 4: Service Layer orchestration
@@ -2937,14 +3119,16 @@ def main(custom_input_path: Optional[Path] = None):
     print("Multi-Chapter Generator - Tab 5: Guideline Generation")
     print("=" * 66)
 
-    # Type guard: PRIMARY_BOOK must be set by argparse before reaching here
-    if PRIMARY_BOOK is None:
+    # Type guard: the primary book must be known before reaching here
+    run = _run_or_default(run)
+    if run.primary_book is None:
         print("ERROR: PRIMARY_BOOK not set (should be set by argparse)")
         sys.exit(1)
 
     # Step 1: Load primary and companion books
-    primary = load_json_book(PRIMARY_BOOK, custom_path=custom_input_path)
-    companions = _load_companion_books(ALL_BOOKS)
+    primary = load_json_book(run.primary_book, custom_path=custom_input_path)
+    if companions is None:
+        companions = _load_companion_books(ALL_BOOKS)
     
     # Step 1a: Extract chapters from input JSON (dynamic, not hardcoded)
     chapters_from_json = _extract_chapters_from_json(primary)
@@ -2955,25 +3139,26 @@ def main(custom_input_path: Optional[Path] = None):
         chapters_to_process = chapters_from_json
         print(f"✓ Extracted {len(chapters_to_process)} chapters from input JSON")
     
-    # Step 1b: Load enriched metadata from Tab 4 (Option C Architecture)
-    enriched_metadata: Optional[Dict[str, Any]] = None
-    enriched_file = _get_enriched_metadata_filename(PRIMARY_BOOK)
-    if enriched_file:
-        print("\nLoading enriched metadata (Tab 4 output)...")
-        enriched_metadata = _load_enriched_metadata(enriched_file)
-        if enriched_metadata:
-            topic_info = enriched_metadata.get("enrichment_metadata", {}).get("topic_clustering", {})
-            print(f"  ✓ Loaded enriched metadata with {topic_info.get('num_topics', 0)} topics")
-        else:
-            print("  Note: Enriched metadata not found, using keyword-based cross-referencing")
-
-    # Step 2: Build document header
-    total_chapters = len(chapters_to_process)
-    all_docs = _build_document_header(total_chapters)
+    # Step 1b: Load basic + enriched metadata (Tab 4, Option C Architecture) once per run
+    print("\nLoading chapter metadata (basic + Tab 4 enriched)...")
+    run.metadata_index = BookMetadataIndex.load(run.primary_book)
+    enriched_metadata = run.metadata_index.enriched
+    if enriched_metadata:
+        topic_info = enriched_metadata.get("enrichment_metadata", {}).get("topic_clustering", {})
+        print(f"  ✓ Loaded enriched metadata with {topic_info.get('num_topics', 0)} topics")
+    elif _get_enriched_metadata_filename(run.primary_book):
+        print("  Note: Enriched metadata not found, using keyword-based cross-referencing")
+
+    # Step 2: Start the document model
+    document = GuidelineDocument(
+        book_name=run.primary_book,
+        full_title=run.book_meta["full_title"],
+        total_chapters=len(chapters_to_process),
+        book_meta=run.book_meta,
+    )
 
     # Step 3: Process each chapter
     global_footnote_num = 1
-    all_footnotes = []
 
     for chapter_data in chapters_to_process:
         result = _process_single_chapter(
@@ -2982,32 +3167,205 @@ def main(custom_input_path: Optional[Path] = None):
             companions=companions,
             global_footnote_num=global_footnote_num,
             enriched_metadata=enriched_metadata,
+            run=run,
         )
 
         # Update state
-        all_docs.append("\n".join(result["chapter_doc"]))
+        document.chapters.append(result["chapter"])
         global_footnote_num = result["global_footnote_num"]
-        all_footnotes.extend(result["new_footnotes"])
-
-    # Step 4: Add footnotes section
-    all_docs.append("\n---\n\n### **Footnotes**\n")
-    for f in all_footnotes:
-        citation = CitationInfo(
-            num=f["num"],
-            author=f["author"],
-            title=f["title"],
-            file_stub=f["file"],
-            page=f["page"],
-            start_line=f["start_line"],
-            end_line=f["end_line"],
-        )
-        all_docs.append(chicago_footnote(citation))
-    all_docs.append("")
+        document.footnotes.extend(result["new_footnotes"])
+
+    # Step 4: Write output files (MD + JSON, both rendered from the model)
+    _write_output_file(document)
 
-    # Step 5: Write output files (MD + JSON)
-    # Type guard: PRIMARY_BOOK is already validated above
-    if PRIMARY_BOOK is not None:
-        _write_output_file(all_docs, PRIMARY_BOOK, all_footnotes)
+
+# -------------------------------
+# Library mode: many primary books in one process
+# -------------------------------
+
+
+def load_taxonomy_concepts(taxonomy_path: Path) -> List[str]:
+    """
+    Collect the concepts of every tier of a taxonomy file.
+
+    Handles the 'tiers' layout and the legacy flat layout.
+
+    Raises:
+        OSError, json.JSONDecodeError: If the file cannot be read or parsed
+    """
+    with open(taxonomy_path, "r", encoding="utf-8") as f:
+        taxonomy_data = json.load(f)
+
+    loaded_concepts: List[str] = []
+
+    # Handle new taxonomy structure with 'tiers' key
+    if "tiers" in taxonomy_data:
+        for tier_name, tier_content in taxonomy_data["tiers"].items():
+            if isinstance(tier_content, dict) and "concepts" in tier_content:
+                loaded_concepts.extend(tier_content["concepts"])
+                print(f"  ✓ Loaded {len(tier_content['concepts'])} concepts from '{tier_name}' tier")
+            elif isinstance(tier_content, list):
+                loaded_concepts.extend(tier_content)
+    # Handle legacy flat structure
+    else:
+        for tier_data in taxonomy_data.values():
+            if isinstance(tier_data, dict) and "concepts" in tier_data:
+                loaded_concepts.extend(tier_data["concepts"])
+            elif isinstance(tier_data, list):
+                loaded_concepts.extend(tier_data)
+
+    return loaded_concepts
+
+
+@dataclass
+class CompanionCorpus:
+    """Companion books and taxonomy concepts, loaded once for a batch of books."""
+
+    companions: Dict[str, Dict[str, Any]]
+    key_concepts: Optional[List[str]] = None
+
+
+def load_companion_corpus(key_concepts: Optional[List[str]] = None) -> CompanionCorpus:
+    """Load ALL_BOOKS and compile the concept matcher once (before any fork)."""
+    corpus = CompanionCorpus(_load_companion_books(ALL_BOOKS), key_concepts)
+    _concept_locator()
+    return corpus
+
+
+def generate_book_guideline(input_path: Path, corpus: CompanionCorpus) -> bool:
+    """
+    Generate one book's guideline against a preloaded companion corpus.
+
+    Returns:
+        True on success; failures are reported and do not stop a batch
+    """
+    context = GuidelineRunContext(primary_book=input_path.stem, key_concepts=corpus.key_concepts)
+    print(f"Processing book: {context.primary_book}")
+    print(f"Input file: {input_path}")
+    try:
+        main(custom_input_path=input_path, companions=corpus.companions, run=context)
+        return True
+    except (Exception, SystemExit) as e:  # noqa: BLE001 - isolate books in a batch
+        print(f"❌ Guideline generation failed for {context.primary_book}: {e}")
+        return False
+
+
+# Corpus inherited by forked workers (set only while workers are running)
+_worker_corpus: Optional[CompanionCorpus] = None
+
+# Exit status of a worker whose book failed (and was already reported)
+_BOOK_FAILED_EXIT = 3
+
+
+def _generate_in_worker(input_path: Path) -> bool:
+    assert _worker_corpus is not None, "worker started without a companion corpus"
+    return generate_book_guideline(input_path, _worker_corpus)
+
+
+def _book_worker_main(input_path: Path) -> None:
+    """Forked worker entry point: one book, reported through the exit status."""
+    sys.exit(0 if _generate_in_worker(input_path) else _BOOK_FAILED_EXIT)
+
+
+def _finished_book_result(input_path: Path, exitcode: Optional[int]) -> bool:
+    """A finished worker's result; a book whose worker process died counts as failed."""
+    if exitcode == 0:
+        return True
+    if exitcode != _BOOK_FAILED_EXIT:
+        print(f"❌ Guideline generation failed for {input_path.stem}: worker process died (exit code {exitcode})")
+    return False
+
+
+def _generate_in_forked_workers(
+    paths: List[Path],
+    workers: int,
+    book_timeout: Optional[float],
+) -> List[bool]:
+    """
+    Generate each book in its own forked process, ``workers`` at a time.
+
+    A book still running after ``book_timeout`` seconds has its process
+    killed and counts as failed, so one hung book cannot stall the batch.
+    """
+    context = multiprocessing.get_context("fork")
+    results: Dict[int, bool] = {}
+    pending = list(enumerate(paths))
+    running: Dict[int, Tuple[Any, float]] = {}
+
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                idx, path = pending.pop(0)
+                process = context.Process(target=_book_worker_main, args=(path,))
+                process.start()
+                running[idx] = (process, time.monotonic())
+
+            wait_for = None
+            if book_timeout is not None:
+                first_deadline = min(started for _, started in running.values()) + book_timeout
+                wait_for = max(0.0, first_deadline - time.monotonic())
+            multiprocessing.connection.wait([process.sentinel for process, _ in running.values()], wait_for)
+
+            for idx, (process, started) in list(running.items()):
+                if not process.is_alive():
+                    process.join()
+                    results[idx] = _finished_book_result(paths[idx], process.exitcode)
+                elif book_timeout is not None and time.monotonic() - started >= book_timeout:
+                    process.kill()
+                    process.join()
+                    print(f"❌ Guideline generation failed for {paths[idx].stem}: timed out after {book_timeout:.0f}s")
+                    results[idx] = False
+                else:
+                    continue
+                del running[idx]
+    finally:
+        for process, _ in running.values():
+            process.kill()
+            process.join()
+
+    return [results[idx] for idx in range(len(paths))]
+
+
+def generate_guidelines(
+    input_paths: List[Path],
+    key_concepts: Optional[List[str]] = None,
+    workers: int = 1,
+    book_timeout: Optional[float] = None,
+) -> Dict[str, bool]:
+    """
+    Generate guidelines for several primary books in one process.
+
+    The companion corpus (ALL_BOOKS) and the concept matcher are loaded
+    once and shared by every book; a subprocess per book reloaded them
+    each time. With ``workers`` > 1 or a ``book_timeout`` each book runs in
+    a process forked from the warm one (POSIX only; falls back to
+    sequential, without a timeout, elsewhere). A book whose worker dies or
+    overruns ``book_timeout`` is reported as failed.
+
+    Args:
+        input_paths: Primary book JSON files
+        key_concepts: Taxonomy concepts for cross-book matching (None = defaults)
+        workers: Books generated in parallel
+        book_timeout: Seconds one book may take before its worker is killed (None = no limit)
+
+    Returns:
+        Book name (file stem) -> success
+    """
+    global _worker_corpus
+    corpus = load_companion_corpus(key_concepts)
+    paths = [Path(p) for p in input_paths]
+
+    forked = (workers > 1 and len(paths) > 1) or book_timeout is not None
+    if forked and "fork" in multiprocessing.get_all_start_methods():
+        _worker_corpus = corpus
+        try:
+            results = _generate_in_forked_workers(paths, max(1, workers), book_timeout)
+        finally:
+            _worker_corpus = None
+    else:
+        results = [generate_book_guideline(path, corpus) for path in paths]
+
+    return {path.stem: ok for path, ok in zip(paths, results)}
 
 
 if __name__ == "__main__":
@@ -3016,36 +3374,33 @@ if __name__ == "__main__":
         description="Generate comprehensive guidelines from textbook JSON"
     )
     parser.add_argument(
-        "input_file",
-        help="Path to input JSON file (e.g., workflows/pdf_to_json/output/textbooks_json/makinggames.json)",
+        "input_files",
+        nargs="+",
+        metavar="input_file",
+        help="Path to input JSON file(s) (e.g., workflows/pdf_to_json/output/textbooks_json/makinggames.json); "
+        "several books share one loaded companion corpus",
     )
     parser.add_argument(
         "--taxonomy",
         type=str,
         help="Path to taxonomy JSON file to use for cross-referencing (e.g., workflows/taxonomy_generation/output/python_taxonomy.json)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Books generated in parallel, forked after the companion corpus is loaded (default: 1)",
+    )
     args = parser.parse_args()
 
-    # Require input file - no defaults
-    if not args.input_file:
-        parser.error("Input file is required. Please specify the path to a textbook JSON file.")
-
-    custom_path = Path(args.input_file)
-
-    # Extract book name from filename (remove .json extension)
-    book_name = custom_path.stem
-
-    # Update PRIMARY_BOOK global for this run
-    PRIMARY_BOOK = book_name  # type: ignore
-
-    print(f"Processing book: {book_name}")
-    print(f"Input file: {custom_path}")
-
-    if not custom_path.exists():
-        print(f"Error: File not found: {custom_path}")
-        sys.exit(1)
+    input_paths = [Path(p) for p in args.input_files]
+    for custom_path in input_paths:
+        if not custom_path.exists():
+            print(f"Error: File not found: {custom_path}")
+            sys.exit(1)
 
-    # If taxonomy file provided, load it and override KEY_CONCEPTS
+    # If taxonomy file provided, its concepts replace KEY_CONCEPTS for the run
+    key_concepts: Optional[List[str]] = None
     if args.taxonomy:
         taxonomy_path = Path(args.taxonomy)
         print(f"Loading taxonomy from: {taxonomy_path}")
@@ -3055,40 +3410,15 @@ if __name__ == "__main__":
             sys.exit(1)
 
         try:
-            with open(taxonomy_path, "r", encoding="utf-8") as f:
-                taxonomy_data = json.load(f)
-
-            # Extract all concepts from all tiers
-            loaded_concepts = []
-
-            # Handle new taxonomy structure with 'tiers' key
-            if "tiers" in taxonomy_data:
-                tier_data = taxonomy_data["tiers"]
-                for tier_name, tier_content in tier_data.items():
-                    if isinstance(tier_content, dict) and "concepts" in tier_content:
-                        loaded_concepts.extend(tier_content["concepts"])
-                        print(
-                            f"  ✓ Loaded {len(tier_content['concepts'])} concepts from '{tier_name}' tier"
-                        )
-                    elif isinstance(tier_content, list):
-                        loaded_concepts.extend(tier_content)
-            # Handle legacy flat structure
-            else:
-                for tier_name, tier_data in taxonomy_data.items():
-                    if isinstance(tier_data, dict) and "concepts" in tier_data:
-                        loaded_concepts.extend(tier_data["concepts"])
-                    elif isinstance(tier_data, list):
-                        loaded_concepts.extend(tier_data)
-
-            if loaded_concepts:
-                # Override the global KEY_CONCEPTS
-                KEY_CONCEPTS = loaded_concepts  # type: ignore
-                print(f"✓ Total: {len(loaded_concepts)} concepts loaded from taxonomy")
-            else:
-                print("⚠️  Warning: No concepts found in taxonomy file, using defaults")
-
+            key_concepts = load_taxonomy_concepts(taxonomy_path)
         except Exception as e:
             print(f"Error loading taxonomy: {e}")
             sys.exit(1)
 
-    main(custom_input_path=custom_path)
+        if key_concepts:
+            print(f"✓ Total: {len(key_concepts)} concepts loaded from taxonomy")
+        else:
+            print("⚠️  Warning: No concepts found in taxonomy file, using defaults")
+
+    results = generate_guidelines(input_paths, key_concepts=key_concepts or None, workers=args.workers)
+    sys.exit(0 if all(results.values()) else 1)
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Aggregate package container: fragment cache and streamed package writer
+(Tab 6).
+
+Tab 6 used to parse every companion book's metadata and guideline, build
+one in-memory package and json.dump it, on every run. Now each book is a
+fragment: its package entry encoded once to JSON bytes and cached under a
+fingerprint of the files it was built from (path, size, mtime). A rebuild
+re-encodes only books whose files changed and streams the package by
+concatenating fragment bytes.
+
+The package file stays a single valid JSON document (existing readers are
+unchanged). Tab 7 looks chapters up through the context index sidecar
+(context_index.py), not through the package.
+
+NO LLM CALLS - pure file I/O.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+FRAGMENT_VERSION = 1
+
+
+def encode_json(data: Any) -> bytes:
+    """Package JSON encoding (same formatting as save_json)."""
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def files_fingerprint(paths: Iterable[Optional[Path]], **extra: Any) -> str:
+    """
+    Fingerprint of a set of input files plus any extra build parameters.
+
+    Missing files are part of the fingerprint too, so a file appearing or
+    disappearing changes it.
+    """
+    stats = []
+    for path in paths:
+        if path is None:
+            continue
+        try:
+            stat = path.stat()
+            stats.append([str(path), stat.st_size, stat.st_mtime_ns])
+        except OSError:
+            stats.append([str(path), None, None])
+    payload = json.dumps({"version": FRAGMENT_VERSION, "files": stats, **extra}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class BookFragment:
+    """One book's package entry, pre-encoded."""
+    name: str
+    data: bytes                                   # JSON bytes embedded verbatim in the package
+    fingerprint: str
+    chapter_count: int = 0
+    info: Dict[str, Any] = field(default_factory=dict)  # Build details cached with the fragment (tier, note, ...)
+    context_entries: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
+    cached: bool = False
+
+    def meta(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "chapter_count": self.chapter_count,
+            "info": self.info,
+            "context_entries": self.context_entries,
+        }
+
+    @classmethod
+    def from_cache(cls, fingerprint: str, meta: Dict[str, Any], data: bytes) -> "BookFragment":
+        return cls(
+            name=meta["name"],
+            data=data,
+            fingerprint=fingerprint,
+            chapter_count=meta.get("chapter_count", 0),
+            info=meta.get("info", {}),
+            context_entries=[tuple(e) for e in meta.get("context_entries", [])],
+            cached=True,
+        )
+
+
+class FragmentCache:
+    """
+    On-disk cache of book fragments keyed by fingerprint.
+
+    Each entry is one file: a compact JSON metadata line, then the fragment
+    bytes. Entries are written atomically, so concurrent builders sharing a
+    cache directory never read a partial fragment.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, fingerprint: str) -> Path:
+        return self.cache_dir / f"{fingerprint}.fragment"
+
+    def get(self, fingerprint: str) -> Optional[BookFragment]:
+        """Cached fragment, or None when absent or unreadable."""
+        try:
+            with open(self._path(fingerprint), "rb") as f:
+                meta = json.loads(f.readline())
+                data = f.read()
+        except (OSError, ValueError):
+            return None
+        if not isinstance(meta, dict) or "name" not in meta:
+            return None
+        return BookFragment.from_cache(fingerprint, meta, data)
+
+    def put(self, fragment: BookFragment) -> None:
+        """Store a fragment (errors are reported, never raised)."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(json.dumps(fragment.meta(), ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+                    f.write(b"\n")
+                    f.write(fragment.data)
+                os.replace(tmp_name, self._path(fragment.fingerprint))
+            except BaseException:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            print(f"  ⚠️  Could not cache fragment for {fragment.name}: {e}")
+
+
+def write_package(
+    path: Path,
+    sections: List[Tuple[str, Any]],
+) -> None:
+    """
+    Stream an aggregate package to ``path``.
+
+    Args:
+        path: Package file to write (replaced atomically)
+        sections: Top-level (key, value) pairs in output order. A value may
+            be a BookFragment, a list of BookFragments, or any JSON value.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"{")
+            for idx, (key, value) in enumerate(sections):
+                f.write((",\n  " if idx else "\n  ").encode("utf-8") + json.dumps(key).encode("utf-8") + b": ")
+                if isinstance(value, BookFragment):
+                    f.write(value.data)
+                elif isinstance(value, list) and value and all(isinstance(v, BookFragment) for v in value):
+                    f.write(b"[\n")
+                    for i, fragment in enumerate(value):
+                        if i:
+                            f.write(b",\n")
+                        f.write(fragment.data)
+                    f.write(b"\n]")
+                else:
+                    f.write(encode_json(value))
+            f.write(b"\n}")
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
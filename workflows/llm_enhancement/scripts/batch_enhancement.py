@@ -0,0 +1,245 @@
+"""
+Tab 7 batch mode: submit all chapter prompts as one provider batch job.
+
+For overnight book- or library-wide reruns latency does not matter, but
+per-call cost and rate limits do. Instead of one synchronous call per
+chapter, every prompt not already in the LLM response cache is submitted
+as a single Message Batches job, polled until it ends, and each result is
+written to LLMCacheRepository (phase "enhancement") before the caller
+parses it with parse_llm_response.
+
+Checkpointing:
+    The batch id and the prompt hash of every submitted request are saved
+    (atomically) to a checkpoint file right after submission and refreshed
+    on every poll. A run that is interrupted or times out leaves the
+    checkpoint in place; the next run with the same prompts resumes polling
+    the same batch instead of paying for a new one. The checkpoint is
+    removed once all results are cached.
+
+Reference: Anthropic API docs - Message Batches
+Pattern: Cache-Aside + checkpoint/resume (Python Architecture Patterns Ch. 3)
+"""
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from workflows.llm_enhancement.scripts.cache.llm_cache import LLMCacheRepository
+from workflows.llm_enhancement.scripts.cache.llm_cache import LLMResponse as CachedResponse
+from workflows.llm_enhancement.scripts.cache.single_flight import atomic_write_json
+from workflows.shared.clients.anthropic_batch_client import (
+    AnthropicBatchClient,
+    BatchStatus,
+)
+from workflows.shared.providers.base import LLMResponse
+
+
+BATCH_CHECKPOINT_VERSION = 1
+ENHANCEMENT_PHASE = "enhancement"
+# Seconds between status polls / total wait before giving up (checkpoint kept)
+DEFAULT_BATCH_POLL_INTERVAL = float(os.getenv("LLM_BATCH_POLL_INTERVAL", "60"))
+DEFAULT_BATCH_MAX_WAIT = float(os.getenv("LLM_BATCH_MAX_WAIT", str(24 * 60 * 60)))
+
+
+class BatchTimeoutError(Exception):
+    """Raised when a batch has not ended within max_wait; rerun to resume it."""
+
+    def __init__(self, batch_id: str, checkpoint_path: Path, status: BatchStatus):
+        super().__init__(
+            f"Batch {batch_id} still {status.describe()} - rerun to resume from {checkpoint_path}"
+        )
+        self.batch_id = batch_id
+        self.checkpoint_path = checkpoint_path
+        self.status = status
+
+
+@dataclass
+class BatchItem:
+    """One prompt to run in the batch."""
+    custom_id: str      # Unique within the batch; [A-Za-z0-9_-]{1,64}
+    prompt: str
+    chapter_num: int = 0
+
+    @property
+    def prompt_hash(self) -> str:
+        return hashlib.sha256(self.prompt.encode("utf-8")).hexdigest()
+
+
+def _load_checkpoint(path: Path) -> Optional[Dict[str, Any]]:
+    """Checkpoint contents, or None when missing, unreadable or another version."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != BATCH_CHECKPOINT_VERSION:
+        return None
+    return data
+
+
+def _resumable(checkpoint: Optional[Dict[str, Any]], items: List[BatchItem], model: str) -> bool:
+    """True when the checkpointed batch covers every pending prompt unchanged."""
+    if not checkpoint or checkpoint.get("model") != model or not checkpoint.get("batch_id"):
+        return False
+    submitted = checkpoint.get("requests", {})
+    return all(submitted.get(item.custom_id) == item.prompt_hash for item in items)
+
+
+def _to_provider_response(cached: CachedResponse) -> LLMResponse:
+    """Cache hit as a provider response; no tokens are spent this run."""
+    return LLMResponse(content=cached.response_text, model=cached.model, input_tokens=0, output_tokens=0)
+
+
+def run_batch(
+    items: List[BatchItem],
+    model: str,
+    max_tokens: int,
+    temperature: float,
+    checkpoint_path: Path,
+    client: Optional[AnthropicBatchClient] = None,
+    cache: Optional[LLMCacheRepository] = None,
+    poll_interval: float = DEFAULT_BATCH_POLL_INTERVAL,
+    max_wait: float = DEFAULT_BATCH_MAX_WAIT,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> Dict[str, LLMResponse]:
+    """
+    Run prompts through the cache and, for misses, one provider batch.
+
+    Args:
+        items: Prompts to run (custom_ids must be unique)
+        model: Model for every request
+        max_tokens: Max output tokens per request
+        temperature: Sampling temperature
+        checkpoint_path: Where the in-flight batch is recorded for resume
+        client: Batch API client (default: AnthropicBatchClient())
+        cache: LLM response cache (None = no cache lookups/writes)
+        poll_interval: Seconds between status polls
+        max_wait: Seconds to poll before raising BatchTimeoutError
+        sleep: Sleep function (injectable for tests)
+        clock: Monotonic clock (injectable for tests)
+
+    Returns:
+        custom_id -> response for every item that succeeded (cached or batched);
+        failed items are absent
+
+    Raises:
+        BatchTimeoutError: Batch still running after max_wait (checkpoint kept)
+        BatchClientError / RetryExhaustedError: Batch API failures (checkpoint kept)
+    """
+    responses: Dict[str, LLMResponse] = {}
+    pending: List[BatchItem] = []
+    for item in items:
+        cached = cache.get(ENHANCEMENT_PHASE, item.chapter_num, item.prompt_hash, model=model) if cache else None
+        if cached is not None:
+            responses[item.custom_id] = _to_provider_response(cached)
+        else:
+            pending.append(item)
+
+    print(f"  💰 Cache hits: {len(responses)}/{len(items)} prompts")
+    if not pending:
+        checkpoint_path.unlink(missing_ok=True)
+        return responses
+
+    owns_client = client is None
+    client = client or AnthropicBatchClient()
+    try:
+        status = _submit_or_resume(client, pending, model, max_tokens, temperature, checkpoint_path)
+        status = _poll_until_ended(client, status, checkpoint_path, poll_interval, max_wait, sleep, clock)
+
+        by_id = {item.custom_id: item for item in pending}
+        failed = 0
+        for result in client.iter_results(status):
+            item = by_id.get(result.custom_id)
+            if item is None:
+                continue
+            if not result.succeeded:
+                failed += 1
+                print(f"  ⚠️  {result.custom_id}: {result.error}")
+                continue
+            response = LLMResponse(
+                content=result.content,
+                model=result.model or model,
+                input_tokens=result.input_tokens,
+                output_tokens=result.output_tokens,
+            )
+            responses[item.custom_id] = response
+            if cache is not None:
+                cache.set(CachedResponse(
+                    phase=ENHANCEMENT_PHASE,
+                    chapter_num=item.chapter_num,
+                    prompt_hash=item.prompt_hash,
+                    response_text=result.content,
+                    parsed_data={},
+                    model=model,
+                    tokens_used=result.input_tokens + result.output_tokens,
+                ))
+        print(f"  ✓ Batch {status.batch_id}: {len(pending) - failed} succeeded, {failed} failed")
+    finally:
+        if owns_client:
+            client.close()
+
+    checkpoint_path.unlink(missing_ok=True)
+    return responses
+
+
+def _submit_or_resume(
+    client: AnthropicBatchClient,
+    pending: List[BatchItem],
+    model: str,
+    max_tokens: int,
+    temperature: float,
+    checkpoint_path: Path,
+) -> BatchStatus:
+    """Resume the checkpointed batch when it covers ``pending``, else submit a new one."""
+    checkpoint = _load_checkpoint(checkpoint_path)
+    if _resumable(checkpoint, pending, model):
+        print(f"  ↻ Resuming batch {checkpoint['batch_id']} from checkpoint")
+        return BatchStatus(batch_id=checkpoint["batch_id"], processing_status=checkpoint.get("status", ""))
+
+    print(f"  📤 Submitting batch of {len(pending)} requests ({model})")
+    status = client.create_batch([
+        AnthropicBatchClient.build_request(item.custom_id, item.prompt, model, max_tokens, temperature)
+        for item in pending
+    ])
+    atomic_write_json(checkpoint_path, {
+        "version": BATCH_CHECKPOINT_VERSION,
+        "batch_id": status.batch_id,
+        "model": model,
+        "submitted_at": datetime.now().isoformat(),
+        "status": status.processing_status,
+        "requests": {item.custom_id: item.prompt_hash for item in pending},
+    })
+    print(f"  ✓ Batch {status.batch_id} submitted (checkpoint: {checkpoint_path})")
+    return status
+
+
+def _poll_until_ended(
+    client: AnthropicBatchClient,
+    status: BatchStatus,
+    checkpoint_path: Path,
+    poll_interval: float,
+    max_wait: float,
+    sleep: Callable[[float], None],
+    clock: Callable[[], float],
+) -> BatchStatus:
+    """Poll a batch until it ends, recording each status in the checkpoint."""
+    started = clock()
+    while True:
+        status = client.get_batch(status.batch_id)
+        checkpoint = _load_checkpoint(checkpoint_path)
+        if checkpoint is not None:
+            checkpoint["status"] = status.processing_status
+            checkpoint["request_counts"] = status.request_counts
+            atomic_write_json(checkpoint_path, checkpoint)
+        if status.ended:
+            return status
+        if clock() - started + poll_interval > max_wait:
+            raise BatchTimeoutError(status.batch_id, checkpoint_path, status)
+        print(f"  ⏳ Batch {status.batch_id}: {status.describe()}")
+        sleep(poll_interval)
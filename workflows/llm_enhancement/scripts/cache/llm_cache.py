@@ -1,7 +1,8 @@
 """
 LLMCacheRepository: Repository Pattern for LLM response cache.
 
-Caches expensive Claude API responses for content selection (phase1) and citation extraction (phase2).
+Caches expensive Claude API responses for content selection (phase1), citation extraction (phase2)
+and Tab 7 chapter enhancement (enhancement).
 
 Design Principles:
 1. Repository Pattern: Abstract storage behind clean interface
@@ -22,43 +23,41 @@ Pattern References:
 - Python Architecture Patterns Ch. 3, pg. 99 (Cache systems)
 - Learning Python Ed6 Ch. 9 (File I/O), Ch. 28-31 (Dataclass patterns)
 
-File Structure:
+Storage (see response_store.py):
     cache/llm_responses/
-        phase1/
-            chapter_1_abc12345.json
-            chapter_2_def67890.json
-            ...
-        phase2/
-            chapter_1_xyz98765.json
-            chapter_2_mno54321.json
-            ...
+        responses.sqlite3     # Single SQLite store shared by all workers
 
-Cache File Format:
-    {
-        "metadata": {
-            "key": "chapter_3_abc12345",
-            "created_at": 1234567890.0,
-            "ttl_seconds": 2592000,
-            "content_hash": "abc12345"  # Reused for prompt_hash
-        },
-        "data": {
-            "phase": "phase1",
-            "chapter_num": 3,
-            "prompt_hash": "abc12345",
-            "response_text": "{...}",
-            "parsed_data": {...},
-            "model": "claude-sonnet-4",
-            "tokens_used": 1200
-        }
-    }
+    Entries are keyed by (full prompt hash, model), not by chapter: the same
+    prompt sent for a different chapter or book is a cache hit. Payloads
+    (LLMResponse fields) are stored as zstd- (or zlib-) compressed JSON.
+    Per-file JSON entries written by older versions under phase1/ and
+    phase2/ are imported once, on first open.
+
+Concurrency:
+    Each write is a single SQLite transaction, so a killed run never leaves
+    a partial entry. get_or_compute() adds a single-flight guard (per-key
+    advisory lock under .locks/ plus in-process de-duplication) so two
+    workers that miss the same prompt make one LLM call between them.
 """
 
 import hashlib
 import json
+import sqlite3
 import time
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Callable, Dict, Optional, Any, Tuple
+
+from workflows.llm_enhancement.scripts.cache.response_store import (
+    DEFAULT_COMPACTION_INTERVAL_SECONDS,
+    DEFAULT_STORE_FILENAME,
+    ResponseStore,
+)
+from workflows.llm_enhancement.scripts.cache.single_flight import LOCK_DIR_NAME, SingleFlight
+
+VALID_PHASES = ("phase1", "phase2", "enhancement")
+_LEGACY_PHASE_DIRS = ("phase1", "phase2")
+_LEGACY_IMPORT_MARKER = "legacy_json_imported"
 
 
 # ============================================================
@@ -68,7 +67,7 @@ from typing import Dict, Optional, Any
 @dataclass
 class LLMResponse:
     """DTO for LLM API responses (phase1 or phase2)."""
-    phase: str                     # "phase1" or "phase2"
+    phase: str                     # "phase1", "phase2" or "enhancement"
     chapter_num: int
     prompt_hash: str               # Hash of prompt sent to LLM
     response_text: str             # Raw LLM response
@@ -107,9 +106,10 @@ class LLMCacheRepository:
     """
     Repository Pattern for LLM response cache.
     
-    Abstracts file-based cache storage for expensive Claude API calls.
-    Implements Cache-Aside Pattern with TTL-based expiration.
-    Separate phase1/phase2 directories for organization.
+    Abstracts the shared ResponseStore behind the phase/chapter interface
+    the LLM callers use. Implements Cache-Aside Pattern with TTL-based
+    expiration. Safe to share between parallel enhancement workers (threads
+    or processes).
     
     Pattern: Repository Pattern (Architecture Patterns Ch. 2)
     Anti-Pattern Avoidance: Optional types for nullable returns (ANTI_PATTERN_ANALYSIS §1.1)
@@ -119,13 +119,13 @@ class LLMCacheRepository:
         >>> 
         >>> # Phase 1: Content selection
         >>> prompt_hash = cache._compute_prompt_hash(prompt)
-        >>> response = cache.get_phase1(chapter_num=3, prompt_hash=prompt_hash)
+        >>> response = cache.get_phase1(chapter_num=3, prompt_hash=prompt_hash, model=model)
         >>> if response is None:
         ...     response = call_llm_api(prompt)  # $0.30 cost
         ...     cache.set_phase1(response)
         >>> 
         >>> # Phase 2: Citation extraction
-        >>> response = cache.get_phase2(chapter_num=3, prompt_hash=prompt_hash)
+        >>> response = cache.get_phase2(chapter_num=3, prompt_hash=prompt_hash, model=model)
         >>> if response is None:
         ...     response = call_llm_api(prompt)  # $0.30 cost
         ...     cache.set_phase2(response)
@@ -136,13 +136,19 @@ class LLMCacheRepository:
         - Total savings: Up to $0.60 per chapter on repeated runs
     """
     
-    def __init__(self, cache_dir: Optional[Path] = None, ttl_days: int = 30):
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_days: int = 30,
+        compaction_interval: Optional[float] = DEFAULT_COMPACTION_INTERVAL_SECONDS,
+    ):
         """
         Initialize LLMCacheRepository.
         
         Args:
             cache_dir: Root directory for cache storage. Defaults to: cache/llm_responses/
             ttl_days: Time-to-live in days. Default 30 days (expensive to regenerate - $0.60/chapter).
+            compaction_interval: Seconds between background TTL compactions (None = off)
         
         Pattern: Repository Pattern initialization (Architecture Patterns Ch. 2)
         """
@@ -152,80 +158,64 @@ class LLMCacheRepository:
         else:
             self.cache_dir = cache_dir
         
-        # Create phase-specific directories
-        self.phase1_dir = self.cache_dir / "phase1"
-        self.phase2_dir = self.cache_dir / "phase2"
-        
-        self.phase1_dir.mkdir(parents=True, exist_ok=True)
-        self.phase2_dir.mkdir(parents=True, exist_ok=True)
-        
         self.ttl_seconds = ttl_days * 24 * 60 * 60  # Convert days to seconds
+        self.store = ResponseStore(
+            self.cache_dir / DEFAULT_STORE_FILENAME,
+            ttl_seconds=self.ttl_seconds,
+            compaction_interval=compaction_interval,
+        )
+        self._flight: SingleFlight[LLMResponse] = SingleFlight(self.cache_dir / LOCK_DIR_NAME)
+        try:
+            self._import_legacy_files()
+        except sqlite3.Error:
+            pass  # Legacy entries are an optimization; retried on next open
     
-    def get(self, phase: str, chapter_num: int, prompt_hash: str) -> Optional[LLMResponse]:
+    def get(
+        self,
+        phase: str,
+        chapter_num: int,
+        prompt_hash: str,
+        model: Optional[str] = None,
+    ) -> Optional[LLMResponse]:
         """
         Retrieve cached LLM response (generic method).
         
         Args:
-            phase: "phase1" or "phase2"
-            chapter_num: Chapter number
+            phase: "phase1", "phase2" or "enhancement"
+            chapter_num: Chapter number (reported on the result; not part of the key)
             prompt_hash: Hash of prompt sent to LLM
+            model: Model the caller would use; None accepts any model
         
         Returns:
             LLMResponse if cache hit and not expired, None otherwise
         
         Cache Invalidation:
-            - TTL expiration: Entry deleted if older than 30 days
-            - Prompt hash mismatch: Different hash → cache miss (prompt changed)
-            - Corrupted file: Returns None (graceful degradation)
+            - TTL expiration: Expired entries are never returned and are
+              removed by background compaction
+            - Prompt hash / model mismatch: Different key → cache miss
+            - Corrupted payload: Returns None (graceful degradation)
         
         Pattern: Cache-Aside Pattern
         Anti-Pattern Avoidance: Returns Optional[T] not None (ANTI_PATTERN_ANALYSIS §1.1)
         Cost Impact: Cache miss triggers $0.30 LLM API call
         """
+        self._validate_phase(phase)
         try:
-            cache_key = self._get_cache_key(chapter_num, prompt_hash)
-            cache_file = self._get_cache_path(phase, cache_key)
-            
-            # Cache miss: File doesn't exist
-            if not cache_file.exists():
-                return None
-            
-            # Read cache file
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
-            # Validate cache structure
-            if 'metadata' not in cache_data or 'data' not in cache_data:
-                return None
-            
-            # Parse metadata
-            metadata = CacheEntry.from_dict(cache_data['metadata'])
-            
-            # Check TTL expiration
-            if metadata.is_expired():
-                # Delete expired entry
-                cache_file.unlink(missing_ok=True)
-                return None
-            
-            # Verify prompt hash matches (detect prompt changes)
-            if metadata.content_hash != prompt_hash:
+            data = self.store.get(prompt_hash, model)
+            if data is None:
                 return None
             
-            # Parse cached data
-            data = cache_data['data']
-            result = LLMResponse(
-                phase=data['phase'],
-                chapter_num=data['chapter_num'],
+            return LLMResponse(
+                phase=phase,
+                chapter_num=chapter_num,
                 prompt_hash=data['prompt_hash'],
                 response_text=data['response_text'],
                 parsed_data=data['parsed_data'],
                 model=data['model'],
                 tokens_used=data['tokens_used']
             )
-            
-            return result
         
-        except (json.JSONDecodeError, KeyError, IOError, OSError):
+        except (KeyError, TypeError, sqlite3.Error):
             # Graceful degradation: Cache errors return None
             # Workflow continues by calling LLM API ($0.30 cost acceptable)
             return None
@@ -235,54 +225,71 @@ class LLMCacheRepository:
         Store LLM response in cache (generic method).
         
         Args:
-            response: LLMResponse to cache
-        
-        Cache Structure:
-            {
-                "metadata": { CacheEntry fields },
-                "data": { LLMResponse fields }
-            }
+            response: LLMResponse to cache (keyed by its prompt_hash and model)
         
-        Pattern: Value Object (CacheEntry) wraps business data
         Error Handling: Graceful failure (doesn't raise exceptions)
         Cost Impact: Successful cache write saves $0.30 on future runs
         """
+        self._validate_phase(response.phase)
         try:
-            cache_key = self._get_cache_key(response.chapter_num, response.prompt_hash)
-            cache_file = self._get_cache_path(response.phase, cache_key)
-            
-            # Create metadata wrapper (reuse content_hash for prompt_hash)
-            metadata = CacheEntry(
-                key=cache_key,
-                created_at=time.time(),
-                ttl_seconds=self.ttl_seconds,
-                content_hash=response.prompt_hash  # Reuse field for prompt_hash
+            self.store.put(
+                response.prompt_hash, response.model, response.phase, asdict(response)
             )
-            
-            # Serialize to JSON
-            cache_data = {
-                'metadata': metadata.to_dict(),
-                'data': asdict(response)
-            }
-            
-            # Write cache file atomically
-            cache_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
-        
-        except (IOError, OSError):
+        except sqlite3.Error:
             # Graceful failure: Cache write errors don't break workflow
             pass
     
-    def get_phase1(self, chapter_num: int, prompt_hash: str) -> Optional[LLMResponse]:
+    def get_or_compute(
+        self,
+        phase: str,
+        chapter_num: int,
+        prompt_hash: str,
+        model: str,
+        compute: Callable[[], LLMResponse],
+    ) -> Tuple[LLMResponse, bool]:
+        """
+        Return the cached response, calling ``compute`` (the LLM) once on a miss.
+        
+        Concurrent callers that miss the same (prompt_hash, model) - threads
+        in this process, or other processes sharing cache_dir - wait for the
+        first caller's response instead of making their own LLM call.
+        
+        Args:
+            phase: "phase1", "phase2" or "enhancement"
+            chapter_num: Chapter number (reported on the result)
+            prompt_hash: Hash of prompt sent to LLM
+            model: Model used for the call
+            compute: Makes the LLM call and returns its LLMResponse
+        
+        Returns:
+            (response, hit) - ``hit`` is False only for the caller that ran ``compute``
+        
+        Pattern: Cache-Aside Pattern with single-flight
+        Cost Impact: One $0.30 call per distinct prompt, however many workers miss it
+        """
+        self._validate_phase(phase)
+        return self._flight.run(
+            f"{prompt_hash}:{model}",
+            lookup=lambda: self.get(phase, chapter_num, prompt_hash, model),
+            compute=compute,
+            store=self.set,
+        )
+    
+    def get_phase1(
+        self,
+        chapter_num: int,
+        prompt_hash: str,
+        model: Optional[str] = None,
+    ) -> Optional[LLMResponse]:
         """
         Retrieve cached phase1 LLM response (content selection).
         
-        Convenience method for get("phase1", chapter_num, prompt_hash).
+        Convenience method for get("phase1", chapter_num, prompt_hash, model).
         
         Args:
             chapter_num: Chapter number
             prompt_hash: Hash of phase1 prompt
+            model: Model the caller would use; None accepts any model
         
         Returns:
             LLMResponse if cache hit, None otherwise
@@ -290,17 +297,23 @@ class LLMCacheRepository:
         Pattern: Facade Pattern (convenient interface)
         Cost Savings: $0.30 per cache hit
         """
-        return self.get("phase1", chapter_num, prompt_hash)
+        return self.get("phase1", chapter_num, prompt_hash, model)
     
-    def get_phase2(self, chapter_num: int, prompt_hash: str) -> Optional[LLMResponse]:
+    def get_phase2(
+        self,
+        chapter_num: int,
+        prompt_hash: str,
+        model: Optional[str] = None,
+    ) -> Optional[LLMResponse]:
         """
         Retrieve cached phase2 LLM response (citation extraction).
         
-        Convenience method for get("phase2", chapter_num, prompt_hash).
+        Convenience method for get("phase2", chapter_num, prompt_hash, model).
         
         Args:
             chapter_num: Chapter number
             prompt_hash: Hash of phase2 prompt
+            model: Model the caller would use; None accepts any model
         
         Returns:
             LLMResponse if cache hit, None otherwise
@@ -308,7 +321,7 @@ class LLMCacheRepository:
         Pattern: Facade Pattern (convenient interface)
         Cost Savings: $0.30 per cache hit
         """
-        return self.get("phase2", chapter_num, prompt_hash)
+        return self.get("phase2", chapter_num, prompt_hash, model)
     
     def set_phase1(self, response: LLMResponse) -> None:
         """
@@ -372,58 +385,80 @@ class LLMCacheRepository:
         Cost Impact: Next run will incur full $0.60/chapter LLM cost
         """
         try:
-            deleted_count = 0
-            
-            # Clear phase1 entries
-            for cache_file in self.phase1_dir.glob("chapter_*.json"):
-                cache_file.unlink(missing_ok=True)
-                deleted_count += 1
-            
-            # Clear phase2 entries
-            for cache_file in self.phase2_dir.glob("chapter_*.json"):
-                cache_file.unlink(missing_ok=True)
-                deleted_count += 1
-            
-            return deleted_count
-        except (IOError, OSError):
+            return self.store.clear()
+        except sqlite3.Error:
+            return 0
+    
+    def compact(self) -> int:
+        """Delete expired entries now (also done in the background); returns count."""
+        try:
+            return self.store.compact()
+        except sqlite3.Error:
             return 0
     
-    def _get_cache_key(self, chapter_num: int, prompt_hash: str) -> str:
+    def stats(self) -> Dict[str, Any]:
         """
-        Generate cache key from chapter number and prompt hash.
-        
-        Args:
-            chapter_num: Chapter number
-            prompt_hash: Full hash string (will be truncated to 8 chars)
+        Entry counts and compressed size per phase, without scanning entries.
         
         Returns:
-            Cache key format: "chapter_{num}_{hash[:8]}"
-        
-        Pattern: Deterministic key generation (same inputs → same key)
-        Rationale: Truncate hash for readability (8 chars = 4B collision space)
+            Dict with phase1_count, phase2_count, enhancement_count, total_count, total_bytes
         """
-        return f"chapter_{chapter_num}_{prompt_hash[:8]}"
+        per_phase = self.store.stats()
+        return {
+            "phase1_count": per_phase.get("phase1", {}).get("entries", 0),
+            "phase2_count": per_phase.get("phase2", {}).get("entries", 0),
+            "enhancement_count": per_phase.get("enhancement", {}).get("entries", 0),
+            "total_count": sum(p["entries"] for p in per_phase.values()),
+            "total_bytes": sum(p["bytes"] for p in per_phase.values()),
+        }
+    
+    def close(self) -> None:
+        """Stop background compaction and close the store."""
+        self.store.close()
     
-    def _get_cache_path(self, phase: str, cache_key: str) -> Path:
+    @staticmethod
+    def _validate_phase(phase: str) -> None:
+        if phase not in VALID_PHASES:
+            raise ValueError(f"Invalid phase: {phase}. Expected one of {', '.join(VALID_PHASES)}")
+    
+    def _import_legacy_files(self) -> int:
         """
-        Get full path to cache file in phase-specific directory.
+        Copy per-file JSON entries from older versions into the store, once.
         
-        Args:
-            phase: "phase1" or "phase2"
-            cache_key: Cache key from _get_cache_key()
+        Entries keep their original creation time (so their TTL is
+        unchanged); expired or unreadable files are skipped. The files are
+        left in place and a store marker prevents importing them again.
         
         Returns:
-            Full path: {cache_dir}/{phase}/{cache_key}.json
-        
-        Pattern: File I/O with pathlib.Path (Learning Python Ch. 9)
-        Benefit: Phase separation prevents key collisions
+            Number of entries imported
         """
-        if phase == "phase1":
-            return self.phase1_dir / f"{cache_key}.json"
-        elif phase == "phase2":
-            return self.phase2_dir / f"{cache_key}.json"
-        else:
-            raise ValueError(f"Invalid phase: {phase}. Expected 'phase1' or 'phase2'")
+        if self.store.get_meta(_LEGACY_IMPORT_MARKER) is not None:
+            return 0
+        
+        imported = 0
+        for phase in _LEGACY_PHASE_DIRS:
+            phase_dir = self.cache_dir / phase
+            if not phase_dir.is_dir():
+                continue
+            for cache_file in phase_dir.glob("chapter_*.json"):
+                try:
+                    with open(cache_file, 'r', encoding='utf-8') as f:
+                        cache_data = json.load(f)
+                    metadata = CacheEntry.from_dict(cache_data['metadata'])
+                    data = LLMResponse(**cache_data['data'])
+                except (json.JSONDecodeError, KeyError, TypeError, OSError):
+                    continue
+                if metadata.is_expired():
+                    continue
+                self.store.put(
+                    data.prompt_hash, data.model, data.phase, asdict(data),
+                    ttl_seconds=metadata.ttl_seconds,
+                    created_at=metadata.created_at,
+                )
+                imported += 1
+        
+        self.store.set_meta(_LEGACY_IMPORT_MARKER, str(imported))
+        return imported
     
     def _compute_prompt_hash(self, prompt: str) -> str:
         """
@@ -9,6 +9,7 @@ Design Principles:
 3. TTL Management: 7-day expiration (cheap to regenerate - no API costs)
 4. Content Hash Invalidation: Detect chapter text changes
 5. Fail-Safe: Cache errors return None (graceful degradation)
+6. Concurrency-Safe: Atomic temp+fsync+rename writes (single_flight.py)
 
 Pattern References:
 - Architecture Patterns with Python Ch. 2 (Repository Pattern)
@@ -50,6 +51,8 @@ from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from workflows.llm_enhancement.scripts.cache.single_flight import atomic_write_json
+
 
 # ============================================================
 # DATACLASS DEFINITIONS
@@ -235,12 +238,10 @@ class PrefilterCacheRepository:
                 'data': asdict(output)
             }
             
-            # Write cache file atomically
-            cache_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
+            # Write cache file atomically (temp file + fsync + rename)
+            atomic_write_json(cache_file, cache_data)
         
-        except (IOError, OSError):
+        except (IOError, OSError, TypeError):
             # Graceful failure: Cache write errors don't break workflow
             pass
     
@@ -0,0 +1,351 @@
+"""
+ResponseStore: content-addressed, compressed store for LLM responses.
+
+Single embedded SQLite database shared by every process and worker thread
+that caches LLM responses. Replaces the one-JSON-file-per-(phase, chapter,
+hash) layout that LLMCacheRepository used to write.
+
+Design Principles:
+1. Content-Addressed: Rows keyed by (full prompt hash, model) - identical
+   prompts are shared across chapters and books
+2. Compressed Payloads: zstd when ``zstandard`` is installed, zlib otherwise;
+   the codec is stored per row so either environment can read the other's rows
+3. O(1) Stats: Per-phase entry/byte counters maintained by triggers
+4. TTL Compaction: Expired rows deleted by a background daemon thread
+   (and on demand via compact())
+5. Concurrent Writers: WAL journal, busy timeout, one connection per thread,
+   BEGIN IMMEDIATE for writes
+
+Pattern References:
+- Architecture Patterns with Python Ch. 2 (Repository Pattern)
+- Python Architecture Patterns Ch. 3, pg. 99 (Cache systems)
+
+Schema:
+    responses(prompt_hash, model, phase, created_at, expires_at, codec, payload, size)
+        PRIMARY KEY (prompt_hash, model)
+    phase_stats(phase, entries, bytes)
+    store_meta(name, value)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+    _DECODE_ERRORS: Tuple[type, ...] = (zlib.error, ValueError, zstandard.ZstdError)
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+    ZSTD_AVAILABLE = False
+    _DECODE_ERRORS = (zlib.error, ValueError)
+
+
+CODEC_ZSTD = "zstd"
+CODEC_ZLIB = "zlib"
+DEFAULT_STORE_FILENAME = "responses.sqlite3"
+DEFAULT_BUSY_TIMEOUT_MS = 30_000
+DEFAULT_COMPACTION_INTERVAL_SECONDS = 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    prompt_hash TEXT NOT NULL,
+    model       TEXT NOT NULL,
+    phase       TEXT NOT NULL,
+    created_at  REAL NOT NULL,
+    expires_at  REAL NOT NULL,
+    codec       TEXT NOT NULL,
+    payload     BLOB NOT NULL,
+    size        INTEGER NOT NULL,
+    PRIMARY KEY (prompt_hash, model)
+);
+CREATE INDEX IF NOT EXISTS responses_expires_at ON responses(expires_at);
+CREATE TABLE IF NOT EXISTS store_meta (
+    name  TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS phase_stats (
+    phase   TEXT PRIMARY KEY,
+    entries INTEGER NOT NULL DEFAULT 0,
+    bytes   INTEGER NOT NULL DEFAULT 0
+);
+CREATE TRIGGER IF NOT EXISTS responses_stats_insert AFTER INSERT ON responses
+BEGIN
+    INSERT INTO phase_stats(phase, entries, bytes) VALUES (NEW.phase, 1, NEW.size)
+    ON CONFLICT(phase) DO UPDATE SET entries = entries + 1, bytes = bytes + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS responses_stats_delete AFTER DELETE ON responses
+BEGIN
+    UPDATE phase_stats SET entries = entries - 1, bytes = bytes - OLD.size
+    WHERE phase = OLD.phase;
+END;
+CREATE TRIGGER IF NOT EXISTS responses_stats_update AFTER UPDATE ON responses
+BEGIN
+    UPDATE phase_stats SET entries = entries - 1, bytes = bytes - OLD.size
+    WHERE phase = OLD.phase;
+    INSERT INTO phase_stats(phase, entries, bytes) VALUES (NEW.phase, 1, NEW.size)
+    ON CONFLICT(phase) DO UPDATE SET entries = entries + 1, bytes = bytes + NEW.size;
+END;
+"""
+
+
+class ResponseStoreError(Exception):
+    """Raised when the response store cannot be opened or is unusable."""
+    pass
+
+
+def _compress(data: bytes) -> Tuple[str, bytes]:
+    """Compress with the best available codec."""
+    if ZSTD_AVAILABLE:
+        return CODEC_ZSTD, zstandard.ZstdCompressor(level=10).compress(data)
+    return CODEC_ZLIB, zlib.compress(data, 6)
+
+
+def _decompress(codec: str, payload: bytes) -> Optional[bytes]:
+    """Decompress a stored payload; None if its codec is unavailable here."""
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(payload)
+    if codec == CODEC_ZSTD and ZSTD_AVAILABLE:
+        return zstandard.ZstdDecompressor().decompress(payload)
+    return None
+
+
+class ResponseStore:
+    """
+    SQLite-backed LLM response store, safe for concurrent readers and writers.
+
+    Usage:
+        >>> store = ResponseStore(Path("cache/llm_responses/responses.sqlite3"), ttl_seconds=30 * 86400)
+        >>> store.put(prompt_hash, "claude-sonnet-4", "phase1", {"response_text": "..."})
+        >>> store.get(prompt_hash, "claude-sonnet-4")
+        {'response_text': '...'}
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: int,
+        compaction_interval: Optional[float] = DEFAULT_COMPACTION_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Open (creating if needed) the store.
+
+        Args:
+            path: SQLite database file
+            ttl_seconds: Default time-to-live for new entries
+            compaction_interval: Seconds between background TTL compactions;
+                None disables the background thread
+            clock: Time source (injectable for tests)
+
+        Raises:
+            ResponseStoreError: If the database cannot be opened
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._local = threading.local()
+        self._connections: list = []
+        self._connections_lock = threading.Lock()
+        self._closed = False
+        self._stop = threading.Event()
+        self._compactor: Optional[threading.Thread] = None
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection().executescript(_SCHEMA)
+        except (sqlite3.Error, OSError) as e:
+            raise ResponseStoreError(f"Cannot open response store {self.path}: {e}") from e
+
+        if compaction_interval:
+            self._start_compactor(compaction_interval)
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    def _connection(self) -> sqlite3.Connection:
+        """Per-thread connection (sqlite3 connections are not thread-safe)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self._closed:
+                raise ResponseStoreError(f"Response store is closed: {self.path}")
+            conn = sqlite3.connect(
+                str(self.path),
+                timeout=DEFAULT_BUSY_TIMEOUT_MS / 1000,
+                isolation_level=None,  # explicit BEGIN IMMEDIATE for writes
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={DEFAULT_BUSY_TIMEOUT_MS}")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _write(self, sql: str, params: Tuple[Any, ...] = ()) -> int:
+        """Run one write statement in an immediate transaction; returns rowcount."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rowcount = conn.execute(sql, params).rowcount
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return rowcount
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+
+    def get(self, prompt_hash: str, model: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a live entry.
+
+        Args:
+            prompt_hash: Full prompt hash
+            model: Model that produced the response; None matches the newest
+                entry for the prompt from any model
+
+        Returns:
+            Stored payload dict, or None on miss, expiry or undecodable payload
+        """
+        now = self._clock()
+        if model is None:
+            row = self._connection().execute(
+                "SELECT codec, payload FROM responses WHERE prompt_hash = ? AND expires_at > ? "
+                "ORDER BY created_at DESC LIMIT 1",
+                (prompt_hash, now),
+            ).fetchone()
+        else:
+            row = self._connection().execute(
+                "SELECT codec, payload FROM responses "
+                "WHERE prompt_hash = ? AND model = ? AND expires_at > ?",
+                (prompt_hash, model, now),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            raw = _decompress(row[0], row[1])
+            return None if raw is None else json.loads(raw.decode("utf-8"))
+        except _DECODE_ERRORS:  # UnicodeDecodeError/JSONDecodeError are ValueErrors
+            return None
+
+    def put(
+        self,
+        prompt_hash: str,
+        model: str,
+        phase: str,
+        payload: Dict[str, Any],
+        ttl_seconds: Optional[int] = None,
+        created_at: Optional[float] = None,
+    ) -> None:
+        """
+        Insert or replace an entry.
+
+        Args:
+            prompt_hash: Full prompt hash
+            model: Model that produced the response
+            phase: Phase label used for stats ("phase1", "phase2", ...)
+            payload: JSON-serializable response payload
+            ttl_seconds: Override the store's default TTL
+            created_at: Override the creation time (migration/tests)
+        """
+        created = self._clock() if created_at is None else created_at
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        codec, blob = _compress(raw)
+        self._write(
+            "INSERT INTO responses (prompt_hash, model, phase, created_at, expires_at, codec, payload, size) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(prompt_hash, model) DO UPDATE SET "
+            "phase = excluded.phase, created_at = excluded.created_at, "
+            "expires_at = excluded.expires_at, codec = excluded.codec, "
+            "payload = excluded.payload, size = excluded.size",
+            (prompt_hash, model, phase, created, created + ttl, codec, blob, len(blob)),
+        )
+
+    def delete(self, prompt_hash: str, model: Optional[str] = None) -> int:
+        """Delete an entry (all models when model is None); returns rows removed."""
+        if model is None:
+            return self._write("DELETE FROM responses WHERE prompt_hash = ?", (prompt_hash,))
+        return self._write(
+            "DELETE FROM responses WHERE prompt_hash = ? AND model = ?", (prompt_hash, model)
+        )
+
+    def compact(self) -> int:
+        """Delete expired entries; returns rows removed."""
+        return self._write("DELETE FROM responses WHERE expires_at <= ?", (self._clock(),))
+
+    def clear(self) -> int:
+        """Delete every entry; returns rows removed."""
+        return self._write("DELETE FROM responses")
+
+    def get_meta(self, name: str) -> Optional[str]:
+        """Read a store-level marker (e.g. one-time migrations)."""
+        row = self._connection().execute(
+            "SELECT value FROM store_meta WHERE name = ?", (name,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def set_meta(self, name: str, value: str) -> None:
+        """Write a store-level marker."""
+        self._write(
+            "INSERT INTO store_meta (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = excluded.value",
+            (name, value),
+        )
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Per-phase entry counts and compressed bytes, read from trigger-maintained
+        counters (no table scan). Expired-but-not-yet-compacted rows are included.
+        """
+        rows = self._connection().execute(
+            "SELECT phase, entries, bytes FROM phase_stats WHERE entries > 0"
+        ).fetchall()
+        return {phase: {"entries": entries, "bytes": size} for phase, entries, size in rows}
+
+    # ------------------------------------------------------------------
+    # Background compaction / lifecycle
+    # ------------------------------------------------------------------
+
+    def _start_compactor(self, interval: float) -> None:
+        """Compact once now and then every ``interval`` seconds on a daemon thread."""
+        def run() -> None:
+            while True:
+                try:
+                    self.compact()
+                except (sqlite3.Error, ResponseStoreError):
+                    pass  # Another writer holds the lock for too long; retry next round
+                if self._stop.wait(interval):
+                    return
+
+        self._compactor = threading.Thread(
+            target=run, name="llm-response-store-compactor", daemon=True
+        )
+        self._compactor.start()
+
+    def close(self) -> None:
+        """Stop background compaction and close all connections."""
+        self._stop.set()
+        if self._compactor is not None and self._compactor is not threading.current_thread():
+            self._compactor.join(timeout=5)
+        self._closed = True
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def __enter__(self) -> "ResponseStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
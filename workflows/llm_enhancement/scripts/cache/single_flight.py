@@ -0,0 +1,188 @@
+"""
+Concurrency primitives shared by the cache repositories.
+
+Parallel enhancement workers (threads in one run, or several runs sharing a
+cache directory) must never see a half-written cache entry, and must not
+both pay for the same LLM call when they miss the same key at once.
+
+- atomic_write_json: write-to-temp + fsync + rename, so readers see either
+  the old file or the complete new one - never a truncated file
+- key_lock: per-key advisory file lock (``fcntl.flock``) across processes
+- SingleFlight: per-key in-process de-duplication plus key_lock; one caller
+  computes, concurrent callers for the same key wait and share its result
+
+Pattern References:
+- Python Architecture Patterns Ch. 3, pg. 99 (Cache systems, thundering herd)
+- Learning Python Ed6 Ch. 9 (File I/O)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, Iterator, Optional, Tuple, TypeVar
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+    FCNTL_AVAILABLE = False
+
+
+T = TypeVar("T")
+
+LOCK_DIR_NAME = ".locks"
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename by syncing its directory entry (no-op where unsupported)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write_json(path: Path, data: Any, indent: Optional[int] = 2) -> None:
+    """
+    Write ``data`` as JSON to ``path`` atomically and durably.
+
+    The JSON is written to a temporary file in the same directory, flushed
+    and fsync'd, then renamed over ``path``. A crash or a concurrent reader
+    sees either the previous file or the complete new one.
+
+    Raises:
+        OSError / TypeError: On I/O or serialization failure (``path`` is
+            left untouched and the temporary file is removed)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    _fsync_directory(path.parent)
+
+
+def lock_path(lock_dir: Path, key: str) -> Path:
+    """Lock file for ``key`` (hashed, so any key is a safe file name)."""
+    return lock_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]}.lock"
+
+
+@contextmanager
+def key_lock(lock_dir: Optional[Path], key: str) -> Iterator[None]:
+    """
+    Hold an exclusive advisory lock on ``key`` for the duration of the block.
+
+    Blocks until other processes holding the same key release it. Without a
+    ``lock_dir`` or on platforms without ``fcntl`` this is a no-op (SingleFlight
+    still de-duplicates within the process).
+    """
+    if lock_dir is None or not FCNTL_AVAILABLE:
+        yield
+        return
+    lock_dir.mkdir(parents=True, exist_ok=True)
+    with open(lock_path(lock_dir, key), "a+b") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+class _Call(Generic[T]):
+    """One in-flight computation that followers wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(Generic[T]):
+    """
+    Per-key duplicate-suppression for cache-aside lookups.
+
+    Usage:
+        >>> flight = SingleFlight(lock_dir=cache_dir / ".locks")
+        >>> value, hit = flight.run(key, lookup=cache_get, compute=call_llm, store=cache_set)
+
+    For each key only one caller (the leader) runs ``compute``. Callers that
+    arrive while it is running wait and receive its result (or exception);
+    callers in other processes block on the key's advisory lock and then find
+    the leader's result via ``lookup``.
+    """
+
+    def __init__(self, lock_dir: Optional[Path] = None):
+        self.lock_dir = lock_dir
+        self._mutex = threading.Lock()
+        self._calls: Dict[str, _Call[T]] = {}
+
+    def run(
+        self,
+        key: str,
+        lookup: Callable[[], Optional[T]],
+        compute: Callable[[], T],
+        store: Callable[[T], None],
+    ) -> Tuple[T, bool]:
+        """
+        Return the cached value for ``key``, computing and storing it once on a miss.
+
+        Args:
+            key: Cache key
+            lookup: Returns the cached value or None
+            compute: Produces the value on a miss (e.g. the LLM call)
+            store: Persists a computed value
+
+        Returns:
+            (value, hit) - ``hit`` is False only for the caller that ran ``compute``
+        """
+        value = lookup()
+        if value is not None:
+            return value, True
+
+        with self._mutex:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+
+        try:
+            with key_lock(self.lock_dir, key):
+                value = lookup()
+                hit = value is not None
+                if not hit:
+                    value = compute()
+                    store(value)
+            call.value = value
+            return value, hit
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._mutex:
+                self._calls.pop(key, None)
+            call.done.set()
@@ -0,0 +1,139 @@
+"""
+Per-chapter checkpoint journal for integrate_llm_enhancements.
+
+Every chapter that finishes enhancement is appended to a JSONL journal next
+to the output file as soon as its worker returns (flushed and fsync'd), so
+a crash or Ctrl-C loses at most the chapters that were still in flight. On
+the next run the journal is replayed: chapters whose source text is
+unchanged are taken from it instead of being sent to the LLM again.
+
+Record format (one JSON object per line):
+    {"version": 1, "chapter": 3, "source_hash": "<sha256 of chapter text>",
+     "has_cross_refs": true, "enhanced": "<enhanced chapter>",
+     "completed_at": "<iso timestamp>"}
+
+A torn last line (crash mid-append) or a record for a chapter whose text
+has changed is ignored, never an error; the next append starts on a fresh
+line so it is not glued onto the torn one. The journal is removed once the
+full enhanced document has been saved.
+
+Pattern: Write-ahead journal / checkpoint-resume (Python Architecture Patterns Ch. 3)
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+
+
+JOURNAL_VERSION = 1
+
+
+def chapter_hash(chapter_text: str) -> str:
+    """Fingerprint of a chapter's source text (journal entries are keyed on it)."""
+    return hashlib.sha256(chapter_text.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    """One completed chapter."""
+    chapter: int
+    source_hash: str
+    enhanced: str
+    has_cross_refs: bool
+
+
+class ChapterJournal:
+    """
+    Append-only record of completed chapters; safe to call from worker threads.
+
+    Usage:
+        journal = ChapterJournal(ChapterJournal.path_for(output_file))
+        done = journal.load()                     # chapter -> JournalEntry
+        journal.record(3, chapter_text, enhanced, has_cross_refs=True)
+        journal.discard()                         # after the final save
+    """
+
+    SUFFIX = ".journal.jsonl"
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def path_for(cls, output_file: Path) -> Path:
+        """Journal location for an output document."""
+        output_file = Path(output_file)
+        return output_file.with_name(output_file.name + cls.SUFFIX)
+
+    def load(self) -> Dict[int, JournalEntry]:
+        """
+        Replay the journal.
+
+        Returns:
+            chapter number -> latest entry; empty when there is no journal
+        """
+        entries: Dict[int, JournalEntry] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except OSError:
+            return entries
+
+        for line in lines:
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn write from an interrupted run
+            if not isinstance(data, dict) or data.get("version") != JOURNAL_VERSION:
+                continue
+            try:
+                entry = JournalEntry(
+                    chapter=int(data["chapter"]),
+                    source_hash=str(data["source_hash"]),
+                    enhanced=str(data["enhanced"]),
+                    has_cross_refs=bool(data.get("has_cross_refs", False)),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+            entries[entry.chapter] = entry
+        return entries
+
+    def completed(self, chapter_texts: Dict[int, str]) -> Dict[int, JournalEntry]:
+        """Journal entries whose chapter text is unchanged (safe to reuse)."""
+        entries = self.load()
+        return {
+            num: entry for num, entry in entries.items()
+            if num in chapter_texts and entry.source_hash == chapter_hash(chapter_texts[num])
+        }
+
+    def record(self, chapter: int, chapter_text: str, enhanced: str, has_cross_refs: bool) -> None:
+        """Durably append one completed chapter."""
+        line = json.dumps({
+            "version": JOURNAL_VERSION,
+            "chapter": chapter,
+            "source_hash": chapter_hash(chapter_text),
+            "has_cross_refs": has_cross_refs,
+            "enhanced": enhanced,
+            "completed_at": datetime.now().isoformat(),
+        }, ensure_ascii=False)
+        record = (line + "\n").encode("utf-8")
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a+b") as f:
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        # Terminate a torn line left by an interrupted run
+                        record = b"\n" + record
+                f.write(record)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def discard(self) -> None:
+        """Remove the journal (run finished, or a fresh start was requested)."""
+        self.path.unlink(missing_ok=True)
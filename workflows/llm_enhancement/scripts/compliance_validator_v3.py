@@ -13,6 +13,13 @@ TDD Refactoring improvements:
 - Auto-fix mode for common errors
 - Progress indicators and color-coded output
 
+Streaming rule engine:
+- Files are read line by line and every active rule is fed each line once
+  (single pass, precompiled patterns) instead of each rule rescanning the
+  whole document; errors carry the line they were found on
+- --input-dir validates files in parallel worker processes and can emit one
+  combined JUnit report (<testsuites>, one <testsuite> per file)
+
 Legacy improvements (v3):
 - Filters false positive chapter detections (ignores text inside code blocks)
 - Filters false positive TPM detections (distinguishes TPM sections from concept sections)
@@ -22,15 +29,213 @@ Legacy improvements (v3):
 
 from __future__ import annotations
 
+import io
 import json
+import os
 import re
 import argparse
 import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any
+from xml.sax.saxutils import escape, quoteattr
 import sys
 
 
+# ==========================
+# Streaming Rules
+# ==========================
+
+FOOTNOTE_REF_RE = re.compile(r'\[\^\d+\]')
+FOOTNOTE_USE_RE = re.compile(r'\[\^\d+\](?!:)')
+FOOTNOTE_DEF_RE = re.compile(r'\[\^\d+\]:\s*.+')
+# Definition marker ending its line; the definition text is on a later line
+FOOTNOTE_DEF_OPEN_RE = re.compile(r'\[\^\d+\]:$')
+CODE_FENCE = "```"
+CHAPTER_SUMMARY_HEADING = "### Chapter Summary"
+CROSS_TEXT_HEADING = "Cross-Text Analysis"
+MIN_CONTENT_CHARS = 1000
+MIN_SUMMARY_CHARS = 100
+# Lines any rule can act on; all other lines are skipped unless a rule
+# is waiting for the next line (StreamingRule.needs_next_line)
+LINE_MARKER_RE = re.compile(r'```|\[\^|Cross-Text Analysis|### Chapter Summary')
+
+
+class StreamingRule:
+    """
+    One validation rule fed a document line by line.
+
+    Subclasses keep whatever state they need between lines; ``finish`` is
+    called once after the last line and returns the rule's errors. Rules
+    only see lines matching LINE_MARKER_RE, plus every line while
+    ``needs_next_line`` is True.
+    """
+
+    name = ""
+    needs_next_line = False
+
+    def __init__(self) -> None:
+        self.errors: List[Dict[str, Any]] = []
+
+    def feed(self, line_no: int, text: str, end: int) -> None:
+        """
+        Consume one line.
+
+        Args:
+            line_no: 1-based line number
+            text: Line without its terminator
+            end: Character offset just past this line (and its newline)
+        """
+
+    def finish(self, total_chars: int) -> List[Dict[str, Any]]:
+        return self.errors
+
+    def _error(self, line_no: int, message: str, location: str) -> None:
+        self.errors.append({"rule": self.name, "line": line_no, "message": message, "location": location})
+
+
+class VerbatimBlockRule(StreamingRule):
+    """Every fenced code block must be followed by a footnote reference line."""
+
+    name = "verbatim_block"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._block_start: Optional[int] = None
+        self._in_block = False
+
+    @property
+    def needs_next_line(self) -> bool:
+        return self._block_start is not None and not self._in_block
+
+    def feed(self, line_no: int, text: str, end: int) -> None:
+        stripped = text.strip()
+        if self._block_start is not None and not self._in_block:
+            # Closed block: the next non-blank line must carry the annotation
+            if not stripped:
+                return
+            if not FOOTNOTE_REF_RE.search(text):
+                self._missing(self._block_start)
+            self._block_start = None
+        if self._in_block:
+            if stripped.startswith(CODE_FENCE):
+                self._in_block = False
+        elif stripped.startswith(CODE_FENCE):
+            self._block_start = line_no
+            self._in_block = True
+
+    def finish(self, total_chars: int) -> List[Dict[str, Any]]:
+        if self._block_start is not None:
+            self._missing(self._block_start)
+            self._block_start = None
+        return self.errors
+
+    def _missing(self, block_start: int) -> None:
+        self._error(block_start, "Code block missing footnote annotation", f"Line {block_start}")
+
+
+class AnnotationRule(StreamingRule):
+    """
+    Source annotation format.
+
+    Note: Reserved for future implementation (reports nothing yet).
+    """
+
+    name = "annotation"
+
+
+class ChicagoCitationRule(StreamingRule):
+    """Footnote references need at least one citation definition ([^N]: ...)."""
+
+    name = "chicago_citation"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._first_reference: Optional[int] = None
+        self._has_definitions = False
+        self._definition_open = False
+
+    @property
+    def needs_next_line(self) -> bool:
+        return self._definition_open and not self._has_definitions
+
+    def feed(self, line_no: int, text: str, end: int) -> None:
+        if self._has_definitions:
+            if self._first_reference is None and FOOTNOTE_USE_RE.search(text):
+                self._first_reference = line_no
+            return
+        if self._definition_open and text:
+            self._has_definitions = True
+        if "[^" not in text:
+            return
+        if self._first_reference is None and FOOTNOTE_USE_RE.search(text):
+            self._first_reference = line_no
+        if FOOTNOTE_DEF_RE.search(text):
+            self._has_definitions = True
+        elif FOOTNOTE_DEF_OPEN_RE.search(text):
+            self._definition_open = True
+
+    def finish(self, total_chars: int) -> List[Dict[str, Any]]:
+        if self._first_reference is not None and not self._has_definitions:
+            self._error(self._first_reference,
+                        "Footnote references found but no citation definitions.", "Document end")
+        return self.errors
+
+
+class ContentQualityRule(StreamingRule):
+    """
+    Minimum content quality indicators (always active).
+
+    V3: Added to catch empty/stub output files.
+    """
+
+    name = "content_quality"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._has_cross_text = False
+        self._has_footnotes = False
+        self._summary_body_start: Optional[int] = None
+
+    def feed(self, line_no: int, text: str, end: int) -> None:
+        if not self._has_cross_text and CROSS_TEXT_HEADING in text:
+            self._has_cross_text = True
+        if not self._has_footnotes and FOOTNOTE_REF_RE.search(text):
+            self._has_footnotes = True
+        if self._summary_body_start is None and CHAPTER_SUMMARY_HEADING in text:
+            tail = text[text.rfind(CHAPTER_SUMMARY_HEADING) + len(CHAPTER_SUMMARY_HEADING):]
+            if not tail.strip():
+                self._summary_body_start = end
+
+    def finish(self, total_chars: int) -> List[Dict[str, Any]]:
+        if total_chars < MIN_CONTENT_CHARS:
+            self._error(1, f"Content too short ({total_chars} chars). Expected substantial scholarly content.",
+                        "Entire file")
+        if not self._has_cross_text:
+            self._error(1, "Missing 'Cross-Text Analysis' section. LLM enhancement may have failed.",
+                        "Document structure")
+        if not self._has_footnotes:
+            self._error(1, "No footnote references found. Expected scholarly annotations with citations.",
+                        "Document citations")
+        if self._summary_body_start is None or total_chars - self._summary_body_start < MIN_SUMMARY_CHARS:
+            self._error(1, "Chapter summaries appear empty or missing. Expected detailed summaries.",
+                        "Chapter content")
+        return self.errors
+
+
+# Rule name (validation_rules.json) -> streaming implementation
+RULE_ENGINES = {
+    VerbatimBlockRule.name: VerbatimBlockRule,
+    AnnotationRule.name: AnnotationRule,
+    ChicagoCitationRule.name: ChicagoCitationRule,
+}
+
+
+def _validate_file_worker(validator: "ComplianceValidator", md_file: Path) -> Dict[str, Any]:
+    """Process-pool entry point for validate_all (must be module-level to pickle)."""
+    return validator._validate_file(md_file)
+
+
 # ==========================
 # Refactored Compliance Validator Class (TDD)
 # ==========================
@@ -64,7 +269,8 @@ class ComplianceValidator:
         disable_rules: Optional[List[str]] = None,
         verbose: bool = False,
         quiet: bool = False,
-        color: bool = False
+        color: bool = False,
+        workers: Optional[int] = None
     ):
         """
         Initialize validator with configuration.
@@ -77,6 +283,7 @@ class ComplianceValidator:
             verbose: Show detailed output
             quiet: Show minimal output
             color: Use ANSI color codes in output
+            workers: Parallel processes for validate_all (default: CPU count)
         
         Guideline: ARCH 5336 - Dependency Injection for configuration
         """
@@ -87,6 +294,7 @@ class ComplianceValidator:
         self.verbose = verbose
         self.quiet = quiet
         self.color = color
+        self.workers = workers
         
         # Load validation rules
         self.rules = self._load_validation_rules()
@@ -160,8 +368,7 @@ class ComplianceValidator:
         if not self.md_file:
             raise ValueError("No markdown file specified (use md_file parameter)")
         
-        content = self._read_markdown_file()
-        errors = self._run_validations(content)
+        errors = self._validate_lines(self._iter_markdown_lines())
         
         if auto_fix and errors:
             self._auto_fix_errors(errors)
@@ -174,20 +381,22 @@ class ComplianceValidator:
         
         return formatted_output
     
-    def _read_markdown_file(self) -> str:
-        """Read and return markdown file content (EAFP pattern - PY 21)."""
-        if self.md_file is None:
+    def _iter_markdown_lines(self, md_file: Optional[Path] = None) -> Iterator[str]:
+        """Yield markdown file lines without loading the whole file (EAFP pattern - PY 21)."""
+        md_file = md_file or self.md_file
+        if md_file is None:
             raise ValueError("No markdown file specified")
         try:
-            with open(self.md_file, 'r') as f:
-                return f.read()
+            f = open(md_file, 'r', encoding='utf-8')
         except FileNotFoundError:
-            raise ValueError(f"Markdown file not found: {self.md_file}")
+            raise ValueError(f"Markdown file not found: {md_file}")
+        with f:
+            yield from f
     
-    def _build_results_dict(self, errors: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _build_results_dict(self, errors: List[Dict[str, Any]], md_file: Optional[Path] = None) -> Dict[str, Any]:
         """Build validation results dictionary."""
         return {
-            "file": str(self.md_file),
+            "file": str(md_file or self.md_file),
             "summary": {
                 "total_errors": len(errors),
                 "rules_checked": len(self.get_active_rules()),
@@ -213,51 +422,80 @@ class ComplianceValidator:
         if fail_on_errors:
             sys.exit(1 if errors else 0)
     
-    def validate_all(self, output_format: str = "json") -> Dict[str, Any]:
+    def validate_all(self, output_format: str = "json") -> Any:
         """
         Validate all markdown files in input directory.
         
+        Files are validated in parallel worker processes (``workers``);
+        results are keyed by file name in sorted order.
+        
         Args:
-            output_format: Format for individual file outputs (unused in aggregation)
+            output_format: json (dict of per-file results), junit (one combined
+                <testsuites> report) or text (per-file summaries printed)
         
         Returns:
             Validation results for all files
         
         Guideline: PY 3754 - Use Path.glob() for file discovery
-        Note: output_format parameter reserved for future use (per-file format control)
         """
         if not self.input_dir:
             raise ValueError("No input directory specified (use input_dir parameter)")
         
-        md_files = list(self.input_dir.glob("*.md"))
+        md_files = sorted(self.input_dir.glob("*.md"))
         
         if not self.quiet:
             print(f"📁 Found {len(md_files)} markdown files in {self.input_dir}")
         
-        all_results: Dict[str, Any] = {"files": {}}
-        
-        for idx, md_file in enumerate(md_files):
+        file_results: Dict[str, Any] = {}
+        for idx, (md_file, results) in enumerate(self._iter_file_results(md_files)):
             if self.verbose or not self.quiet:
                 progress = ((idx + 1) / len(md_files)) * 100
                 print(f"[{progress:.1f}%] Validating {md_file.name}", file=sys.stderr)
-            
-            # Temporarily set md_file and validate
-            original_md = self.md_file
-            self.md_file = md_file
-            
-            try:
-                results = self.validate(output_format="json", fail_on_errors=False)
-                all_results["files"][md_file.name] = results
-            except Exception as e:
-                all_results["files"][md_file.name] = {
-                    "error": str(e),
-                    "summary": {"total_errors": 1, "passed": False}
-                }
-            finally:
-                self.md_file = original_md
+            file_results[md_file.name] = results
         
+        all_results: Dict[str, Any] = {"files": {name: file_results[name] for name in sorted(file_results)}}
+        
+        if output_format == "junit":
+            return self._format_junit_report(all_results)
+        if output_format == "text":
+            for results in all_results["files"].values():
+                if "errors" in results:
+                    self._print_text_results(results)
+            return None
         return all_results
     
+    def _iter_file_results(self, md_files: List[Path]) -> Iterator[Any]:
+        """Yield (md_file, results) as files finish, in worker processes when more than one."""
+        workers = min(self.workers or os.cpu_count() or 1, len(md_files))
+        if workers <= 1:
+            for md_file in md_files:
+                yield md_file, self._validate_file(md_file)
+            return
+        
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_validate_file_worker, self, md_file): md_file for md_file in md_files}
+            for future in as_completed(futures):
+                md_file = futures[future]
+                try:
+                    yield md_file, future.result()
+                except Exception as e:
+                    yield md_file, self._file_error_results(e)
+    
+    def _validate_file(self, md_file: Path) -> Dict[str, Any]:
+        """Validate one file, reporting any failure as a per-file error entry."""
+        try:
+            errors = self._validate_lines(self._iter_markdown_lines(md_file))
+            return self._build_results_dict(errors, md_file)
+        except Exception as e:
+            return self._file_error_results(e)
+    
+    @staticmethod
+    def _file_error_results(error: Exception) -> Dict[str, Any]:
+        return {
+            "error": str(error),
+            "summary": {"total_errors": 1, "passed": False}
+        }
+    
     def _run_validations(self, content: str) -> List[Dict[str, Any]]:
         """
         Run all active validation rules on content.
@@ -268,149 +506,47 @@ class ComplianceValidator:
         Returns:
             List of validation errors
         """
-        errors = []
-        active_rules = self.get_active_rules()
-        
-        for rule_name in active_rules:
-            rule_config = self.rules[rule_name]
-            pattern = rule_config.get("pattern", "")
-            
-            if rule_name == "verbatim_block":
-                # Check for code blocks without annotations
-                errors.extend(self._check_verbatim_blocks(content))
-            elif rule_name == "annotation":
-                # Check for source annotations
-                errors.extend(self._check_annotations(content, pattern))
-            elif rule_name == "chicago_citation":
-                # Check for Chicago-style citations
-                errors.extend(self._check_chicago_citations(content, pattern))
-        
-        # V3: Add content quality checks
-        errors.extend(self._check_content_quality(content))
-        
-        # Add fix suggestions
-        for error in errors:
-            error["suggestion"] = self._generate_fix_suggestion(error)
-        
-        return errors
+        return self._validate_lines(io.StringIO(content))
     
-    def _check_content_quality(self, content: str) -> List[Dict[str, Any]]:
-        """
-        Check for minimum content quality indicators.
-        
-        V3: Added to catch empty/stub output files.
-        """
-        errors = []
-        
-        # Check minimum content length (less than 1000 chars is suspicious)
-        if len(content) < 1000:
-            errors.append({
-                "rule": "content_quality",
-                "line": 1,
-                "message": f"Content too short ({len(content)} chars). Expected substantial scholarly content.",
-                "location": "Entire file"
-            })
-        
-        # Check for Cross-Text Analysis section
-        if "### Cross-Text Analysis" not in content and "Cross-Text Analysis" not in content:
-            errors.append({
-                "rule": "content_quality",
-                "line": 1,
-                "message": "Missing 'Cross-Text Analysis' section. LLM enhancement may have failed.",
-                "location": "Document structure"
-            })
-        
-        # Check for footnotes (scholarly content should have citations)
-        footnote_pattern = r'\[\^\d+\]'
-        if not re.search(footnote_pattern, content):
-            errors.append({
-                "rule": "content_quality",
-                "line": 1,
-                "message": "No footnote references found. Expected scholarly annotations with citations.",
-                "location": "Document citations"
-            })
-        
-        # Check for chapter summaries with actual content
-        summary_pattern = r'### Chapter Summary\s*\n(.{100,})'
-        if not re.search(summary_pattern, content, re.DOTALL):
-            errors.append({
-                "rule": "content_quality",
-                "line": 1,
-                "message": "Chapter summaries appear empty or missing. Expected detailed summaries.",
-                "location": "Chapter content"
-            })
-        
-        return errors
+    def _build_rule_engines(self) -> List[StreamingRule]:
+        """Fresh rule state for one document: active rules, then content quality."""
+        rules: List[StreamingRule] = [
+            RULE_ENGINES[name]() for name in self.get_active_rules() if name in RULE_ENGINES
+        ]
+        # V3: Add content quality checks
+        rules.append(ContentQualityRule())
+        return rules
     
-    def _check_chicago_citations(self, content: str, _pattern: str) -> List[Dict[str, Any]]:
+    def _validate_lines(self, lines: Iterable[str]) -> List[Dict[str, Any]]:
         """
-        Check for Chicago-style citations in content.
-        
-        V3: Actually implements citation checking (was stub before).
+        Single pass over a document: every line is fed to every active rule.
         
         Args:
-            content: Markdown content to validate
-            _pattern: Reserved for custom pattern (unused, kept for API compatibility)
-        """
-        errors = []
-        
-        # Check for footnote definitions with content (e.g., [^1]: Author, Title...)
-        footnote_def_pattern = r'\[\^\d+\]:\s*.+'
-        
-        # Check if there are footnote references
-        has_references = re.search(r'\[\^\d+\](?!:)', content)
-        has_definitions = re.search(footnote_def_pattern, content)
+            lines: Document lines (with or without trailing newlines)
         
-        if has_references and not has_definitions:
-            errors.append({
-                "rule": "chicago_citation",
-                "line": 1,
-                "message": "Footnote references found but no citation definitions.",
-                "location": "Document end"
-            })
+        Returns:
+            List of validation errors, in rule order
+        """
+        rules = self._build_rule_engines()
+        total_chars = 0
+        watching = False
+        for line_no, line in enumerate(lines, start=1):
+            total_chars += len(line)
+            if not watching and LINE_MARKER_RE.search(line) is None:
+                continue
+            text = line[:-1] if line.endswith("\n") else line
+            for rule in rules:
+                rule.feed(line_no, text, total_chars)
+            watching = any(rule.needs_next_line for rule in rules)
+        
+        errors = [error for rule in rules for error in rule.finish(total_chars)]
         
-        return errors
-    
-    def _check_verbatim_blocks(self, content: str) -> List[Dict[str, Any]]:
-        """Check verbatim code blocks have annotations."""
-        errors = []
-        lines = content.split("\n")
-        
-        i = 0
-        while i < len(lines):
-            if lines[i].strip().startswith("```"):
-                # Found code block
-                block_start = i
-                i += 1
-                while i < len(lines) and not lines[i].strip().startswith("```"):
-                    i += 1
-                
-                # Check next non-blank line for annotation
-                j = i + 1
-                while j < len(lines) and not lines[j].strip():
-                    j += 1
-                
-                if j >= len(lines) or not re.search(r'\[\^\d+\]', lines[j]):
-                    errors.append({
-                        "rule": "verbatim_block",
-                        "line": block_start + 1,
-                        "message": "Code block missing footnote annotation",
-                        "location": f"Line {block_start + 1}"
-                    })
-            i += 1
+        # Add fix suggestions
+        for error in errors:
+            error["suggestion"] = self._generate_fix_suggestion(error)
         
         return errors
     
-    def _check_annotations(self, _content: str, _pattern: str) -> List[Dict[str, Any]]:
-        """
-        Check for annotation format issues.
-        
-        Note: Parameters prefixed with _ to indicate reserved for future implementation
-        (Python Cookbook Ch. 9: Classes and Objects)
-        """
-        # Simple check - in production would be more sophisticated
-        return []
-    
     def _generate_fix_suggestion(self, error: Dict[str, Any]) -> str:
         """Generate fix suggestion for an error."""
         rule = error.get("rule", "")
@@ -591,24 +727,61 @@ class ComplianceValidator:
             JUnit XML string
         """
         xml_lines = ['<?xml version="1.0" encoding="UTF-8"?>']
-        xml_lines.append(f'<testsuite name="compliance_validation" tests="{results["summary"]["rules_checked"]}" errors="{results["summary"]["total_errors"]}">')
+        xml_lines.extend(self._junit_testsuite_lines(results, "compliance_validation"))
+        return '\n'.join(xml_lines)
+    
+    def _format_junit_report(self, all_results: Dict[str, Any]) -> str:
+        """
+        Format validate_all results as one JUnit report (one testsuite per file).
+        
+        Args:
+            all_results: validate_all results ({"files": {name: results}})
         
-        # Add testcases for each rule
-        for rule_name in self.get_active_rules():
+        Returns:
+            JUnit XML string with a <testsuites> root
+        """
+        files = all_results["files"]
+        total_errors = sum(r["summary"]["total_errors"] for r in files.values())
+        xml_lines = ['<?xml version="1.0" encoding="UTF-8"?>']
+        xml_lines.append(f'<testsuites name="compliance_validation" tests="{len(files)}" errors="{total_errors}">')
+        for name, results in files.items():
+            xml_lines.extend('  ' + line for line in self._junit_testsuite_lines(results, name))
+        xml_lines.append('</testsuites>')
+        return '\n'.join(xml_lines)
+    
+    def _junit_testsuite_lines(self, results: Dict[str, Any], suite_name: str) -> List[str]:
+        """<testsuite> element for one file: a testcase per rule, a failure per error."""
+        if "errors" not in results:
+            # File could not be validated at all
+            return [
+                f'<testsuite name={quoteattr(suite_name)} tests="1" errors="1">',
+                '  <testcase name="read" classname="ComplianceValidator">',
+                f'    <error message={quoteattr(results.get("error", "Validation failed"))}/>',
+                '  </testcase>',
+                '</testsuite>',
+            ]
+        
+        rule_names = self.get_active_rules() + [ContentQualityRule.name]
+        xml_lines = [
+            f'<testsuite name={quoteattr(suite_name)} tests="{len(rule_names)}" '
+            f'errors="{results["summary"]["total_errors"]}">'
+        ]
+        for rule_name in rule_names:
             rule_errors = [e for e in results["errors"] if e.get("rule") == rule_name]
             
             if rule_errors:
-                xml_lines.append(f'  <testcase name="{rule_name}" classname="ComplianceValidator">')
+                xml_lines.append(f'  <testcase name={quoteattr(rule_name)} classname="ComplianceValidator">')
                 for error in rule_errors:
-                    xml_lines.append(f'    <failure message="{error.get("message", "Validation failed")}">')
-                    xml_lines.append(f'      {error.get("location", "Unknown location")}')
+                    xml_lines.append(f'    <failure message={quoteattr(error.get("message", "Validation failed"))}>')
+                    xml_lines.append(f'      Line {error.get("line", "?")}: '
+                                     f'{escape(str(error.get("location", "Unknown location")))}')
                     xml_lines.append('    </failure>')
                 xml_lines.append('  </testcase>')
             else:
-                xml_lines.append(f'  <testcase name="{rule_name}" classname="ComplianceValidator"/>')
+                xml_lines.append(f'  <testcase name={quoteattr(rule_name)} classname="ComplianceValidator"/>')
         
         xml_lines.append('</testsuite>')
-        return '\n'.join(xml_lines)
+        return xml_lines
 
 
 # ==========================
@@ -641,6 +814,8 @@ def _create_argument_parser() -> argparse.ArgumentParser:
     # Display arguments
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--quiet", "-q", action="store_true", help="Suppress all output except errors")
+    parser.add_argument("--workers", type=int,
+                       help="Parallel processes for --input-dir (default: CPU count)")
     
     return parser
 
@@ -652,7 +827,8 @@ def _create_validator_from_args(args) -> ComplianceValidator:
         rules_file=Path(args.rules_file) if args.rules_file else None,
         disable_rules=args.disable_rules or [],
         verbose=args.verbose,
-        quiet=args.quiet
+        quiet=args.quiet,
+        workers=args.workers
     )
 
 def _run_validation(validator: ComplianceValidator, args) -> Any:
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Cross-book context index sidecar (Tab 6 writes, Tab 7 reads).
+
+Tab 7 used to parse the whole aggregate package and walk every companion
+book's chapter metadata just to build its ``{book}_ch{N}`` lookup table, on
+every run. Aggregates only change when Tab 6 reruns, so Tab 6 now writes
+the index once, next to the package, and Tab 7 memory-maps it and decodes
+individual chapter entries on first lookup.
+
+File layout ({package}.ctxidx):
+    magic      8 bytes   b"LLMCTXIX"
+    header     20 bytes  <I version><Q directory offset><Q directory length>
+    entries    compact UTF-8 JSON per chapter, back to back
+    directory  JSON {"meta": {...}, "keys": {key: [offset, length]}}
+
+``meta`` records the package's size and mtime so a sidecar left over from
+an older package (or a package edited by hand) is ignored, not trusted.
+
+NO LLM CALLS - pure file I/O.
+"""
+
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+
+CONTEXT_INDEX_MAGIC = b"LLMCTXIX"
+CONTEXT_INDEX_VERSION = 1
+CONTEXT_INDEX_SUFFIX = ".ctxidx"
+_HEADER = struct.Struct("<IQQ")
+_HEADER_SIZE = len(CONTEXT_INDEX_MAGIC) + _HEADER.size
+
+
+class ContextIndexError(Exception):
+    """Raised when a context index sidecar is missing, corrupt or incompatible."""
+    pass
+
+
+def _chapter_entry(book_name: str, chapter: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """Index key and lookup entry for one chapter."""
+    ch_num = chapter.get('chapter_number', chapter.get('number', 0))
+    return f"{book_name}_ch{ch_num}", {
+        "book": book_name,
+        "chapter": ch_num,
+        "title": chapter.get("title", ""),
+        "keywords": chapter.get("keywords_enriched", chapter.get("keywords", [])),
+        "concepts": chapter.get("concepts_enriched", chapter.get("concepts", [])),
+        "summary": chapter.get("summary", "")
+    }
+
+
+def iter_book_entries(book: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield (key, entry) for one book of an aggregate package.
+
+    Args:
+        book: Source or companion book entry; metadata is a dict with
+            "chapters" or a direct list of chapters
+    """
+    book_name = book.get("name", "unknown")
+    metadata = book.get("metadata", [])
+    chapters = metadata.get("chapters", []) if isinstance(metadata, dict) else metadata
+    for chapter in chapters:
+        yield _chapter_entry(book_name, chapter)
+
+
+def iter_context_entries(aggregate: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield (key, entry) for the source book and every companion book.
+
+    Later duplicates of a key win, matching dict assignment order.
+
+    Args:
+        aggregate: Aggregate package from Tab 6
+    """
+    yield from iter_book_entries(aggregate.get("source_book", {}))
+    for book in aggregate.get("companion_books", []):
+        yield from iter_book_entries(book)
+
+
+def context_index_path(aggregate_path: Path) -> Path:
+    """Sidecar path for an aggregate package (same stem, .ctxidx suffix)."""
+    return aggregate_path.with_suffix(CONTEXT_INDEX_SUFFIX)
+
+
+def _source_fingerprint(aggregate_path: Path) -> Dict[str, int]:
+    stat = aggregate_path.stat()
+    return {"source_size": stat.st_size, "source_mtime_ns": stat.st_mtime_ns}
+
+
+def write_context_index(aggregate: Dict[str, Any], aggregate_path: Path) -> Path:
+    """
+    Write the context index sidecar for a saved aggregate package.
+
+    Must be called after the package file is written (its size and mtime
+    are recorded for staleness checks).
+
+    Args:
+        aggregate: The aggregate package that was saved
+        aggregate_path: Where it was saved
+
+    Returns:
+        Path to the sidecar
+    """
+    return write_context_index_entries(
+        iter_context_entries(aggregate),
+        aggregate_path,
+        project_id=aggregate.get("project", {}).get("id", "unknown"),
+        statistics=aggregate.get("statistics", {}),
+        book_count=len(aggregate.get("companion_books", [])) + 1,
+    )
+
+
+def write_context_index_entries(
+    entries: Iterable[Tuple[str, Dict[str, Any]]],
+    aggregate_path: Path,
+    project_id: str,
+    statistics: Dict[str, Any],
+    book_count: int,
+) -> Path:
+    """
+    Write a context index sidecar from precomputed entries.
+
+    Used when the package was streamed from cached fragments and is never
+    held in memory as a whole. Written to a temp file and renamed so
+    readers never see a partial index.
+
+    Args:
+        entries: (key, entry) pairs; later duplicates of a key win
+        aggregate_path: The saved package
+        project_id, statistics, book_count: Recorded in the directory meta
+
+    Returns:
+        Path to the sidecar
+    """
+    entries = dict(entries)
+
+    body = bytearray()
+    keys: Dict[str, Tuple[int, int]] = {}
+    for key, entry in entries.items():
+        encoded = json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        keys[key] = (_HEADER_SIZE + len(body), len(encoded))
+        body += encoded
+
+    directory = json.dumps({
+        "meta": {
+            **_source_fingerprint(aggregate_path),
+            "project_id": project_id,
+            "statistics": statistics,
+            "book_count": book_count,
+        },
+        "keys": keys,
+    }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    directory_offset = _HEADER_SIZE + len(body)
+    sidecar = context_index_path(aggregate_path)
+    tmp_path = sidecar.with_name(sidecar.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(CONTEXT_INDEX_MAGIC)
+        f.write(_HEADER.pack(CONTEXT_INDEX_VERSION, directory_offset, len(directory)))
+        f.write(body)
+        f.write(directory)
+    os.replace(tmp_path, sidecar)
+    return sidecar
+
+
+class ContextIndex(Mapping[str, Dict[str, Any]]):
+    """
+    Read-only, memory-mapped view of a context index sidecar.
+
+    Behaves like the dict build_context_index returns; entries are decoded
+    on first access and cached.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open and validate a sidecar.
+
+        Raises:
+            ContextIndexError: If the file is corrupt or from another format version
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:  # empty file
+            self._file.close()
+            raise ContextIndexError(f"Empty context index: {path}") from e
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        try:
+            self._keys, self.meta = self._read_directory()
+        except ContextIndexError:
+            self.close()
+            raise
+
+    def _read_directory(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        if self._mm[:len(CONTEXT_INDEX_MAGIC)] != CONTEXT_INDEX_MAGIC or len(self._mm) < _HEADER_SIZE:
+            raise ContextIndexError(f"Not a context index: {self.path}")
+        version, offset, length = _HEADER.unpack_from(self._mm, len(CONTEXT_INDEX_MAGIC))
+        if version != CONTEXT_INDEX_VERSION:
+            raise ContextIndexError(
+                f"Context index version {version} != {CONTEXT_INDEX_VERSION}: {self.path}"
+            )
+        try:
+            directory = json.loads(self._mm[offset:offset + length].decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ContextIndexError(f"Corrupt context index directory: {self.path}") from e
+        return directory["keys"], directory["meta"]
+
+    @property
+    def project_id(self) -> str:
+        return self.meta.get("project_id", "unknown")
+
+    @property
+    def statistics(self) -> Dict[str, Any]:
+        return self.meta.get("statistics", {})
+
+    @property
+    def book_count(self) -> int:
+        return self.meta.get("book_count", 0)
+
+    def is_current_for(self, aggregate_path: Path) -> bool:
+        """True if the sidecar was written for the package as it is now."""
+        try:
+            fingerprint = _source_fingerprint(aggregate_path)
+        except OSError:
+            return False
+        return all(self.meta.get(k) == v for k, v in fingerprint.items())
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        entry = self._cache.get(key)
+        if entry is None:
+            offset, length = self._keys[key]
+            entry = json.loads(self._mm[offset:offset + length].decode("utf-8"))
+            self._cache[key] = entry
+        return entry
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def close(self) -> None:
+        """Unmap and close the sidecar file."""
+        if not self._mm.closed:
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "ContextIndex":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def load_context_index(aggregate_path: Path) -> Optional[ContextIndex]:
+    """
+    Open the sidecar for an aggregate package if it exists and is current.
+
+    Args:
+        aggregate_path: Path to the aggregate package JSON
+
+    Returns:
+        ContextIndex, or None if missing, stale or unreadable (callers fall
+        back to building the index from the package)
+    """
+    sidecar = context_index_path(aggregate_path)
+    if not sidecar.exists():
+        return None
+    try:
+        index = ContextIndex(sidecar)
+    except (OSError, ContextIndexError) as e:
+        print(f"  ⚠️  Ignoring context index sidecar: {e}")
+        return None
+    if not index.is_current_for(aggregate_path):
+        print(f"  ⚠️  Context index sidecar is stale: {sidecar.name}")
+        index.close()
+        return None
+    return index
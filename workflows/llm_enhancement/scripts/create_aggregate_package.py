@@ -18,13 +18,15 @@ Input:
 
 Output:
 - {book}_llm_package_{timestamp}.json (~720 KB for 12 books)
+- {book}_llm_package_{timestamp}.ctxidx (context index sidecar for Tab 7)
 - Location: workflows/llm_enhancement/tmp/
 
 Processing:
 1. Load taxonomy
 2. Build book list from taxonomy tiers
-3. Load metadata with graceful degradation
-4. Combine into single package
+3. Load metadata with graceful degradation (books in parallel; each book's
+   fragment is reused from the fragment cache while its files are unchanged)
+4. Stream fragments into a single package
 5. Generate statistics
 6. Save with timestamp
 
@@ -33,15 +35,38 @@ NO LLM CALLS - Pure file loading and combining.
 
 import argparse
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from workflows.llm_enhancement.scripts.aggregate_container import (
+    BookFragment,
+    FragmentCache,
+    encode_json,
+    files_fingerprint,
+    write_package,
+)
+from workflows.llm_enhancement.scripts.context_index import (
+    iter_book_entries,
+    write_context_index,
+    write_context_index_entries,
+)
 
 
 # Path to the LLM cross-reference workflow schema
 WORKFLOW_SCHEMA_PATH = Path(__file__).parent.parent / "llm_cross_reference_workflow.json"
 
+# Fragment cache location inside the output directory, and companion loader threads
+FRAGMENT_CACHE_DIRNAME = ".fragment_cache"
+DEFAULT_LOAD_WORKERS = int(os.getenv("AGGREGATE_LOAD_WORKERS", "8"))
+
 
 def load_json(file_path: Path) -> Dict[str, Any]:
     """
@@ -196,12 +221,107 @@ def load_book_guideline(book_name: str, guideline_dir: Path) -> Optional[Dict[st
     return None
 
 
+def _metadata_candidates(
+    book_name: str,
+    metadata_dir: Path,
+    specific_enriched_file: Optional[Path]
+) -> List[Path]:
+    """Files load_book_metadata may read for a book (for fingerprinting)."""
+    candidates = [metadata_dir / f"{book_name}_metadata.json"]
+    if specific_enriched_file and specific_enriched_file.stem.split("_enr_metadata_")[0] == book_name:
+        candidates.insert(0, specific_enriched_file)
+    return candidates
+
+
+def count_chapters(metadata: Any) -> int:
+    """Chapter count of book metadata (a dict with "chapters" or a direct list)."""
+    if isinstance(metadata, dict):
+        return len(metadata.get("chapters", []))
+    if isinstance(metadata, list):
+        return len(metadata)
+    return 0
+
+
+def build_book_fragment(
+    book_info: Dict[str, Any],
+    metadata_dir: Path,
+    guideline_dir: Path,
+    specific_enriched_file: Optional[Path] = None,
+    cache: Optional[FragmentCache] = None
+) -> Tuple[Optional[BookFragment], str]:
+    """
+    Load one book's metadata and guideline as a package fragment.
+    
+    The fragment is taken from ``cache`` when none of the files it was
+    built from has changed (path, size and mtime); otherwise the files are
+    loaded, encoded once and cached.
+    
+    Args:
+        book_info: {"name", "tier"} plus "priority" for companion books;
+            tier "source" builds the source book entry
+        metadata_dir: Directory with basic metadata files
+        guideline_dir: Directory with guideline JSON files
+        specific_enriched_file: Specific enriched file (used if it matches the book)
+        cache: Fragment cache (None = always load)
+    
+    Returns:
+        (fragment, note), or (None, reason) when no metadata exists
+    
+    Pattern: Cache-Aside keyed by input file fingerprint
+    """
+    book_name = book_info["name"]
+    is_source = book_info["tier"] == "source"
+    guideline_path = guideline_dir / f"{book_name}_guideline.json"
+    fingerprint = files_fingerprint(
+        [*_metadata_candidates(book_name, metadata_dir, specific_enriched_file), guideline_path],
+        book=book_info,
+    )
+    
+    fragment = cache.get(fingerprint) if cache else None
+    if fragment is not None:
+        return fragment, fragment.info.get("note", "")
+    
+    metadata, note = load_book_metadata(book_name, metadata_dir, specific_enriched_file)
+    if metadata is None:
+        return None, note
+    guideline = load_book_guideline(book_name, guideline_dir)
+    
+    if is_source:
+        book_data = {"name": book_name, "tier": "source", "metadata": metadata}
+    else:
+        book_data = {
+            "name": book_name,
+            "tier": book_info["tier"],
+            "priority": book_info["priority"],
+            "metadata": metadata,
+            "note": note
+        }
+    if guideline:
+        book_data["guideline"] = guideline
+    
+    info = {"tier": book_info["tier"], "note": note, "has_guideline": bool(guideline)}
+    if not is_source:
+        info["priority"] = book_info["priority"]
+    fragment = BookFragment(
+        name=book_name,
+        data=encode_json(book_data),
+        fingerprint=fingerprint,
+        chapter_count=count_chapters(metadata),
+        info=info,
+        context_entries=list(iter_book_entries(book_data)),
+    )
+    if cache:
+        cache.put(fragment)
+    return fragment, note
+
+
 def load_source_book(
     source_book: str,
     metadata_dir: Path,
     guideline_dir: Path,
-    specific_enriched_file: Optional[Path] = None
-) -> Dict[str, Any]:
+    specific_enriched_file: Optional[Path] = None,
+    cache: Optional[FragmentCache] = None
+) -> BookFragment:
     """
     Load source book metadata and guideline.
     
@@ -210,9 +330,10 @@ def load_source_book(
         metadata_dir: Directory with basic metadata files
         guideline_dir: Directory with guideline JSON files
         specific_enriched_file: Specific enriched file to use
+        cache: Fragment cache (None = always load)
         
     Returns:
-        Source book data dictionary with metadata and optional guideline
+        Source book fragment (entry has name, tier, metadata and optional guideline)
         
     Raises:
         FileNotFoundError: If source book metadata not found
@@ -221,28 +342,18 @@ def load_source_book(
     Pattern: Extract complex loading logic (REFACTOR phase)
     """
     print(f"\n📄 Loading source book: {source_book}...")
-    source_metadata, source_note = load_book_metadata(
-        source_book, metadata_dir, specific_enriched_file
+    fragment, source_note = build_book_fragment(
+        {"name": source_book, "tier": "source"}, metadata_dir, guideline_dir,
+        specific_enriched_file, cache
     )
-    source_guideline = load_book_guideline(source_book, guideline_dir)
     
-    if source_metadata is None:
+    if fragment is None:
         raise FileNotFoundError(f"Source book metadata not found for {source_book}")
     
-    print(f"  Source metadata: {source_note}")
-    print(f"  Source guideline: {'found' if source_guideline else 'not found'}")
-    
-    # Build source book dict
-    source_book_data = {
-        "name": source_book,
-        "tier": "source",
-        "metadata": source_metadata
-    }
-    
-    if source_guideline:
-        source_book_data["guideline"] = source_guideline
+    print(f"  Source metadata: {source_note}{' (cached)' if fragment.cached else ''}")
+    print(f"  Source guideline: {'found' if fragment.info.get('has_guideline') else 'not found'}")
     
-    return source_book_data
+    return fragment
 
 
 def load_companion_books(
@@ -250,56 +361,54 @@ def load_companion_books(
     source_book: str,
     metadata_dir: Path,
     guideline_dir: Path,
-    specific_enriched_file: Optional[Path] = None
-) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    specific_enriched_file: Optional[Path] = None,
+    cache: Optional[FragmentCache] = None,
+    workers: int = DEFAULT_LOAD_WORKERS
+) -> Tuple[List[BookFragment], List[Dict[str, Any]]]:
     """
     Load companion books with graceful degradation.
     
+    Books are loaded concurrently (``workers`` threads); results keep
+    taxonomy order.
+    
     Args:
         book_list: List of books from taxonomy
         source_book: Name of source book (to skip)
         metadata_dir: Directory with basic metadata files
         guideline_dir: Directory with guideline JSON files
         specific_enriched_file: Specific enriched file (will check if it matches each book)
+        cache: Fragment cache (None = always load)
+        workers: Loader threads
         
     Returns:
-        Tuple of (companion_books, missing_books)
+        Tuple of (companion_fragments, missing_books)
         
     Reference: CONSOLIDATED_IMPLEMENTATION_PLAN.md lines 1633-1655
     Pattern: Extract complex loading logic (REFACTOR phase)
     """
     print("\n📚 Loading companion books...")
-    companion_books = []
-    missing_books = []
-    
+    companions = []
     for book_info in book_list:
         book_name = book_info["name"].replace(".json", "")  # Remove .json extension if present
         
         # Skip source book (already loaded)
         if book_name == source_book or book_name == f"{source_book}.json":
             continue
-        
-        # Load metadata (will use enriched if specific file matches this book)
-        metadata, note = load_book_metadata(
-            book_name, metadata_dir, specific_enriched_file
-        )
-        
-        if metadata is not None:
-            book_data = {
-                "name": book_name,
-                "tier": book_info["tier"],
-                "priority": book_info["priority"],
-                "metadata": metadata,
-                "note": note
-            }
-            
-            # Load guideline if available
-            guideline = load_book_guideline(book_name, guideline_dir)
-            if guideline:
-                book_data["guideline"] = guideline
-            
-            companion_books.append(book_data)
-            print(f"  ✓ {book_name} ({note})")
+        companions.append({**book_info, "name": book_name})
+    
+    def load(book_info: Dict[str, Any]) -> Tuple[Optional[BookFragment], str]:
+        return build_book_fragment(book_info, metadata_dir, guideline_dir, specific_enriched_file, cache)
+    
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(pool.map(load, companions))
+    
+    companion_books = []
+    missing_books = []
+    for book_info, (fragment, note) in zip(companions, results):
+        book_name = book_info["name"]
+        if fragment is not None:
+            companion_books.append(fragment)
+            print(f"  ✓ {book_name} ({note}){' (cached)' if fragment.cached else ''}")
         else:
             missing_books.append({
                 "name": book_name,
@@ -312,16 +421,16 @@ def load_companion_books(
 
 
 def calculate_statistics(
-    source_metadata: Dict[str, Any],
-    companion_books: List[Dict[str, Any]],
+    source_chapters: int,
+    companion_chapters: List[int],
     missing_books: List[Dict[str, Any]]
 ) -> Dict[str, int]:
     """
     Calculate package statistics.
     
     Args:
-        source_metadata: Source book metadata
-        companion_books: List of companion book data
+        source_chapters: Chapter count of the source book
+        companion_chapters: Chapter count of each companion book
         missing_books: List of missing book data
         
     Returns:
@@ -331,26 +440,11 @@ def calculate_statistics(
     Pattern: Extract calculation logic (REFACTOR phase)
     """
     print("\n📊 Calculating statistics...")
-    total_chapters = 0
-    
-    # Count chapters in source book
-    if "chapters" in source_metadata:
-        total_chapters += len(source_metadata["chapters"])
-    elif isinstance(source_metadata, list):
-        total_chapters += len(source_metadata)
-    
-    # Count chapters in companion books
-    for book in companion_books:
-        metadata = book.get("metadata", {})
-        if "chapters" in metadata:
-            total_chapters += len(metadata["chapters"])
-        elif isinstance(metadata, list):
-            total_chapters += len(metadata)
     
     statistics = {
-        "total_books": len(companion_books) + 1,  # +1 for source book
-        "companion_books": len(companion_books),
-        "total_chapters": total_chapters,
+        "total_books": len(companion_chapters) + 1,  # +1 for source book
+        "companion_books": len(companion_chapters),
+        "total_chapters": source_chapters + sum(companion_chapters),
         "missing_count": len(missing_books)
     }
     
@@ -367,7 +461,10 @@ def create_aggregate_package(
     metadata_dir: Path,
     guideline_dir: Path,
     output_dir: Path,
-    enriched_metadata_file: Optional[Path] = None
+    enriched_metadata_file: Optional[Path] = None,
+    fragment_cache_dir: Optional[Path] = None,
+    use_fragment_cache: bool = True,
+    workers: int = DEFAULT_LOAD_WORKERS
 ) -> Path:
     """
     Create aggregate package combining all sources.
@@ -381,6 +478,9 @@ def create_aggregate_package(
         output_dir: Directory for output package
         enriched_metadata_file: Optional specific enriched metadata file.
                                Only used for the book that matches the filename.
+        fragment_cache_dir: Fragment cache (default: output_dir/.fragment_cache)
+        use_fragment_cache: False rebuilds every book from its files
+        workers: Companion loader threads
         
     Returns:
         Path to created package file
@@ -396,6 +496,8 @@ def create_aggregate_package(
         print(f"Enriched metadata file: {enriched_metadata_file.name}")
         print("Will use this enriched metadata for the matching book only")
     
+    cache = FragmentCache(fragment_cache_dir or output_dir / FRAGMENT_CACHE_DIRNAME) if use_fragment_cache else None
+    
     # 1. Load taxonomy
     print("\n📖 Loading taxonomy...")
     taxonomy = load_json(taxonomy_path)
@@ -408,21 +510,21 @@ def create_aggregate_package(
     print(f"  Found {len(book_list)} books across {len(taxonomy.get('tiers', {}))} tiers")
     
     # 3. Load source book (extracted to helper function)
-    source_book_data = load_source_book(
+    source_fragment = load_source_book(
         source_book, metadata_dir, guideline_dir,
-        specific_enriched_file=enriched_metadata_file
+        specific_enriched_file=enriched_metadata_file, cache=cache
     )
     
     # 4. Load companion books (extracted to helper function)
     companion_books, missing_books = load_companion_books(
         book_list, source_book, metadata_dir, guideline_dir,
-        specific_enriched_file=enriched_metadata_file
+        specific_enriched_file=enriched_metadata_file, cache=cache, workers=workers
     )
     
     # 5. Calculate statistics (extracted to helper function)
     statistics = calculate_statistics(
-        source_book_data["metadata"],
-        companion_books,
+        source_fragment.chapter_count,
+        [fragment.chapter_count for fragment in companion_books],
         missing_books
     )
     
@@ -434,35 +536,46 @@ def create_aggregate_package(
     else:
         print("  ⚠️  Workflow schema not found - package will be created without it")
     
-    # 7. Build aggregate package
+    # 7. Build aggregate package (fragments are streamed, never re-encoded)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    package = {
-        "project": {
-            "id": source_book,
-            "generated": datetime.now().isoformat(),
-            "source_taxonomy": taxonomy_path.name,
-            "package_version": "1.0"
-        },
-        "taxonomy": taxonomy,
-        "source_book": source_book_data,
-        "companion_books": companion_books,
-        "missing_books": missing_books,
-        "statistics": statistics
+    project = {
+        "id": source_book,
+        "generated": datetime.now().isoformat(),
+        "source_taxonomy": taxonomy_path.name,
+        "package_version": "1.0"
     }
+    sections = [
+        ("project", project),
+        ("taxonomy", taxonomy),
+        ("source_book", source_fragment),
+        ("companion_books", companion_books),
+        ("missing_books", missing_books),
+        ("statistics", statistics),
+    ]
     
     # Add workflow schema if available
     if workflow_schema:
-        package["llm_workflow"] = workflow_schema
+        sections.append(("llm_workflow", workflow_schema))
     
-    # 8. Save package
+    # 8. Save package and context index
     output_path = output_dir / f"{source_book}_llm_package_{timestamp}.json"
-    save_json(output_path, package)
+    write_package(output_path, sections)
+    index_path = write_context_index_entries(
+        (entry for fragment in [source_fragment, *companion_books] for entry in fragment.context_entries),
+        output_path,
+        project_id=source_book,
+        statistics=statistics,
+        book_count=len(companion_books) + 1,
+    )
     
+    cached = sum(fragment.cached for fragment in [source_fragment, *companion_books])
     file_size_kb = output_path.stat().st_size / 1024
     print(f"\n✅ Package created: {output_path.name}")
     print(f"  File size: {file_size_kb:.1f} KB")
     print(f"  Location: {output_path}")
+    print(f"  Books from fragment cache: {cached}/{len(companion_books) + 1}")
+    print(f"  Context index: {index_path.name}")
     print("  NO LLM calls made ✓")
     
     return output_path
@@ -618,11 +731,13 @@ def create_aggregate_from_enriched(
     # 6. Save package
     output_path.parent.mkdir(parents=True, exist_ok=True)
     save_json(output_path, package)
+    index_path = write_context_index(package, output_path)
     
     file_size_kb = output_path.stat().st_size / 1024
     print(f"\n✅ Aggregate package created: {output_path.name}")
     print(f"  File size: {file_size_kb:.1f} KB")
     print(f"  Location: {output_path}")
+    print(f"  Context index: {index_path.name}")
     
     return output_path
 
@@ -685,7 +800,9 @@ def _run_full_mode(args) -> int:
             args.metadata_dir,
             args.guideline_dir,
             args.output_dir,
-            enriched_metadata_file=enriched_metadata_file
+            enriched_metadata_file=enriched_metadata_file,
+            use_fragment_cache=not args.no_fragment_cache,
+            workers=args.workers
         )
         
         print(f"\n✅ Success! Package created at: {output_path}")
@@ -794,6 +911,19 @@ Reference: END_TO_END_INTEGRATION_WBS.md WBS 4.1.1
         help="Directory for output package in full mode (default: workflows/llm_enhancement/tmp)"
     )
     
+    parser.add_argument(
+        "--no-fragment-cache",
+        action="store_true",
+        help="Full mode: rebuild every book instead of reusing unchanged cached fragments"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_LOAD_WORKERS,
+        help=f"Full mode: companion books loaded in parallel (default: {DEFAULT_LOAD_WORKERS})"
+    )
+    
     args = parser.parse_args()
     
     # Determine mode and dispatch to appropriate handler
@@ -28,7 +28,10 @@ import logging
 import traceback
 import sys
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 
@@ -68,9 +71,11 @@ logger.info(f"Logging initialized - log file: {LOG_FILE}")
 
 # Note: Set OPENAI_API_KEY environment variable before running
 
+from workflows.llm_enhancement.scripts.chapter_journal import ChapterJournal, JournalEntry  # noqa: E402
+
 # Import simplified LLM function (still used for summary enhancement)
 try:
-    from workflows.shared.llm_integration import call_llm, get_cache_stats
+    from workflows.shared.llm_integration import call_llm, get_cache_stats, reset_token_usage
     LLM_AVAILABLE = True
     logger.info("✓ LLM integration loaded successfully")
 except ImportError as e:
@@ -80,6 +85,9 @@ except ImportError as e:
     # Fallback for get_cache_stats
     def get_cache_stats():
         return {"enabled": False, "phase1_count": 0, "phase2_count": 0}
+    
+    def reset_token_usage():
+        pass
 
 # Import new interactive system (V3 with hybrid prompt quality enforcement)
 # UPDATED: Now using TwoPhaseOrchestrator from refactored phases package
@@ -111,6 +119,60 @@ TAXONOMY_DATA = None  # Will be loaded from --taxonomy or --aggregate
 # Regex pattern constants (to avoid duplication)
 CHAPTER_TITLE_PATTERN = r'## Chapter \d+:\s*(.+)'
 CHAPTER_SUMMARY_PATTERN = r'### Chapter Summary\s*\n([^#]+)(?=\n###|\n##|$)'
+CHAPTER_HEADING_RE = re.compile(r'## Chapter (\d+):')
+
+# Chapters enhanced concurrently (--workers overrides)
+DEFAULT_CHAPTER_WORKERS = int(os.getenv("LLM_ENHANCEMENT_WORKERS", "4"))
+# Consecutive failed chapters (in completion order) before the run is stopped
+MAX_CONSECUTIVE_FAILURES = 3
+
+
+@dataclass(frozen=True)
+class ChapterSpan:
+    """Location of one chapter in the guideline text: content[start:end]."""
+    number: int
+    start: int
+    end: int
+
+
+def segment_chapters(content: str) -> List[ChapterSpan]:
+    """
+    Split guideline text into chapters in a single pass.
+
+    Each chapter runs from its '## Chapter N:' heading to the next chapter
+    heading (or the end of the text). Text before the first heading is not
+    part of any span.
+
+    Returns:
+        Spans in document order
+    """
+    starts = [(m.start(), int(m.group(1))) for m in CHAPTER_HEADING_RE.finditer(content)]
+    ends = [start for start, _ in starts[1:]] + [len(content)]
+    return [ChapterSpan(number, start, end) for (start, number), end in zip(starts, ends)]
+
+
+def splice_chapters(content: str, spans: List[ChapterSpan], replacements: Dict[int, str]) -> str:
+    """
+    Rebuild ``content`` with some chapters replaced, copying the text once.
+
+    Args:
+        content: Original text the spans were computed from
+        spans: segment_chapters(content)
+        replacements: Span index -> new chapter text
+
+    Returns:
+        Text with each replaced span swapped in place; all other text unchanged
+    """
+    segments = []
+    pos = 0
+    for idx, span in enumerate(spans):
+        if idx in replacements:
+            segments.append(content[pos:span.start])
+            segments.append(replacements[idx])
+            pos = span.end
+    segments.append(content[pos:])
+    return "".join(segments)
+
 
 def get_or_create_orchestrator() -> Optional[TwoPhaseOrchestrator]:
     """Get or create the global orchestrator instance (singleton pattern).
@@ -602,8 +664,7 @@ def _extract_chapters_from_content(content: str) -> tuple[str, str, List[int], i
     print(f"Loaded full document: {len(content.split())} words")
     
     # Extract all chapter numbers
-    chapter_pattern = r'## Chapter (\d+):'
-    all_chapters = sorted([int(m.group(1)) for m in re.finditer(chapter_pattern, chapters_content)])
+    all_chapters = sorted(span.number for span in segment_chapters(chapters_content))
     
     # CRITICAL CHECK 8: Chapters found
     if not all_chapters:
@@ -623,15 +684,14 @@ def _test_first_chapter(orchestrator, chapters_content: str, test_chapter_num: i
     print(f"\n🧪 RUNNING TEST on Chapter {test_chapter_num} to validate workflow...")
     logger.info(f"Running test on Chapter {test_chapter_num} to validate workflow before processing all chapters")
     
-    chapter_pattern = rf'(## Chapter {test_chapter_num}:.*?)(?=## Chapter {test_chapter_num + 1}:|$)'
-    chapter_match = re.search(chapter_pattern, chapters_content, re.DOTALL)
+    span = next((s for s in segment_chapters(chapters_content) if s.number == test_chapter_num), None)
     
-    if not chapter_match:
+    if span is None:
         logger.error(f"✗ CRITICAL: Could not extract test chapter {test_chapter_num}")
         print(f"❌ CRITICAL ERROR: Could not extract test chapter {test_chapter_num}")
         return 1
     
-    test_chapter_content = chapter_match.group(1)
+    test_chapter_content = chapters_content[span.start:span.end]
     
     try:
         print(f"   Testing LLM enhancement on Chapter {test_chapter_num}...")
@@ -641,16 +701,11 @@ def _test_first_chapter(orchestrator, chapters_content: str, test_chapter_num: i
         title_match = re.search(CHAPTER_TITLE_PATTERN, test_chapter_content)
         chapter_title = title_match.group(1) if title_match else f"Chapter {test_chapter_num}"
         
-        # Extract full chapter text
-        chapter_pattern = rf'## Chapter {test_chapter_num}:.*?(?=## Chapter {test_chapter_num + 1}:|$)'
-        chapter_match = re.search(chapter_pattern, test_chapter_content, re.DOTALL)
-        full_chapter_text = chapter_match.group(0) if chapter_match else test_chapter_content
-        
         # Try to run the analysis
         annotation = orchestrator.analyze_chapter_comprehensive(
             chapter_num=test_chapter_num,
             chapter_title=chapter_title,
-            chapter_full_text=full_chapter_text
+            chapter_full_text=test_chapter_content
         )
         
         if not annotation:
@@ -681,13 +736,19 @@ def _test_first_chapter(orchestrator, chapters_content: str, test_chapter_num: i
         return 1
 
 
-def _process_single_chapter(chapter_num: int, chapters_content: str, companion_data: Dict,
-                           all_chapters: List[int]) -> Tuple[Optional[Tuple[str, str]], bool]:
+def _process_single_chapter(chapter_num: int, chapter_content: str, companion_data: Dict,
+                           all_chapters: List[int]) -> Tuple[Optional[str], bool]:
     """
     Process a single chapter with LLM enhancement.
     
+    Args:
+        chapter_num: Chapter number
+        chapter_content: The chapter's text (from segment_chapters)
+        companion_data: Companion book data
+        all_chapters: All chapter numbers being processed (for progress output)
+    
     Returns:
-        ((original_chapter, enhanced_chapter), success_flag) tuple, or (None, False) on failure
+        (enhanced_chapter, has_cross_refs) tuple, or (None, False) on failure
     """
     print(f"\n{'='*70}")
     print(f"[Chapter {chapter_num}/{all_chapters[-1]}] Enhancing...")
@@ -696,17 +757,6 @@ def _process_single_chapter(chapter_num: int, chapters_content: str, companion_d
     logger.info(f"Processing Chapter {chapter_num}/{all_chapters[-1]}")
     logger.info(f"{'='*70}")
     
-    # Extract individual chapter
-    chapter_pattern = rf'(## Chapter {chapter_num}:.*?)(?=## Chapter {chapter_num + 1}:|$)'
-    chapter_match = re.search(chapter_pattern, chapters_content, re.DOTALL)
-    
-    if not chapter_match:
-        logger.warning(f"  Could not find Chapter {chapter_num}")
-        print(f"  Warning: Could not find Chapter {chapter_num}")
-        return None, False
-    
-    chapter_content = chapter_match.group(1)
-    
     try:
         # Enhance summary
         logger.info(f"  Enhancing summary for Chapter {chapter_num}...")
@@ -725,7 +775,7 @@ def _process_single_chapter(chapter_num: int, chapters_content: str, companion_d
             logger.warning(f"  No cross-references added to Chapter {chapter_num}")
         
         logger.info(f"✓ Chapter {chapter_num} processing complete")
-        return (chapter_content, enhanced_chapter), has_cross_refs
+        return enhanced_chapter, has_cross_refs
         
     except Exception as e:
         logger.error(f"✗ Failed to process Chapter {chapter_num}: {e}")
@@ -734,51 +784,163 @@ def _process_single_chapter(chapter_num: int, chapters_content: str, companion_d
         return None, False
 
 
+def _chapter_texts(chapters_content: str, all_chapters: List[int]) -> Dict[int, str]:
+    """Text of each requested chapter (first heading wins); missing chapters are absent."""
+    texts: Dict[int, str] = {}
+    wanted = set(all_chapters)
+    for span in segment_chapters(chapters_content):
+        if span.number in wanted and span.number not in texts:
+            texts[span.number] = chapters_content[span.start:span.end]
+    return texts
+
+
+class _FailureBreaker:
+    """
+    Consecutive-failure circuit breaker shared by all chapter workers.
+
+    Workers report each result as it completes; after
+    MAX_CONSECUTIVE_FAILURES failures in a row ``stop`` is set and no
+    further chapter is started.
+    """
+
+    def __init__(self, threshold: int = MAX_CONSECUTIVE_FAILURES):
+        self.threshold = threshold
+        self.stop = threading.Event()
+        self._consecutive = 0
+        self._lock = threading.Lock()
+
+    @property
+    def tripped(self) -> bool:
+        return self.stop.is_set()
+
+    def record(self, success: bool) -> None:
+        with self._lock:
+            self._consecutive = 0 if success else self._consecutive + 1
+            if self._consecutive >= self.threshold:
+                self.stop.set()
+
+
+def _enhance_chapter_task(chapter_num: int, chapter_text: str, companion_data: Dict,
+                          all_chapters: List[int], journal: Optional[ChapterJournal],
+                          breaker: _FailureBreaker) -> Optional[Tuple[Optional[str], bool]]:
+    """
+    Worker body: enhance one chapter and journal it as soon as it completes.
+
+    Returns:
+        _process_single_chapter's result, or None if the run was stopped
+        before this chapter started (no tokens spent)
+    """
+    if breaker.tripped:
+        return None
+    enhanced_chapter, has_cross_refs = _process_single_chapter(
+        chapter_num, chapter_text, companion_data, all_chapters
+    )
+    if enhanced_chapter is not None and journal is not None:
+        try:
+            journal.record(chapter_num, chapter_text, enhanced_chapter, has_cross_refs)
+        except OSError as e:
+            logger.warning(f"  Could not journal Chapter {chapter_num}: {e}")
+    breaker.record(enhanced_chapter is not None and has_cross_refs)
+    return enhanced_chapter, has_cross_refs
+
+
 def _process_all_chapters(header: str, chapters_content: str, all_chapters: List[int],
-                         companion_data: Dict) -> Tuple[str, int, List[int], int]:
+                         companion_data: Dict, journal: Optional[ChapterJournal] = None,
+                         resumed: Optional[Dict[int, JournalEntry]] = None,
+                         workers: int = 1) -> Tuple[str, int, List[int], int]:
     """
     Process all chapters with LLM enhancement.
     
+    Chapters are located once (segment_chapters) and enhanced text is
+    spliced in by offset at the end, so the document is copied once rather
+    than rescanned per chapter.
+    
+    Up to ``workers`` chapters are enhanced concurrently. Each completed
+    chapter is appended to ``journal`` by its worker; chapters in
+    ``resumed`` (from a previous run's journal) are reused without an LLM
+    call. The consecutive-failure circuit breaker counts results in
+    completion order; once it trips, chapters not yet started are skipped
+    and in-flight ones are allowed to finish (and are journaled).
+    
     Returns:
         (enhanced_content, chapters_with_cross_refs, failed_chapters, exit_code)
     """
-    enhanced_content = chapters_content
+    # Token usage is tracked by chapter number; start each book from zero
+    reset_token_usage()
+    spans = segment_chapters(chapters_content)
+    span_index: Dict[int, int] = {}
+    for idx, span in enumerate(spans):
+        span_index.setdefault(span.number, idx)  # first heading wins
+    chapter_texts = _chapter_texts(chapters_content, all_chapters)
+    resumed = resumed or {}
+    
+    replacements: Dict[int, str] = {}
     chapters_with_cross_refs = 0
     failed_chapters = []
-    consecutive_failures = 0
-    MAX_CONSECUTIVE_FAILURES = 3
     
+    pending = []
     for chapter_num in all_chapters:
-        result, success = _process_single_chapter(chapter_num, chapters_content, companion_data, all_chapters)
-        
-        if result is None:
+        if chapter_num not in chapter_texts:
+            logger.warning(f"  Could not find Chapter {chapter_num}")
+            print(f"  Warning: Could not find Chapter {chapter_num}")
             failed_chapters.append(chapter_num)
-            consecutive_failures += 1
+        elif chapter_num in resumed:
+            entry = resumed[chapter_num]
+            replacements[span_index[chapter_num]] = entry.enhanced
+            chapters_with_cross_refs += int(entry.has_cross_refs)
         else:
-            # Unpack the tuple of (original_chapter, enhanced_chapter)
-            chapter_content: str
-            enhanced_chapter: str
-            chapter_content, enhanced_chapter = result
-            enhanced_content = enhanced_content.replace(chapter_content, enhanced_chapter)
-            if success:
-                chapters_with_cross_refs += 1
-                consecutive_failures = 0
-            else:
-                consecutive_failures += 1
-        
-        # Check for too many consecutive failures
-        if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
-            logger.error(f"✗ CRITICAL: {MAX_CONSECUTIVE_FAILURES} consecutive failures - stopping")
-            print(f"\n❌ CRITICAL: {MAX_CONSECUTIVE_FAILURES} consecutive failures detected")
-            print(f"   Failed chapters: {failed_chapters[-MAX_CONSECUTIVE_FAILURES:]}")
-            print("   Stopping to prevent wasting tokens")
-            print(f"   Check the log file: {LOG_FILE}")
-            
-            # Save partial results if any were successful
-            if chapters_with_cross_refs > 0:
-                _save_partial_results(header, enhanced_content, chapters_with_cross_refs)
+            pending.append(chapter_num)
+    
+    if resumed:
+        print(f"↻ Resuming: {len(resumed)} chapter(s) restored from {journal.path if journal else 'journal'}, "
+              f"{len(pending)} to process")
+        logger.info(f"Resumed {len(resumed)} chapters from journal; {len(pending)} pending")
+    
+    breaker = _FailureBreaker()
+    reported = False
+    pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="chapter")
+    futures = {
+        pool.submit(_enhance_chapter_task, chapter_num, chapter_texts[chapter_num],
+                    companion_data, all_chapters, journal, breaker): chapter_num
+        for chapter_num in pending
+    }
+    try:
+        for future in as_completed(futures):
+            result = None if future.cancelled() else future.result()
+            if result is not None:
+                chapter_num = futures[future]
+                enhanced_chapter, success = result
+                if enhanced_chapter is None:
+                    failed_chapters.append(chapter_num)
+                else:
+                    replacements[span_index[chapter_num]] = enhanced_chapter
+                    chapters_with_cross_refs += int(success)
             
-            return enhanced_content, chapters_with_cross_refs, failed_chapters, 1
+            # Check for too many consecutive failures
+            if breaker.tripped and not reported:
+                reported = True
+                for other in futures:
+                    other.cancel()
+                logger.error(f"✗ CRITICAL: {MAX_CONSECUTIVE_FAILURES} consecutive failures - stopping")
+                print(f"\n❌ CRITICAL: {MAX_CONSECUTIVE_FAILURES} consecutive failures detected")
+                print(f"   Failed chapters: {failed_chapters[-MAX_CONSECUTIVE_FAILURES:]}")
+                print("   Stopping to prevent wasting tokens (waiting for in-flight chapters)")
+                print(f"   Check the log file: {LOG_FILE}")
+    except KeyboardInterrupt:
+        breaker.stop.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+        print("\n⏸  Interrupted - completed chapters are journaled; rerun the same command to resume")
+        logger.warning("Interrupted by user; completed chapters kept in journal")
+        raise
+    pool.shutdown(wait=True)
+    
+    failed_chapters.sort()
+    enhanced_content = splice_chapters(chapters_content, spans, replacements)
+    if breaker.tripped:
+        # Save partial results if any were successful
+        if chapters_with_cross_refs > 0:
+            _save_partial_results(header, enhanced_content, chapters_with_cross_refs)
+        return enhanced_content, chapters_with_cross_refs, failed_chapters, 1
     
     return enhanced_content, chapters_with_cross_refs, failed_chapters, 0
 
@@ -948,25 +1110,39 @@ def main():
     
     all_chapters = _apply_chapter_limit(all_chapters)
     
-    exit_code = _test_first_chapter(orchestrator, chapters_content, all_chapters[0])
-    if exit_code != 0:
-        return exit_code
+    enhanced_file = _determine_output_path()
+    journal = ChapterJournal(ChapterJournal.path_for(enhanced_file))
+    if CLI_ARGS and CLI_ARGS.fresh:
+        journal.discard()
+    resumed = journal.completed(_chapter_texts(chapters_content, all_chapters))
+    
+    if resumed:
+        # The pipeline was validated by the run that wrote the journal
+        print(f"\n↻ Checkpoint journal found ({len(resumed)} chapter(s) done) - skipping test chapter")
+        logger.info(f"Resuming from {journal.path}; skipping test chapter")
+    else:
+        exit_code = _test_first_chapter(orchestrator, chapters_content, all_chapters[0])
+        if exit_code != 0:
+            return exit_code
     
+    workers = CLI_ARGS.workers if CLI_ARGS and CLI_ARGS.workers else DEFAULT_CHAPTER_WORKERS
     print("\n✅ ALL CRITICAL CHECKS PASSED")
     print(f"🚀 Proceeding with full enhancement of {len(all_chapters)} chapters...")
     logger.info("✅ ALL CRITICAL CHECKS PASSED - Proceeding with full enhancement")
-    print("🔄 Processing ALL chapters with LLM enhancement...")
+    print(f"🔄 Processing ALL chapters with LLM enhancement ({workers} worker(s))...")
     
     enhanced_content, chapters_with_cross_refs, failed_chapters, exit_code = _process_all_chapters(
-        header, chapters_content, all_chapters, companion_data
+        header, chapters_content, all_chapters, companion_data,
+        journal=journal, resumed=resumed, workers=workers
     )
     if exit_code != 0:
+        print(f"   Completed chapters are kept in {journal.path}; rerun to resume")
         return exit_code
     
-    enhanced_file = _determine_output_path()
     exit_code = _save_enhanced_document(header + enhanced_content, enhanced_file)
     if exit_code != 0:
         return exit_code
+    journal.discard()
     
     _print_completion_summary(all_chapters, chapters_with_cross_refs, failed_chapters, enhanced_file)
     return 0
@@ -999,6 +1175,16 @@ if __name__ == "__main__":
         type=int,
         help='Number of chapters to process (for testing, default: all)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help=f'Chapters to enhance concurrently (default: LLM_ENHANCEMENT_WORKERS or {DEFAULT_CHAPTER_WORKERS})'
+    )
+    parser.add_argument(
+        '--fresh',
+        action='store_true',
+        help='Ignore and delete the checkpoint journal from a previous interrupted run'
+    )
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -1094,5 +1280,8 @@ if __name__ == "__main__":
         print("  Taxonomy: loaded")
     print("="*70 + "\n")
     
-    exit_code = main()
+    try:
+        exit_code = main()
+    except KeyboardInterrupt:
+        exit(130)
     exit(exit_code if exit_code is not None else 0)
\ No newline at end of file
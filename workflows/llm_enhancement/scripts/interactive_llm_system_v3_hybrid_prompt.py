@@ -32,6 +32,7 @@ import sys
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 import json
+import threading
 
 # Add project root to path for imports
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
@@ -45,8 +46,11 @@ from workflows.llm_enhancement.scripts.metadata_extraction_system import (  # no
 # Import LLM integration
 import os  # noqa: E402
 
+from workflows.shared.prompts.prompt_cache import TokenUsage  # noqa: E402
+from workflows.shared.streaming import StreamAbortedError  # noqa: E402
+
 try:
-    from workflows.shared.llm_integration import call_llm  # noqa: E402
+    from workflows.shared.llm_integration import call_llm, get_chapter_token_usage  # noqa: E402
     # Check if API key is actually available
     LLM_AVAILABLE = bool(os.getenv("OPENAI_API_KEY") or os.getenv("ANTHROPIC_API_KEY"))
     if not LLM_AVAILABLE:
@@ -54,12 +58,23 @@ try:
 except ImportError:
     LLM_AVAILABLE = False
     print("Warning: LLM integration not available")
+    
+    def get_chapter_token_usage(chapter_num: int) -> TokenUsage:
+        """No LLM integration, so no calls were made."""
+        return TokenUsage()
 
 # Sprint 3.3: Import centralized constants (eliminates duplication)
 # Per Quality Assessment: Fix 4 duplicate constants issue
 # Reference: REFACTORING_PLAN.md Sprint 3.3 - Constants extraction
 from workflows.shared.constants import BookTitles  # noqa: E402
 
+# Prompt assembly: stable prefix first so providers can cache it across chapters
+from workflows.shared.prompts.templates import (  # noqa: E402
+    PromptParts,
+    build_comprehensive_phase1_prompt,
+    build_comprehensive_phase2_prompt,
+)
+
 # Sprint 3.4: Import metadata builder (extract builder pattern)
 # Per BOOK_TAXONOMY_MATRIX.md: Architecture Patterns with Python (Tier 1)
 # Reference: REFACTORING_PLAN.md Sprint 3.4 - Builder extraction
@@ -180,8 +195,13 @@ class AnalysisOrchestrator:
         self._metadata_service = metadata_service
         self._llm_available = llm_available
         self._lazy_load = lazy_load
-        self._state = AnalysisPhase.INITIAL
-        self._current_chapter_num = 0  # Tracking for cache keys
+        # Phase per chapter: chapters may be analysed concurrently on one
+        # orchestrator, so no per-call state lives on the instance itself
+        self._chapter_phases: Dict[int, AnalysisPhase] = {}
+        self._phase_lock = threading.Lock()
+        # Companion book list built once per run; prompt prefixes are memoized on it
+        self._books_metadata: Optional[List[Dict[str, Any]]] = None
+        self._books_metadata_lock = threading.Lock()
         self._aggregate_data = aggregate_data or {}
         
         # Extract source book and companion books from aggregate for dynamic use
@@ -196,6 +216,15 @@ class AnalysisOrchestrator:
         if not lazy_load:
             print("Note: Lazy loading disabled - loading all books upfront")
     
+    def _set_phase(self, chapter_num: int, phase: AnalysisPhase) -> None:
+        with self._phase_lock:
+            self._chapter_phases[chapter_num] = phase
+    
+    def chapter_phase(self, chapter_num: int) -> AnalysisPhase:
+        """Last analysis phase reached for a chapter."""
+        with self._phase_lock:
+            return self._chapter_phases.get(chapter_num, AnalysisPhase.INITIAL)
+    
     def _extract_source_book_name(self) -> str:
         """Extract source book name from aggregate data."""
         source_book = self._aggregate_data.get("source_book", {})
@@ -276,7 +305,9 @@ class AnalysisOrchestrator:
         self,
         prompt: str,
         max_tokens: int,
-        books_count: int
+        books_count: int,
+        chapter_num: int,
+        cache_prefix: Optional[str] = None
     ) -> LLMMetadataResponse:
         """
         Execute Phase 1 LLM call with truncation detection and retry logic.
@@ -287,6 +318,8 @@ class AnalysisOrchestrator:
             prompt: The prompt to send to LLM
             max_tokens: Maximum tokens for response
             books_count: Number of books in metadata (for constraint message)
+            chapter_num: Chapter being analysed (cache key and token accounting)
+            cache_prefix: Run-stable prompt prefix for provider prompt caching
             
         Returns:
             LLMMetadataResponse with content requests
@@ -298,8 +331,18 @@ class AnalysisOrchestrator:
             - Fluent Python Ch. 7: Extract Method pattern for complexity reduction
             - Architecture Patterns Ch. 3: Error handling separation
         """
-        # Pass phase="phase1" and chapter_num for caching
-        llm_output = call_llm(prompt, max_tokens=max_tokens, phase="phase1", chapter_num=self._current_chapter_num)
+        # Pass phase="phase1" and chapter_num for caching; expect_json lets a
+        # streamed call stop as soon as the output can no longer be valid JSON
+        try:
+            llm_output = call_llm(
+                prompt, max_tokens=max_tokens, phase="phase1",
+                chapter_num=chapter_num, cache_prefix=cache_prefix,
+                expect_json=True
+            )
+        except StreamAbortedError as e:
+            print(f"\n❌ MALFORMED JSON DETECTED mid-stream: {e.reason}")
+            print(f"   Abandoned after {e.metrics.output_tokens:,} tokens (limit: {max_tokens:,})")
+            return self._retry_phase1_with_constraint(prompt, max_tokens, books_count, chapter_num, cache_prefix)
         
         # DEBUG: Show raw LLM response
         print("\n" + "="*80)
@@ -325,18 +368,47 @@ class AnalysisOrchestrator:
         if len(response.content_requests) == 0 and estimated_tokens >= truncation_threshold:
             print(f"\n❌ TRUNCATION DETECTED: Got 0 content requests but response was {estimated_tokens:,} tokens")
             print("   Re-prompting with constraint to limit to top 10 most relevant books...")
+            response = self._retry_phase1_with_constraint(prompt, max_tokens, books_count, chapter_num, cache_prefix)
+        
+        return response
+    
+    def _retry_phase1_with_constraint(
+        self,
+        prompt: str,
+        max_tokens: int,
+        books_count: int,
+        chapter_num: int,
+        cache_prefix: Optional[str] = None
+    ) -> LLMMetadataResponse:
+        """
+        Re-run Phase 1 asking for only the top 10 books.
+        
+        Used when the first response was truncated or abandoned mid-stream.
+        
+        Args:
+            prompt: The original Phase 1 prompt
+            max_tokens: Maximum tokens for response
+            books_count: Number of books in metadata (for constraint message)
+            chapter_num: Chapter being analysed (cache key and token accounting)
+            cache_prefix: Run-stable prompt prefix for provider prompt caching
             
-            constrained_prompt = prompt + f"""
+        Returns:
+            LLMMetadataResponse parsed from the constrained response
+        """
+        constrained_prompt = prompt + f"""
 
 IMPORTANT CONSTRAINT: You have access to {books_count} books, but please limit your content_requests 
 to ONLY the TOP 10 most relevant and high-priority books. Focus on quality over quantity. 
 Prioritize books that provide the most direct, substantial coverage of this chapter's core concepts."""
-            
-            # Note: Different prompt = different cache key (won't hit previous cache)
-            llm_output = call_llm(constrained_prompt, max_tokens=max_tokens, phase="phase1", chapter_num=self._current_chapter_num)
-            response = LLMMetadataResponse.from_llm_output(llm_output)
-            print(f"✓ Retry with constraint: Found {len(response.content_requests)} content requests")
         
+        # Note: Different prompt = different cache key (won't hit previous cache),
+        # but the constraint is appended so the provider prompt-cache prefix still applies
+        llm_output = call_llm(
+            constrained_prompt, max_tokens=max_tokens, phase="phase1",
+            chapter_num=chapter_num, cache_prefix=cache_prefix
+        )
+        response = LLMMetadataResponse.from_llm_output(llm_output)
+        print(f"✓ Retry with constraint: Found {len(response.content_requests)} content requests")
         return response
     
     def _limit_content_requests(self, response: LLMMetadataResponse, max_requests: int = 10) -> LLMMetadataResponse:
@@ -386,26 +458,25 @@ Prioritize books that provide the most direct, substantial coverage of this chap
         print(f"COMPREHENSIVE LLM ANALYSIS: Chapter {chapter_num} - {chapter_title}")
         print(f"{'='*80}")
         
-        # Track current chapter for cache key generation
-        self._current_chapter_num = chapter_num
-        
         # Build books metadata (all books - using data-driven concept taxonomy)
-        books_metadata = self._build_books_metadata_only()
+        books_metadata = self._run_books_metadata()
         
         # Phase 1: LLM reads chapter, extracts concepts, identifies relevant books
         print("\n📋 PHASE 1: Concept Extraction & Book Identification")
         print("-" * 40)
         
-        prompt = self._build_comprehensive_phase1_prompt(
+        prompt_parts = self._build_comprehensive_phase1_prompt(
             chapter_num,
             chapter_title,
             chapter_full_text,
             books_metadata
         )
+        prompt = prompt_parts.text
         
         print(f"Sending full chapter text ({len(chapter_full_text)} chars)")
         print(f"Book metadata for {len(books_metadata)} books")
-        print(f"Estimated tokens: ~{self._estimate_tokens(prompt):,}")
+        print(f"Estimated tokens: ~{self._estimate_tokens(prompt):,} "
+              f"(stable prefix ~{self._estimate_tokens(prompt_parts.prefix):,})")
         
         if not self._llm_available:
             print("⚠️  LLM not available, cannot perform comprehensive analysis")
@@ -414,7 +485,10 @@ Prioritize books that provide the most direct, substantial coverage of this chap
         try:
             # Phase 1: Execute with retry logic (extracted to helper)
             max_tokens_phase1 = 8000
-            response = self._execute_phase1_with_retry(prompt, max_tokens_phase1, len(books_metadata))
+            response = self._execute_phase1_with_retry(
+                prompt, max_tokens_phase1, len(books_metadata), chapter_num,
+                cache_prefix=prompt_parts.prefix
+            )
             
             # LLM self-limits - no hard cap on books
             # (removed max_requests=10 to let LLM decide what's relevant)
@@ -440,7 +514,11 @@ Prioritize books that provide the most direct, substantial coverage of this chap
             response
         )
         
-        self._state = AnalysisPhase.ANALYSIS_COMPLETE
+        usage = get_chapter_token_usage(chapter_num)
+        if usage.calls:
+            print(f"\n🧮 Chapter {chapter_num} token usage: {usage.describe()}")
+        
+        self._set_phase(chapter_num, AnalysisPhase.ANALYSIS_COMPLETE)
         return annotation
     
     def analyze_chapter(
@@ -487,7 +565,7 @@ Prioritize books that provide the most direct, substantial coverage of this chap
             metadata_response
         )
         
-        self._state = AnalysisPhase.ANALYSIS_COMPLETE
+        self._set_phase(chapter_num, AnalysisPhase.ANALYSIS_COMPLETE)
         return annotation
     
     def _phase1_metadata_analysis(
@@ -505,7 +583,7 @@ Prioritize books that provide the most direct, substantial coverage of this chap
         print("\n📋 PHASE 1: Metadata Analysis")
         print("-" * 40)
         
-        self._state = AnalysisPhase.METADATA_SENT
+        self._set_phase(chapter_num, AnalysisPhase.METADATA_SENT)
         
         # Gather comprehensive metadata (Sprint 3.4: delegated to MetadataBuilder)
         metadata_package = self._metadata_builder.build_metadata_package(concepts)
@@ -529,24 +607,26 @@ Prioritize books that provide the most direct, substantial coverage of this chap
             print(f"✓ Generated {len(mock_response.content_requests)} mock content requests")
             for req in mock_response.content_requests[:3]:
                 print(f"  - {req.book_name}: {len(req.pages)} pages - {req.rationale[:60]}...")
-            self._state = AnalysisPhase.CONTENT_REQUESTED
+            self._set_phase(chapter_num, AnalysisPhase.CONTENT_REQUESTED)
             return mock_response
         
         # Call LLM
         try:
-            llm_output = call_llm(prompt, max_tokens=2000, phase="phase1", chapter_num=chapter_num)
+            llm_output = call_llm(
+                prompt, max_tokens=2000, phase="phase1", chapter_num=chapter_num, expect_json=True
+            )
             response = LLMMetadataResponse.from_llm_output(llm_output)
             
             print(f"✓ Received {len(response.content_requests)} content requests")
             for req in response.content_requests[:3]:
                 print(f"  - {req.book_name}: {len(req.pages)} pages - {req.rationale[:60]}...")
             
-            self._state = AnalysisPhase.CONTENT_REQUESTED
+            self._set_phase(chapter_num, AnalysisPhase.CONTENT_REQUESTED)
             return response
             
         except Exception as e:
             print(f"❌ Phase 1 failed: {e}")
-            self._state = AnalysisPhase.FAILED
+            self._set_phase(chapter_num, AnalysisPhase.FAILED)
             return self._mock_metadata_response(concepts)
     
     def _phase2_content_analysis(
@@ -624,6 +704,13 @@ Prioritize books that provide the most direct, substantial coverage of this chap
     # SCENARIO 2 METHODS: LLM-Driven Comprehensive Analysis
     # ========================================================================
     
+    def _run_books_metadata(self) -> List[Dict[str, Any]]:
+        """Books metadata for this run, built on first use and shared by every chapter."""
+        with self._books_metadata_lock:
+            if self._books_metadata is None:
+                self._books_metadata = self._build_books_metadata_only()
+            return self._books_metadata
+    
     def _build_books_metadata_only(self) -> List[Dict[str, Any]]:
         """Build books metadata WITHOUT loading any book content.
         
@@ -696,20 +783,19 @@ Prioritize books that provide the most direct, substantial coverage of this chap
         chapter_title: str,
         chapter_full_text: str,
         books_metadata: List[Dict[str, Any]]
-    ) -> str:
+    ) -> PromptParts:
         """
         Build Phase 1 prompt for comprehensive LLM-driven analysis.
         
         REFACTORED: Now uses template system from src/prompts/
+        Returned as stable prefix + chapter suffix for provider prompt caching.
         
         References:
             - Template: src/prompts/comprehensive_phase1.txt
-            - Formatter: src/prompts/templates.format_comprehensive_phase1_prompt
+            - Formatter: src/prompts/templates.build_comprehensive_phase1_prompt
             - Sprint 2.11: TDD REFACTOR - Integrate Phase1
         """
-        from workflows.shared.prompts.templates import format_comprehensive_phase1_prompt
-        
-        return format_comprehensive_phase1_prompt(
+        return build_comprehensive_phase1_prompt(
             chapter_num=chapter_num,
             chapter_title=chapter_title,
             chapter_full_text=chapter_full_text,
@@ -1034,12 +1120,14 @@ Prioritize books that provide the most direct, substantial coverage of this chap
             metadata_response, content_package
         )
         
-        print(f"Estimated tokens: ~{self._estimate_tokens(user_prompt):,}")
+        print(f"Estimated tokens: ~{self._estimate_tokens(user_prompt.text):,} "
+              f"(stable prefix ~{self._estimate_tokens(user_prompt.prefix):,})")
         
         try:
             llm_output = call_llm(
-                user_prompt, system_prompt=system_prompt, 
-                max_tokens=4000, phase="phase2", chapter_num=chapter_num
+                user_prompt.text, system_prompt=system_prompt, 
+                max_tokens=4000, phase="phase2", chapter_num=chapter_num,
+                cache_prefix=user_prompt.prefix
             )
             
             annotation_text = llm_output.strip()
@@ -1095,20 +1183,18 @@ Prioritize books that provide the most direct, substantial coverage of this chap
             content_package: Book excerpts requested in Phase 1
             
         Returns:
-            Tuple of (system_prompt, user_prompt) ready for LLM
+            Tuple of (system_prompt, PromptParts user prompt) ready for LLM
             
         References:
             - Template: src/prompts/comprehensive_phase2.txt
             - System: src/prompts/comprehensive_phase2_system.txt
-            - Formatter: src/prompts/templates.format_comprehensive_phase2_prompt
+            - Formatter: src/prompts/templates.build_comprehensive_phase2_prompt
             - Sprint 2.12: TDD REFACTOR - Integrate Phase2
         """
-        from workflows.shared.prompts.templates import format_comprehensive_phase2_prompt
-        
         # Extract taxonomy from aggregate data
         taxonomy_data = self._aggregate_data.get('taxonomy') if self._aggregate_data else None
         
-        return format_comprehensive_phase2_prompt(
+        return build_comprehensive_phase2_prompt(
             chapter_num=chapter_num,
             chapter_title=chapter_title,
             metadata_response=metadata_response,
@@ -24,15 +24,17 @@ Output:
 - Enhanced guideline Markdown (400-1000 KB with LLM enhancements)
 
 Processing:
-1. Load aggregate package
+1. Load aggregate package (or open its Tab 6 context index sidecar)
 2. Load guideline
-3. Build cross-book context index
-4. For each chapter:
+3. Build cross-book context index (skipped when the sidecar is current)
+4. For each chapter (sequentially, or concurrently with --concurrency N):
    a. Get related content from context
    b. Construct LLM prompt
    c. Call LLM API
    d. Parse response
    e. Integrate enhancements
+   (--batch: all prompts of the book, or of every book with --library,
+   go to the provider as one batch job; see batch_enhancement.py)
 5. Generate enhanced markdown
 6. Save output
 
@@ -40,16 +42,33 @@ NO LLM CALLS in Tabs 1-6 - ONLY Tab 7
 """
 
 import argparse
+import asyncio
+import hashlib
 import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from workflows.shared.rate_limiter import LLMRateLimiter, RateLimits, estimate_tokens
+from workflows.llm_enhancement.scripts.context_index import (
+    iter_context_entries,
+    load_context_index,
+)
+from workflows.llm_enhancement.scripts.batch_enhancement import (
+    DEFAULT_BATCH_MAX_WAIT,
+    DEFAULT_BATCH_POLL_INTERVAL,
+    BatchItem,
+    run_batch,
+)
+from workflows.llm_enhancement.scripts.cache.llm_cache import LLMCacheRepository
+from workflows.llm_enhancement.scripts.cache.response_store import ResponseStoreError
+
 # Import LLM provider (Tab 7 ONLY)
 # WBS GATEWAY_ROUTING_REFACTOR: Use factory to route through Gateway
 try:
@@ -62,6 +81,23 @@ except ImportError as e:
     LLM_AVAILABLE = False
 
 
+# Concurrent enhancement mode: chapters are independent given context_index.
+# 1 = sequential (original behaviour); >1 fans out via provider.call_async.
+ENV_ENHANCE_CONCURRENCY = "LLM_ENHANCE_CONCURRENCY"
+# Tokens-per-minute budget (input + output) across all in-flight chapters; 0 = unlimited
+ENV_TOKENS_PER_MINUTE = "LLM_TOKENS_PER_MINUTE"
+
+
+def default_enhance_concurrency() -> int:
+    """Chapters enhanced at once when not given explicitly (LLM_ENHANCE_CONCURRENCY, default 1)."""
+    return int(os.getenv(ENV_ENHANCE_CONCURRENCY, "1") or "1")
+
+
+def default_tokens_per_minute() -> int:
+    """Per-run token budget when not given explicitly (LLM_TOKENS_PER_MINUTE, default 0 = unlimited)."""
+    return int(os.getenv(ENV_TOKENS_PER_MINUTE, "0") or "0")
+
+
 def load_json(file_path: Path) -> Dict[str, Any]:
     """
     Load JSON file with error handling.
@@ -110,7 +146,8 @@ def build_context_index(aggregate: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     Build searchable context index from aggregate package.
     
     Creates a dictionary mapping "book_ch{number}" keys to chapter data,
-    enabling quick lookup of related content during enhancement.
+    enabling quick lookup of related content during enhancement. Fallback
+    for packages without a current Tab 6 sidecar (see load_context_index).
     
     Args:
         aggregate: Aggregate package from Tab 6
@@ -121,45 +158,7 @@ def build_context_index(aggregate: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     Reference: CONSOLIDATED_IMPLEMENTATION_PLAN.md lines 1765-1780
     """
     print("\n📚 Building cross-book context index...")
-    context_index = {}
-    
-    # Index source book
-    source_book = aggregate.get("source_book", {})
-    book_name = source_book.get("name", "unknown")
-    metadata = source_book.get("metadata", {})
-    
-    # Handle both dict with "chapters" key and direct list
-    chapters = metadata.get("chapters", []) if isinstance(metadata, dict) else metadata
-    for chapter in chapters:
-        ch_num = chapter.get('chapter_number', chapter.get('number', 0))
-        key = f"{book_name}_ch{ch_num}"
-        context_index[key] = {
-            "book": book_name,
-            "chapter": ch_num,
-            "title": chapter.get("title", ""),
-            "keywords": chapter.get("keywords_enriched", chapter.get("keywords", [])),
-            "concepts": chapter.get("concepts_enriched", chapter.get("concepts", [])),
-            "summary": chapter.get("summary", "")
-        }
-    
-    # Index companion books
-    for book in aggregate.get("companion_books", []):
-        book_name = book.get("name", "unknown")
-        metadata = book.get("metadata", [])
-        
-        # metadata is a list of chapters directly, not a dict with "chapters" key
-        chapters = metadata if isinstance(metadata, list) else metadata.get("chapters", [])
-        for chapter in chapters:
-            ch_num = chapter.get('chapter_number', chapter.get('number', 0))
-            key = f"{book_name}_ch{ch_num}"
-            context_index[key] = {
-                "book": book_name,
-                "chapter": ch_num,
-                "title": chapter.get("title", ""),
-                "keywords": chapter.get("keywords_enriched", chapter.get("keywords", [])),
-                "concepts": chapter.get("concepts_enriched", chapter.get("concepts", [])),
-                "summary": chapter.get("summary", "")
-            }
+    context_index = dict(iter_context_entries(aggregate))
     
     print(f"  Indexed {len(context_index)} chapters across {len(aggregate.get('companion_books', [])) + 1} books")
     return context_index
@@ -344,7 +343,7 @@ def parse_llm_response(response: str) -> Dict[str, str]:
 
 def enhance_chapter(
     chapter: Dict[str, Any],
-    context_index: Dict[str, Dict[str, Any]],
+    context_index: Mapping[str, Dict[str, Any]],
     llm_provider: Any,
     source_book_name: str,
     config: LLMConfig
@@ -368,11 +367,41 @@ def enhance_chapter(
     Reference: ARCHITECTURE_GUIDELINES Ch.2 - Repository Pattern
     Reference: PYTHON_GUIDELINES Ch.1 - Exception handling, EAFP
     """
-    # Get related content if available
-    related_chapters = chapter.get("related_chapters", [])
+    related_content = _collect_related_content(chapter, context_index)
+    
+    # Construct prompt
+    prompt = construct_enhancement_prompt(chapter, related_content, source_book_name)
+    
+    try:
+        # Call LLM (THE ONLY LLM CALL IN ENTIRE PROJECT OUTSIDE TESTING)
+        print(f"  🤖 Enhancing: {chapter.get('title', 'Unknown')}")
+        
+        response = llm_provider.call(
+            prompt=prompt,
+            max_tokens=config.max_tokens,
+            temperature=config.temperature
+        )
+        
+        return _build_enhanced_chapter(chapter, response)
+        
+    except LLMError as e:
+        print(f"  ⚠️  LLM Error: {e}")
+        # Graceful degradation - return original chapter
+        return chapter
+    except Exception as e:
+        print(f"  ⚠️  Unexpected error: {e}")
+        # Graceful degradation - return original chapter
+        return chapter
+
+
+def _collect_related_content(
+    chapter: Dict[str, Any],
+    context_index: Mapping[str, Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Resolve a chapter's related_chapters against the context index."""
     related_content = []
     
-    for rel in related_chapters:
+    for rel in chapter.get("related_chapters", []):
         if isinstance(rel, dict):
             book = rel.get("book", "")
             ch_num = rel.get("chapter", 0)
@@ -384,35 +413,89 @@ def enhance_chapter(
         if key in context_index:
             related_content.append(context_index[key])
     
-    # Construct prompt
-    prompt = construct_enhancement_prompt(chapter, related_content, source_book_name)
-    
-    try:
-        # Call LLM (THE ONLY LLM CALL IN ENTIRE PROJECT OUTSIDE TESTING)
-        print(f"  🤖 Enhancing: {chapter.get('title', 'Unknown')}")
-        
-        response = llm_provider.call(
+    return related_content
+
+
+def _build_enhanced_chapter(chapter: Dict[str, Any], response: Any) -> Dict[str, Any]:
+    """Parse an LLM response and merge its sections into a copy of the chapter."""
+    enhancements = parse_llm_response(response.content)
+    
+    enhanced_chapter = chapter.copy()
+    enhanced_chapter.update({
+        "enhanced_summary": enhancements.get("enhanced_summary", ""),
+        "key_takeaways": enhancements.get("key_takeaways", ""),
+        "best_practices": enhancements.get("best_practices", ""),
+        "common_pitfalls": enhancements.get("common_pitfalls", ""),
+        "llm_enhanced": True,
+        "llm_model": response.model,
+        "llm_tokens": response.input_tokens + response.output_tokens
+    })
+    return enhanced_chapter
+
+
+async def _call_provider_async(llm_provider: Any, prompt: str, config: LLMConfig) -> Any:
+    """Use provider.call_async when available, else run call() in a worker thread."""
+    call_async = getattr(llm_provider, "call_async", None)
+    if call_async is not None:
+        return await call_async(
             prompt=prompt,
             max_tokens=config.max_tokens,
             temperature=config.temperature
         )
+    return await asyncio.to_thread(
+        llm_provider.call,
+        prompt=prompt,
+        max_tokens=config.max_tokens,
+        temperature=config.temperature
+    )
+
+
+async def enhance_chapter_async(
+    chapter: Dict[str, Any],
+    context_index: Mapping[str, Dict[str, Any]],
+    llm_provider: Any,
+    source_book_name: str,
+    config: LLMConfig,
+    token_budget: Optional[LLMRateLimiter] = None
+) -> Dict[str, Any]:
+    """
+    Async variant of enhance_chapter for concurrent enhancement mode.
+    
+    Same prompt, parsing, and graceful degradation as enhance_chapter; the
+    call goes through provider.call_async under an optional per-run budget.
+    
+    Args:
+        chapter: Chapter data to enhance
+        context_index: Full cross-book context index
+        llm_provider: LLM provider instance
+        source_book_name: Name of the source book
+        config: LLM configuration
+        token_budget: Per-run tokens-per-minute limiter (None = unlimited)
         
-        # Parse response
-        enhancements = parse_llm_response(response.content)
+    Returns:
+        Enhanced chapter data, or the original chapter on failure
+    """
+    related_content = _collect_related_content(chapter, context_index)
+    prompt = construct_enhancement_prompt(chapter, related_content, source_book_name)
+    
+    reservation = None
+    try:
+        if token_budget is not None:
+            reservation = await token_budget.acquire_async(
+                estimate_tokens(prompt), config.max_tokens
+            )
         
-        # Add enhancements to chapter
-        enhanced_chapter = chapter.copy()
-        enhanced_chapter.update({
-            "enhanced_summary": enhancements.get("enhanced_summary", ""),
-            "key_takeaways": enhancements.get("key_takeaways", ""),
-            "best_practices": enhancements.get("best_practices", ""),
-            "common_pitfalls": enhancements.get("common_pitfalls", ""),
-            "llm_enhanced": True,
-            "llm_model": response.model,
-            "llm_tokens": response.input_tokens + response.output_tokens
-        })
+        print(f"  🤖 Enhancing: {chapter.get('title', 'Unknown')}")
+        try:
+            response = await _call_provider_async(llm_provider, prompt, config)
+        except Exception:
+            if reservation is not None:
+                token_budget.release(reservation)
+            raise
         
-        return enhanced_chapter
+        if reservation is not None:
+            token_budget.settle(reservation, response.input_tokens, response.output_tokens)
+        return _build_enhanced_chapter(chapter, response)
         
     except LLMError as e:
         print(f"  ⚠️  LLM Error: {e}")
@@ -424,6 +507,122 @@ def enhance_chapter(
         return chapter
 
 
+async def enhance_chapters_concurrently(
+    chapters: List[Dict[str, Any]],
+    context_index: Mapping[str, Dict[str, Any]],
+    llm_provider: Any,
+    source_book_name: str,
+    config: LLMConfig,
+    max_concurrency: Optional[int] = None,
+    tokens_per_minute: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Enhance chapters concurrently, returning results in chapter order.
+    
+    At most max_concurrency chapters are in flight; when tokens_per_minute
+    is set, calls also wait for room in a per-run token bucket (on top of
+    the process-wide limits the provider itself enforces).
+    A failing chapter degrades to its original data without affecting others.
+    
+    Args:
+        chapters: Chapters to enhance (order preserved in the result)
+        context_index: Full cross-book context index
+        llm_provider: LLM provider instance (call_async preferred)
+        source_book_name: Name of the source book
+        config: LLM configuration
+        max_concurrency: Maximum concurrent LLM calls
+            (None = LLM_ENHANCE_CONCURRENCY, read at call time)
+        tokens_per_minute: Token budget per minute, 0 = unlimited
+            (None = LLM_TOKENS_PER_MINUTE, read at call time)
+        
+    Returns:
+        Enhanced chapters, index-aligned with the input
+    """
+    if max_concurrency is None:
+        max_concurrency = default_enhance_concurrency()
+    if tokens_per_minute is None:
+        tokens_per_minute = default_tokens_per_minute()
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    token_budget = (
+        LLMRateLimiter(RateLimits(tokens_per_minute=tokens_per_minute))
+        if tokens_per_minute > 0 else None
+    )
+    total = len(chapters)
+    
+    async def _run(idx: int, chapter: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            enhanced = await enhance_chapter_async(
+                chapter, context_index, llm_provider, source_book_name, config, token_budget
+            )
+        status = "✓" if enhanced.get("llm_enhanced") else "⚠️"
+        print(f"  {status} Chapter {idx}/{total}: {chapter.get('title', 'Unknown')}")
+        return enhanced
+    
+    return list(await asyncio.gather(
+        *(_run(idx, chapter) for idx, chapter in enumerate(chapters, 1))
+    ))
+
+
+def batch_checkpoint_path(output_dir: Path, name: str) -> Path:
+    """Checkpoint file for a book's (or library's) in-flight batch job."""
+    return output_dir / ".batch" / f"{name}_batch_checkpoint.json"
+
+
+def enhance_chapters_batch(
+    jobs: List[Tuple[str, List[Dict[str, Any]], Mapping[str, Dict[str, Any]]]],
+    config: LLMConfig,
+    checkpoint_path: Path,
+    client: Any = None,
+    cache: Optional[LLMCacheRepository] = None,
+    poll_interval: float = DEFAULT_BATCH_POLL_INTERVAL,
+    max_wait: float = DEFAULT_BATCH_MAX_WAIT,
+    **batch_kwargs: Any
+) -> List[List[Dict[str, Any]]]:
+    """
+    Enhance the chapters of one or more books through a single provider batch.
+    
+    Prompts are built exactly as in enhance_chapter; responses (from the
+    cache or the batch) are parsed with parse_llm_response. A chapter whose
+    batch request failed keeps its original data.
+    
+    Args:
+        jobs: (source_book_name, chapters, context_index) per book
+        config: LLM configuration (model, max_tokens, temperature)
+        checkpoint_path: Checkpoint for resuming an interrupted batch
+        client: Batch API client (default: AnthropicBatchClient)
+        cache: LLM response cache (None = no caching)
+        poll_interval: Seconds between batch status polls
+        max_wait: Seconds to wait before BatchTimeoutError (rerun resumes)
+        
+    Returns:
+        Enhanced chapters per book, index-aligned with ``jobs``
+    """
+    items: List[BatchItem] = []
+    for book_idx, (source_book_name, chapters, context_index) in enumerate(jobs):
+        for chapter_idx, chapter in enumerate(chapters):
+            related_content = _collect_related_content(chapter, context_index)
+            items.append(BatchItem(
+                custom_id=f"b{book_idx}-c{chapter_idx}",
+                prompt=construct_enhancement_prompt(chapter, related_content, source_book_name),
+                chapter_num=chapter.get("number", chapter_idx + 1),
+            ))
+    
+    responses = run_batch(
+        items, config.model, config.max_tokens, config.temperature, checkpoint_path,
+        client=client, cache=cache, poll_interval=poll_interval, max_wait=max_wait,
+        **batch_kwargs
+    )
+    
+    results = []
+    for book_idx, (_, chapters, _) in enumerate(jobs):
+        enhanced = []
+        for chapter_idx, chapter in enumerate(chapters):
+            response = responses.get(f"b{book_idx}-c{chapter_idx}")
+            enhanced.append(_build_enhanced_chapter(chapter, response) if response else chapter)
+        results.append(enhanced)
+    return results
+
+
 def _format_chapter_markdown(chapter: Dict[str, Any]) -> List[str]:
     """
     Format a single chapter as markdown lines.
@@ -555,11 +754,110 @@ def generate_enhanced_markdown(
     return '\n'.join(lines)
 
 
+def _load_book_inputs(
+    aggregate_path: Path,
+    guideline_path: Path
+) -> Tuple[str, Any, List[Dict[str, Any]], Mapping[str, Dict[str, Any]]]:
+    """
+    Load one book's Tab 6 context and Tab 5 guideline.
+    
+    Returns:
+        (source_book_name, guideline, chapters, context_index)
+    """
+    # 1. Open the Tab 6 context index sidecar; parse the package only without one
+    print("\n📦 Loading aggregate package...")
+    context_index = load_context_index(aggregate_path)
+    if context_index is not None:
+        source_book_name = context_index.project_id
+        statistics = context_index.statistics
+        print(f"  Using context index sidecar: {context_index.path.name}")
+    else:
+        aggregate = load_json(aggregate_path)
+        source_book_name = aggregate.get("project", {}).get("id", "unknown")
+        statistics = aggregate.get("statistics", {})
+    print(f"  Source book: {source_book_name}")
+    print(f"  Statistics: {statistics}")
+    
+    # 2. Load guideline
+    print("\n📖 Loading guideline...")
+    guideline = load_json(guideline_path)
+    
+    # Extract chapters (handle different formats)
+    if "chapters" in guideline:
+        chapters = guideline["chapters"]
+    elif isinstance(guideline, list):
+        chapters = guideline
+    else:
+        chapters = []
+    
+    print(f"  Found {len(chapters)} chapters to enhance")
+    
+    # 3. Build context index (only when no sidecar was available)
+    if context_index is None:
+        context_index = build_context_index(aggregate)
+    else:
+        print(f"\n📚 Context index: {len(context_index)} chapters across {context_index.book_count} books (mapped)")
+    
+    return source_book_name, guideline, chapters, context_index
+
+
+def _close_context_index(context_index: Any) -> None:
+    close_index = getattr(context_index, "close", None)
+    if callable(close_index):
+        close_index()
+
+
+def _open_llm_cache() -> Optional[LLMCacheRepository]:
+    """LLM response cache for batch mode (None when LLM_CACHE_ENABLED=false or unusable)."""
+    if os.getenv("LLM_CACHE_ENABLED", "true").lower() != "true":
+        return None
+    try:
+        return LLMCacheRepository(ttl_days=30)
+    except ResponseStoreError as e:
+        print(f"  ⚠️  LLM cache unavailable: {e}")
+        return None
+
+
+def _write_enhanced_guideline(
+    guideline: Any,
+    enhanced_chapters: List[Dict[str, Any]],
+    source_book_name: str,
+    output_dir: Path
+) -> Path:
+    """Render and save the enhanced guideline Markdown; returns its path."""
+    total_tokens = sum(ch.get("llm_tokens") or 0 for ch in enhanced_chapters)
+    print("\n✅ Enhancement complete")
+    print(f"  Total chapters enhanced: {len(enhanced_chapters)}")
+    print(f"  Total tokens used: {total_tokens:,}")
+    
+    # 6. Generate markdown
+    print("\n📄 Generating enhanced markdown...")
+    markdown = generate_enhanced_markdown(guideline, enhanced_chapters, source_book_name)
+    
+    # 7. Save output
+    output_path = output_dir / f"{source_book_name}_guideline_enhanced.md"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    output_path.write_text(markdown, encoding='utf-8')
+    
+    file_size_kb = output_path.stat().st_size / 1024
+    print(f"\n✅ Enhanced guideline created: {output_path.name}")
+    print(f"  File size: {file_size_kb:.1f} KB")
+    print(f"  Location: {output_path}")
+    
+    return output_path
+
+
 def enhance_guideline(
     aggregate_path: Path,
     guideline_path: Path,
     output_dir: Path,
-    config: LLMConfig
+    config: LLMConfig,
+    max_concurrency: Optional[int] = None,
+    tokens_per_minute: Optional[int] = None,
+    batch: bool = False,
+    batch_poll_interval: float = DEFAULT_BATCH_POLL_INTERVAL,
+    batch_max_wait: float = DEFAULT_BATCH_MAX_WAIT
 ) -> Path:
     """
     Main orchestration function for Tab 7 enhancement.
@@ -572,6 +870,13 @@ def enhance_guideline(
         guideline_path: Path to guideline JSON
         output_dir: Directory for output files
         config: LLM configuration
+        max_concurrency: Chapters enhanced at once, 1 = sequential
+            (None = LLM_ENHANCE_CONCURRENCY)
+        tokens_per_minute: Token budget for concurrent mode, 0 = unlimited
+            (None = LLM_TOKENS_PER_MINUTE)
+        batch: Submit all chapters as one provider batch job (offline mode)
+        batch_poll_interval: Seconds between batch status polls
+        batch_max_wait: Seconds to wait for the batch before giving up (rerun resumes)
         
     Returns:
         Path to generated enhanced guideline
@@ -583,32 +888,28 @@ def enhance_guideline(
     print(f"Aggregate package: {aggregate_path.name}")
     print(f"Guideline: {guideline_path.name}")
     
-    # 1. Load aggregate package
-    print("\n📦 Loading aggregate package...")
-    aggregate = load_json(aggregate_path)
-    source_book_name = aggregate.get("project", {}).get("id", "unknown")
-    print(f"  Source book: {source_book_name}")
-    print(f"  Statistics: {aggregate.get('statistics', {})}")
-    
-    # 2. Load guideline
-    print("\n📖 Loading guideline...")
-    guideline = load_json(guideline_path)
-    
-    # Extract chapters (handle different formats)
-    if "chapters" in guideline:
-        chapters = guideline["chapters"]
-    elif isinstance(guideline, list):
-        chapters = guideline
-    else:
-        chapters = []
-    
-    print(f"  Found {len(chapters)} chapters to enhance")
+    source_book_name, guideline, chapters, context_index = _load_book_inputs(
+        aggregate_path, guideline_path
+    )
     
-    # 3. Build context index
-    context_index = build_context_index(aggregate)
+    if batch:
+        print(f"\n📦 Batch mode: {len(chapters)} chapters ({config.model})")
+        cache = _open_llm_cache()
+        try:
+            enhanced_chapters = enhance_chapters_batch(
+                [(source_book_name, chapters, context_index)], config,
+                batch_checkpoint_path(output_dir, source_book_name),
+                cache=cache, poll_interval=batch_poll_interval, max_wait=batch_max_wait
+            )[0]
+        finally:
+            if cache is not None:
+                cache.close()
+            _close_context_index(context_index)
+        return _write_enhanced_guideline(guideline, enhanced_chapters, source_book_name, output_dir)
     
     # 4. Initialize LLM provider
     if not LLM_AVAILABLE:
+        _close_context_index(context_index)
         raise RuntimeError("LLM provider not available - cannot perform enhancement")
     
     print(f"\n🤖 Initializing LLM provider: {config.provider}")
@@ -617,42 +918,112 @@ def enhance_guideline(
     print(f"  Temperature: {config.temperature}")
     
     # WBS GATEWAY_ROUTING_REFACTOR: Use factory to route through Gateway
-    # Factory respects LLM_PROVIDER env var (defaults to 'gateway')
-    llm_provider = create_llm_provider()
+    # Factory respects LLM_PROVIDER env var (defaults to 'gateway').
+    # Pooled: one loop thread + keep-alive gateway client for all chapters.
+    llm_provider = create_llm_provider(pooled=True)
     
     # 5. Enhance each chapter
     print(f"\n📝 Enhancing {len(chapters)} chapters...")
     enhanced_chapters = []
-    total_tokens = 0
-    
-    for idx, chapter in enumerate(chapters, 1):
-        print(f"\nChapter {idx}/{len(chapters)}")
-        enhanced = enhance_chapter(chapter, context_index, llm_provider, source_book_name, config)
-        enhanced_chapters.append(enhanced)
-        
-        if enhanced.get("llm_tokens"):
-            total_tokens += enhanced["llm_tokens"]
     
-    print("\n✅ Enhancement complete")
-    print(f"  Total chapters enhanced: {len(enhanced_chapters)}")
-    print(f"  Total tokens used: {total_tokens:,}")
+    if max_concurrency is None:
+        max_concurrency = default_enhance_concurrency()
+    if tokens_per_minute is None:
+        tokens_per_minute = default_tokens_per_minute()
     
-    # 6. Generate markdown
-    print("\n📄 Generating enhanced markdown...")
-    markdown = generate_enhanced_markdown(guideline, enhanced_chapters, source_book_name)
-    
-    # 7. Save output
-    output_path = output_dir / f"{source_book_name}_guideline_enhanced.md"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    output_path.write_text(markdown, encoding='utf-8')
+    try:
+        if max_concurrency > 1:
+            budget = f"{tokens_per_minute:,} tokens/min" if tokens_per_minute > 0 else "unlimited"
+            print(f"  Concurrent mode: {max_concurrency} chapters in flight, budget {budget}")
+            enhanced_chapters = asyncio.run(enhance_chapters_concurrently(
+                chapters, context_index, llm_provider, source_book_name, config,
+                max_concurrency=max_concurrency,
+                tokens_per_minute=tokens_per_minute
+            ))
+        else:
+            for idx, chapter in enumerate(chapters, 1):
+                print(f"\nChapter {idx}/{len(chapters)}")
+                enhanced_chapters.append(
+                    enhance_chapter(chapter, context_index, llm_provider, source_book_name, config)
+                )
+    finally:
+        close_provider = getattr(llm_provider, "close", None)
+        if callable(close_provider):
+            close_provider()
+        _close_context_index(context_index)
+    
+    return _write_enhanced_guideline(guideline, enhanced_chapters, source_book_name, output_dir)
+
+
+def enhance_library_batch(
+    books: List[Tuple[Path, Path]],
+    output_dir: Path,
+    config: LLMConfig,
+    batch_poll_interval: float = DEFAULT_BATCH_POLL_INTERVAL,
+    batch_max_wait: float = DEFAULT_BATCH_MAX_WAIT
+) -> List[Path]:
+    """
+    Enhance several books' guidelines with one provider batch job.
     
-    file_size_kb = output_path.stat().st_size / 1024
-    print(f"\n✅ Enhanced guideline created: {output_path.name}")
-    print(f"  File size: {file_size_kb:.1f} KB")
-    print(f"  Location: {output_path}")
+    Args:
+        books: (aggregate_path, guideline_path) per book
+        output_dir: Directory for output files
+        config: LLM configuration
+        batch_poll_interval: Seconds between batch status polls
+        batch_max_wait: Seconds to wait for the batch before giving up (rerun resumes)
+        
+    Returns:
+        Paths of the enhanced guidelines, in ``books`` order
+    """
+    print(f"\n🚀 Tab 7: LLM Enhancement - library batch ({len(books)} books)")
+    loaded = [_load_book_inputs(aggregate_path, guideline_path) for aggregate_path, guideline_path in books]
+    library_key = "library_" + hashlib.sha256(
+        "|".join(name for name, _, _, _ in loaded).encode("utf-8")
+    ).hexdigest()[:12]
+    
+    total_chapters = sum(len(chapters) for _, _, chapters, _ in loaded)
+    print(f"\n📦 Batch mode: {total_chapters} chapters across {len(loaded)} books ({config.model})")
+    cache = _open_llm_cache()
+    try:
+        enhanced_per_book = enhance_chapters_batch(
+            [(name, chapters, context_index) for name, _, chapters, context_index in loaded],
+            config, batch_checkpoint_path(output_dir, library_key),
+            cache=cache, poll_interval=batch_poll_interval, max_wait=batch_max_wait
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+        for _, _, _, context_index in loaded:
+            _close_context_index(context_index)
+    
+    return [
+        _write_enhanced_guideline(guideline, enhanced, name, output_dir)
+        for (name, guideline, _, _), enhanced in zip(loaded, enhanced_per_book)
+    ]
+
+
+def _resolve_aggregate_path(aggregate: str) -> Path:
+    """Resolve an aggregate path or glob pattern; exits when nothing matches."""
+    if '*' in aggregate:
+        aggregate_path = get_latest_file(aggregate)
+        if not aggregate_path:
+            print(f"❌ Error: No files match pattern: {aggregate}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        aggregate_path = Path(aggregate)
     
-    return output_path
+    if not aggregate_path.exists():
+        print(f"❌ Error: Aggregate package not found: {aggregate_path}", file=sys.stderr)
+        sys.exit(1)
+    return aggregate_path
+
+
+def _validate_guideline_path(guideline_path: Path) -> Path:
+    """Exit when the guideline file is missing."""
+    if not guideline_path.exists():
+        print(f"❌ Error: Guideline not found: {guideline_path}", file=sys.stderr)
+        sys.exit(1)
+    return guideline_path
 
 
 def main():
@@ -678,6 +1049,9 @@ Examples:
     --guideline workflows/base_guideline_generation/output/architecture_patterns_guideline.json \\
     --output-dir workflows/llm_enhancement/output
 
+  # Overnight library-wide rerun as one batch job (resumable)
+  python llm_enhance_guideline.py --library library_books.json --batch
+
 Reference: CONSOLIDATED_IMPLEMENTATION_PLAN.md Tab 7
 THE ONLY WORKFLOW THAT MAKES LLM API CALLS (Tabs 1-6 use statistical methods only)
         """
@@ -686,14 +1060,12 @@ THE ONLY WORKFLOW THAT MAKES LLM API CALLS (Tabs 1-6 use statistical methods onl
     parser.add_argument(
         "--aggregate",
         type=str,
-        required=True,
         help="Path or pattern to aggregate package JSON (from Tab 6)"
     )
     
     parser.add_argument(
         "--guideline",
         type=Path,
-        required=True,
         help="Path to guideline JSON (from Tab 5)"
     )
     
@@ -704,24 +1076,61 @@ THE ONLY WORKFLOW THAT MAKES LLM API CALLS (Tabs 1-6 use statistical methods onl
         help="Directory for enhanced guideline output (default: workflows/llm_enhancement/output)"
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=default_enhance_concurrency(),
+        help="Chapters enhanced concurrently via call_async (default: LLM_ENHANCE_CONCURRENCY or 1 = sequential)"
+    )
     
-    # Resolve aggregate path (handle glob patterns)
-    if '*' in args.aggregate:
-        aggregate_path = get_latest_file(args.aggregate)
-        if not aggregate_path:
-            print(f"❌ Error: No files match pattern: {args.aggregate}", file=sys.stderr)
-            sys.exit(1)
-    else:
-        aggregate_path = Path(args.aggregate)
+    parser.add_argument(
+        "--tokens-per-minute",
+        type=int,
+        default=default_tokens_per_minute(),
+        help="Token budget per minute in concurrent mode (default: LLM_TOKENS_PER_MINUTE or 0 = unlimited)"
+    )
     
-    # Validate inputs
-    if not aggregate_path.exists():
-        print(f"❌ Error: Aggregate package not found: {aggregate_path}", file=sys.stderr)
-        sys.exit(1)
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Offline mode: submit all chapter prompts as one provider batch job and poll for results"
+    )
+    
+    parser.add_argument(
+        "--library",
+        type=Path,
+        help="JSON list of {\"aggregate\": ..., \"guideline\": ...} books to enhance in one batch (implies --batch)"
+    )
+    
+    parser.add_argument(
+        "--batch-poll-interval",
+        type=float,
+        default=DEFAULT_BATCH_POLL_INTERVAL,
+        help="Seconds between batch status polls (default: LLM_BATCH_POLL_INTERVAL or 60)"
+    )
+    
+    parser.add_argument(
+        "--batch-max-wait",
+        type=float,
+        default=DEFAULT_BATCH_MAX_WAIT,
+        help="Seconds to wait for a batch before exiting; rerun to resume (default: LLM_BATCH_MAX_WAIT or 86400)"
+    )
     
-    if not args.guideline.exists():
-        print(f"❌ Error: Guideline not found: {args.guideline}", file=sys.stderr)
+    args = parser.parse_args()
+    
+    if args.library is None and (args.aggregate is None or args.guideline is None):
+        parser.error("--aggregate and --guideline are required unless --library is given")
+    
+    try:
+        if args.library is not None:
+            books = [
+                (_resolve_aggregate_path(entry["aggregate"]), _validate_guideline_path(Path(entry["guideline"])))
+                for entry in load_json(args.library)
+            ]
+        else:
+            books = [(_resolve_aggregate_path(args.aggregate), _validate_guideline_path(args.guideline))]
+    except (KeyError, TypeError) as e:
+        print(f"❌ Error: Invalid library file {args.library}: {e}", file=sys.stderr)
         sys.exit(1)
     
     try:
@@ -729,14 +1138,28 @@ THE ONLY WORKFLOW THAT MAKES LLM API CALLS (Tabs 1-6 use statistical methods onl
         config = LLMConfig()
         
         # Run enhancement
-        output_path = enhance_guideline(
-            aggregate_path,
-            args.guideline,
-            args.output_dir,
-            config
-        )
+        if args.library is not None:
+            output_paths = enhance_library_batch(
+                books, args.output_dir, config,
+                batch_poll_interval=args.batch_poll_interval,
+                batch_max_wait=args.batch_max_wait
+            )
+        else:
+            aggregate_path, guideline_path = books[0]
+            output_paths = [enhance_guideline(
+                aggregate_path,
+                guideline_path,
+                args.output_dir,
+                config,
+                max_concurrency=args.concurrency,
+                tokens_per_minute=args.tokens_per_minute,
+                batch=args.batch,
+                batch_poll_interval=args.batch_poll_interval,
+                batch_max_wait=args.batch_max_wait
+            )]
         
-        print(f"\n✅ Success! Enhanced guideline created at: {output_path}")
+        for output_path in output_paths:
+            print(f"\n✅ Success! Enhanced guideline created at: {output_path}")
         return 0
         
     except Exception as e:
@@ -24,11 +24,13 @@ Test-Driven Development:
 
 import argparse
 import asyncio
+import atexit
 import hashlib
 import json
 import sys
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Callable, Awaitable, Sequence, TypeVar
 from datetime import datetime, timezone
 
 import aiofiles
@@ -82,6 +84,124 @@ def compute_file_checksum(file_path: Path) -> str:
     return f"sha256:{sha256_hash.hexdigest()}"
 
 
+# Chapter fields that feed MSEP corpus text and orchestrator similarity queries
+CHAPTER_FINGERPRINT_FIELDS = ("title", "summary", "content", "keywords", "concepts")
+
+
+def compute_chapter_fingerprint(chapter: Dict[str, Any]) -> str:
+    """
+    Compute SHA-256 fingerprint of a chapter's similarity inputs.
+    
+    Reference: WBS D2.1.3 - Enrichment Provenance
+    Pattern: Content-addressed change detection for delta enrichment
+    
+    Only CHAPTER_FINGERPRINT_FIELDS contribute, so edits to fields that do
+    not influence enrichment (page ranges, extraction timestamps) keep the
+    fingerprint stable.
+    
+    Args:
+        chapter: Chapter dict from Tab 2 metadata
+        
+    Returns:
+        Fingerprint string in format "sha256:{hex_digest}"
+    """
+    payload = {field: chapter.get(field) for field in CHAPTER_FINGERPRINT_FIELDS}
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return f"sha256:{hashlib.sha256(encoded).hexdigest()}"
+
+
+def load_prior_enrichment(output_path: Path) -> Dict[int, Dict[str, Any]]:
+    """
+    Load previously enriched chapters keyed by chapter number.
+    
+    Returns:
+        Dict of chapter number -> enriched chapter, empty if no usable prior output
+    """
+    if not output_path.exists():
+        return {}
+    try:
+        with open(output_path, encoding="utf-8") as f:
+            prior_data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+    prior_chapters = prior_data if isinstance(prior_data, list) else prior_data.get("chapters", [])
+    return {
+        chapter.get("chapter_number", idx + 1): chapter
+        for idx, chapter in enumerate(prior_chapters)
+    }
+
+
+def _is_reusable_enrichment(prior_chapter: Dict[str, Any], fingerprint: str) -> bool:
+    """Prior enrichment is reusable if it came from a real (non-fallback) run on the same content."""
+    provenance = prior_chapter.get("chapter_provenance") or {}
+    return (
+        provenance.get("content_fingerprint") == fingerprint
+        and "fallback" not in provenance.get("methods_used", [])
+    )
+
+
+def _references_any(chapter: Dict[str, Any], book_title: str, chapter_numbers: set) -> bool:
+    """
+    Check whether a chapter's cross-references point at any of the given same-book chapters.
+    
+    Orchestrator ``cross_book_references`` are not checked: they target other
+    books, whose changes delta mode cannot see (see plan_delta_enrichment).
+    """
+    for field in ("similar_chapters", "related_chapters"):
+        for ref in chapter.get(field) or []:
+            if ref.get("book") == book_title and ref.get("chapter") in chapter_numbers:
+                return True
+    return False
+
+
+def plan_delta_enrichment(
+    chapters: List[Dict[str, Any]],
+    prior_chapters: Dict[int, Dict[str, Any]],
+    book_title: str,
+) -> Tuple[List[int], Dict[int, Dict[str, Any]]]:
+    """
+    Decide which chapters need (re-)enrichment in delta mode.
+    
+    A chapter keeps its prior enrichment when its content fingerprint is
+    unchanged. An unchanged chapter is still refreshed when one of its prior
+    same-book cross-references points at a chapter that changed or was removed,
+    since that neighbour's similarity inputs are no longer the ones scored.
+    
+    Only the book's own chapters are compared: an orchestrator chapter whose
+    cross-book references point at a book that has since changed keeps its
+    prior enrichment. Run without --delta after re-extracting other books.
+    
+    Args:
+        chapters: Current chapters from Tab 2 metadata
+        prior_chapters: Prior enriched chapters from load_prior_enrichment()
+        book_title: Book title used in cross-reference targets
+        
+    Returns:
+        Tuple of (chapter indices to enrich in book order,
+                  {chapter index: reused enriched chapter})
+    """
+    reused: Dict[int, Dict[str, Any]] = {}
+    stale_numbers = set(prior_chapters)
+
+    for idx, chapter in enumerate(chapters):
+        chapter_num = chapter.get("chapter_number", idx + 1)
+        prior = prior_chapters.get(chapter_num)
+        if prior is not None and _is_reusable_enrichment(prior, compute_chapter_fingerprint(chapter)):
+            # Refresh raw Tab 2 fields, keep prior enrichment fields
+            reused[idx] = {**prior, **chapter}
+            stale_numbers.discard(chapter_num)
+        else:
+            stale_numbers.add(chapter_num)
+
+    for idx in list(reused):
+        if _references_any(reused[idx], book_title, stale_numbers):
+            del reused[idx]
+
+    refresh = [idx for idx in range(len(chapters)) if idx not in reused]
+    return refresh, reused
+
+
 def build_enrichment_provenance(
     input_path: Path,
     taxonomy_path: Optional[Path],
@@ -103,8 +223,8 @@ def build_enrichment_provenance(
     Returns:
         Dictionary with all provenance fields:
         - taxonomy_id, taxonomy_version, taxonomy_path, taxonomy_checksum
-        - source_metadata_file, enrichment_date
-        - enrichment_method, model_version
+        - source_metadata_file, source_metadata_checksum
+        - enrichment_date, enrichment_method, model_version
     """
     # Extract taxonomy info if available
     taxonomy_id = "none"
@@ -132,6 +252,7 @@ def build_enrichment_provenance(
         "taxonomy_path": taxonomy_path_str,
         "taxonomy_checksum": taxonomy_checksum,
         "source_metadata_file": input_path.name,
+        "source_metadata_checksum": compute_file_checksum(input_path),
         "enrichment_date": datetime.now(timezone.utc).isoformat(),
         "enrichment_method": enrichment_method,
         "model_version": model_version,
@@ -177,6 +298,12 @@ def get_statistical_extractor():
 # =============================================================================
 
 
+# WBS 6.2.3: Per-chapter latency tracking for concurrent enrichment
+try:
+    from workflows.shared.clients.metrics import PerformanceLogger
+except ImportError:
+    PerformanceLogger = None  # type: ignore[misc, assignment]
+
 # WBS 3.2.3: Semantic Search Client for remote API calls
 try:
     from workflows.shared.clients.search_client import SemanticSearchClient
@@ -241,6 +368,7 @@ try:
         MetadataExtractionResult,
         MetadataExtractionOptions,
         MetadataClientError,
+        SyncMetadataExtractionClient,
     )
     from config.extraction_settings import get_extraction_settings
     METADATA_CLIENT_AVAILABLE = True
@@ -251,11 +379,105 @@ except ImportError as e:
     MetadataExtractionResult = None  # type: ignore[misc, assignment]
     MetadataExtractionOptions = None  # type: ignore[misc, assignment]
     MetadataClientError = Exception  # type: ignore[misc, assignment]
+    SyncMetadataExtractionClient = None  # type: ignore[misc, assignment]
     get_extraction_settings = None  # type: ignore[misc, assignment]
 
+# One pooled sync client (background loop + httpx pool) per orchestrator URL
+# for the whole process run; closed at interpreter exit.
+_METADATA_SYNC_CLIENTS: Dict[str, Any] = {}
+_METADATA_SYNC_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_metadata_sync_client(base_url: str) -> Any:
+    """
+    Return the process-wide SyncMetadataExtractionClient for base_url.
+    
+    Per-chapter keyword/concept fallbacks reuse this client, so each call
+    costs one HTTP request instead of a new event loop and connection pool.
+    """
+    with _METADATA_SYNC_CLIENTS_LOCK:
+        client = _METADATA_SYNC_CLIENTS.get(base_url)
+        if client is None:
+            client = SyncMetadataExtractionClient(base_url=base_url)
+            _METADATA_SYNC_CLIENTS[base_url] = client
+        return client
+
+
+def close_metadata_sync_clients() -> None:
+    """Close all pooled metadata clients (registered with atexit)."""
+    with _METADATA_SYNC_CLIENTS_LOCK:
+        clients = list(_METADATA_SYNC_CLIENTS.values())
+        _METADATA_SYNC_CLIENTS.clear()
+    for client in clients:
+        client.close()
+
+
+atexit.register(close_metadata_sync_clients)
+
 # Provenance method identifier for MSEP enrichment
 ENRICHMENT_METHOD_MSEP = "msep"
 
+# Sharded MSEP enrichment defaults: bound each enrich_metadata request by
+# corpus characters and chapter count, and cap in-flight shard requests
+MSEP_SHARD_MAX_CHARS = 200_000
+MSEP_SHARD_MAX_CHAPTERS = 8
+MSEP_SHARD_CONCURRENCY = 4
+
+
+# Concurrent per-chapter enrichment (semantic search / orchestrator)
+CHAPTER_ENRICHMENT_CONCURRENCY = 8
+CHAPTER_LATENCY_OPERATION = "chapter_enrichment"
+
+_T = TypeVar("_T")
+
+
+async def _enrich_chapters_concurrently(
+    items: Sequence[_T],
+    enrich_one: Callable[[_T], Awaitable[Dict[str, Any]]],
+    max_concurrency: int = CHAPTER_ENRICHMENT_CONCURRENCY,
+    perf_logger: Optional["PerformanceLogger"] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fan chapter enrichment out under a concurrency limit.
+    
+    Results are returned in the order of ``items`` regardless of completion
+    order. When ``perf_logger`` is given, each call is timed (excluding time
+    spent waiting for a concurrency slot) under CHAPTER_LATENCY_OPERATION.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _run(item: _T) -> Dict[str, Any]:
+        async with semaphore:
+            if perf_logger is None:
+                return await enrich_one(item)
+            with perf_logger.timed(CHAPTER_LATENCY_OPERATION):
+                return await enrich_one(item)
+
+    return list(await asyncio.gather(*(_run(item) for item in items)))
+
+
+def _chapter_latency_summary(perf_logger: Optional["PerformanceLogger"]) -> Dict[str, Any]:
+    """Summarize per-chapter latency percentiles (empty if not tracked)."""
+    if perf_logger is None:
+        return {}
+    stats = perf_logger.get_stats(CHAPTER_LATENCY_OPERATION)
+    if not stats["count"]:
+        return {}
+    return {
+        "count": stats["count"],
+        "p50_ms": round(stats["p50_ms"], 1),
+        "p90_ms": round(stats["p90_ms"], 1),
+        "p99_ms": round(stats["p99_ms"], 1),
+        "max_ms": round(stats["max_ms"], 1),
+    }
+
+
+def _print_latency_summary(summary: Dict[str, Any]) -> None:
+    """Print per-chapter latency percentiles."""
+    if summary:
+        print(f"  Chapter latency: p50={summary['p50_ms']}ms p90={summary['p90_ms']}ms "
+              f"p99={summary['p99_ms']}ms max={summary['max_ms']}ms (n={summary['count']})")
+
 
 def _extract_books_from_taxonomy(taxonomy: Dict[str, Any]) -> set:
     """
@@ -743,6 +965,7 @@ async def run_enrichment_with_orchestrator(
     book_name: str,
     domain: str,
     client: "OrchestratorClientProtocol",
+    max_concurrency: int = CHAPTER_ENRICHMENT_CONCURRENCY,
 ) -> Dict[str, Any]:
     """
     Run full book enrichment using orchestrator semantic search.
@@ -754,9 +977,11 @@ async def run_enrichment_with_orchestrator(
         book_name: Name of the book to enrich
         domain: Domain filter (e.g., "ai-ml")
         client: OrchestratorClient instance
+        max_concurrency: Maximum chapters enriched at once
         
     Returns:
         Enriched book metadata with chapters containing related_chapters
+        (in chapter order) and per-chapter latency percentiles
     """
     # For testing, generate sample chapters if not loading from file
     sample_chapters = [
@@ -772,20 +997,25 @@ async def run_enrichment_with_orchestrator(
         },
     ]
     
-    enriched_chapters = []
-    for chapter in sample_chapters:
-        enriched = await enrich_chapter_with_orchestrator(
+    perf_logger = PerformanceLogger() if PerformanceLogger is not None else None
+    
+    async def _enrich(chapter: Dict[str, Any]) -> Dict[str, Any]:
+        return await enrich_chapter_with_orchestrator(
             chapter=chapter,
             client=client,
             current_book=book_name,
             domain=domain,
         )
-        enriched_chapters.append(enriched)
+    
+    enriched_chapters = await _enrich_chapters_concurrently(
+        sample_chapters, _enrich, max_concurrency, perf_logger
+    )
     
     return {
         "book": book_name,
         "book_title": book_name.replace("_", " "),
         "chapters": enriched_chapters,
+        "chapter_latency_ms": _chapter_latency_summary(perf_logger),
     }
 
 
@@ -804,9 +1034,11 @@ def _try_orchestrator_keywords(combined_text: str, top_n: int) -> Optional[List[
         return None
     
     try:
-        import asyncio
-        result = asyncio.run(_extract_keywords_via_orchestrator(combined_text, top_n))
-        return result if result else None
+        result = _get_metadata_sync_client(settings.orchestrator_url).extract_metadata(
+            combined_text, options=MetadataExtractionOptions(filter_noise=True)
+        )
+        keywords = _format_orchestrator_keywords(result, top_n)
+        return keywords if keywords else None
     except Exception as e:
         if not settings.fallback_on_error:
             raise
@@ -892,24 +1124,25 @@ async def _extract_keywords_via_orchestrator(text: str, top_n: int = 10) -> List
         List of keyword dicts with orchestrator format
     """
     settings = get_extraction_settings()
-    options = MetadataExtractionOptions(
-        top_k_keywords=top_n,
-        filter_noise=True,
-    )
+    options = MetadataExtractionOptions(filter_noise=True)
     
     async with MetadataExtractionClient(base_url=settings.orchestrator_url) as client:
         result = await client.extract_metadata(text=text, options=options)
-        
-    keywords_enriched = []
-    for kw in result.keywords:
-        keywords_enriched.append({
+    
+    return _format_orchestrator_keywords(result, top_n)
+
+
+def _format_orchestrator_keywords(result: Any, top_n: int) -> List[Dict[str, Any]]:
+    """Format the top_n orchestrator keywords per output schema."""
+    return [
+        {
             "term": kw.term,
             "score": round(kw.score, 3),
             "source": "orchestrator_tfidf",
             "is_technical": kw.is_technical,
-        })
-    
-    return keywords_enriched
+        }
+        for kw in result.keywords[:top_n]
+    ]
 
 
 def _try_orchestrator_concepts(combined_text: str, top_n: int) -> Optional[List[Dict[str, Any]]]:
@@ -927,9 +1160,11 @@ def _try_orchestrator_concepts(combined_text: str, top_n: int) -> Optional[List[
         return None
     
     try:
-        import asyncio
-        result = asyncio.run(_extract_concepts_via_orchestrator(combined_text, top_n))
-        return result if result else None
+        result = _get_metadata_sync_client(settings.orchestrator_url).extract_metadata(
+            combined_text, options=MetadataExtractionOptions(filter_noise=True)
+        )
+        concepts = _format_orchestrator_concepts(result, top_n)
+        return concepts if concepts else None
     except Exception as e:
         if not settings.fallback_on_error:
             raise
@@ -1008,25 +1243,26 @@ async def _extract_concepts_via_orchestrator(text: str, top_n: int = 10) -> List
         List of concept dicts with orchestrator format
     """
     settings = get_extraction_settings()
-    options = MetadataExtractionOptions(
-        top_k_concepts=top_n,
-        filter_noise=True,
-    )
+    options = MetadataExtractionOptions(filter_noise=True)
     
     async with MetadataExtractionClient(base_url=settings.orchestrator_url) as client:
         result = await client.extract_metadata(text=text, options=options)
-        
-    concepts_enriched = []
-    for c in result.concepts:
-        concepts_enriched.append({
+    
+    return _format_orchestrator_concepts(result, top_n)
+
+
+def _format_orchestrator_concepts(result: Any, top_n: int) -> List[Dict[str, Any]]:
+    """Format the top_n orchestrator concepts per output schema."""
+    return [
+        {
             "concept": c.name,
             "source": "orchestrator_concept",
             "confidence": round(c.confidence, 3),
             "domain": c.domain,
             "tier": c.tier,
-        })
-    
-    return concepts_enriched
+        }
+        for c in result.concepts[:top_n]
+    ]
 
 
 # =============================================================================
@@ -1308,17 +1544,23 @@ def enrich_metadata_local(
     print("  ⚠️  Run with --use-msep when ai-agents is available for full enrichment")
 
 
-async def _load_book_data_from_path(input_path: Path) -> Tuple[List[Dict[str, Any]], str]:
+async def _read_book_bytes(input_path: Path) -> bytes:
+    """Read a book metadata JSON file as raw bytes."""
+    async with aiofiles.open(input_path, 'rb') as f:
+        return await f.read()
+
+
+async def _read_book_json(input_path: Path) -> Any:
+    """Read and parse a book metadata JSON file (list or dict format)."""
+    return json.loads(await _read_book_bytes(input_path))
+
+
+def _unpack_book_data(book_data: Any, input_path: Path) -> Tuple[List[Dict[str, Any]], str]:
     """
-    Load book metadata from JSON file.
+    Split parsed book metadata into chapters and book title.
     
-    Returns:
-        Tuple of (chapters list, book_title string)
+    Handles both formats: list of chapters or {chapters: [...]}.
     """
-    async with aiofiles.open(input_path, encoding='utf-8') as f:
-        content = await f.read()
-        book_data = json.loads(content)
-    
     if isinstance(book_data, list):
         return book_data, input_path.stem.replace("_metadata", "")
     return (
@@ -1327,6 +1569,16 @@ async def _load_book_data_from_path(input_path: Path) -> Tuple[List[Dict[str, An
     )
 
 
+async def _load_book_data_from_path(input_path: Path) -> Tuple[List[Dict[str, Any]], str]:
+    """
+    Load book metadata from JSON file.
+    
+    Returns:
+        Tuple of (chapters list, book_title string)
+    """
+    return _unpack_book_data(await _read_book_json(input_path), input_path)
+
+
 def _build_chapter_query(chapter: Dict[str, Any], chapter_num: int) -> str:
     """Build search query text from chapter fields."""
     query_parts = [
@@ -1397,13 +1649,17 @@ async def _enrich_chapter_semantic(
 async def enrich_metadata_semantic(
     input_path: Path,
     output_path: Path,
-    semantic_search_url: str = "http://localhost:8081"
+    semantic_search_url: str = "http://localhost:8081",
+    max_concurrency: int = CHAPTER_ENRICHMENT_CONCURRENCY,
 ) -> None:
     """
     Semantic search enrichment - uses remote semantic search API for similarity.
     
     Reference: WBS 3.2.4 - Integrate Search Client into Metadata Enrichment
     Pattern: Remote API integration via SemanticSearchClient
+    
+    Chapters are searched concurrently (up to ``max_concurrency`` in flight)
+    over the client's pooled connections; output keeps chapter order.
     """
     print("\n📊 WBS 3.2.4: Semantic Search Enrichment (Remote API)")
     print(f"Input: {input_path.name}")
@@ -1417,7 +1673,7 @@ async def enrich_metadata_semantic(
     print(f"Chapters: {len(chapters)}")
     
     print("\nConnecting to semantic search service...")
-    enriched_chapters = []
+    perf_logger = PerformanceLogger() if PerformanceLogger is not None else None
     
     async with SemanticSearchClient(base_url=semantic_search_url) as client:
         try:
@@ -1426,11 +1682,17 @@ async def enrich_metadata_semantic(
         except Exception as e:
             print(f"  ⚠️  Health check failed: {e}")
         
-        print("\nEnriching chapters with semantic search...")
-        for idx, chapter in enumerate(chapters):
-            enriched = await _enrich_chapter_semantic(client, chapter, idx, len(chapters))
-            enriched_chapters.append(enriched)
+        print(f"\nEnriching chapters with semantic search (concurrency {max_concurrency})...")
+        
+        async def _enrich(indexed: Tuple[int, Dict[str, Any]]) -> Dict[str, Any]:
+            idx, chapter = indexed
+            return await _enrich_chapter_semantic(client, chapter, idx, len(chapters))
+        
+        enriched_chapters = await _enrich_chapters_concurrently(
+            list(enumerate(chapters)), _enrich, max_concurrency, perf_logger
+        )
     
+    latency_summary = _chapter_latency_summary(perf_logger)
     enriched_metadata = {
         "book_title": book_title,
         "total_chapters": len(enriched_chapters),
@@ -1439,6 +1701,8 @@ async def enrich_metadata_semantic(
             "method": "semantic_search",
             "mode": "remote_api",
             "semantic_search_url": semantic_search_url,
+            "max_concurrency": max_concurrency,
+            "chapter_latency_ms": latency_summary,
             "libraries": {"httpx": "async HTTP client", "semantic-search-service": "all-mpnet-base-v2"}
         },
         "chapters": enriched_chapters
@@ -1452,6 +1716,7 @@ async def enrich_metadata_semantic(
     print(f"\n✅ Enriched metadata saved: {output_path.name}")
     print(f"  File size: {size_kb:.1f} KB")
     print(f"  Chapters enriched: {len(enriched_chapters)}")
+    _print_latency_summary(latency_summary)
 
 
 # =============================================================================
@@ -1527,13 +1792,105 @@ def create_argument_parser() -> argparse.ArgumentParser:
         default="http://localhost:8082",
         help="ai-agents MSEP service URL (default: http://localhost:8082)"
     )
+    parser.add_argument(
+        "--msep-shard-chars",
+        type=int,
+        default=None,
+        help=("Enable sharded MSEP enrichment with at most this many corpus characters per request "
+              "(similar chapters are only found within the same shard)")
+    )
+    parser.add_argument(
+        "--msep-shard-chapters",
+        type=int,
+        default=MSEP_SHARD_MAX_CHAPTERS,
+        help=f"Maximum chapters per MSEP shard (default: {MSEP_SHARD_MAX_CHAPTERS})"
+    )
+    parser.add_argument(
+        "--msep-concurrency",
+        type=int,
+        default=MSEP_SHARD_CONCURRENCY,
+        help=f"Maximum concurrent MSEP shard requests (default: {MSEP_SHARD_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--chapter-concurrency",
+        type=int,
+        default=CHAPTER_ENRICHMENT_CONCURRENCY,
+        help="Maximum chapters searched at once in semantic search / orchestrator modes "
+             f"(default: {CHAPTER_ENRICHMENT_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="Only re-enrich chapters whose content changed since the existing --output "
+             "(applies to --use-msep and --use-orchestrator)"
+    )
     return parser
 
 
+async def _enrich_chapter_orchestrator(
+    client: Any,
+    chapter: Dict[str, Any],
+    idx: int,
+    total_chapters: int,
+    book_title: str,
+) -> Dict[str, Any]:
+    """Enrich a single chapter with orchestrator cross-book references."""
+    chapter_num = chapter.get("chapter_number", idx + 1)
+    chapter_title = chapter.get("title", f"Chapter {chapter_num}")
+
+    # Build query from chapter content
+    query_parts = [
+        chapter_title,
+        chapter.get("summary", "")[:500],  # Limit summary length
+        " ".join(chapter.get("keywords", [])[:10]),
+        " ".join(chapter.get("concepts", [])[:5])
+    ]
+    query_text = " ".join(filter(None, query_parts))
+
+    chapter_provenance: Optional[Dict[str, Any]] = None
+    try:
+        # Call orchestrator for semantic search
+        related = await find_related_chapters_semantic(
+            chapter_text=query_text,
+            current_book=book_title,
+            client=client,
+            threshold=SEMANTIC_SIMILARITY_THRESHOLD,
+            top_n=5,
+        )
+        chapter_provenance = {
+            "methods_used": ["orchestrator_semantic"],
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "content_fingerprint": compute_chapter_fingerprint(chapter),
+        }
+
+        # Progress output
+        if idx < 3 or idx == total_chapters - 1:
+            top_scores = [f"{r['relevance_score']:.3f}" for r in related[:3]]
+            print(f"  Chapter {chapter_num}: {len(related)} related, scores={top_scores}")
+        elif idx == 3:
+            print(f"  ... (processing {total_chapters - 4} more chapters)")
+
+    except Exception as e:
+        print(f"  ⚠️  Chapter {chapter_num} search failed: {e}")
+        related = []
+
+    # Build enriched chapter with cross-book references
+    enriched_chapter = {
+        **chapter,
+        "cross_book_references": related,
+        "similarity_source": "orchestrator_semantic",
+    }
+    if chapter_provenance is not None:
+        enriched_chapter["chapter_provenance"] = chapter_provenance
+    return enriched_chapter
+
+
 async def enrich_metadata_orchestrator(
     input_path: Path,
     output_path: Path,
     orchestrator_url: str = "http://localhost:8083",
+    delta: bool = False,
+    max_concurrency: int = CHAPTER_ENRICHMENT_CONCURRENCY,
 ) -> None:
     """
     Orchestrator-based enrichment - uses Code-Orchestrator-Service for semantic search.
@@ -1552,6 +1909,9 @@ async def enrich_metadata_orchestrator(
         input_path: Path to book metadata JSON (WBS 3.1.1 output)
         output_path: Path for enriched metadata JSON output
         orchestrator_url: URL of Code-Orchestrator-Service
+        delta: Only query chapters whose content fingerprint changed since
+            the existing output at output_path (see plan_delta_enrichment)
+        max_concurrency: Maximum chapters searched at once (output keeps chapter order)
     """
     print("\n📊 WBS 5.1: Orchestrator-based Semantic Enrichment")
     print(f"Input: {input_path.name}")
@@ -1577,54 +1937,31 @@ async def enrich_metadata_orchestrator(
     print(f"Chapters: {len(chapters)}")
     print(f"Threshold: {SEMANTIC_SIMILARITY_THRESHOLD}")
     
+    if delta:
+        refresh, reused = plan_delta_enrichment(
+            chapters, load_prior_enrichment(output_path), book_title
+        )
+        print(f"Delta: {len(refresh)} chapters to enrich, {len(reused)} unchanged")
+    else:
+        refresh, reused = list(range(len(chapters))), {}
+    
     # 2. Connect to orchestrator service and enrich each chapter
     print("\nConnecting to Code-Orchestrator-Service...")
-    enriched_chapters = []
+    enriched_chapters: List[Optional[Dict[str, Any]]] = [reused.get(idx) for idx in range(len(chapters))]
+    
+    perf_logger = PerformanceLogger() if PerformanceLogger is not None else None
     
     async with OrchestratorClient(base_url=orchestrator_url) as client:
-        print("\nEnriching chapters with orchestrator semantic search...")
+        print(f"\nEnriching chapters with orchestrator semantic search (concurrency {max_concurrency})...")
         
-        for idx, chapter in enumerate(chapters):
-            chapter_num = chapter.get("chapter_number", idx + 1)
-            chapter_title = chapter.get("title", f"Chapter {chapter_num}")
-            
-            # Build query from chapter content
-            query_parts = [
-                chapter_title,
-                chapter.get("summary", "")[:500],  # Limit summary length
-                " ".join(chapter.get("keywords", [])[:10]),
-                " ".join(chapter.get("concepts", [])[:5])
-            ]
-            query_text = " ".join(filter(None, query_parts))
-            
-            try:
-                # Call orchestrator for semantic search
-                related = await find_related_chapters_semantic(
-                    chapter_text=query_text,
-                    current_book=book_title,
-                    client=client,
-                    threshold=SEMANTIC_SIMILARITY_THRESHOLD,
-                    top_n=5,
-                )
-                
-                # Progress output
-                if idx < 3 or idx == len(chapters) - 1:
-                    top_scores = [f"{r['relevance_score']:.3f}" for r in related[:3]]
-                    print(f"  Chapter {chapter_num}: {len(related)} related, scores={top_scores}")
-                elif idx == 3:
-                    print(f"  ... (processing {len(chapters) - 4} more chapters)")
-                
-            except Exception as e:
-                print(f"  ⚠️  Chapter {chapter_num} search failed: {e}")
-                related = []
-            
-            # Build enriched chapter with cross-book references
-            enriched_chapter = {
-                **chapter,
-                "cross_book_references": related,
-                "similarity_source": "orchestrator_semantic",
-            }
-            enriched_chapters.append(enriched_chapter)
+        async def _enrich(idx: int) -> Dict[str, Any]:
+            return await _enrich_chapter_orchestrator(client, chapters[idx], idx, len(chapters), book_title)
+        
+        refreshed = await _enrich_chapters_concurrently(refresh, _enrich, max_concurrency, perf_logger)
+        for idx, enriched_chapter in zip(refresh, refreshed):
+            enriched_chapters[idx] = enriched_chapter
+    
+    latency_summary = _chapter_latency_summary(perf_logger)
     
     # 3. Build enriched metadata output
     enriched_metadata = {
@@ -1636,6 +1973,8 @@ async def enrich_metadata_orchestrator(
             "mode": "remote_api",
             "orchestrator_url": orchestrator_url,
             "threshold": SEMANTIC_SIMILARITY_THRESHOLD,
+            "max_concurrency": max_concurrency,
+            "chapter_latency_ms": latency_summary,
             "libraries": {
                 "httpx": "async HTTP client",
                 "code-orchestrator-service": "sentence-transformers"
@@ -1644,6 +1983,12 @@ async def enrich_metadata_orchestrator(
         "chapters": enriched_chapters
     }
     
+    if delta:
+        enriched_metadata["enrichment_metadata"]["delta"] = {
+            "refreshed_chapters": len(refresh),
+            "reused_chapters": len(reused),
+        }
+    
     # 4. Save enriched metadata
     output_path.parent.mkdir(parents=True, exist_ok=True)
     async with aiofiles.open(output_path, 'w', encoding='utf-8') as f:
@@ -1656,6 +2001,7 @@ async def enrich_metadata_orchestrator(
     print(f"  Chapters enriched: {len(enriched_chapters)}")
     print("  Similarity source: orchestrator_semantic")
     print(f"  Threshold: {SEMANTIC_SIMILARITY_THRESHOLD}")
+    _print_latency_summary(latency_summary)
     print("  NO LLM calls made ✓")
 
 
@@ -1736,6 +2082,7 @@ def _merge_msep_chapter(
         "sbert_score": msep_chapter.provenance.sbert_score,
         "topic_boost": msep_chapter.provenance.topic_boost,
         "timestamp": msep_chapter.provenance.timestamp,
+        "content_fingerprint": compute_chapter_fingerprint(chapter),
     }
     return enriched
 
@@ -1743,13 +2090,22 @@ def _merge_msep_chapter(
 def _merge_msep_response(
     chapters: List[Dict[str, Any]],
     enriched_response: Any,
-    book_title: str
+    book_title: str,
+    positions: Optional[List[int]] = None,
 ) -> List[Dict[str, Any]]:
-    """Merge MSEP response with original chapters."""
+    """
+    Merge MSEP response with original chapters.
+    
+    ``positions`` gives each chapter's index within the book, so a subset of
+    chapters (a shard or a delta batch) resolves the same default chapter
+    numbers as the full list.
+    """
     enriched_chapters = []
     chapter_map = {ec.chapter_id: ec for ec in enriched_response.chapters}
+    if positions is None:
+        positions = list(range(len(chapters)))
 
-    for idx, chapter in enumerate(chapters):
+    for idx, chapter in zip(positions, chapters):
         chapter_num = chapter.get("chapter_number", idx + 1)
         chapter_id = f"{book_title}:ch{chapter_num}"
         msep_chapter = chapter_map.get(chapter_id)
@@ -1764,16 +2120,181 @@ def _merge_msep_response(
     return enriched_chapters
 
 
+def _plan_msep_shards(
+    corpus: List[str],
+    max_chars: int,
+    max_chapters: int = MSEP_SHARD_MAX_CHAPTERS,
+) -> List[List[int]]:
+    """
+    Group corpus positions into contiguous shards bounded by size and count.
+    
+    A chapter larger than ``max_chars`` gets a shard of its own rather than
+    being split, so every chapter is sent exactly once. Chapters in
+    different shards are never compared with each other.
+    
+    Returns:
+        List of shards, each a list of corpus indices in book order
+    """
+    shards: List[List[int]] = []
+    current: List[int] = []
+    current_chars = 0
+
+    for idx, text in enumerate(corpus):
+        if current and (current_chars + len(text) > max_chars or len(current) >= max_chapters):
+            shards.append(current)
+            current, current_chars = [], 0
+        current.append(idx)
+        current_chars += len(text)
+
+    if current:
+        shards.append(current)
+    return shards
+
+
+def _compute_msep_corpus_id(book_title: str, content: bytes) -> str:
+    """
+    Derive a stable corpus context id shared by every shard of a book.
+
+    Hashes the book's metadata bytes as already read for enrichment, so the
+    input file is not read a second time.
+    """
+    digest = hashlib.sha256(book_title.encode("utf-8") + b"|" + content).hexdigest()
+    return f"{book_title}:{digest[:16]}"
+
+
+async def _run_msep_shards(
+    client: Any,
+    chapters: List[Dict[str, Any]],
+    corpus: List[str],
+    chapter_index: List[Any],
+    book_title: str,
+    shards: List[List[int]],
+    corpus_id: Optional[str],
+    max_concurrency: int,
+) -> Tuple[List[Optional[Dict[str, Any]]], Dict[str, Any]]:
+    """
+    Send MSEP shards concurrently and merge each response as it arrives.
+    
+    Shards that hit MSEPConnectionError/MSEPTimeoutError keep their chapters
+    with empty enrichment and are reported in the returned stats. If every
+    shard fails, the last error is re-raised so the caller can fall back.
+    MSEPAPIError is not retried and cancels the remaining shards.
+    
+    Returns:
+        Tuple of (enriched chapters in book order, aggregate shard stats).
+        Positions not covered by any shard are left as None.
+    """
+    enriched_chapters: List[Optional[Dict[str, Any]]] = [None] * len(chapters)
+    stats: Dict[str, Any] = {
+        "processing_time_ms": 0.0,
+        "total_cross_references": 0,
+        "failed_shards": [],
+    }
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    config = MSEPConfig(threshold=0.3)
+
+    async def _send_shard(shard_no: int, indices: List[int]) -> Tuple[int, List[int], Any, Optional[Exception]]:
+        async with semaphore:
+            try:
+                response = await client.enrich_metadata(
+                    corpus=[corpus[i] for i in indices],
+                    chapter_index=[chapter_index[i] for i in indices],
+                    config=config,
+                    corpus_id=corpus_id,
+                )
+            except (MSEPConnectionError, MSEPTimeoutError) as e:
+                return shard_no, indices, None, e
+        return shard_no, indices, response, None
+
+    last_error: Optional[Exception] = None
+    tasks = [asyncio.ensure_future(_send_shard(n, indices)) for n, indices in enumerate(shards)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            shard_no, indices, response, error = await next_done
+            shard_chapters = [chapters[i] for i in indices]
+
+            if error is not None:
+                last_error = error
+                stats["failed_shards"].append(shard_no)
+                _logger.warning(
+                    f"MSEP shard {shard_no + 1}/{len(shards)} failed ({type(error).__name__}: {error})"
+                )
+                merged = [{**chapter, "similar_chapters": []} for chapter in shard_chapters]
+            else:
+                stats["processing_time_ms"] += response.processing_time_ms
+                stats["total_cross_references"] += response.total_cross_references
+                merged = _merge_msep_response(shard_chapters, response, book_title, positions=indices)
+
+            for idx, enriched in zip(indices, merged):
+                enriched_chapters[idx] = enriched
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    if last_error is not None and len(stats["failed_shards"]) == len(shards):
+        raise last_error
+
+    stats["failed_shards"].sort()
+    return enriched_chapters, stats
+
+
+def _apply_delta_reuse(
+    enriched_chapters: List[Optional[Dict[str, Any]]],
+    chapters: List[Dict[str, Any]],
+    refresh: List[int],
+    reused: Dict[int, Dict[str, Any]],
+    book_title: str,
+) -> int:
+    """
+    Put prior enrichment back for unchanged chapters, in place.
+    
+    An unchanged chapter whose fresh result now links to a changed chapter
+    keeps the fresh result, so new links to changed chapters are not lost.
+    
+    Returns:
+        Number of chapters that kept their prior enrichment
+    """
+    changed_numbers = {chapters[idx].get("chapter_number", idx + 1) for idx in refresh}
+    reused_count = 0
+    for idx, reused_chapter in reused.items():
+        fresh = enriched_chapters[idx]
+        if fresh is not None and _references_any(fresh, book_title, changed_numbers):
+            continue
+        enriched_chapters[idx] = reused_chapter
+        reused_count += 1
+    return reused_count
+
+
 async def enrich_metadata_msep(
     input_path: Path,
     output_path: Path,
     msep_url: str = "http://localhost:8082",
+    shard_max_chars: Optional[int] = None,
+    shard_max_chapters: int = MSEP_SHARD_MAX_CHAPTERS,
+    max_concurrency: int = MSEP_SHARD_CONCURRENCY,
+    delta: bool = False,
 ) -> None:
     """
     MSEP-based enrichment - uses ai-agents MSEP endpoint for enrichment.
 
     Kitchen Brigade Pattern: llm-document-enhancer delegates ALL enrichment
     logic to ai-agents (EXPEDITOR). NO local ML processing.
+
+    Sharded mode (``shard_max_chars`` set): chapters are sent in bounded
+    batches tagged with a shared corpus context id, up to ``max_concurrency``
+    batches in flight, and each response is merged as soon as it arrives.
+    A failed batch leaves only its own chapters un-enriched. The MSEP API
+    scores similarity only within the corpus of one request, so a chapter's
+    similar_chapters never include chapters from another shard; sharding
+    trades cross-shard recall for bounded request size. The shard count is
+    recorded in provenance so such outputs can be told apart.
+
+    Delta mode (``delta=True``): chapters whose content fingerprint matches the
+    existing output at ``output_path`` keep their prior enrichment (see
+    plan_delta_enrichment). Nothing is sent when no chapter changed;
+    otherwise the whole book is sent so changed chapters are scored against
+    every chapter, and an unchanged chapter takes its fresh result only if
+    it now links to a changed one.
     """
     print("\n📊 WBS MSE-6.2: MSEP Enrichment (ai-agents API)")
     print(f"Input: {input_path.name}")
@@ -1782,24 +2303,59 @@ async def enrich_metadata_msep(
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
 
-    chapters, book_title = await _load_book_data_from_path(input_path)
-    async with aiofiles.open(input_path, encoding="utf-8") as f:
-        original_book_data = json.loads(await f.read())
+    book_bytes = await _read_book_bytes(input_path)
+    original_book_data = json.loads(book_bytes)
+    chapters, book_title = _unpack_book_data(original_book_data, input_path)
 
     print(f"\nBook: {book_title}")
     print(f"Chapters: {len(chapters)}")
 
     corpus, chapter_index = _build_msep_corpus(chapters, book_title)
 
+    if delta:
+        refresh, reused = plan_delta_enrichment(
+            chapters, load_prior_enrichment(output_path), book_title
+        )
+        print(f"Delta: {len(refresh)} chapters to enrich, {len(reused)} unchanged")
+    else:
+        refresh, reused = list(range(len(chapters))), {}
+
+    # Changed chapters are scored against the whole book: the MSEP API cannot
+    # score a subset against the rest, so the full corpus is sent whenever
+    # anything changed (and nothing is sent when nothing did)
+    send = list(range(len(chapters))) if refresh else []
+
+    if shard_max_chars is not None:
+        shards = [
+            [send[i] for i in shard]
+            for shard in _plan_msep_shards([corpus[i] for i in send], shard_max_chars, shard_max_chapters)
+        ]
+        corpus_id: Optional[str] = _compute_msep_corpus_id(book_title, book_bytes)
+        print(f"Shards: {len(shards)} (max {shard_max_chars} chars / {shard_max_chapters} chapters, "
+              f"concurrency {max_concurrency})")
+        if len(shards) > 1:
+            print("  ⚠️  Chapters are only matched within their own shard; "
+                  "cross-shard related chapters are not found")
+    else:
+        shards = [send] if send else []
+        corpus_id = None
+
     try:
-        print("\nConnecting to ai-agents MSEP service...")
-        async with MSEPClient(base_url=msep_url) as client:
-            enriched_response = await client.enrich_metadata(
-                corpus=corpus,
-                chapter_index=chapter_index,
-                config=MSEPConfig(threshold=0.3),
-            )
-        print(f"✅ MSEP enrichment complete: {enriched_response.total_cross_references} cross-references")
+        if shards:
+            print("\nConnecting to ai-agents MSEP service...")
+            async with MSEPClient(base_url=msep_url) as client:
+                enriched_chapters, shard_stats = await _run_msep_shards(
+                    client, chapters, corpus, chapter_index, book_title,
+                    shards, corpus_id, max_concurrency,
+                )
+        else:
+            enriched_chapters = [None] * len(chapters)
+            shard_stats = {"processing_time_ms": 0.0, "total_cross_references": 0, "failed_shards": []}
+        reused_count = _apply_delta_reuse(enriched_chapters, chapters, refresh, reused, book_title)
+        print(f"✅ MSEP enrichment complete: {shard_stats['total_cross_references']} cross-references")
+        if shard_stats["failed_shards"]:
+            print(f"  ⚠️  {len(shard_stats['failed_shards'])}/{len(shards)} shards failed; "
+                  "their chapters were left un-enriched")
 
     except (MSEPConnectionError, MSEPTimeoutError) as e:
         _logger.warning(f"MSEP service unavailable ({type(e).__name__}: {e}). Falling back to local enrichment.")
@@ -1812,8 +2368,6 @@ async def enrich_metadata_msep(
         _logger.error(f"MSEP API error: {e}")
         raise
 
-    enriched_chapters = _merge_msep_response(chapters, enriched_response, book_title)
-
     enriched_metadata: Dict[str, Any] = {
         "metadata": {"title": book_title, "source_file": input_path.name},
         "chapters": enriched_chapters,
@@ -1831,8 +2385,17 @@ async def enrich_metadata_msep(
         enrichment_method=ENRICHMENT_METHOD_MSEP,
         model_version="ai-agents-msep-v1",
     )
-    enriched_metadata["enrichment_provenance"]["processing_time_ms"] = enriched_response.processing_time_ms
-    enriched_metadata["enrichment_provenance"]["total_similar_chapters"] = enriched_response.total_cross_references
+    enriched_metadata["enrichment_provenance"]["processing_time_ms"] = shard_stats["processing_time_ms"]
+    enriched_metadata["enrichment_provenance"]["total_similar_chapters"] = shard_stats["total_cross_references"]
+    if corpus_id is not None:
+        enriched_metadata["enrichment_provenance"]["corpus_id"] = corpus_id
+        enriched_metadata["enrichment_provenance"]["shards"] = len(shards)
+        enriched_metadata["enrichment_provenance"]["failed_shards"] = shard_stats["failed_shards"]
+    if delta:
+        enriched_metadata["enrichment_provenance"]["delta"] = {
+            "refreshed_chapters": len(chapters) - reused_count,
+            "reused_chapters": reused_count,
+        }
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     async with aiofiles.open(output_path, "w", encoding="utf-8") as f:
@@ -1842,8 +2405,8 @@ async def enrich_metadata_msep(
     print(f"\n✅ Enriched metadata saved: {output_path.name}")
     print(f"  File size: {size_kb:.1f} KB")
     print(f"  Chapters enriched: {len(enriched_chapters)}")
-    print(f"  Cross-references: {enriched_response.total_cross_references}")
-    print(f"  Processing time: {enriched_response.processing_time_ms:.1f}ms")
+    print(f"  Cross-references: {shard_stats['total_cross_references']}")
+    print(f"  Processing time: {shard_stats['processing_time_ms']:.1f}ms")
 
 
 def main():
@@ -1874,6 +2437,14 @@ def main():
             --output workflows/metadata_enrichment/output/architecture_patterns_enriched.json \\
             --use-msep \\
             --msep-url http://localhost:8082
+    
+    Example (sharded MSEP mode - large books):
+        python enrich_metadata_per_book.py \\
+            --input workflows/metadata_extraction/output/architecture_patterns_metadata.json \\
+            --output workflows/metadata_enrichment/output/architecture_patterns_enriched.json \\
+            --use-msep \\
+            --msep-shard-chars 200000 \\
+            --msep-concurrency 4
     """
     parser = create_argument_parser()
     args = parser.parse_args()
@@ -1887,6 +2458,9 @@ def main():
         print(f"❌ Error: Taxonomy file not found: {args.taxonomy}")
         sys.exit(1)
     
+    if args.delta and not (args.use_msep or args.use_orchestrator):
+        print("⚠️  --delta only applies to --use-msep and --use-orchestrator; running a full enrichment")
+    
     # Run enrichment - priority: MSEP > Orchestrator > Semantic Search > Taxonomy > Local
     try:
         if args.use_msep:
@@ -1898,7 +2472,11 @@ def main():
             asyncio.run(enrich_metadata_msep(
                 args.input,
                 args.output,
-                msep_url=args.msep_url
+                msep_url=args.msep_url,
+                shard_max_chars=args.msep_shard_chars,
+                shard_max_chapters=args.msep_shard_chapters,
+                max_concurrency=args.msep_concurrency,
+                delta=args.delta,
             ))
         elif args.use_orchestrator:
             # Orchestrator mode (WBS 5.1)
@@ -1909,7 +2487,9 @@ def main():
             asyncio.run(enrich_metadata_orchestrator(
                 args.input,
                 args.output,
-                orchestrator_url=args.orchestrator_url
+                orchestrator_url=args.orchestrator_url,
+                delta=args.delta,
+                max_concurrency=args.chapter_concurrency,
             ))
         elif args.use_semantic_search:
             # Semantic search mode (WBS 3.2.4)
@@ -1920,7 +2500,8 @@ def main():
             asyncio.run(enrich_metadata_semantic(
                 args.input, 
                 args.output,
-                semantic_search_url=args.semantic_search_url
+                semantic_search_url=args.semantic_search_url,
+                max_concurrency=args.chapter_concurrency,
             ))
         elif args.taxonomy:
             # Cross-book mode with taxonomy
@@ -31,13 +31,12 @@ Author: TDD Implementation following MASTER_IMPLEMENTATION_GUIDE.md
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
-# NetworkX is optional - gracefully handle if not installed
-try:
-    import networkx as nx
-    NETWORKX_AVAILABLE = True
-except ImportError:
-    nx = None  # type: ignore
-    NETWORKX_AVAILABLE = False
+from workflows.shared.lazy_imports import lazy_import, module_available
+
+# NetworkX is optional - gracefully handle if not installed. It is imported
+# when the first cascade graph is built, not when this module is imported.
+NETWORKX_AVAILABLE = module_available("networkx")
+nx = lazy_import("networkx") if NETWORKX_AVAILABLE else None
 
 
 # ============================================================================
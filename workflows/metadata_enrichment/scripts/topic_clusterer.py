@@ -21,19 +21,15 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 import logging
 
+from workflows.shared.lazy_imports import module_available
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Check if BERTopic is available
-try:
-    from bertopic import BERTopic  # type: ignore[import-untyped]
-    from sentence_transformers import SentenceTransformer  # type: ignore[import-untyped]
-    BERTOPIC_AVAILABLE = True
-    logger.info("BERTopic and SentenceTransformers available")
-except ImportError as e:
-    BERTOPIC_AVAILABLE = False
-    logger.warning(f"BERTopic/SentenceTransformers not available: {e}. Using fallback mode.")
+# Check if BERTopic is available without importing it (torch + UMAP cost
+# seconds); the packages are imported in _initialize_model on first use
+BERTOPIC_AVAILABLE = module_available("bertopic", "sentence_transformers")
 
 
 @dataclass
@@ -120,6 +116,9 @@ class TopicClusterer:
             return
         
         try:
+            from bertopic import BERTopic  # type: ignore[import-untyped]
+            from sentence_transformers import SentenceTransformer  # type: ignore[import-untyped]
+
             # Initialize SentenceTransformer for embeddings
             embedding_model = SentenceTransformer(self.embedding_model)
             
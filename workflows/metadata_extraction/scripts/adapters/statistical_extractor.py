@@ -27,8 +27,14 @@ import re
 from datetime import datetime
 from pathlib import Path
 from typing import List, Tuple, Set, Union, cast, Optional
-import yake  # type: ignore[import-untyped]
-from summa import keywords as summa_keywords, summarizer  # type: ignore[import-untyped]
+
+from workflows.shared.lazy_imports import ensure_loaded, lazy_import, module_available
+
+# YAKE, Summa and NLTK are imported on first use: NLTK alone pulls in scipy
+# and costs seconds of startup for callers that never extract keywords.
+yake = lazy_import("yake")
+summa_keywords = lazy_import("summa.keywords")
+summarizer = lazy_import("summa.summarizer")
 
 # Global verbose log file handle
 _VERBOSE_LOG_PATH: Optional[Path] = None
@@ -106,13 +112,9 @@ def _log_extraction_details(
 # Initialize verbose logging on module load
 _init_verbose_logging()
 
-# Try to import WordNet for dictionary validation
-try:
-    from nltk.corpus import wordnet
-    _HAS_WORDNET = True
-except ImportError:
-    _HAS_WORDNET = False
-    wordnet = None  # type: ignore
+# WordNet for dictionary validation (imported on first lookup)
+_HAS_WORDNET = module_available("nltk")
+wordnet = lazy_import("nltk.corpus", "wordnet") if _HAS_WORDNET else None
 
 
 # Constants - Per PYTHON_GUIDELINES Ch. 6: Class constants for validation messages
@@ -513,6 +515,8 @@ class StatisticalExtractor:
         self.stem_dedup_enabled = os.environ.get("EXTRACTION_STEM_DEDUP_ENABLED", "true").lower() == "true"
         self.ngram_clean_enabled = os.environ.get("EXTRACTION_NGRAM_CLEAN_ENABLED", "true").lower() == "true"
         
+        # Deferred at module import; every extraction needs them, so load now
+        ensure_loaded(summa_keywords, summarizer, wordnet)
         self.kw_extractor = yake.KeywordExtractor(
             lan='en',
             n=yake_n,
@@ -41,7 +41,6 @@ AC Reference:
 
 from __future__ import annotations
 
-import asyncio
 import json
 import argparse
 import logging
@@ -78,6 +77,9 @@ from workflows.shared.clients.metadata_client import (  # noqa: E402
     MetadataClientTimeoutError,
     BatchTextItem,
     BatchExtractionResult,
+    SyncMetadataExtractionClient,
+    DEFAULT_BASE_URL as DEFAULT_ORCHESTRATOR_URL,
+    shared_batch_sizer,
 )
 from config.extraction_settings import get_extraction_settings  # noqa: E402
 
@@ -179,6 +181,8 @@ class UniversalMetadataGenerator:
         
         self._fallback_on_error = fallback_on_error
         self._orchestrator_url = orchestrator_url
+        # One pooled client + event loop per run (opened lazily, see close())
+        self._sync_client: Optional[SyncMetadataExtractionClient] = None
         
         # No limits on keywords/concepts - extract ALL, filter downstream, dedupe
         # Limits removed per user requirement: "pull all available, filter through confirmed, dedupe"
@@ -402,12 +406,77 @@ class UniversalMetadataGenerator:
             - AC-5.1: Client instantiation when use_orchestrator=True
         
         Returns:
-            Configured MetadataExtractionClient instance
+            Configured MetadataExtractionClient instance (batch sizing
+            shares the process-wide latency estimate for its URL)
         """
         # Use configured URL or default from client
-        if self._orchestrator_url:
-            return MetadataExtractionClient(base_url=self._orchestrator_url)
-        return MetadataExtractionClient()
+        base_url = self._orchestrator_url or DEFAULT_ORCHESTRATOR_URL
+        return MetadataExtractionClient(base_url=base_url, batch_sizer=shared_batch_sizer(base_url))
+
+    def _get_sync_client(self) -> SyncMetadataExtractionClient:
+        """
+        Return the run's pooled sync client, creating it on first use.
+        
+        All orchestrator calls from this generator share one background
+        event loop and one httpx connection pool instead of paying for
+        ``asyncio.run()`` plus a fresh pool per chapter.
+        
+        Returns:
+            SyncMetadataExtractionClient wrapping _create_metadata_client()
+        """
+        if self._sync_client is None:
+            self._sync_client = SyncMetadataExtractionClient(
+                client_factory=self._create_metadata_client
+            )
+        return self._sync_client
+
+    def close(self) -> None:
+        """Close the pooled orchestrator client (reopened lazily if reused)."""
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+
+    @staticmethod
+    def _orchestrator_options() -> MetadataExtractionOptions:
+        """Extraction options shared by per-chapter and batch requests."""
+        return MetadataExtractionOptions(
+            enable_summary=True,
+            summary_ratio=0.2,
+        )
+
+    def _map_orchestrator_result(
+        self,
+        result: MetadataExtractionResult,
+        text: str,
+        title: str,
+        chapter_num: int,
+    ) -> Tuple[List[str], List[str], str]:
+        """Map orchestrator response to standard (keywords, concepts, summary) (AC-5.5)."""
+        keywords = [kw.term for kw in result.keywords]
+        concepts = [c.name for c in result.concepts]
+        summary = result.summary or self.generate_summary(text, title, chapter_num)
+        
+        logger.info(
+            f"Orchestrator extraction for chapter {chapter_num}: "
+            f"{len(keywords)} keywords, {len(concepts)} concepts"
+        )
+        return keywords, concepts, summary
+
+    def _handle_orchestrator_error(
+        self,
+        error: MetadataClientError,
+        text: str,
+        title: str,
+        chapter_num: int,
+    ) -> Tuple[List[str], List[str], str]:
+        """Fall back to local extraction (AC-5.3) or re-raise (AC-5.4)."""
+        if not self._fallback_on_error:
+            raise error
+        logger.warning(
+            f"Orchestrator failed for chapter {chapter_num}, "
+            f"falling back to local extraction: {error}"
+        )
+        return self._extract_local(text, title, chapter_num)
 
     async def _extract_via_orchestrator_async(
         self,
@@ -418,6 +487,8 @@ class UniversalMetadataGenerator:
         """
         Extract metadata via orchestrator service asynchronously.
         
+        For callers that already own an event loop; sync callers use
+        _extract_via_orchestrator(), which reuses the pooled client.
         No limits on keywords/concepts - orchestrator extracts all, filters, and dedupes.
         
         AC Reference:
@@ -438,34 +509,12 @@ class UniversalMetadataGenerator:
         """
         try:
             async with self._create_metadata_client() as client:
-                options = MetadataExtractionOptions(
-                    enable_summary=True,
-                    summary_ratio=0.2,
+                result = await client.extract_metadata(
+                    text, title=title, options=self._orchestrator_options()
                 )
-                result = await client.extract_metadata(text, title=title, options=options)
-                
-                # Map orchestrator response to standard format (AC-5.5)
-                keywords = [kw.term for kw in result.keywords]
-                concepts = [c.name for c in result.concepts]
-                summary = result.summary or self.generate_summary(text, title, chapter_num)
-                
-                logger.info(
-                    f"Orchestrator extraction for chapter {chapter_num}: "
-                    f"{len(keywords)} keywords, {len(concepts)} concepts"
-                )
-                return keywords, concepts, summary
-                
         except MetadataClientError as e:
-            if self._fallback_on_error:
-                # AC-5.3: Fallback to local extraction
-                logger.warning(
-                    f"Orchestrator failed for chapter {chapter_num}, "
-                    f"falling back to local extraction: {e}"
-                )
-                return self._extract_local(text, title, chapter_num)
-            else:
-                # AC-5.4: Propagate exception
-                raise
+            return self._handle_orchestrator_error(e, text, title, chapter_num)
+        return self._map_orchestrator_result(result, text, title, chapter_num)
 
     def _extract_via_orchestrator(
         self,
@@ -474,9 +523,9 @@ class UniversalMetadataGenerator:
         chapter_num: int,
     ) -> Tuple[List[str], List[str], str]:
         """
-        Synchronous wrapper for orchestrator extraction.
+        Synchronous orchestrator extraction over the run's pooled client.
         
-        Handles asyncio event loop management for sync callers.
+        One HTTP request per chapter - no per-call event loop or connection pool.
         No limits on keywords/concepts - extracts all.
         
         Args:
@@ -487,21 +536,61 @@ class UniversalMetadataGenerator:
         Returns:
             Tuple of (keywords, concepts, summary)
         """
-        return asyncio.run(
-            self._extract_via_orchestrator_async(
-                text, title, chapter_num
+        try:
+            result = self._get_sync_client().extract_metadata(
+                text, title=title, options=self._orchestrator_options()
             )
+        except MetadataClientError as e:
+            return self._handle_orchestrator_error(e, text, title, chapter_num)
+        return self._map_orchestrator_result(result, text, title, chapter_num)
+
+    @staticmethod
+    def _build_batch_items(chapters_data: List[Dict[str, Any]]) -> List[BatchTextItem]:
+        """Build batch request items from collected chapter data."""
+        return [
+            BatchTextItem(
+                id=ch['id'],
+                text=ch['text'],
+                title=ch.get('title'),
+            )
+            for ch in chapters_data
+        ]
+
+    @staticmethod
+    def _map_batch_result(
+        result: BatchExtractionResult,
+    ) -> Dict[str, Tuple[List[str], List[str], str]]:
+        """Map batch results back to chapter IDs (failed items get empty results)."""
+        logger.info(
+            f"Batch extraction: {result.successful}/{result.total_items} succeeded "
+            f"in {result.total_processing_time_ms:.1f}ms"
         )
+        
+        results_map = {}
+        for item_result in result.results:
+            if item_result.success and item_result.result:
+                r = item_result.result
+                keywords = [kw.term for kw in r.keywords]
+                concepts = [c.name for c in r.concepts]
+                summary = r.summary or ""
+                results_map[item_result.id] = (keywords, concepts, summary)
+            else:
+                # Failed item - return empty results
+                logger.warning(f"Batch item {item_result.id} failed: {item_result.error}")
+                results_map[item_result.id] = ([], [], "")
+        
+        return results_map
 
     async def _extract_batch_via_orchestrator_async(
         self,
         chapters_data: List[Dict[str, Any]],
     ) -> Dict[str, Tuple[List[str], List[str], str]]:
         """
-        Extract metadata for all chapters in a single batch request.
+        Extract metadata for all chapters via adaptive batching.
         
-        Optimized for large books - reduces HTTP overhead by sending all chapters
-        in one request instead of one request per chapter.
+        Optimized for large books - chapters are split into a few size-planned
+        sub-batches sent concurrently; failing sub-batches are bisected and
+        retried instead of abandoning the whole book to per-chapter extraction.
         
         No limits on keywords/concepts - extracts all, filters, and dedupes.
         
@@ -511,69 +600,31 @@ class UniversalMetadataGenerator:
         Returns:
             Dict mapping chapter_id to (keywords, concepts, summary) tuple
         """
-        try:
-            async with self._create_metadata_client() as client:
-                # Build batch items
-                items = [
-                    BatchTextItem(
-                        id=ch['id'],
-                        text=ch['text'],
-                        title=ch.get('title'),
-                    )
-                    for ch in chapters_data
-                ]
-                
-                options = MetadataExtractionOptions(
-                    enable_summary=True,
-                    summary_ratio=0.2,
-                )
-                
-                result = await client.extract_metadata_batch(
-                    items=items,
-                    book_title=self.book_name,
-                    options=options,
-                )
-                
-                logger.info(
-                    f"Batch extraction: {result.successful}/{result.total_items} succeeded "
-                    f"in {result.total_processing_time_ms:.1f}ms"
-                )
-                
-                # Map results back to chapter IDs
-                results_map = {}
-                for item_result in result.results:
-                    if item_result.success and item_result.result:
-                        r = item_result.result
-                        keywords = [kw.term for kw in r.keywords]
-                        concepts = [c.name for c in r.concepts]
-                        summary = r.summary or ""
-                        results_map[item_result.id] = (keywords, concepts, summary)
-                    else:
-                        # Failed item - return empty results
-                        logger.warning(f"Batch item {item_result.id} failed: {item_result.error}")
-                        results_map[item_result.id] = ([], [], "")
-                
-                return results_map
-                
-        except MetadataClientError as e:
-            if self._fallback_on_error:
-                logger.warning(f"Batch extraction failed, falling back to per-chapter: {e}")
-                raise  # Let caller handle fallback
-            else:
-                raise
+        async with self._create_metadata_client() as client:
+            result = await client.extract_metadata_batch_adaptive(
+                items=self._build_batch_items(chapters_data),
+                book_title=self.book_name,
+                options=self._orchestrator_options(),
+            )
+        return self._map_batch_result(result)
 
     def _extract_batch_via_orchestrator(
         self,
         chapters_data: List[Dict[str, Any]],
     ) -> Dict[str, Tuple[List[str], List[str], str]]:
         """
-        Synchronous wrapper for batch orchestrator extraction.
+        Synchronous adaptive batch extraction over the run's pooled client.
+        
+        Raises:
+            MetadataClientError: Caller falls back to per-chapter extraction,
+                which reuses the same pooled connection.
         """
-        return asyncio.run(
-            self._extract_batch_via_orchestrator_async(
-                chapters_data
-            )
+        result = self._get_sync_client().extract_metadata_batch_adaptive(
+            items=self._build_batch_items(chapters_data),
+            book_title=self.book_name,
+            options=self._orchestrator_options(),
         )
+        return self._map_batch_result(result)
 
     def _extract_local(
         self,
@@ -821,6 +872,8 @@ class UniversalMetadataGenerator:
         
         metadata_list = []
         
+        # Batch + per-chapter fallback share one pooled connection, kept open
+        # until the owner calls close()
         if self._use_orchestrator and chapters_data:
             print(f"\n🚀 Using BATCH orchestrator extraction for {len(chapters_data)} chapters...")
             try:
@@ -1213,7 +1266,10 @@ Examples:
     
     # Generate metadata
     print(f"\n🔬 Generating metadata for {len(chapters)} chapters...")
-    metadata_list = generator.generate_metadata(chapters)
+    try:
+        metadata_list = generator.generate_metadata(chapters)
+    finally:
+        generator.close()
     
     # Save metadata
     output_path = Path(args.output) if args.output else None
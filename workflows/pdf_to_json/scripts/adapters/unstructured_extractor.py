@@ -26,20 +26,14 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 
-# Lazy imports for optional dependencies
-try:
-    from unstructured.partition.pdf import partition_pdf
-    UNSTRUCTURED_AVAILABLE = True
-except ImportError:
-    UNSTRUCTURED_AVAILABLE = False
-    partition_pdf = None
+from workflows.shared.lazy_imports import lazy_import, module_available
 
-try:
-    import fitz  # PyMuPDF
-    PYMUPDF_AVAILABLE = True
-except ImportError:
-    PYMUPDF_AVAILABLE = False
-    fitz = None
+# Lazy imports for optional dependencies (imported on first use)
+UNSTRUCTURED_AVAILABLE = module_available("unstructured")
+partition_pdf = lazy_import("unstructured.partition.pdf", "partition_pdf") if UNSTRUCTURED_AVAILABLE else None
+
+PYMUPDF_AVAILABLE = module_available("fitz")
+fitz = lazy_import("fitz") if PYMUPDF_AVAILABLE else None  # PyMuPDF
 
 
 class ElementType(Enum):
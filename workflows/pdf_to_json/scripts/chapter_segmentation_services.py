@@ -17,11 +17,14 @@ References:
 
 import re
 from typing import List, Optional, Tuple
-from sklearn.feature_extraction.text import TfidfVectorizer  # type: ignore[import-untyped]
-from sklearn.metrics.pairwise import cosine_similarity  # type: ignore[import-untyped]
 
 from workflows.pdf_to_json.scripts.chapter_models import Chapter
 from workflows.metadata_extraction.scripts.adapters.statistical_extractor import StatisticalExtractor
+from workflows.shared.lazy_imports import lazy_import
+
+# scikit-learn (and scipy) load on the first topic-shift pass, not at import
+TfidfVectorizer = lazy_import("sklearn.feature_extraction.text", "TfidfVectorizer")
+cosine_similarity = lazy_import("sklearn.metrics.pairwise", "cosine_similarity")
 
 
 # ============================================================================
@@ -20,21 +20,22 @@ from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Tuple
 
-import fitz  # type: ignore[import-untyped]  # PyMuPDF
-
-# OCR support for scanned PDFs
-try:
-    import pytesseract  # type: ignore[import-untyped]
-    from PIL import Image
-    OCR_AVAILABLE = True
-except ImportError:
-    OCR_AVAILABLE = False
-    print("Warning: pytesseract not available. Install with: pip install pytesseract pillow")
-
 # Add project root to path for config access
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+# Heavy dependencies are imported on first use (see workflows.shared.lazy_imports)
+from workflows.shared.lazy_imports import lazy_import, module_available  # noqa: E402
+
+fitz = lazy_import("fitz")  # PyMuPDF
+
+# OCR support for scanned PDFs
+OCR_AVAILABLE = module_available("pytesseract", "PIL")
+pytesseract = lazy_import("pytesseract")
+Image = lazy_import("PIL.Image")
+if not OCR_AVAILABLE:
+    print("Warning: pytesseract not available. Install with: pip install pytesseract pillow")
+
 # Configuration management (Microservices Up and Running Ch. 7 - 12-Factor Config)
 from config.settings import settings  # noqa: E402
 
@@ -13,6 +13,7 @@ Clients:
 - MSEPClient: Async client for Gateway -> ai-agents MSEP API (WBS MSE-6.1)
 - SemanticSearchClient: Async client for semantic-search-service (WBS 3.2.3)
 - OrchestratorClient: Async client for Code-Orchestrator-Service (WBS 5.1.2)
+- AnthropicBatchClient: Sync client for the provider Message Batches API (Tab 7 batch mode)
 
 NOTE: All external clients MUST route through Gateway:8080 per Kitchen Brigade architecture.
 Direct calls to platform services (ai-agents:8082, Code-Orchestrator:8083) are VIOLATIONS.
@@ -24,6 +25,13 @@ Observability (WBS 6.2):
 
 from workflows.shared.clients import cache
 from workflows.shared.clients import metrics
+from workflows.shared.clients.anthropic_batch_client import (
+    AnthropicBatchClient,
+    BatchAPIError,
+    BatchClientError,
+    BatchResult,
+    BatchStatus,
+)
 from workflows.shared.clients.cache import (
     ResultCache,
     generate_cache_key,
@@ -91,6 +99,12 @@ __all__ = [
     "OrchestratorClientProtocol",
     "FakeOrchestratorClient",
     "SEMANTIC_SIMILARITY_THRESHOLD",
+    # Batch Client (offline bulk submission)
+    "AnthropicBatchClient",
+    "BatchClientError",
+    "BatchAPIError",
+    "BatchStatus",
+    "BatchResult",
     # Cache (WBS 6.1)
     "cache",
     "ResultCache",
@@ -0,0 +1,279 @@
+"""
+Anthropic Message Batches Client - offline bulk LLM submission
+
+Sync HTTP client for the provider's Message Batches API, used by Tab 7's
+batch enhancement mode. A batch trades latency (results within hours) for
+lower per-call cost and no per-minute rate limits, which suits overnight
+library-wide reruns.
+
+Endpoints:
+- POST /v1/messages/batches               create a batch of Messages requests
+- GET  /v1/messages/batches/{id}          processing status and request counts
+- GET  {results_url}                      JSONL results, one line per custom_id
+
+Transient failures (429/5xx, connection errors) are retried with the shared
+retry engine, honouring Retry-After.
+
+Reference Documents:
+- Anthropic API docs: Message Batches
+- GUIDELINES p. 2145: Timeouts, retries, graceful degradation
+
+Usage:
+    with AnthropicBatchClient() as client:
+        status = client.create_batch([
+            AnthropicBatchClient.build_request("b0-c1", prompt, model, 4096, 0.2)
+        ])
+        status = client.get_batch(status.batch_id)
+        if status.ended:
+            for result in client.iter_results(status):
+                ...
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+
+from workflows.shared.retry import (
+    RetryConfig,
+    retry_after_from_response,
+    retry_call,
+)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_BATCH_BASE_URL = "https://api.anthropic.com"
+ANTHROPIC_API_VERSION = "2023-06-01"
+BATCHES_PATH = "/v1/messages/batches"
+STATUS_ENDED = "ended"
+RESULT_SUCCEEDED = "succeeded"
+
+
+# =============================================================================
+# Custom Exceptions
+# =============================================================================
+
+
+class BatchClientError(Exception):
+    """Base exception for batch API errors."""
+
+    pass
+
+
+class BatchAPIError(BatchClientError):
+    """Raised when the batch API returns an error response."""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int,
+        response_body: Optional[str] = None,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.response_body = response_body
+        self.retry_after = retry_after
+
+
+# =============================================================================
+# Response models
+# =============================================================================
+
+
+@dataclass
+class BatchStatus:
+    """Processing state of a submitted batch."""
+
+    batch_id: str
+    processing_status: str
+    request_counts: Dict[str, int] = field(default_factory=dict)
+    results_url: Optional[str] = None
+
+    @property
+    def ended(self) -> bool:
+        """True once every request has a result (succeeded, errored, expired or canceled)."""
+        return self.processing_status == STATUS_ENDED
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BatchStatus":
+        return cls(
+            batch_id=data["id"],
+            processing_status=data.get("processing_status", ""),
+            request_counts=dict(data.get("request_counts") or {}),
+            results_url=data.get("results_url"),
+        )
+
+    def describe(self) -> str:
+        """One-line progress summary."""
+        counts = ", ".join(f"{k}={v}" for k, v in sorted(self.request_counts.items()) if v)
+        return f"{self.processing_status}" + (f" ({counts})" if counts else "")
+
+
+@dataclass
+class BatchResult:
+    """Result of one request in a batch."""
+
+    custom_id: str
+    succeeded: bool
+    content: str = ""
+    model: str = ""
+    input_tokens: int = 0
+    output_tokens: int = 0
+    error: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BatchResult":
+        result = data.get("result") or {}
+        result_type = result.get("type", "")
+        if result_type != RESULT_SUCCEEDED:
+            error = result.get("error") or {}
+            if isinstance(error, dict):
+                detail = error.get("error", error)
+                message = detail.get("message") if isinstance(detail, dict) else None
+            else:
+                message = str(error)
+            return cls(
+                custom_id=data["custom_id"],
+                succeeded=False,
+                error=f"{result_type}: {message}" if message else result_type,
+            )
+
+        message = result.get("message") or {}
+        text = "".join(
+            block.get("text", "")
+            for block in message.get("content", [])
+            if block.get("type") == "text"
+        )
+        usage = message.get("usage") or {}
+        return cls(
+            custom_id=data["custom_id"],
+            succeeded=True,
+            content=text,
+            model=message.get("model", ""),
+            input_tokens=int(usage.get("input_tokens", 0)),
+            output_tokens=int(usage.get("output_tokens", 0)),
+        )
+
+
+# =============================================================================
+# AnthropicBatchClient
+# =============================================================================
+
+
+class AnthropicBatchClient:
+    """
+    Sync client for the Message Batches API.
+
+    Attributes:
+        base_url: API base URL (ANTHROPIC_BATCH_BASE_URL, default https://api.anthropic.com)
+        timeout: Per-request timeout in seconds
+    """
+
+    RETRYABLE_STATUS_CODES: frozenset[int] = frozenset({429, 500, 502, 503, 504, 529})
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: float = 60.0,
+        retry_config: Optional[RetryConfig] = None,
+        http_client: Optional[httpx.Client] = None,
+    ):
+        self.base_url = (
+            base_url or os.getenv("ANTHROPIC_BATCH_BASE_URL", DEFAULT_BATCH_BASE_URL)
+        ).rstrip("/")
+        self.timeout = timeout
+        self.retry_config = retry_config or RetryConfig(max_attempts=5, max_delay=60.0)
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.Client(
+            timeout=timeout,
+            headers={
+                "x-api-key": api_key if api_key is not None else os.getenv("ANTHROPIC_API_KEY", ""),
+                "anthropic-version": ANTHROPIC_API_VERSION,
+                "content-type": "application/json",
+            },
+        )
+
+    def __enter__(self) -> "AnthropicBatchClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying connection pool (if this client created it)."""
+        if self._owns_client:
+            self._client.close()
+
+    @staticmethod
+    def build_request(
+        custom_id: str,
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        system: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """One batch entry: a custom_id plus ordinary Messages API params."""
+        params: Dict[str, Any] = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if system:
+            params["system"] = system
+        return {"custom_id": custom_id, "params": params}
+
+    def create_batch(self, requests: List[Dict[str, Any]]) -> BatchStatus:
+        """Submit a batch; returns its initial status (with the batch id)."""
+        response = self._request("POST", f"{self.base_url}{BATCHES_PATH}", json={"requests": requests})
+        return BatchStatus.from_dict(response.json())
+
+    def get_batch(self, batch_id: str) -> BatchStatus:
+        """Fetch a batch's current processing status."""
+        response = self._request("GET", f"{self.base_url}{BATCHES_PATH}/{batch_id}")
+        return BatchStatus.from_dict(response.json())
+
+    def iter_results(self, status: BatchStatus) -> Iterator[BatchResult]:
+        """
+        Yield results of an ended batch (order is not guaranteed; match on custom_id).
+
+        Raises:
+            BatchClientError: If the batch has not ended yet
+        """
+        if not status.ended:
+            raise BatchClientError(f"Batch {status.batch_id} has not ended ({status.processing_status})")
+        url = status.results_url or f"{self.base_url}{BATCHES_PATH}/{status.batch_id}/results"
+        response = self._request("GET", url)
+        for line in response.text.splitlines():
+            if line.strip():
+                yield BatchResult.from_dict(json.loads(line))
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """HTTP request with retries on 429/5xx and connection errors."""
+        def attempt(_: int) -> httpx.Response:
+            response = self._client.request(method, url, **kwargs)
+            if response.status_code >= 400:
+                raise BatchAPIError(
+                    f"Batch API {method} {url} failed with HTTP {response.status_code}",
+                    status_code=response.status_code,
+                    response_body=response.text[:1000],
+                    retry_after=retry_after_from_response(response),
+                )
+            return response
+
+        return retry_call(
+            attempt,
+            config=self.retry_config,
+            retry_on=(BatchAPIError, httpx.TransportError),
+            is_retryable=lambda e: (
+                not isinstance(e, BatchAPIError) or e.status_code in self.RETRYABLE_STATUS_CODES
+            ),
+        )
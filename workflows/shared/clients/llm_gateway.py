@@ -22,18 +22,34 @@ Usage:
         )
 """
 
-import asyncio
 import os
 from typing import Any, Optional
 
 import httpx
 
+from workflows.shared.retry import (
+    DEFAULT_RETRY_DEADLINE,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryConfig,
+    RetryExhaustedError,
+    retry_after_from_response,
+    retry_call_async,
+)
+from workflows.shared.prompts.prompt_cache import TokenUsage
+from workflows.shared.rate_limiter import (
+    LLMRateLimiter,
+    estimate_messages_tokens,
+    get_rate_limiter,
+)
+
 
 # =============================================================================
 # Constants - SonarQube S1192: Extract duplicated literals
 # =============================================================================
 
 _CLIENT_NOT_INITIALIZED_ERROR = "Client not initialized. Use async context manager."
+_DEFAULT_MAX_RETRY_DELAY = 30.0
 
 
 # =============================================================================
@@ -67,10 +83,17 @@ class GatewayConnectionError(GatewayError):
 class GatewayAPIError(GatewayError):
     """Raised when gateway returns an error response."""
 
-    def __init__(self, message: str, status_code: int, response_body: Optional[dict] = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: int,
+        response_body: Optional[dict] = None,
+        retry_after: Optional[float] = None,
+    ):
         super().__init__(message)
         self.status_code = status_code
         self.response_body = response_body
+        self.retry_after = retry_after
 
 
 # =============================================================================
@@ -113,6 +136,9 @@ class LLMGatewayClient:
         max_connections: int = 10,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        rate_limiter: Optional[LLMRateLimiter] = None,
+        retry_deadline: Optional[float] = DEFAULT_RETRY_DEADLINE,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ) -> None:
         """
         Initialize LLM Gateway client.
@@ -123,6 +149,11 @@ class LLMGatewayClient:
             max_connections: Max connections in pool. Default 10.
             max_retries: Maximum retry attempts for transient failures. Default 3.
             retry_delay: Base delay between retries in seconds. Default 1.0.
+            rate_limiter: Request/token governor. Defaults to the shared
+                process-wide limiter (get_rate_limiter()).
+            retry_deadline: Total seconds one request may spend retrying.
+                Default DEFAULT_RETRY_DEADLINE; None = no budget.
+            circuit_breaker: Breaker to share across clients; one per client by default.
 
         Pattern: Environment variable configuration with sensible defaults
         Reference: CODING_PATTERNS §2.3 (exponential backoff pattern)
@@ -134,6 +165,9 @@ class LLMGatewayClient:
         self.max_connections: int = max_connections
         self.max_retries: int = max_retries
         self.retry_delay: float = retry_delay
+        self._rate_limiter: Optional[LLMRateLimiter] = rate_limiter
+        self.retry_deadline: Optional[float] = retry_deadline
+        self.circuit_breaker: CircuitBreaker = circuit_breaker or CircuitBreaker(name=self.base_url)
 
         # Lazy initialization - client created in __aenter__
         # Pattern: Avoid creating httpx.AsyncClient per request (CODING_PATTERNS line 67)
@@ -254,54 +288,100 @@ class LLMGatewayClient:
         # Add any additional kwargs
         payload.update(kwargs)
 
-        # Make request with error handling and retry
+        # Make request with error handling and retry; every attempt reserves
+        # request/token capacity before it is sent (GUIDELINES p. 2309)
         # Pattern: Timeout handling for graceful degradation (GUIDELINES p. 2145)
         # Pattern: Retry with exponential backoff (CODING_PATTERNS §2.3)
-        return await self._post_with_retry("/v1/chat/completions", payload)
+        return await self._post_with_retry(
+            "/v1/chat/completions",
+            payload,
+            token_estimate=(estimate_messages_tokens(messages), max_tokens or 0),
+        )
+
+    async def _governed_post(
+        self, endpoint: str, payload: dict[str, Any], input_tokens: int, output_tokens: int
+    ) -> dict[str, Any]:
+        """
+        One POST under the rate limiter: reserve, send, settle to actual usage.
+
+        A failed attempt is released (its input counted as sent), so retries
+        are charged like any other request.
+        """
+        limiter = self._rate_limiter or get_rate_limiter()
+        reservation = await limiter.acquire_async(input_tokens, output_tokens)
+        try:
+            response = await self._post(endpoint, payload)
+        except BaseException:
+            await limiter.release_async(reservation)
+            raise
+
+        # Prompt-cache reads do not count against input-token limits
+        usage = response.get("usage") or {}
+        await limiter.settle_async(
+            reservation,
+            (
+                TokenUsage.from_openai(usage).uncached_input_tokens
+                if "prompt_tokens" in usage
+                else reservation.input_tokens
+            ),
+            usage.get("completion_tokens", reservation.output_tokens),
+        )
+        return response
 
     async def _post_with_retry(
-        self, endpoint: str, payload: dict[str, Any]
+        self,
+        endpoint: str,
+        payload: dict[str, Any],
+        token_estimate: Optional[tuple[int, int]] = None,
     ) -> dict[str, Any]:
         """
         Make POST request with retry logic for transient failures.
 
         WBS 3.1.1.2.6: Retry logic for transient failures (503, 429, 502, 504).
-        Pattern: Exponential backoff (CODING_PATTERNS §2.3)
+        Pattern: Decorrelated-jitter backoff honouring Retry-After, optional
+        deadline budget and circuit breaker (workflows.shared.retry)
         Reference: GUIDELINES p. 466 (fail fast then retry at higher level)
 
         Args:
             endpoint: API endpoint path
             payload: Request payload
+            token_estimate: (input, output) tokens to reserve on the rate
+                limiter for each attempt; None sends ungoverned
 
         Returns:
             dict: JSON response
 
         Raises:
             GatewayTimeoutError: On timeout
-            GatewayConnectionError: On connection failure
+            GatewayConnectionError: On connection failure or open circuit
             GatewayAPIError: On API error after exhausting retries
         """
-        last_error: Optional[GatewayAPIError] = None
+        config = RetryConfig(
+            max_attempts=self.max_retries,
+            initial_delay=self.retry_delay,
+            max_delay=max(_DEFAULT_MAX_RETRY_DELAY, self.retry_delay),
+            deadline=self.retry_deadline,
+        )
 
-        for attempt in range(self.max_retries):
-            try:
+        async def _attempt(_attempt: int) -> dict[str, Any]:
+            if token_estimate is None:
                 return await self._post(endpoint, payload)
-            except GatewayAPIError as e:
-                # Check if error is retryable
-                if not self._is_retryable_status(e.status_code):
-                    raise  # Non-retryable: fail immediately
+            return await self._governed_post(endpoint, payload, *token_estimate)
 
-                last_error = e
-
-                # Wait before retry (exponential backoff)
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2**attempt)
-                    await asyncio.sleep(delay)
-
-        # Exhausted retries - raise last error
-        if last_error is not None:
-            raise last_error
-        raise GatewayAPIError("Request failed after retries", status_code=500)
+        try:
+            return await retry_call_async(
+                _attempt,
+                config=config,
+                retry_on=(GatewayAPIError,),
+                # Non-retryable statuses fail immediately
+                is_retryable=lambda e: self._is_retryable_status(e.status_code),  # type: ignore[attr-defined]
+                breaker=self.circuit_breaker,
+            )
+        except RetryExhaustedError as e:
+            # Exhausted retries - raise last error
+            raise e.last_error from None
+        except CircuitOpenError as e:
+            raise GatewayConnectionError(str(e)) from e
 
     async def _post(self, endpoint: str, payload: dict[str, Any]) -> dict[str, Any]:
         """
@@ -346,6 +426,7 @@ class LLMGatewayClient:
                 f"Gateway API error: {e.response.status_code}",
                 status_code=e.response.status_code,
                 response_body=body,
+                retry_after=retry_after_from_response(e.response),
             ) from e
 
     # =========================================================================
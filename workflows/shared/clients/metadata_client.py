@@ -19,8 +19,10 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import threading
+import time
 from dataclasses import dataclass, field
-from typing import Any, Final, Protocol, runtime_checkable
+from typing import Any, Callable, Final, Protocol, runtime_checkable
 
 import httpx
 
@@ -29,6 +31,7 @@ from config.extraction_settings import (
     DEFAULT_ORCHESTRATOR_TIMEOUT,
     DEFAULT_ORCHESTRATOR_MAX_RETRIES,
 )
+from workflows.shared.clients.sync_bridge import PooledAsyncClient
 
 
 # =============================================================================
@@ -43,6 +46,18 @@ ENDPOINT_EXTRACT: Final[str] = "/api/v1/metadata/extract"
 ENDPOINT_EXTRACT_BATCH: Final[str] = "/api/v1/metadata/extract/batch"
 ENDPOINT_HEALTH: Final[str] = "/api/v1/health"
 
+# Adaptive batching: size sub-batches by text bytes so each call lands near
+# the target latency given the observed server cost per KB of text.
+DEFAULT_BATCH_TARGET_LATENCY_S: Final[float] = 20.0
+DEFAULT_BATCH_INITIAL_MS_PER_KB: Final[float] = 20.0
+DEFAULT_BATCH_MIN_BYTES: Final[int] = 32 * 1024
+DEFAULT_BATCH_MAX_BYTES: Final[int] = 1024 * 1024
+DEFAULT_BATCH_CONCURRENCY: Final[int] = 4
+DEFAULT_BATCH_LATENCY_SMOOTHING: Final[float] = 0.3
+# Per-sub-batch timeout = headroom x predicted latency (never below the floor)
+BATCH_TIMEOUT_HEADROOM: Final[float] = 3.0
+BATCH_TIMEOUT_FLOOR_S: Final[float] = 30.0
+
 # HTTP status codes that trigger retry (5xx server errors)
 RETRYABLE_STATUS_CODES: Final[frozenset[int]] = frozenset({502, 503, 504})
 
@@ -190,6 +205,108 @@ class BatchExtractionResult:
     total_processing_time_ms: float = 0.0
 
 
+def _text_bytes(item: BatchTextItem) -> int:
+    """UTF-8 size of an item's text (the unit batch sizing works in)."""
+    return len(item.text.encode("utf-8"))
+
+
+def plan_text_batches(
+    items: list[BatchTextItem],
+    max_bytes: int,
+) -> list[list[BatchTextItem]]:
+    """Split items into consecutive sub-batches of at most max_bytes of text.
+
+    Order is preserved. An item larger than max_bytes is sent on its own
+    rather than rejected.
+
+    Args:
+        items: Items to split.
+        max_bytes: Byte budget per sub-batch.
+
+    Returns:
+        List of non-empty sub-batches covering items in order.
+    """
+    batches: list[list[BatchTextItem]] = []
+    start = 0
+    while start < len(items):
+        end = _next_batch_end(items, start, max_bytes)
+        batches.append(items[start:end])
+        start = end
+    return batches
+
+
+def _next_batch_end(items: list[BatchTextItem], start: int, max_bytes: int) -> int:
+    """End index of the sub-batch starting at start (always takes one item)."""
+    end = start + 1
+    total = _text_bytes(items[start])
+    while end < len(items):
+        size = _text_bytes(items[end])
+        if total + size > max_bytes:
+            break
+        total += size
+        end += 1
+    return end
+
+
+@dataclass
+class AdaptiveBatchSizer:
+    """Chooses sub-batch size from observed per-KB extraction latency.
+
+    Keeps an exponentially weighted estimate of milliseconds per KB of text
+    and sizes batches so each request lands near target_latency_s. Safe to
+    share between clients on different event loops (see shared_batch_sizer).
+    """
+
+    target_latency_s: float = DEFAULT_BATCH_TARGET_LATENCY_S
+    ms_per_kb: float = DEFAULT_BATCH_INITIAL_MS_PER_KB
+    min_bytes: int = DEFAULT_BATCH_MIN_BYTES
+    max_bytes: int = DEFAULT_BATCH_MAX_BYTES
+    smoothing: float = DEFAULT_BATCH_LATENCY_SMOOTHING
+    observations: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def target_batch_bytes(self) -> int:
+        """Byte budget per sub-batch for the current latency estimate."""
+        budget = int(self.target_latency_s * 1000.0 / max(self.ms_per_kb, 1e-6) * 1024)
+        return max(self.min_bytes, min(self.max_bytes, budget))
+
+    def predicted_latency_s(self, text_bytes: int) -> float:
+        """Predicted request latency for text_bytes of input."""
+        return self.ms_per_kb * (text_bytes / 1024.0) / 1000.0
+
+    def timeout_for(self, text_bytes: int) -> float:
+        """Request timeout with headroom over the predicted latency."""
+        return max(BATCH_TIMEOUT_FLOOR_S, BATCH_TIMEOUT_HEADROOM * self.predicted_latency_s(text_bytes))
+
+    def observe(self, text_bytes: int, elapsed_ms: float) -> None:
+        """Fold one successful request's latency into the estimate."""
+        if text_bytes <= 0:
+            return
+        sample = elapsed_ms / (text_bytes / 1024.0)
+        with self._lock:
+            if self.observations == 0:
+                self.ms_per_kb = sample
+            else:
+                self.ms_per_kb += self.smoothing * (sample - self.ms_per_kb)
+            self.observations += 1
+
+
+# One sizer per service URL for the whole process, so what one book's
+# requests learned carries over to the next book's client
+_SHARED_BATCH_SIZERS: dict[str, AdaptiveBatchSizer] = {}
+_SHARED_BATCH_SIZERS_LOCK = threading.Lock()
+
+
+def shared_batch_sizer(base_url: str = DEFAULT_BASE_URL) -> AdaptiveBatchSizer:
+    """Return the process-wide AdaptiveBatchSizer for base_url."""
+    with _SHARED_BATCH_SIZERS_LOCK:
+        sizer = _SHARED_BATCH_SIZERS.get(base_url)
+        if sizer is None:
+            sizer = AdaptiveBatchSizer()
+            _SHARED_BATCH_SIZERS[base_url] = sizer
+        return sizer
+
+
 # =============================================================================
 # Protocol (AC-3.1)
 # =============================================================================
@@ -241,6 +358,7 @@ class MetadataExtractionClient:
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        batch_sizer: AdaptiveBatchSizer | None = None,
     ) -> None:
         """Initialize client.
 
@@ -248,11 +366,15 @@ class MetadataExtractionClient:
             base_url: Base URL of orchestrator service.
             timeout: Request timeout in seconds.
             max_retries: Max retries for failed requests.
+            batch_sizer: Latency estimate for adaptive batches; pass
+                shared_batch_sizer(base_url) to keep it across clients.
         """
         self._base_url = base_url
         self._timeout = timeout
         self._max_retries = max_retries
         self._http_client: httpx.AsyncClient | None = None
+        # Learns per-KB latency across batch calls on this (pooled) client
+        self.batch_sizer = batch_sizer or AdaptiveBatchSizer()
 
     async def __aenter__(self) -> "MetadataExtractionClient":
         """Enter async context - create HTTP client."""
@@ -434,6 +556,7 @@ class MetadataExtractionClient:
         items: list[BatchTextItem],
         book_title: str | None = None,
         options: MetadataExtractionOptions | None = None,
+        timeout: float | None = None,
     ) -> BatchExtractionResult:
         """Extract metadata from multiple texts in a single request.
 
@@ -444,6 +567,7 @@ class MetadataExtractionClient:
             items: List of BatchTextItem to process.
             book_title: Optional book title (applies to all items).
             options: Extraction options (applies to all items).
+            timeout: Request timeout in seconds (default 30s + 5s per item).
 
         Returns:
             BatchExtractionResult with results for each item.
@@ -480,7 +604,7 @@ class MetadataExtractionClient:
 
         try:
             # Use longer timeout for batch requests (30s + 5s per item)
-            batch_timeout = 30.0 + (len(items) * 5.0)
+            batch_timeout = timeout if timeout is not None else 30.0 + (len(items) * 5.0)
             response = await self._http_client.post(
                 ENDPOINT_EXTRACT_BATCH,
                 json=payload,
@@ -520,6 +644,223 @@ class MetadataExtractionClient:
             total_processing_time_ms=data.get("total_processing_time_ms", 0.0),
         )
 
+    async def extract_metadata_batch_adaptive(
+        self,
+        items: list[BatchTextItem],
+        book_title: str | None = None,
+        options: MetadataExtractionOptions | None = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> BatchExtractionResult:
+        """Extract metadata in size-planned sub-batches sent concurrently.
+
+        Items are split by total text size (see AdaptiveBatchSizer) instead
+        of being sent as one request. Each sub-batch is sized when it is
+        sent, from the latency observed so far; with no observations yet,
+        the first sub-batch goes alone as a probe. A sub-batch that times
+        out or errors is bisected and each half retried, so one slow
+        chapter costs a few small requests rather than the whole book. A
+        single item that still fails is reported as a failed
+        BatchItemResult.
+
+        Args:
+            items: List of BatchTextItem to process.
+            book_title: Optional book title (applies to all items).
+            options: Extraction options (applies to all items).
+            max_concurrency: Maximum sub-batch requests in flight.
+
+        Returns:
+            BatchExtractionResult with one result per item, in input order.
+
+        Raises:
+            MetadataClientConnectionError: If the service is unreachable
+                (bisection cannot help, so the caller's fallback runs).
+        """
+        if not items:
+            return BatchExtractionResult()
+
+        workers = max(1, max_concurrency)
+        semaphore = asyncio.Semaphore(workers)
+        calibrated = asyncio.Event()
+        if self.batch_sizer.observations:
+            calibrated.set()
+        next_start = 0
+        sub_results: list[BatchExtractionResult] = []
+
+        async def send_batches(is_probe: bool) -> None:
+            nonlocal next_start
+            if not is_probe:
+                await calibrated.wait()
+            while next_start < len(items):
+                start = next_start
+                next_start = _next_batch_end(items, start, self.batch_sizer.target_batch_bytes())
+                try:
+                    sub_results.append(await self._extract_sub_batch(
+                        items[start:next_start], book_title, options, semaphore
+                    ))
+                except BaseException:
+                    next_start = len(items)  # stop the other workers too
+                    raise
+                finally:
+                    calibrated.set()
+
+        await asyncio.gather(*(send_batches(i == 0) for i in range(workers)))
+
+        by_id = {r.id: r for sub in sub_results for r in sub.results}
+        results = [
+            by_id.get(item.id) or BatchItemResult(id=item.id, success=False, error="missing from response")
+            for item in items
+        ]
+        successful = sum(1 for r in results if r.success)
+        return BatchExtractionResult(
+            results=results,
+            total_items=len(results),
+            successful=successful,
+            failed=len(results) - successful,
+            total_processing_time_ms=sum(sub.total_processing_time_ms for sub in sub_results),
+        )
+
+    async def _extract_sub_batch(
+        self,
+        batch: list[BatchTextItem],
+        book_title: str | None,
+        options: MetadataExtractionOptions | None,
+        semaphore: asyncio.Semaphore,
+    ) -> BatchExtractionResult:
+        """Send one sub-batch, bisecting on timeout/API errors."""
+        text_bytes = sum(_text_bytes(item) for item in batch)
+        try:
+            async with semaphore:
+                start = time.perf_counter()
+                result = await self.extract_metadata_batch(
+                    batch,
+                    book_title=book_title,
+                    options=options,
+                    timeout=self.batch_sizer.timeout_for(text_bytes),
+                )
+                self.batch_sizer.observe(text_bytes, (time.perf_counter() - start) * 1000.0)
+            return result
+        except MetadataClientConnectionError:
+            raise
+        except MetadataClientError as e:
+            if len(batch) == 1:
+                return BatchExtractionResult(
+                    results=[BatchItemResult(id=batch[0].id, success=False, error=str(e))],
+                    total_items=1,
+                    failed=1,
+                )
+            mid = len(batch) // 2
+            halves = await asyncio.gather(
+                self._extract_sub_batch(batch[:mid], book_title, options, semaphore),
+                self._extract_sub_batch(batch[mid:], book_title, options, semaphore),
+            )
+            return BatchExtractionResult(
+                results=[r for half in halves for r in half.results],
+                total_items=len(batch),
+                successful=sum(h.successful for h in halves),
+                failed=sum(h.failed for h in halves),
+                total_processing_time_ms=sum(h.total_processing_time_ms for h in halves),
+            )
+
+
+# =============================================================================
+# SyncMetadataExtractionClient (sync facade over one pooled client)
+# =============================================================================
+
+
+class SyncMetadataExtractionClient:
+    """Synchronous facade over one long-lived MetadataExtractionClient.
+
+    Sync callers previously ran ``asyncio.run()`` per chapter, paying for a
+    new event loop and a new httpx connection pool on every call. This
+    facade keeps one background loop and one pooled client for the whole
+    run, so per-chapter overhead is a single HTTP request.
+
+    Example:
+        with SyncMetadataExtractionClient(base_url=url) as client:
+            result = client.extract_metadata(text, title="Chapter 1")
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        client_factory: Callable[[], Any] | None = None,
+    ) -> None:
+        """Initialize facade (client and loop start on first call).
+
+        Args:
+            base_url: Base URL of orchestrator service.
+            timeout: Request timeout in seconds.
+            max_retries: Max retries for failed requests.
+            client_factory: Override for building the async client
+                (defaults to MetadataExtractionClient with the args above).
+        """
+        factory = client_factory or (
+            lambda: MetadataExtractionClient(
+                base_url=base_url, timeout=timeout, max_retries=max_retries
+            )
+        )
+        self._pool: PooledAsyncClient[Any] = PooledAsyncClient(factory)
+
+    def extract_metadata(
+        self,
+        text: str,
+        title: str | None = None,
+        book_title: str | None = None,
+        options: MetadataExtractionOptions | None = None,
+    ) -> MetadataExtractionResult:
+        """Extract metadata from text via the pooled client."""
+        return self._pool.call(
+            lambda client: client.extract_metadata(text, title, book_title, options)
+        )
+
+    def extract_metadata_batch(
+        self,
+        items: list[BatchTextItem],
+        book_title: str | None = None,
+        options: MetadataExtractionOptions | None = None,
+    ) -> BatchExtractionResult:
+        """Extract metadata for multiple texts via the pooled client."""
+        return self._pool.call(
+            lambda client: client.extract_metadata_batch(
+                items=items, book_title=book_title, options=options
+            )
+        )
+
+    def extract_metadata_batch_adaptive(
+        self,
+        items: list[BatchTextItem],
+        book_title: str | None = None,
+        options: MetadataExtractionOptions | None = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> BatchExtractionResult:
+        """Size-planned concurrent batch extraction via the pooled client."""
+        return self._pool.call(
+            lambda client: client.extract_metadata_batch_adaptive(
+                items=items,
+                book_title=book_title,
+                options=options,
+                max_concurrency=max_concurrency,
+            )
+        )
+
+    def health_check(self) -> bool:
+        """Check orchestrator health via the pooled client."""
+        return self._pool.call(lambda client: client.health_check())
+
+    def close(self) -> None:
+        """Close the pooled client and stop its event loop."""
+        self._pool.close()
+
+    def __enter__(self) -> "SyncMetadataExtractionClient":
+        """Enter context."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Exit context - close pooled client."""
+        self.close()
+
 
 # =============================================================================
 # FakeMetadataExtractionClient (AC-4)
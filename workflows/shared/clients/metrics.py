@@ -279,6 +279,25 @@ def create_span(
 # =============================================================================
 
 
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a list of observations.
+
+    Args:
+        values: Observations (need not be sorted)
+        pct: Percentile in the range 0-100
+
+    Returns:
+        The smallest observation with at least pct% of values at or below it,
+        or 0.0 for an empty list
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))  # ceil without float rounding
+    return ordered[min(int(rank), len(ordered)) - 1]
+
+
 @dataclass
 class TimerContext:
     """Context for timed operations."""
@@ -380,19 +399,25 @@ class PerformanceLogger:
             operation: Operation name
 
         Returns:
-            Dict with count, avg_ms, min_ms, max_ms
+            Dict with count, avg_ms, min_ms, max_ms, p50_ms, p90_ms, p99_ms
         """
         with self._lock:
-            timings = self._timings.get(operation, [])
+            timings = list(self._timings.get(operation, []))
 
         if not timings:
-            return {"count": 0, "avg_ms": 0, "min_ms": 0, "max_ms": 0}
+            return {
+                "count": 0, "avg_ms": 0, "min_ms": 0, "max_ms": 0,
+                "p50_ms": 0, "p90_ms": 0, "p99_ms": 0,
+            }
 
         return {
             "count": len(timings),
             "avg_ms": sum(timings) / len(timings),
             "min_ms": min(timings),
             "max_ms": max(timings),
+            "p50_ms": percentile(timings, 50),
+            "p90_ms": percentile(timings, 90),
+            "p99_ms": percentile(timings, 99),
         }
 
     def reset(self) -> None:
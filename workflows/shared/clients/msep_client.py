@@ -43,13 +43,22 @@ Usage:
 
 from __future__ import annotations
 
-import asyncio
 import os
 from dataclasses import dataclass, field
 from typing import Any, Optional, Protocol, runtime_checkable
 
 import httpx
 
+from workflows.shared.retry import (
+    DEFAULT_RETRY_DEADLINE,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryConfig,
+    RetryExhaustedError,
+    retry_after_from_response,
+    retry_call_async,
+)
+
 
 # =============================================================================
 # Constants - SonarQube S1192
@@ -62,6 +71,7 @@ _DEFAULT_TIMEOUT = 30.0
 _DEFAULT_MAX_CONNECTIONS = 10
 _DEFAULT_MAX_RETRIES = 3
 _DEFAULT_RETRY_DELAY = 1.0
+_DEFAULT_MAX_RETRY_DELAY = 30.0
 
 
 # =============================================================================
@@ -115,6 +125,7 @@ class MSEPAPIError(MSEPClientError):
     Attributes:
         status_code: HTTP status code from the response.
         response_body: Parsed JSON response body if available.
+        retry_after: Server Retry-After hint in seconds, if sent.
     """
 
     def __init__(
@@ -122,10 +133,12 @@ class MSEPAPIError(MSEPClientError):
         message: str,
         status_code: int,
         response_body: Optional[dict[str, Any]] = None,
+        retry_after: Optional[float] = None,
     ) -> None:
         super().__init__(message, status_code)
         self.status_code = status_code
         self.response_body = response_body
+        self.retry_after = retry_after
 
 
 # =============================================================================
@@ -367,6 +380,7 @@ class MSEPClientProtocol(Protocol):
         corpus: list[str],
         chapter_index: list[ChapterMeta],
         config: Optional[MSEPConfig] = None,
+        corpus_id: Optional[str] = None,
     ) -> EnrichedMetadataResponse:
         """Enrich chapter metadata via ai-agents MSEP endpoint."""
         ...
@@ -433,6 +447,8 @@ class MSEPClient:
         max_connections: int = _DEFAULT_MAX_CONNECTIONS,
         max_retries: int = _DEFAULT_MAX_RETRIES,
         retry_delay: float = _DEFAULT_RETRY_DELAY,
+        retry_deadline: Optional[float] = DEFAULT_RETRY_DEADLINE,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ) -> None:
         """Initialize MSEP client.
 
@@ -442,13 +458,18 @@ class MSEPClient:
             timeout: Request timeout in seconds.
             max_connections: Maximum concurrent connections.
             max_retries: Maximum retry attempts for retryable errors.
-            retry_delay: Base delay between retries (exponential backoff).
+            retry_delay: Base delay between retries (decorrelated jitter).
+            retry_deadline: Total seconds one request may spend retrying.
+                Default DEFAULT_RETRY_DEADLINE; None = no budget.
+            circuit_breaker: Breaker to share across clients; one per client by default.
         """
         self.base_url: str = base_url or os.getenv("MSEP_BASE_URL") or _DEFAULT_BASE_URL
         self.timeout = timeout
         self.max_connections = max_connections
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.retry_deadline = retry_deadline
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(name=self.base_url)
         self._client: Optional[httpx.AsyncClient] = None
 
     async def __aenter__(self) -> "MSEPClient":
@@ -490,6 +511,7 @@ class MSEPClient:
         corpus: list[str],
         chapter_index: list[ChapterMeta],
         config: Optional[MSEPConfig] = None,
+        corpus_id: Optional[str] = None,
     ) -> EnrichedMetadataResponse:
         """Enrich chapter metadata via Gateway -> ai-agents MSEP endpoint.
 
@@ -505,6 +527,9 @@ class MSEPClient:
             corpus: List of document/chapter text content.
             chapter_index: List of ChapterMeta with book, chapter, title, id.
             config: Optional MSEPConfig for enrichment parameters.
+            corpus_id: Optional shared corpus context id. Sharded callers send
+                the same id with every chapter batch of a book so ai-agents
+                can resolve cross-references against the whole corpus.
 
         Returns:
             EnrichedMetadataResponse with chapter metadata.
@@ -532,6 +557,10 @@ class MSEPClient:
         if config is not None:
             tool_arguments["config"] = config.to_dict()
 
+        # Add shared corpus context if provided (sharded enrichment)
+        if corpus_id is not None:
+            tool_arguments["corpus_id"] = corpus_id
+
         # Gateway tool execute format: {"name": "tool_name", "arguments": {...}}
         gateway_payload: dict[str, Any] = {
             "name": "enrich_metadata",
@@ -552,75 +581,73 @@ class MSEPClient:
         result_data = response_data.get("result", {})
         return EnrichedMetadataResponse.from_dict(result_data)
 
-    def _handle_http_error(
-        self, e: httpx.HTTPStatusError, attempt: int, endpoint: str
-    ) -> bool:
-        """Handle HTTP status error, return True if should retry."""
-        status_code = e.response.status_code
-        
-        if status_code in self.RETRYABLE_STATUS_CODES and attempt < self.max_retries:
-            return True
-        
-        response_body = self._safe_parse_json(e.response)
-        raise MSEPAPIError(
-            f"MSEP API error on {endpoint}: {status_code}",
-            status_code=status_code,
-            response_body=response_body,
-        ) from e
-
     async def _execute_single_request(
         self, endpoint: str, json_data: dict[str, Any]
-    ) -> dict[str, Any] | None:
-        """Execute a single request, return None if retryable error occurred."""
-        response = await self._client.post(endpoint, json=json_data)
-        response.raise_for_status()
-        return response.json()  # type: ignore[no-any-return]
-
-    def _handle_timeout(self, e: httpx.TimeoutException, attempt: int, endpoint: str) -> None:
-        """Handle timeout, raise if max retries exceeded."""
-        if attempt >= self.max_retries:
-            raise MSEPTimeoutError(
-                f"Request to {endpoint} timed out after {self.max_retries + 1} attempts"
+    ) -> dict[str, Any]:
+        """Execute a single request, mapping httpx failures to MSEP errors."""
+        try:
+            response = await self._client.post(endpoint, json=json_data)  # type: ignore[union-attr]
+            response.raise_for_status()
+            return response.json()  # type: ignore[no-any-return]
+        except httpx.TimeoutException as e:
+            raise MSEPTimeoutError(f"Request to {endpoint} timed out") from e
+        except httpx.ConnectError as e:
+            raise MSEPConnectionError(f"Connection to {self.base_url} failed") from e
+        except httpx.HTTPStatusError as e:
+            raise MSEPAPIError(
+                f"MSEP API error on {endpoint}: {e.response.status_code}",
+                status_code=e.response.status_code,
+                response_body=self._safe_parse_json(e.response),
+                retry_after=retry_after_from_response(e.response),
             ) from e
 
-    def _handle_connect_error(self, e: httpx.ConnectError, attempt: int) -> None:
-        """Handle connection error, raise if max retries exceeded."""
-        if attempt >= self.max_retries:
-            raise MSEPConnectionError(
-                f"Connection to {self.base_url} failed after {self.max_retries + 1} attempts"
-            ) from e
+    def _is_retryable_error(self, error: Exception) -> bool:
+        """Timeouts, connection failures and retryable statuses are transient."""
+        if isinstance(error, MSEPAPIError):
+            return error.status_code in self.RETRYABLE_STATUS_CODES
+        return isinstance(error, (MSEPTimeoutError, MSEPConnectionError))
+
+    def _exhausted_error(self, error: Exception, attempts: int, endpoint: str) -> Exception:
+        """Final error once retries are spent (attempt count in the message)."""
+        if isinstance(error, MSEPTimeoutError):
+            return MSEPTimeoutError(f"Request to {endpoint} timed out after {attempts} attempts")
+        if isinstance(error, MSEPConnectionError):
+            return MSEPConnectionError(
+                f"Connection to {self.base_url} failed after {attempts} attempts"
+            )
+        return error
 
     async def _post(
         self,
         endpoint: str,
         json: dict[str, Any],
     ) -> dict[str, Any]:
-        """Execute POST request with retry logic."""
+        """Execute POST request with retry logic (workflows.shared.retry)."""
         if self._client is None:
             raise MSEPClientError(_CLIENT_NOT_INITIALIZED_ERROR)
 
-        for attempt in range(self.max_retries + 1):
-            try:
-                return await self._execute_single_request(endpoint, json)
-            except httpx.TimeoutException as e:
-                self._handle_timeout(e, attempt, endpoint)
-            except httpx.ConnectError as e:
-                self._handle_connect_error(e, attempt)
-            except httpx.HTTPStatusError as e:
-                self._handle_http_error(e, attempt, endpoint)
-
-            await self._wait_before_retry(attempt)
-
-        raise MSEPClientError(f"Request failed after {self.max_retries + 1} attempts")
+        config = RetryConfig(
+            max_attempts=self.max_retries + 1,
+            initial_delay=self.retry_delay,
+            max_delay=max(_DEFAULT_MAX_RETRY_DELAY, self.retry_delay),
+            deadline=self.retry_deadline,
+        )
 
-    async def _wait_before_retry(self, attempt: int) -> None:
-        """Wait with exponential backoff before retry.
+        async def _attempt(_attempt: int) -> dict[str, Any]:
+            return await self._execute_single_request(endpoint, json)
 
-        Args:
-            attempt: Current attempt number (0-indexed).
-        """
-        delay = self.retry_delay * (2**attempt)
-        await asyncio.sleep(delay)
+        try:
+            return await retry_call_async(
+                _attempt,
+                config=config,
+                retry_on=(MSEPClientError,),
+                is_retryable=self._is_retryable_error,
+                breaker=self.circuit_breaker,
+            )
+        except RetryExhaustedError as e:
+            raise self._exhausted_error(e.last_error, e.attempts, endpoint) from e.last_error
+        except CircuitOpenError as e:
+            raise MSEPConnectionError(str(e)) from e
 
     def _safe_parse_json(self, response: httpx.Response) -> Optional[dict[str, Any]]:
         """Safely parse JSON response body.
@@ -28,12 +28,21 @@ Usage:
 
 from __future__ import annotations
 
-import asyncio
 import os
 from typing import TYPE_CHECKING, Any, Optional, Protocol, runtime_checkable
 
 import httpx
 
+from workflows.shared.retry import (
+    DEFAULT_RETRY_DEADLINE,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryConfig,
+    RetryExhaustedError,
+    retry_after_from_response,
+    retry_call_async,
+)
+
 if TYPE_CHECKING:
     from workflows.shared.clients.cache import ResultCache
     from workflows.shared.clients.metrics import MetricsCollector, PerformanceLogger
@@ -44,6 +53,7 @@ if TYPE_CHECKING:
 # =============================================================================
 
 _CLIENT_NOT_INITIALIZED_ERROR = "Client not initialized. Use async context manager."
+_DEFAULT_MAX_RETRY_DELAY = 30.0
 _DEFAULT_SEARCH_ENDPOINT = "/v1/search"
 
 # WBS 5.1.4: Semantic similarity threshold (down from 0.7 TF-IDF to 0.3 semantic)
@@ -91,11 +101,16 @@ class OrchestratorAPIError(OrchestratorClientError):
     """Raised when orchestrator service returns an error response."""
 
     def __init__(
-        self, message: str, status_code: int, response_body: Optional[dict] = None
+        self,
+        message: str,
+        status_code: int,
+        response_body: Optional[dict] = None,
+        retry_after: Optional[float] = None,
     ):
         super().__init__(message)
         self.status_code = status_code
         self.response_body = response_body
+        self.retry_after = retry_after
 
 
 # =============================================================================
@@ -178,6 +193,8 @@ class OrchestratorClient:
         max_connections: int = 10,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        retry_deadline: Optional[float] = DEFAULT_RETRY_DEADLINE,
+        circuit_breaker: Optional[CircuitBreaker] = None,
         cache: Optional["ResultCache"] = None,
         metrics: Optional["MetricsCollector"] = None,
         perf_logger: Optional["PerformanceLogger"] = None,
@@ -191,6 +208,9 @@ class OrchestratorClient:
             max_connections: Max connections in pool. Default 10.
             max_retries: Maximum retry attempts for transient failures. Default 3.
             retry_delay: Base delay between retries in seconds. Default 1.0.
+            retry_deadline: Total seconds one request may spend retrying.
+                Default DEFAULT_RETRY_DEADLINE; None = no budget.
+            circuit_breaker: Breaker to share across clients; one per client by default.
             cache: Optional ResultCache for caching search results (WBS 6.1.2).
             metrics: Optional MetricsCollector for observability (WBS 6.2.1).
             perf_logger: Optional PerformanceLogger for timing logs (WBS 6.2.3).
@@ -210,6 +230,8 @@ class OrchestratorClient:
         self.max_connections: int = max_connections
         self.max_retries: int = max_retries
         self.retry_delay: float = retry_delay
+        self.retry_deadline: Optional[float] = retry_deadline
+        self.circuit_breaker: CircuitBreaker = circuit_breaker or CircuitBreaker(name=self.base_url)
 
         # WBS 6.1/6.2: Observability components
         self.cache = cache
@@ -403,6 +425,7 @@ class OrchestratorClient:
             f"Orchestrator service error: {response.status_code}",
             status_code=response.status_code,
             response_body=error_body,
+            retry_after=retry_after_from_response(response),
         )
 
     def _wrap_exception(self, e: Exception) -> Exception:
@@ -419,21 +442,29 @@ class OrchestratorClient:
         method: str,
         endpoint: str,
         json_data: Optional[dict],
-    ) -> Optional[dict]:
-        """Attempt a single request, return response or None if retryable."""
-        response = await client.request(
-            method=method,
-            url=endpoint,
-            json=json_data,
-        )
+    ) -> dict:
+        """Attempt a single request; non-API failures are wrapped in OrchestratorClientError types."""
+        try:
+            response = await client.request(
+                method=method,
+                url=endpoint,
+                json=json_data,
+            )
 
-        if self._is_retryable_status(response.status_code):
-            return None
+            if response.status_code >= 400:
+                self._handle_error_response(response)
 
-        if response.status_code >= 400:
-            self._handle_error_response(response)
+            return response.json()
+        except OrchestratorAPIError:
+            raise
+        except Exception as e:
+            raise self._wrap_exception(e) from e
 
-        return response.json()
+    def _is_retryable_error(self, error: Exception) -> bool:
+        """Transport errors and retryable statuses are transient; other API errors are not."""
+        if isinstance(error, OrchestratorAPIError):
+            return self._is_retryable_status(error.status_code)
+        return True
 
     async def _request_with_retry(
         self,
@@ -442,30 +473,33 @@ class OrchestratorClient:
         json_data: Optional[dict] = None,
     ) -> dict:
         """
-        Make HTTP request with exponential backoff retry logic.
+        Make HTTP request with jittered backoff retry logic (workflows.shared.retry).
 
         WBS 5.1.2: Retry logic for transient failures (503, 429, 502, 504).
         """
         client = self._ensure_client()
-        last_exception: Optional[Exception] = None
-
-        for attempt in range(self.max_retries):
-            try:
-                result = await self._attempt_request(client, method, endpoint, json_data)
-                if result is not None:
-                    return result
-            except OrchestratorAPIError:
-                raise
-            except Exception as e:
-                last_exception = self._wrap_exception(e)
-
-            if attempt < self.max_retries - 1:
-                delay = self.retry_delay * (2**attempt)
-                await asyncio.sleep(delay)
-
-        if last_exception is not None:
-            raise last_exception
-        raise OrchestratorClientError("Request failed after all retries")
+        config = RetryConfig(
+            max_attempts=self.max_retries,
+            initial_delay=self.retry_delay,
+            max_delay=max(_DEFAULT_MAX_RETRY_DELAY, self.retry_delay),
+            deadline=self.retry_deadline,
+        )
+
+        async def _attempt(_attempt: int) -> dict:
+            return await self._attempt_request(client, method, endpoint, json_data)
+
+        try:
+            return await retry_call_async(
+                _attempt,
+                config=config,
+                retry_on=(OrchestratorClientError,),
+                is_retryable=self._is_retryable_error,
+                breaker=self.circuit_breaker,
+            )
+        except RetryExhaustedError as e:
+            raise e.last_error from None
+        except CircuitOpenError as e:
+            raise OrchestratorConnectionError(str(e)) from e
 
 
 # =============================================================================
@@ -29,18 +29,28 @@ Usage:
         )
 """
 
-import asyncio
 import os
 from typing import Any, Optional
 
 import httpx
 
+from workflows.shared.retry import (
+    DEFAULT_RETRY_DEADLINE,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryConfig,
+    RetryExhaustedError,
+    retry_after_from_response,
+    retry_call_async,
+)
+
 
 # =============================================================================
 # Constants - SonarQube S1192: Extract duplicated literals
 # =============================================================================
 
 _CLIENT_NOT_INITIALIZED_ERROR = "Client not initialized. Use async context manager."
+_DEFAULT_MAX_RETRY_DELAY = 30.0
 _DEFAULT_COLLECTION = "chapters"
 
 
@@ -75,10 +85,17 @@ class SearchConnectionError(SearchError):
 class SearchAPIError(SearchError):
     """Raised when search service returns an error response."""
 
-    def __init__(self, message: str, status_code: int, response_body: Optional[dict] = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: int,
+        response_body: Optional[dict] = None,
+        retry_after: Optional[float] = None,
+    ):
         super().__init__(message)
         self.status_code = status_code
         self.response_body = response_body
+        self.retry_after = retry_after
 
 
 # =============================================================================
@@ -119,6 +136,8 @@ class SemanticSearchClient:
         max_connections: int = 10,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        retry_deadline: Optional[float] = DEFAULT_RETRY_DEADLINE,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ) -> None:
         """
         Initialize Semantic Search client.
@@ -129,6 +148,9 @@ class SemanticSearchClient:
             max_connections: Max connections in pool. Default 10.
             max_retries: Maximum retry attempts for transient failures. Default 3.
             retry_delay: Base delay between retries in seconds. Default 1.0.
+            retry_deadline: Total seconds one request may spend retrying.
+                Default DEFAULT_RETRY_DEADLINE; None = no budget.
+            circuit_breaker: Breaker to share across clients; one per client by default.
 
         Pattern: Environment variable configuration with sensible defaults
         Reference: CODING_PATTERNS §2.3 (exponential backoff pattern)
@@ -139,6 +161,8 @@ class SemanticSearchClient:
         self.max_connections: int = max_connections
         self.max_retries: int = max_retries
         self.retry_delay: float = retry_delay
+        self.retry_deadline: Optional[float] = retry_deadline
+        self.circuit_breaker: CircuitBreaker = circuit_breaker or CircuitBreaker(name=self.base_url)
 
         # Lazy initialization - client created in __aenter__
         # Pattern: Avoid creating httpx.AsyncClient per request (CODING_PATTERNS line 67)
@@ -210,6 +234,7 @@ class SemanticSearchClient:
             f"Search service error: {response.status_code}",
             status_code=response.status_code,
             response_body=error_body,
+            retry_after=retry_after_from_response(response),
         )
 
     def _wrap_exception(self, e: Exception) -> Exception:
@@ -226,21 +251,29 @@ class SemanticSearchClient:
         method: str,
         endpoint: str,
         json_data: Optional[dict],
-    ) -> Optional[dict]:
-        """Attempt a single request, return response or None if retryable."""
-        response = await client.request(
-            method=method,
-            url=endpoint,
-            json=json_data,
-        )
-
-        if self._is_retryable_status(response.status_code):
-            return None
-
-        if response.status_code >= 400:
-            self._handle_error_response(response)
-
-        return response.json()
+    ) -> dict:
+        """Attempt a single request; non-API failures are wrapped in SearchError types."""
+        try:
+            response = await client.request(
+                method=method,
+                url=endpoint,
+                json=json_data,
+            )
+
+            if response.status_code >= 400:
+                self._handle_error_response(response)
+
+            return response.json()
+        except SearchAPIError:
+            raise
+        except Exception as e:
+            raise self._wrap_exception(e) from e
+
+    def _is_retryable_error(self, error: Exception) -> bool:
+        """Transport errors and retryable statuses are transient; other API errors are not."""
+        if isinstance(error, SearchAPIError):
+            return self._is_retryable_status(error.status_code)
+        return True
 
     async def _request_with_retry(
         self,
@@ -249,7 +282,7 @@ class SemanticSearchClient:
         json_data: Optional[dict] = None,
     ) -> dict:
         """
-        Make HTTP request with exponential backoff retry logic.
+        Make HTTP request with jittered backoff retry logic (workflows.shared.retry).
 
         Args:
             method: HTTP method (GET, POST, etc.)
@@ -265,25 +298,28 @@ class SemanticSearchClient:
             SearchAPIError: If service returns an error response
         """
         client = self._ensure_client()
-        last_exception: Optional[Exception] = None
-
-        for attempt in range(self.max_retries):
-            try:
-                result = await self._attempt_request(client, method, endpoint, json_data)
-                if result is not None:
-                    return result
-            except SearchAPIError:
-                raise
-            except Exception as e:
-                last_exception = self._wrap_exception(e)
-
-            if attempt < self.max_retries - 1:
-                delay = self.retry_delay * (2 ** attempt)
-                await asyncio.sleep(delay)
-
-        if last_exception is not None:
-            raise last_exception
-        raise SearchError("Request failed after all retries")
+        config = RetryConfig(
+            max_attempts=self.max_retries,
+            initial_delay=self.retry_delay,
+            max_delay=max(_DEFAULT_MAX_RETRY_DELAY, self.retry_delay),
+            deadline=self.retry_deadline,
+        )
+
+        async def _attempt(_attempt: int) -> dict:
+            return await self._attempt_request(client, method, endpoint, json_data)
+
+        try:
+            return await retry_call_async(
+                _attempt,
+                config=config,
+                retry_on=(SearchError,),
+                is_retryable=self._is_retryable_error,
+                breaker=self.circuit_breaker,
+            )
+        except RetryExhaustedError as e:
+            raise e.last_error from None
+        except CircuitOpenError as e:
+            raise SearchConnectionError(str(e)) from e
 
     # =========================================================================
     # Embed - WBS 3.2.3.3
@@ -0,0 +1,282 @@
+"""Sync Bridge - long-lived event loop for synchronous callers.
+
+Synchronous entry points (per-chapter enrichment helpers, generator methods)
+used to wrap every async client call in ``asyncio.run()``. Each call created
+and tore down an event loop *and* the client's httpx connection pool, so
+TCP/TLS setup was paid per chapter and connections were never reused.
+
+- BackgroundEventLoop: one event loop on a daemon thread for the whole run
+- PooledAsyncClient: one async-context-managed client entered on that loop,
+  dispatched to from sync code with ``call()`` or from other event loops
+  with ``call_async()``
+
+Anti-Patterns Avoided:
+- Anti-Pattern #12: httpx.AsyncClient created once and reused
+- Anti-Pattern #7/#13: Exception classes end in "Error"
+- Nested asyncio.run() from sync code
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Callable, Coroutine, Final, Generic, TypeVar
+
+
+# =============================================================================
+# Module Constants (S1192 compliance)
+# =============================================================================
+
+DEFAULT_THREAD_NAME: Final[str] = "sync-bridge-loop"
+DEFAULT_SHUTDOWN_TIMEOUT: Final[float] = 5.0
+
+_LOOP_CLOSED_ERROR: Final[str] = "Background event loop is closed."
+_REENTRANT_CALL_ERROR: Final[str] = (
+    "Sync bridge called from its own event loop; await the coroutine instead."
+)
+
+T = TypeVar("T")
+C = TypeVar("C")
+
+
+class SyncBridgeError(RuntimeError):
+    """Raised when the bridge is used after close() or re-entered from its loop."""
+
+    pass
+
+
+# =============================================================================
+# BackgroundEventLoop
+# =============================================================================
+
+
+class BackgroundEventLoop:
+    """Event loop running on a daemon thread, started on first use.
+
+    Sync code submits coroutines with ``run()`` and blocks for the result;
+    the loop (and anything bound to it, such as an httpx connection pool)
+    survives between calls until ``close()``.
+    """
+
+    def __init__(self, name: str = DEFAULT_THREAD_NAME) -> None:
+        """Initialize without starting the thread.
+
+        Args:
+            name: Thread name (visible in thread dumps).
+        """
+        self._name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def is_running(self) -> bool:
+        """True once the loop thread has started and until close()."""
+        return self._thread is not None and self._thread.is_alive() and not self._closed
+
+    @property
+    def closed(self) -> bool:
+        """True after close()."""
+        return self._closed
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """Start the loop thread on first use."""
+        with self._lock:
+            if self._closed:
+                raise SyncBridgeError(_LOOP_CLOSED_ERROR)
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._run_forever,
+                    args=(loop,),
+                    name=self._name,
+                    daemon=True,
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    @staticmethod
+    def _run_forever(loop: asyncio.AbstractEventLoop) -> None:
+        """Thread target: bind the loop to this thread and run it."""
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    def run(
+        self,
+        coro: Coroutine[Any, Any, T],
+        timeout: float | None = None,
+    ) -> T:
+        """Run a coroutine on the background loop and wait for its result.
+
+        Args:
+            coro: Coroutine to execute.
+            timeout: Seconds to wait before cancelling (None = no limit).
+
+        Returns:
+            The coroutine's return value; its exception is re-raised as-is.
+
+        Raises:
+            SyncBridgeError: If closed, or called from the loop thread itself.
+            concurrent.futures.TimeoutError: If ``timeout`` elapses.
+        """
+        try:
+            loop = self._ensure_started()
+            if threading.current_thread() is self._thread:
+                raise SyncBridgeError(_REENTRANT_CALL_ERROR)
+        except SyncBridgeError:
+            coro.close()
+            raise
+
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    async def run_async(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Await a coroutine on the background loop from another event loop.
+
+        Lets async callers share resources bound to the background loop
+        (e.g. a pooled httpx client) without blocking their own loop.
+        """
+        try:
+            loop = self._ensure_started()
+        except SyncBridgeError:
+            coro.close()
+            raise
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    def close(self, timeout: float = DEFAULT_SHUTDOWN_TIMEOUT) -> None:
+        """Stop the loop and join its thread. Safe to call more than once."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+
+        if loop is None or thread is None:
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+    def __enter__(self) -> "BackgroundEventLoop":
+        """Enter context (loop starts lazily on first run())."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Exit context - stop the loop."""
+        self.close()
+
+
+# =============================================================================
+# PooledAsyncClient
+# =============================================================================
+
+
+class PooledAsyncClient(Generic[C]):
+    """One async client, entered once on a BackgroundEventLoop, shared by sync callers.
+
+    The client is created from ``factory`` and entered (``__aenter__``) on
+    first ``call()``; it is exited on ``close()``. Every call in between
+    reuses the same connection pool.
+
+    Example:
+        pool = PooledAsyncClient(lambda: MetadataExtractionClient(base_url=url))
+        result = pool.call(lambda client: client.extract_metadata(text))
+        pool.close()
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        loop: BackgroundEventLoop | None = None,
+    ) -> None:
+        """Initialize without creating the client.
+
+        Args:
+            factory: Zero-arg callable returning an async context manager
+                whose ``__aenter__`` yields the client.
+            loop: Shared loop to run on; a private one is created (and
+                closed with this pool) when omitted.
+        """
+        self._factory = factory
+        self._loop = loop or BackgroundEventLoop()
+        self._owns_loop = loop is None
+        self._manager: Any = None
+        self._client: C | None = None
+        self._open_lock: asyncio.Lock | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """True while the underlying client is entered."""
+        return self._client is not None
+
+    async def _ensure_client(self) -> C:
+        """Create and enter the client once (runs on the loop thread)."""
+        if self._client is not None:
+            return self._client
+        if self._open_lock is None:
+            self._open_lock = asyncio.Lock()
+        async with self._open_lock:
+            if self._client is None:
+                manager = self._factory()
+                self._client = await manager.__aenter__()
+                self._manager = manager
+        return self._client
+
+    async def _invoke(self, fn: Callable[[C], Coroutine[Any, Any, T]]) -> T:
+        """Resolve the pooled client and await ``fn(client)``."""
+        client = await self._ensure_client()
+        return await fn(client)
+
+    def call(
+        self,
+        fn: Callable[[C], Coroutine[Any, Any, T]],
+        timeout: float | None = None,
+    ) -> T:
+        """Run ``fn(client)`` on the background loop and return its result.
+
+        Args:
+            fn: Callable taking the pooled client and returning a coroutine.
+            timeout: Seconds to wait for the result (None = no limit).
+
+        Returns:
+            Result of the awaited coroutine.
+        """
+        return self._loop.run(self._invoke(fn), timeout)
+
+    async def call_async(self, fn: Callable[[C], Coroutine[Any, Any, T]]) -> T:
+        """Await ``fn(client)`` on the background loop from any event loop."""
+        return await self._loop.run_async(self._invoke(fn))
+
+    async def _aclose(self) -> None:
+        """Exit the client's async context (runs on the loop thread)."""
+        manager, self._manager, self._client = self._manager, None, None
+        if manager is not None:
+            await manager.__aexit__(None, None, None)
+
+    def close(self) -> None:
+        """Exit the pooled client and, if owned, stop the loop."""
+        try:
+            if self._manager is not None and not self._loop.closed:
+                self._loop.run(self._aclose())
+        finally:
+            if self._owns_loop:
+                self._loop.close()
+
+    def __enter__(self) -> "PooledAsyncClient[C]":
+        """Enter context (client opens lazily on first call())."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Exit context - close client and loop."""
+        self.close()
@@ -0,0 +1,106 @@
+"""
+Deferred imports for heavy optional dependencies.
+
+Stage scripts used to import PyMuPDF, Tesseract, Unstructured, YAKE,
+Summa, NLTK, BERTopic and networkx at module import time, even for runs
+that never touch them. With one subprocess per book that import cost is
+paid on every run. Adapters now bind these names to a LazyModule proxy
+instead: the real import happens on first attribute access (or call),
+and availability flags are answered from the import system's finder
+without executing the package.
+
+Usage:
+    fitz = lazy_import("fitz")                      # module
+    summarizer = lazy_import("summa.summarizer")    # submodule
+    wordnet = lazy_import("nltk.corpus", "wordnet") # attribute of a module
+    OCR_AVAILABLE = module_available("pytesseract", "PIL")
+    ensure_loaded(fitz)                             # import now (e.g. in __init__)
+
+Call sites are unchanged (``fitz.open(...)``), and tests can still patch
+the module-level name.
+
+Pattern: Virtual Proxy / Lazy Initialization (Python Distilled Ch. 7)
+"""
+
+import importlib
+import importlib.util
+import threading
+from typing import Any, Optional
+
+
+def module_available(*names: str) -> bool:
+    """
+    True if every named top-level module can be imported.
+
+    Uses importlib.util.find_spec, so nothing is executed. A name mapped
+    to None in sys.modules (the usual way tests hide a module) counts as
+    unavailable.
+    """
+    for name in names:
+        try:
+            if importlib.util.find_spec(name) is None:
+                return False
+        except (ImportError, ValueError):
+            return False
+    return True
+
+
+class LazyModule:
+    """
+    Stand-in for a module, or an attribute of one, imported on first use.
+
+    Attribute access and calls are forwarded to the real object. Import
+    errors surface at first use, as they would have at import time.
+    """
+
+    def __init__(self, module_name: str, attribute: Optional[str] = None):
+        self._lazy_module_name = module_name
+        self._lazy_attribute = attribute
+        self._lazy_target: Any = None
+        self._lazy_lock = threading.Lock()
+
+    def _lazy_load(self) -> Any:
+        target = self._lazy_target
+        if target is None:
+            with self._lazy_lock:
+                if self._lazy_target is None:
+                    module = importlib.import_module(self._lazy_module_name)
+                    self._lazy_target = (
+                        getattr(module, self._lazy_attribute) if self._lazy_attribute else module
+                    )
+                target = self._lazy_target
+        return target
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names not set on the proxy itself
+        if name.startswith("_lazy_"):
+            raise AttributeError(name)
+        return getattr(self._lazy_load(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._lazy_load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        target = self._lazy_module_name
+        if self._lazy_attribute:
+            target = f"{target}.{self._lazy_attribute}"
+        state = "not loaded" if self._lazy_target is None else "loaded"
+        return f"<LazyModule {target} ({state})>"
+
+
+def lazy_import(module_name: str, attribute: Optional[str] = None) -> Any:
+    """Proxy for ``module_name`` (or ``module_name.attribute``), imported on first use."""
+    return LazyModule(module_name, attribute)
+
+
+def ensure_loaded(*proxies: Any) -> None:
+    """
+    Import the targets of lazy proxies now.
+
+    For objects that are about to use them anyway (e.g. in ``__init__``),
+    so the import cost is not charged to the first timed call. Non-proxy
+    arguments (None, real modules, test doubles) are ignored.
+    """
+    for proxy in proxies:
+        if isinstance(proxy, LazyModule):
+            proxy._lazy_load()
@@ -20,6 +20,7 @@ import json
 import sys
 import os
 import hashlib
+import threading
 from pathlib import Path
 from typing import Dict, List, Set, Any, Tuple, Optional
 from datetime import datetime
@@ -34,6 +35,7 @@ CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
 
 try:
     from workflows.llm_enhancement.scripts.cache.llm_cache import LLMCacheRepository, LLMResponse
+    from workflows.llm_enhancement.scripts.cache.response_store import ResponseStoreError
     if CACHE_ENABLED:
         LLM_CACHE = LLMCacheRepository(ttl_days=30)
         print("[llm_integration] ✓ LLM cache initialized (30-day TTL)", flush=True)
@@ -41,6 +43,8 @@ try:
         print("[llm_integration] ⚠ LLM cache disabled via LLM_CACHE_ENABLED=false", flush=True)
 except ImportError as e:
     print(f"[llm_integration] ⚠ LLM cache not available: {e}", flush=True)
+except ResponseStoreError as e:
+    print(f"[llm_integration] ⚠ LLM cache could not be opened: {e}", flush=True)
 
 # Load environment variables
 try:
@@ -50,6 +54,20 @@ try:
 except ImportError:
     print("[llm_integration] dotenv not available, using system env only", flush=True)
 
+from workflows.shared.prompts.prompt_cache import (
+    TokenUsage,
+    build_system_blocks,
+    build_user_content,
+    prompt_cache_enabled,
+)
+from workflows.shared.rate_limiter import get_rate_limiter
+from workflows.shared.streaming import (
+    StreamAbortedError,
+    StreamMetrics,
+    StreamMonitor,
+    streaming_enabled,
+)
+
 print("[llm_integration] Basic imports done", flush=True)
 
 # Try to import LLM clients
@@ -99,8 +117,17 @@ LLM_MAX_TOKENS = int(os.getenv("LLM_MAX_TOKENS", "8192"))  # Max tokens for resp
 # Enable detailed API logging (set to False to disable)
 ENABLE_API_LOGGING = os.getenv("ENABLE_API_LOGGING", "true").lower() == "true"
 
-# API call counter
+# API call counter (call_llm runs on chapter worker threads)
 _api_call_count = 0
+_api_call_lock = threading.Lock()
+
+# Per-chapter token usage (cached vs. uncached input), chapter 0 = untracked.
+# Keyed by chapter number only: callers reset it at the start of each book.
+_chapter_token_usage: Dict[int, TokenUsage] = {}
+_token_usage_lock = threading.Lock()
+
+# Latency metrics of streamed calls (LLM_STREAMING_ENABLED / call_llm(stream=True))
+_stream_metrics: List[StreamMetrics] = []
 
 
 # ============================================================================
@@ -292,6 +319,87 @@ def _log_response_details(call_num: int, response_text: str, input_tokens: int,
     print(f"[LLM API #{call_num}] Response length: {response_length:,} chars", flush=True)
 
 
+def _log_prompt_cache_details(call_num: int, usage: TokenUsage):
+    """Log prompt-cache reads/writes when the provider reported any."""
+    if usage.cache_read_input_tokens or usage.cache_creation_input_tokens:
+        print(
+            f"[LLM API #{call_num}] Prompt cache: {usage.cache_read_input_tokens:,} read, "
+            f"{usage.cache_creation_input_tokens:,} written, "
+            f"{usage.uncached_input_tokens:,} uncached input tokens",
+            flush=True
+        )
+
+
+def _record_token_usage(chapter_num: int, usage: TokenUsage):
+    """Accumulate a call's usage into its chapter's totals."""
+    if chapter_num <= 0:
+        return
+    with _token_usage_lock:
+        _chapter_token_usage.setdefault(chapter_num, TokenUsage()).add(usage)
+
+
+def get_chapter_token_usage(chapter_num: int) -> TokenUsage:
+    """
+    Token usage of all API calls made for a chapter so far.
+    
+    Returns:
+        TokenUsage copy (zeros if no calls were made, e.g. all cache hits)
+    """
+    with _token_usage_lock:
+        usage = TokenUsage()
+        usage.add(_chapter_token_usage.get(chapter_num, TokenUsage()))
+        return usage
+
+
+def reset_token_usage():
+    """Clear per-chapter token usage totals (call before each book)."""
+    with _token_usage_lock:
+        _chapter_token_usage.clear()
+
+
+def _record_stream_metrics(call_num: int, metrics: StreamMetrics):
+    """Log and keep a streamed call's TTFT and throughput."""
+    print(f"[LLM API #{call_num}] ⏱  Stream: {metrics.describe()}", flush=True)
+    with _token_usage_lock:
+        _stream_metrics.append(metrics)
+
+
+def get_stream_metrics(chapter_num: Optional[int] = None) -> List[StreamMetrics]:
+    """
+    Metrics of streamed calls so far, optionally for one chapter.
+    
+    Returns:
+        StreamMetrics list in call order (empty when streaming is off)
+    """
+    with _token_usage_lock:
+        return [m for m in _stream_metrics if chapter_num is None or m.chapter_num == chapter_num]
+
+
+def reset_stream_metrics():
+    """Clear recorded stream metrics."""
+    with _token_usage_lock:
+        _stream_metrics.clear()
+
+
+def _stream_anthropic_message(client: Any, request: Dict[str, Any], monitor: StreamMonitor) -> Any:
+    """
+    Stream a Messages API request through ``monitor``.
+    
+    Leaving the stream context on StreamAbortedError closes the HTTP
+    connection, so generation (and output billing) stops at that point.
+    
+    Returns:
+        The final Message (content, stop_reason, usage) for completed streams
+    
+    Raises:
+        StreamAbortedError: When the monitor rejects the partial output
+    """
+    with client.messages.stream(**request) as stream:
+        for text in stream.text_stream:
+            monitor.feed(text)
+        return stream.get_final_message()
+
+
 def _validate_response(call_num: int, response_text: str, prompt: str, system_prompt: Optional[str], 
                        input_tokens: int, output_tokens: int):
     """Validate response and log warnings."""
@@ -321,7 +429,9 @@ def _handle_anthropic_error(call_num: int, e: Exception, prompt: str, system_pro
     _log_api_exchange(call_num, prompt, system_prompt, None, 0, 0, error=error_msg)
 
 
-def _call_anthropic_api(call_num: int, prompt: str, system_prompt: Optional[str], max_tokens: int) -> str:
+def _call_anthropic_api(call_num: int, prompt: str, system_prompt: Optional[str], max_tokens: int,
+                        cache_prefix: Optional[str] = None, chapter_num: int = 0,
+                        stream: bool = False, expect_json: bool = False) -> str:
     """Make Anthropic API call and validate response.
     
     Extracted from call_llm to reduce cognitive complexity.
@@ -332,12 +442,19 @@ def _call_anthropic_api(call_num: int, prompt: str, system_prompt: Optional[str]
         prompt: User prompt
         system_prompt: Optional system prompt
         max_tokens: Maximum response tokens
+        cache_prefix: Run-stable leading part of prompt; sent with the system
+            prompt as cache_control breakpoints (LLM_PROMPT_CACHE_ENABLED)
+        chapter_num: Chapter whose token usage this call counts towards
+        stream: Stream the response, reporting TTFT and tokens/sec
+        expect_json: With stream, validate JSON structure as it arrives and
+            abort on the first irrecoverable error
         
     Returns:
         Response text from API
         
     Raises:
         anthropic.APIError: On API failures
+        StreamAbortedError: When a streamed JSON response was abandoned
         Exception: On unexpected errors
     """
     # Print confirmation on first call
@@ -349,15 +466,43 @@ def _call_anthropic_api(call_num: int, prompt: str, system_prompt: Optional[str]
     # Log request
     _log_request_details(call_num, prompt, system_prompt, max_tokens)
     
-    # Make API call
+    # Make API call under the shared request/token budget
+    effective_max_tokens = max_tokens if max_tokens <= LLM_MAX_TOKENS else LLM_MAX_TOKENS
     client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-    response = client.messages.create(
+    system_text = system_prompt if system_prompt else "You are a helpful assistant analyzing Python documentation."
+    use_cache = bool(cache_prefix) and prompt_cache_enabled()
+    request = dict(
         model=ANTHROPIC_MODEL,
-        max_tokens=max_tokens if max_tokens <= LLM_MAX_TOKENS else LLM_MAX_TOKENS,
+        max_tokens=effective_max_tokens,
         temperature=LLM_TEMPERATURE,
-        system=system_prompt if system_prompt else "You are a helpful assistant analyzing Python documentation.",
-        messages=[{"role": "user", "content": prompt}]
+        system=build_system_blocks(system_text) if use_cache else system_text,
+        messages=[{
+            "role": "user",
+            "content": build_user_content(prompt, cache_prefix) if use_cache else prompt
+        }]
     )
+    monitor = StreamMonitor(expect_json=expect_json, chapter_num=chapter_num) if stream else None
+    limiter = get_rate_limiter()
+    reservation = limiter.acquire_for_prompt(prompt, effective_max_tokens, system_prompt)
+    try:
+        if monitor is None:
+            response = client.messages.create(**request)
+        else:
+            response = _stream_anthropic_message(client, request, monitor)
+        usage = TokenUsage.from_anthropic(response.usage)
+    except StreamAbortedError as e:
+        # Only the streamed prefix was generated; bill the limiter for that
+        limiter.settle(reservation, reservation.input_tokens, e.metrics.output_tokens)
+        _record_stream_metrics(call_num, e.metrics)
+        print(f"[LLM API #{call_num}] ✂️  Stream aborted after {e.metrics.output_chars:,} chars: {e.reason}",
+              file=sys.stderr, flush=True)
+        _log_api_exchange(call_num, prompt, system_prompt, e.partial_text, 0,
+                          e.metrics.output_tokens, error=str(e))
+        raise
+    except BaseException:
+        limiter.release(reservation)
+        raise
+    limiter.settle(reservation, usage.uncached_input_tokens, usage.output_tokens)
     
     # Extract response (Sprint 1: add stop_reason)
     # Type guard: response.content can contain various block types, only TextBlock has .text
@@ -369,11 +514,15 @@ def _call_anthropic_api(call_num: int, prompt: str, system_prompt: Optional[str]
         response_text = str(content_block)
     
     stop_reason = response.stop_reason  # Anthropic API field
-    input_tokens = getattr(response.usage, 'input_tokens', 0)
-    output_tokens = getattr(response.usage, 'output_tokens', 0)
+    input_tokens = usage.input_tokens
+    output_tokens = usage.output_tokens
+    _record_token_usage(chapter_num, usage)
+    if monitor is not None:
+        _record_stream_metrics(call_num, monitor.finish(output_tokens=output_tokens))
     
     # Log response
     _log_response_details(call_num, response_text, input_tokens, output_tokens)
+    _log_prompt_cache_details(call_num, usage)
     _log_api_exchange(call_num, prompt, system_prompt, response_text, input_tokens, output_tokens)
     
     # Sprint 1: Validate JSON response with finish_reason
@@ -407,7 +556,9 @@ def _compute_prompt_hash(prompt: str, system_prompt: Optional[str] = None) -> st
 
 
 def call_llm(prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 2000,
-             phase: str = "general", chapter_num: int = 0) -> str:
+             phase: str = "general", chapter_num: int = 0,
+             cache_prefix: Optional[str] = None, stream: Optional[bool] = None,
+             expect_json: bool = False) -> str:
     """
     Make automated LLM API call using Anthropic Claude (no user interaction).
     
@@ -422,20 +573,35 @@ def call_llm(prompt: str, system_prompt: Optional[str] = None, max_tokens: int =
         max_tokens: Maximum response tokens
         phase: "phase1", "phase2", or "general" for cache organization
         chapter_num: Chapter number for cache key (0 = no caching)
+        cache_prefix: Run-stable leading part of prompt (e.g. PromptParts.prefix)
+            to mark as a provider prompt-cache breakpoint
+        stream: Stream the response (default: LLM_STREAMING_ENABLED)
+        expect_json: Response must be JSON; when streaming, generation is
+            aborted as soon as the output cannot become valid JSON. Up to
+            2000 chars of prose may precede the value, on its own line or
+            before it on the same line ("Here is the analysis: {...")
     
     Returns:
         LLM response as string
+    
+    Raises:
+        StreamAbortedError: Streamed JSON response abandoned (nothing is cached)
     """
     global _api_call_count
-    _api_call_count += 1
-    call_num = _api_call_count
+    with _api_call_lock:
+        _api_call_count += 1
+        call_num = _api_call_count
     
     # Compute prompt hash for caching
     prompt_hash = _compute_prompt_hash(prompt, system_prompt)
     
+    cacheable = bool(LLM_CACHE) and chapter_num > 0 and phase in ("phase1", "phase2")
+    if stream is None:
+        stream = streaming_enabled()
+    
     # Check cache first (Cache-Aside Pattern)
-    if LLM_CACHE and chapter_num > 0 and phase in ("phase1", "phase2"):
-        cached = LLM_CACHE.get(phase, chapter_num, prompt_hash)
+    if cacheable:
+        cached = LLM_CACHE.get(phase, chapter_num, prompt_hash, model=ANTHROPIC_MODEL)
         if cached:
             print(f"[LLM API #{call_num}] 💰 CACHE HIT for {phase} Chapter {chapter_num} (saved ~$0.30)", flush=True)
             return cached.response_text
@@ -443,11 +609,20 @@ def call_llm(prompt: str, system_prompt: Optional[str] = None, max_tokens: int =
     # Try Anthropic Claude
     if LLM_PROVIDER == "anthropic" and ANTHROPIC_AVAILABLE:
         try:
-            response_text = _call_anthropic_api(call_num, prompt, system_prompt, max_tokens)
+            if not cacheable:
+                return _call_anthropic_api(
+                    call_num, prompt, system_prompt, max_tokens,
+                    cache_prefix=cache_prefix, chapter_num=chapter_num,
+                    stream=stream, expect_json=expect_json
+                )
             
-            # Cache the response
-            if LLM_CACHE and chapter_num > 0 and phase in ("phase1", "phase2"):
-                llm_response = LLMResponse(
+            def _compute() -> LLMResponse:
+                response_text = _call_anthropic_api(
+                    call_num, prompt, system_prompt, max_tokens,
+                    cache_prefix=cache_prefix, chapter_num=chapter_num,
+                    stream=stream, expect_json=expect_json
+                )
+                return LLMResponse(
                     phase=phase,
                     chapter_num=chapter_num,
                     prompt_hash=prompt_hash,
@@ -456,14 +631,24 @@ def call_llm(prompt: str, system_prompt: Optional[str] = None, max_tokens: int =
                     model=ANTHROPIC_MODEL,
                     tokens_used=0  # Could track from API response
                 )
-                LLM_CACHE.set(llm_response)
-                print(f"[LLM API #{call_num}] 💾 Cached {phase} Chapter {chapter_num}", flush=True)
             
-            return response_text
+            # Cache-Aside with single-flight: parallel workers missing the
+            # same prompt wait for one API call instead of each paying for it
+            llm_response, hit = LLM_CACHE.get_or_compute(
+                phase, chapter_num, prompt_hash, ANTHROPIC_MODEL, _compute
+            )
+            if hit:
+                print(f"[LLM API #{call_num}] 💰 CACHE HIT for {phase} Chapter {chapter_num} (saved ~$0.30)", flush=True)
+            else:
+                print(f"[LLM API #{call_num}] 💾 Cached {phase} Chapter {chapter_num}", flush=True)
+            return llm_response.response_text
             
         except anthropic.APIError as e:
             _handle_anthropic_error(call_num, e, prompt, system_prompt)
             raise
+        
+        except StreamAbortedError:
+            raise  # Already logged by _call_anthropic_api
             
         except Exception as e:
             error_msg = f"{type(e).__name__}: {str(e)}"
@@ -487,18 +672,21 @@ def get_cache_stats() -> Dict[str, Any]:
         - enabled: Whether caching is enabled
         - phase1_count: Number of cached phase1 responses
         - phase2_count: Number of cached phase2 responses
+        - total_bytes: Compressed size of all cached responses
         - cache_dir: Path to cache directory
+    
+    Counts come from the store's maintained counters (no directory scan).
     """
     if not LLM_CACHE:
         return {"enabled": False, "phase1_count": 0, "phase2_count": 0, "cache_dir": None}
     
     try:
-        phase1_count = len(list(LLM_CACHE.phase1_dir.glob("chapter_*.json")))
-        phase2_count = len(list(LLM_CACHE.phase2_dir.glob("chapter_*.json")))
+        stats = LLM_CACHE.stats()
         return {
             "enabled": True,
-            "phase1_count": phase1_count,
-            "phase2_count": phase2_count,
+            "phase1_count": stats["phase1_count"],
+            "phase2_count": stats["phase2_count"],
+            "total_bytes": stats["total_bytes"],
             "cache_dir": str(LLM_CACHE.cache_dir),
             "ttl_days": LLM_CACHE.ttl_seconds // (24 * 60 * 60)
         }
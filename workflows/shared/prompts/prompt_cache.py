@@ -0,0 +1,156 @@
+"""
+Provider-side prompt caching for Phase 1/Phase 2 prompts.
+
+The comprehensive templates are assembled stable-prefix-first (see
+templates.build_comprehensive_phase1_prompt): instructions, companion-book
+metadata and taxonomy are identical for every chapter of a run and only the
+chapter block at the end changes. Marking the end of that prefix, and the
+system prompt, with a ``cache_control`` breakpoint lets the provider reuse
+the prefix across chapters instead of re-reading it at the full input rate.
+
+- build_system_blocks / build_user_content: Anthropic-style content blocks,
+  also accepted by the llm-gateway for Anthropic-backed models
+- TokenUsage: cached vs. uncached input token accounting from either
+  Anthropic (``cache_read_input_tokens``) or OpenAI-style
+  (``prompt_tokens_details.cached_tokens``) usage payloads
+
+Set LLM_PROMPT_CACHE_ENABLED=false to send plain string prompts.
+
+References:
+- Anthropic API docs: Prompt caching (cache_control, ephemeral breakpoints)
+- ARCHITECTURE_GUIDELINES Ch 13: separation of concerns
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Final, List, Optional, Union
+
+PROMPT_CACHE_ENV: Final[str] = "LLM_PROMPT_CACHE_ENABLED"
+EPHEMERAL_CACHE_CONTROL: Final[Dict[str, str]] = {"type": "ephemeral"}
+
+
+def prompt_cache_enabled() -> bool:
+    """True unless LLM_PROMPT_CACHE_ENABLED=false."""
+    return os.getenv(PROMPT_CACHE_ENV, "true").lower() == "true"
+
+
+def _text_block(text: str, cached: bool = False) -> Dict[str, Any]:
+    block: Dict[str, Any] = {"type": "text", "text": text}
+    if cached:
+        block["cache_control"] = dict(EPHEMERAL_CACHE_CONTROL)
+    return block
+
+
+def build_system_blocks(system_prompt: str) -> List[Dict[str, Any]]:
+    """System prompt as a single cacheable text block."""
+    return [_text_block(system_prompt, cached=True)]
+
+
+def build_user_content(
+    prompt: str,
+    cache_prefix: Optional[str],
+) -> Union[str, List[Dict[str, Any]]]:
+    """
+    User message content with a cache breakpoint after ``cache_prefix``.
+
+    Args:
+        prompt: Full user prompt
+        cache_prefix: Run-stable leading part of ``prompt``
+
+    Returns:
+        Two text blocks (cached prefix, per-call remainder), or ``prompt``
+        unchanged when there is no usable prefix
+    """
+    if not cache_prefix or not prompt.startswith(cache_prefix):
+        return prompt
+    remainder = prompt[len(cache_prefix):]
+    blocks = [_text_block(cache_prefix, cached=True)]
+    if remainder:
+        blocks.append(_text_block(remainder))
+    return blocks
+
+
+def _usage_int(value: Any) -> int:
+    """Integer token count, treating missing/non-numeric values as 0."""
+    return value if isinstance(value, int) and not isinstance(value, bool) else 0
+
+
+@dataclass
+class TokenUsage:
+    """
+    Token usage for one call or an accumulated chapter.
+
+    ``input_tokens`` counts every prompt token, whether it was read from the
+    provider cache, written to it, or neither.
+    """
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    calls: int = 0
+
+    @property
+    def cached_input_tokens(self) -> int:
+        """Prompt tokens served from the provider cache."""
+        return self.cache_read_input_tokens
+
+    @property
+    def uncached_input_tokens(self) -> int:
+        """Prompt tokens billed at the full (or cache-write) input rate."""
+        return self.input_tokens - self.cache_read_input_tokens
+
+    def add(self, other: "TokenUsage") -> None:
+        """Accumulate another usage record into this one."""
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.cache_read_input_tokens += other.cache_read_input_tokens
+        self.cache_creation_input_tokens += other.cache_creation_input_tokens
+        self.calls += other.calls
+
+    def describe(self) -> str:
+        """One-line summary for progress output."""
+        return (
+            f"{self.input_tokens:,} input tokens "
+            f"({self.cached_input_tokens:,} cached, {self.uncached_input_tokens:,} uncached), "
+            f"{self.output_tokens:,} output tokens"
+        )
+
+    @classmethod
+    def from_anthropic(cls, usage: Any) -> "TokenUsage":
+        """
+        Build from an Anthropic ``Message.usage`` object.
+
+        Anthropic reports cache reads/writes separately from ``input_tokens``,
+        so the total is their sum.
+        """
+        read = _usage_int(getattr(usage, "cache_read_input_tokens", 0))
+        created = _usage_int(getattr(usage, "cache_creation_input_tokens", 0))
+        return cls(
+            input_tokens=_usage_int(getattr(usage, "input_tokens", 0)) + read + created,
+            output_tokens=_usage_int(getattr(usage, "output_tokens", 0)),
+            cache_read_input_tokens=read,
+            cache_creation_input_tokens=created,
+            calls=1,
+        )
+
+    @classmethod
+    def from_openai(cls, usage: Optional[Dict[str, Any]]) -> "TokenUsage":
+        """
+        Build from an OpenAI-compatible ``usage`` dict (llm-gateway).
+
+        ``prompt_tokens`` already includes cached tokens; the cached share is
+        read from ``prompt_tokens_details.cached_tokens`` or, when the gateway
+        passes Anthropic fields through, ``cache_read_input_tokens``.
+        """
+        usage = usage or {}
+        details = usage.get("prompt_tokens_details") or {}
+        read = _usage_int(details.get("cached_tokens")) or _usage_int(
+            usage.get("cache_read_input_tokens")
+        )
+        return cls(
+            input_tokens=_usage_int(usage.get("prompt_tokens")),
+            output_tokens=_usage_int(usage.get("completion_tokens")),
+            cache_read_input_tokens=read,
+            cache_creation_input_tokens=_usage_int(usage.get("cache_creation_input_tokens")),
+            calls=1,
+        )
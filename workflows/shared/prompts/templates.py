@@ -12,14 +12,88 @@ References:
 - ARCHITECTURE_GUIDELINES Ch 13: Dependency Injection, separation of concerns
 - PYTHON_GUIDELINES: pathlib.Path, context managers, EAFP error handling
 - REFACTORING_PLAN.md Section II.2.1: Extract prompts to src/prompts/
+
+Prompt Assembly:
+- Template files are read once per process (clear_prompt_caches() resets)
+- Comprehensive prompts are split at the chapter section into a run-stable
+  prefix (instructions, companion books, taxonomy) and a per-chapter suffix,
+  so the prefix is byte-identical across chapters and can be cached by the
+  provider (see prompt_cache.py)
+- Static blocks are memoized on the identity of their inputs: callers build
+  the companion book list and taxonomy once per run, pass the same objects
+  for every chapter, and do not mutate them
 """
 
+import json
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Final, List, Optional, Tuple
+from typing import Any, Callable, Dict, Final, List, Optional, Tuple
 
 # Template directory is fixed relative to this module
 TEMPLATE_DIR: Final[Path] = Path(__file__).parent
 
+# Comprehensive templates put everything chapter-specific after this line
+CHAPTER_SECTION_MARKER: Final[str] = "CHAPTER {chapter_num}: {chapter_title}"
+
+# Rendered static blocks kept per run (distinct book sets / taxonomies)
+_STATIC_BLOCK_LIMIT: Final[int] = 32
+_static_blocks: Dict[Tuple[Any, ...], Tuple[Tuple[Any, ...], str]] = {}
+
+
+@dataclass(frozen=True)
+class PromptParts:
+    """A prompt split into a run-stable prefix and a per-chapter suffix."""
+    prefix: str
+    suffix: str
+
+    @property
+    def text(self) -> str:
+        """The full prompt (prefix followed by suffix)."""
+        return self.prefix + self.suffix
+
+
+@lru_cache(maxsize=None)
+def _read_prompt_file(name: str) -> str:
+    """Read {TEMPLATE_DIR}/{name}.txt once per process."""
+    prompt_path = TEMPLATE_DIR / f"{name}.txt"
+    with prompt_path.open('r', encoding='utf-8') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def _split_template(name: str) -> Tuple[str, str]:
+    """Split a comprehensive template at CHAPTER_SECTION_MARKER."""
+    template = load_template(name)
+    index = template.index(CHAPTER_SECTION_MARKER)
+    return template[:index], template[index:]
+
+
+def _memoized_block(kind: str, inputs: Tuple[Any, ...], render: Callable[[], str]) -> str:
+    """
+    Render a static prompt block once per run-scoped set of inputs.
+    
+    Strings are keyed by value and everything else by identity, so a hit
+    costs a dict lookup instead of re-serializing the book list. The cached
+    entry holds its inputs, which keeps their ids from being reused.
+    """
+    key = (kind, *(value if isinstance(value, str) else id(value) for value in inputs))
+    cached = _static_blocks.get(key)
+    if cached is not None and all(a is b for a, b in zip(cached[0], inputs) if not isinstance(b, str)):
+        return cached[1]
+    if len(_static_blocks) >= _STATIC_BLOCK_LIMIT:
+        _static_blocks.clear()
+    block = render()
+    _static_blocks[key] = (inputs, block)
+    return block
+
+
+def clear_prompt_caches() -> None:
+    """Forget memoized template files and rendered static blocks."""
+    _read_prompt_file.cache_clear()
+    _split_template.cache_clear()
+    _static_blocks.clear()
+
 
 def load_system_prompt(name: str) -> str:
     """
@@ -27,6 +101,7 @@ def load_system_prompt(name: str) -> str:
     
     System prompts contain persistent role/identity context that doesn't
     change between chapters - separated from task-specific user prompts.
+    The file is read once per process.
     
     Args:
         name: System prompt name (e.g., "comprehensive_phase2_system")
@@ -41,9 +116,7 @@ def load_system_prompt(name: str) -> str:
     if '/' in name or '\\' in name:
         raise ValueError(f"System prompt name cannot contain path separators: {name}")
     
-    prompt_path = TEMPLATE_DIR / f"{name}.txt"
-    with prompt_path.open('r', encoding='utf-8') as f:
-        return f.read()
+    return _read_prompt_file(name)
 
 
 def load_template(name: str) -> str:
@@ -60,6 +133,7 @@ def load_template(name: str) -> str:
         
     Returns:
         Template content as UTF-8 encoded string, ready for str.format() replacement.
+        Read from disk on first use, then served from memory.
         
     Raises:
         FileNotFoundError: If template file doesn't exist at {TEMPLATE_DIR}/{name}.txt
@@ -79,9 +153,7 @@ def load_template(name: str) -> str:
     if '/' in name or '\\' in name:
         raise ValueError(f"Template name cannot contain path separators: {name}")
     
-    template_path = TEMPLATE_DIR / f"{name}.txt"
-    with template_path.open('r', encoding='utf-8') as f:
-        return f.read()
+    return _read_prompt_file(name)
 
 
 def _format_book_description(book: Dict[str, Any], index: int) -> str:
@@ -129,17 +201,32 @@ def _format_book_description(book: Dict[str, Any], index: int) -> str:
     return book_desc
 
 
-def format_comprehensive_phase1_prompt(
+def _format_books_text(books_metadata: List[Dict[str, Any]]) -> str:
+    """Companion book list for the Phase 1 prefix (memoized per book list object)."""
+    return _memoized_block(
+        "books_text",
+        (books_metadata,),
+        lambda: "\n\n".join(
+            _format_book_description(book, i)
+            for i, book in enumerate(books_metadata, 1)
+        ),
+    )
+
+
+def build_comprehensive_phase1_prompt(
     chapter_num: int,
     chapter_title: str,
     chapter_full_text: str,
     books_metadata: List[Dict[str, Any]],
     source_book_name: str = "Unknown Book"
-) -> str:
+) -> PromptParts:
     """
-    Format comprehensive Phase 1 prompt with actual values.
+    Build the comprehensive Phase 1 prompt as stable prefix + chapter suffix.
     
-    TDD GREEN: Minimal implementation to pass tests.
+    The prefix (instructions and companion book metadata) depends only on
+    the source book and book set, so it is rendered once per run and is
+    identical for every chapter. Pass the same ``books_metadata`` list for
+    every chapter of a run; a new list object renders the prefix again.
     
     Args:
         chapter_num: Chapter number (e.g., 1, 2, 3)
@@ -149,20 +236,22 @@ def format_comprehensive_phase1_prompt(
         source_book_name: Name of the source book being analyzed (dynamic, not hardcoded)
         
     Returns:
-        Formatted prompt string ready for LLM
+        PromptParts; ``.prefix`` is the provider cache breakpoint
         
     References:
-        - Source: interactive_llm_system_v3_hybrid_prompt.py::_build_comprehensive_phase1_prompt
         - Template: src/prompts/comprehensive_phase1.txt
     """
-    template = load_template("comprehensive_phase1")
-    
-    # Format book metadata list
-    books_list = [
-        _format_book_description(book, i) 
-        for i, book in enumerate(books_metadata, 1)
-    ]
-    books_text = "\n\n".join(books_list)
+    prefix_template, suffix_template = _split_template("comprehensive_phase1")
+    
+    prefix = _memoized_block(
+        "phase1_prefix",
+        (source_book_name, books_metadata),
+        lambda: prefix_template.format(
+            source_book_name=source_book_name,
+            books_count=len(books_metadata),
+            books_text=_format_books_text(books_metadata)
+        ),
+    )
     
     # Prepare text preview and truncation indicator
     chapter_text_preview = chapter_full_text[:8000]
@@ -172,16 +261,49 @@ def format_comprehensive_phase1_prompt(
         else ""
     )
     
-    return template.format(
-        source_book_name=source_book_name,
+    suffix = suffix_template.format(
         chapter_num=chapter_num,
         chapter_title=chapter_title,
         chapter_text_length=len(chapter_full_text),
         chapter_text_preview=chapter_text_preview,
-        chapter_text_truncation=chapter_text_truncation,
-        books_count=len(books_metadata),
-        books_text=books_text
+        chapter_text_truncation=chapter_text_truncation
     )
+    return PromptParts(prefix=prefix, suffix=suffix)
+
+
+def format_comprehensive_phase1_prompt(
+    chapter_num: int,
+    chapter_title: str,
+    chapter_full_text: str,
+    books_metadata: List[Dict[str, Any]],
+    source_book_name: str = "Unknown Book"
+) -> str:
+    """
+    Format comprehensive Phase 1 prompt with actual values.
+    
+    TDD GREEN: Minimal implementation to pass tests.
+    
+    Args:
+        chapter_num: Chapter number (e.g., 1, 2, 3)
+        chapter_title: Chapter title (e.g., "Introduction to Python")
+        chapter_full_text: Full chapter text content
+        books_metadata: List of book metadata dicts
+        source_book_name: Name of the source book being analyzed (dynamic, not hardcoded)
+        
+    Returns:
+        Formatted prompt string ready for LLM
+        
+    References:
+        - Source: interactive_llm_system_v3_hybrid_prompt.py::_build_comprehensive_phase1_prompt
+        - Template: src/prompts/comprehensive_phase1.txt
+    """
+    return build_comprehensive_phase1_prompt(
+        chapter_num=chapter_num,
+        chapter_title=chapter_title,
+        chapter_full_text=chapter_full_text,
+        books_metadata=books_metadata,
+        source_book_name=source_book_name
+    ).text
 
 
 def _format_excerpt_content(book_name: str, excerpts: List[Dict[str, Any]]) -> str:
@@ -263,42 +385,49 @@ def _format_taxonomy_for_prompt(taxonomy_data: Optional[Dict[str, Any]]) -> str:
     return '\n'.join(lines)
 
 
-def format_comprehensive_phase2_prompt(
+def build_comprehensive_phase2_prompt(
     chapter_num: int,
     chapter_title: str,
-    metadata_response: Any,  # MetadataExtractionResponse with validation_summary, analysis_strategy
+    metadata_response: Any,
     content_package: Dict[str, Any],
     source_book_name: str = "Unknown Book",
     taxonomy_data: Optional[Dict[str, Any]] = None
-) -> Tuple[str, str]:
-    """Format Phase 2 comprehensive prompt for integrated scholarly annotation.
+) -> Tuple[str, PromptParts]:
+    """Build the Phase 2 system prompt and user prompt (stable prefix + chapter suffix).
     
-    Builds prompt for generating integrated scholarly annotations that synthesize
-    content from multiple companion books with Chicago-style citations.
-    
-    Returns BOTH system prompt and user prompt for proper separation of concerns:
-    - System prompt: Role identity, output format constraints (persistent)
-    - User prompt: Chapter data, taxonomy, rules, examples (task-specific)
+    The user prompt prefix (taxonomy, tier definitions, rules, examples)
+    depends only on the source book and taxonomy; the retrieved excerpts
+    and Phase 1 results follow it.
     
     Args:
         chapter_num: Chapter number
         chapter_title: Chapter title
         metadata_response: Object with .validation_summary and .analysis_strategy attributes
         content_package: Dict mapping book_name -> list of excerpt dicts
-        source_book_name: Name of the source book being analyzed (dynamic, not hardcoded)
+        source_book_name: Name of the source book being analyzed
         taxonomy_data: Taxonomy dict with tiers and book assignments
         
     Returns:
-        Tuple of (system_prompt, user_prompt) - both ready for LLM
+        Tuple of (system_prompt, PromptParts)
         
     References:
-        - Source: interactive_llm_system_v3_hybrid_prompt.py::_build_comprehensive_phase2_prompt
         - Template: src/prompts/comprehensive_phase2.txt
         - System: src/prompts/comprehensive_phase2_system.txt
     """
-    # Load both templates
     system_prompt = load_system_prompt("comprehensive_phase2_system")
-    template = load_template("comprehensive_phase2")
+    prefix_template, suffix_template = _split_template("comprehensive_phase2")
+    
+    prefix = _memoized_block(
+        "phase2_prefix",
+        (source_book_name, taxonomy_data),
+        lambda: prefix_template.format(
+            source_book_name=source_book_name,
+            taxonomy_text=(
+                _format_taxonomy_for_prompt(taxonomy_data)
+                if taxonomy_data else "No taxonomy data available."
+            )
+        ),
+    )
     
     # Build content sections from all books
     content_sections = []
@@ -307,21 +436,60 @@ def format_comprehensive_phase2_prompt(
     
     content_text = '\n'.join(content_sections)
     
-    # Format taxonomy for prompt
-    taxonomy_text = _format_taxonomy_for_prompt(taxonomy_data) if taxonomy_data else "No taxonomy data available."
-    
-    user_prompt = template.format(
-        source_book_name=source_book_name,
+    suffix = suffix_template.format(
         chapter_num=chapter_num,
         chapter_title=chapter_title,
         metadata_response_validation_summary=metadata_response.validation_summary,
         metadata_response_analysis_strategy=metadata_response.analysis_strategy,
         content_package_count=len(content_package),
-        content_text=content_text[:15000],  # Limit to first 15000 chars
-        taxonomy_text=taxonomy_text
+        content_text=content_text[:15000]  # Limit to first 15000 chars
     )
     
-    return system_prompt, user_prompt
+    return system_prompt, PromptParts(prefix=prefix, suffix=suffix)
+
+
+def format_comprehensive_phase2_prompt(
+    chapter_num: int,
+    chapter_title: str,
+    metadata_response: Any,  # MetadataExtractionResponse with validation_summary, analysis_strategy
+    content_package: Dict[str, Any],
+    source_book_name: str = "Unknown Book",
+    taxonomy_data: Optional[Dict[str, Any]] = None
+) -> Tuple[str, str]:
+    """Format Phase 2 comprehensive prompt for integrated scholarly annotation.
+    
+    Builds prompt for generating integrated scholarly annotations that synthesize
+    content from multiple companion books with Chicago-style citations.
+    
+    Returns BOTH system prompt and user prompt for proper separation of concerns:
+    - System prompt: Role identity, output format constraints (persistent)
+    - User prompt: Taxonomy, rules, examples, then chapter data (task-specific last)
+    
+    Args:
+        chapter_num: Chapter number
+        chapter_title: Chapter title
+        metadata_response: Object with .validation_summary and .analysis_strategy attributes
+        content_package: Dict mapping book_name -> list of excerpt dicts
+        source_book_name: Name of the source book being analyzed (dynamic, not hardcoded)
+        taxonomy_data: Taxonomy dict with tiers and book assignments
+        
+    Returns:
+        Tuple of (system_prompt, user_prompt) - both ready for LLM
+        
+    References:
+        - Source: interactive_llm_system_v3_hybrid_prompt.py::_build_comprehensive_phase2_prompt
+        - Template: src/prompts/comprehensive_phase2.txt
+        - System: src/prompts/comprehensive_phase2_system.txt
+    """
+    system_prompt, user_prompt = build_comprehensive_phase2_prompt(
+        chapter_num=chapter_num,
+        chapter_title=chapter_title,
+        metadata_response=metadata_response,
+        content_package=content_package,
+        source_book_name=source_book_name,
+        taxonomy_data=taxonomy_data
+    )
+    return system_prompt, user_prompt.text
 
 
 def format_phase1_prompt(
@@ -11,6 +11,13 @@ except ImportError:
     anthropic = None  # type: ignore[assignment]
 
 from .base import LLMResponse, LLMError
+from workflows.shared.prompts.prompt_cache import (
+    TokenUsage,
+    build_system_blocks,
+    build_user_content,
+    prompt_cache_enabled,
+)
+from workflows.shared.rate_limiter import get_rate_limiter
 
 
 class AnthropicProvider:
@@ -54,15 +61,21 @@ class AnthropicProvider:
         max_tokens: int,
         temperature: float = 0.0,
         system_prompt: Optional[str] = None,
+        cache_prefix: Optional[str] = None,
     ) -> LLMResponse:
         """
         Make a synchronous call to Claude.
         
+        When ``cache_prefix`` is given (and LLM_PROMPT_CACHE_ENABLED is not
+        false) the system prompt and the prefix are sent as cache_control
+        blocks so later calls sharing them read from the prompt cache.
+        
         Args:
             prompt: The user prompt/message
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (0.0 = deterministic)
             system_prompt: Optional system prompt to set context
+            cache_prefix: Optional run-stable leading part of ``prompt``
             
         Returns:
             LLMResponse with content and usage statistics
@@ -72,19 +85,33 @@ class AnthropicProvider:
         """
         try:
             # Build message parameters with proper typing for Anthropic API
+            use_cache = bool(cache_prefix) and prompt_cache_enabled()
             message_params: dict[str, Any] = {
                 "model": self._model,
                 "max_tokens": max_tokens,
                 "temperature": temperature,
-                "messages": [{"role": "user", "content": prompt}],
+                "messages": [{
+                    "role": "user",
+                    "content": build_user_content(prompt, cache_prefix) if use_cache else prompt,
+                }],
             }
             
             # Add system prompt if provided
             if system_prompt:
-                message_params["system"] = system_prompt
+                message_params["system"] = (
+                    build_system_blocks(system_prompt) if use_cache else system_prompt
+                )
             
-            # Make the API call
-            response = self._client.messages.create(**message_params)
+            # Make the API call under the shared request/token budget
+            limiter = get_rate_limiter()
+            reservation = limiter.acquire_for_prompt(prompt, max_tokens, system_prompt)
+            try:
+                response = self._client.messages.create(**message_params)
+                usage = TokenUsage.from_anthropic(response.usage)
+            except BaseException:
+                limiter.release(reservation)
+                raise
+            limiter.settle(reservation, usage.uncached_input_tokens, usage.output_tokens)
             
             # Extract content (handle both text and content blocks)
             if hasattr(response.content[0], 'text'):
@@ -96,9 +123,11 @@ class AnthropicProvider:
             return LLMResponse(
                 content=content,
                 model=response.model,
-                input_tokens=response.usage.input_tokens,
-                output_tokens=response.usage.output_tokens,
+                input_tokens=usage.input_tokens,
+                output_tokens=usage.output_tokens,
                 stop_reason=response.stop_reason,
+                cache_read_input_tokens=usage.cache_read_input_tokens,
+                cache_creation_input_tokens=usage.cache_creation_input_tokens,
             )
             
         except anthropic.APIError as e:
@@ -8,17 +8,29 @@ from typing import Protocol, Optional
 
 @dataclass
 class LLMResponse:
-    """Standardized response from any LLM provider."""
+    """
+    Standardized response from any LLM provider.
+    
+    ``input_tokens`` counts every prompt token; the cache fields say how
+    many of them were read from / written to the provider's prompt cache.
+    """
     content: str
     model: str
     input_tokens: int
     output_tokens: int
     stop_reason: Optional[str] = None
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
     
     @property
     def total_tokens(self) -> int:
         """Total tokens used in this request."""
         return self.input_tokens + self.output_tokens
+    
+    @property
+    def uncached_input_tokens(self) -> int:
+        """Prompt tokens not served from the provider cache."""
+        return self.input_tokens - self.cache_read_input_tokens
 
 
 class LLMError(Exception):
@@ -35,6 +47,7 @@ class LLMProvider(Protocol):
         max_tokens: int,
         temperature: float = 0.0,
         system_prompt: Optional[str] = None,
+        cache_prefix: Optional[str] = None,
     ) -> LLMResponse:
         """
         Make a synchronous call to the LLM provider.
@@ -44,6 +57,8 @@ class LLMProvider(Protocol):
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (0.0 = deterministic)
             system_prompt: Optional system prompt to set context
+            cache_prefix: Optional leading part of ``prompt`` that is stable
+                across calls; marked as a provider prompt-cache breakpoint
             
         Returns:
             LLMResponse with content and usage statistics
@@ -7,6 +7,8 @@ Reference:
 """
 
 import os
+from typing import Optional
+
 from .base import LLMProvider
 from .anthropic_provider import AnthropicProvider
 from .gateway_provider import GatewayProvider
@@ -16,7 +18,7 @@ from .gateway_provider import GatewayProvider
 SUPPORTED_PROVIDERS = ("anthropic", "gateway")
 
 
-def create_llm_provider() -> LLMProvider:
+def create_llm_provider(pooled: Optional[bool] = None) -> LLMProvider:
     """
     Create LLM provider based on environment configuration.
     
@@ -24,6 +26,11 @@ def create_llm_provider() -> LLMProvider:
     based on the LLM_PROVIDER environment variable. This decouples the
     application code from specific provider implementations.
     
+    Args:
+        pooled: Gateway only - keep one loop thread and keep-alive client
+            for the provider's lifetime (None = LLM_GATEWAY_POOLED env).
+            Callers that enable it should close() the provider when done.
+    
     Returns:
         LLMProvider instance (default: GatewayProvider)
     
@@ -47,10 +54,10 @@ def create_llm_provider() -> LLMProvider:
         ARCHITECTURE.md - Kitchen Brigade "Router" pattern: Gateway is single entry point
     """
     provider_name = os.getenv("LLM_PROVIDER", "gateway").lower()
-    return get_provider(provider_name)
+    return get_provider(provider_name, pooled=pooled)
 
 
-def get_provider(provider_name: str) -> LLMProvider:
+def get_provider(provider_name: str, pooled: Optional[bool] = None) -> LLMProvider:
     """
     Get LLM provider instance by name.
     
@@ -58,6 +65,7 @@ def get_provider(provider_name: str) -> LLMProvider:
     
     Args:
         provider_name: Provider identifier ("anthropic", "gateway")
+        pooled: Gateway only - pooled client mode (see GatewayProvider)
     
     Returns:
         LLMProvider instance
@@ -74,7 +82,7 @@ def get_provider(provider_name: str) -> LLMProvider:
         return AnthropicProvider()
     
     if name == "gateway":
-        return GatewayProvider()
+        return GatewayProvider(pooled=pooled)
     
     raise ValueError(
         f"Unknown LLM provider: {provider_name}. "
@@ -13,10 +13,16 @@ Pattern: Adapter Pattern
 - Adapts async LLMGatewayClient to sync LLMProvider protocol
 - Bridges message formats: prompt → messages list
 - Converts gateway dict response → LLMResponse dataclass
+
+Pooled mode (pooled=True or LLM_GATEWAY_POOLED=true):
+- One background event loop and one keep-alive LLMGatewayClient for the
+  provider's lifetime instead of asyncio.run() + a new client per call
+- Release with close() or use the provider as a context manager
 """
 
 import asyncio
 import os
+import threading
 from typing import Optional, Any
 
 from .base import LLMResponse, LLMError
@@ -27,6 +33,13 @@ from ..clients.llm_gateway import (
     GatewayConnectionError,
     GatewayAPIError,
 )
+from ..clients.sync_bridge import PooledAsyncClient
+from ..prompts.prompt_cache import (
+    TokenUsage,
+    build_system_blocks,
+    build_user_content,
+    prompt_cache_enabled,
+)
 
 
 class GatewayProvider:
@@ -45,6 +58,11 @@ class GatewayProvider:
         )
         print(response.content)
 
+        # Pooled: one loop thread + one keep-alive client for many calls
+        with GatewayProvider(pooled=True) as provider:
+            for prompt in prompts:
+                provider.call(prompt=prompt, max_tokens=100)
+
     Reference:
     - workflows/shared/providers/base.py: LLMProvider protocol
     - GUIDELINES p. 2313: Connection pooling for downstream services
@@ -58,6 +76,7 @@ class GatewayProvider:
         model: Optional[str] = None,
         gateway_url: Optional[str] = None,
         timeout: Optional[float] = None,
+        pooled: Optional[bool] = None,
     ) -> None:
         """
         Initialize GatewayProvider.
@@ -66,12 +85,20 @@ class GatewayProvider:
             model: Model identifier. Defaults to DEFAULT_MODEL.
             gateway_url: Gateway base URL. Defaults to LLM_GATEWAY_URL env or localhost.
             timeout: Request timeout in seconds.
+            pooled: Keep one event loop thread and one keep-alive gateway client
+                for the provider's lifetime. Defaults to LLM_GATEWAY_POOLED env
+                (false). Release with close().
 
         Pattern: Environment variable configuration with sensible defaults
         """
         self._model: str = model or os.getenv("LLM_MODEL") or self.DEFAULT_MODEL
         self._gateway_url: str = gateway_url or os.getenv("LLM_GATEWAY_URL") or "http://localhost:8080"
         self._timeout = timeout
+        if pooled is None:
+            pooled = os.getenv("LLM_GATEWAY_POOLED", "false").lower() == "true"
+        self._pooled: bool = pooled
+        self._pool: Optional[PooledAsyncClient[LLMGatewayClient]] = None
+        self._pool_lock = threading.Lock()
 
     def call(
         self,
@@ -79,18 +106,22 @@ class GatewayProvider:
         max_tokens: int,
         temperature: float = 0.0,
         system_prompt: Optional[str] = None,
+        cache_prefix: Optional[str] = None,
     ) -> LLMResponse:
         """
         Make a synchronous call to the LLM via gateway.
 
         Implements LLMProvider protocol interface.
-        Internally uses async gateway client with asyncio.run().
+        Internally uses the async gateway client: via the pooled background
+        loop in pooled mode, otherwise with asyncio.run() per call.
 
         Args:
             prompt: The user prompt/message
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (0.0 = deterministic)
             system_prompt: Optional system prompt to set context
+            cache_prefix: Optional run-stable leading part of ``prompt``,
+                sent as a cache_control breakpoint
 
         Returns:
             LLMResponse with content and usage statistics
@@ -104,6 +135,7 @@ class GatewayProvider:
                 max_tokens=max_tokens,
                 temperature=temperature,
                 system_prompt=system_prompt,
+                cache_prefix=cache_prefix,
             )
             return self._parse_response(response_dict)
         except GatewayTimeoutError as e:
@@ -121,6 +153,7 @@ class GatewayProvider:
         max_tokens: int,
         temperature: float = 0.0,
         system_prompt: Optional[str] = None,
+        cache_prefix: Optional[str] = None,
     ) -> LLMResponse:
         """
         Async version of call() for use in async contexts.
@@ -130,6 +163,7 @@ class GatewayProvider:
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
             system_prompt: Optional system prompt
+            cache_prefix: Optional run-stable leading part of ``prompt``
 
         Returns:
             LLMResponse with content and usage statistics
@@ -143,6 +177,7 @@ class GatewayProvider:
                 max_tokens=max_tokens,
                 temperature=temperature,
                 system_prompt=system_prompt,
+                cache_prefix=cache_prefix,
             )
             return self._parse_response(response_dict)
         except GatewayTimeoutError as e:
@@ -160,23 +195,32 @@ class GatewayProvider:
         max_tokens: int,
         temperature: float,
         system_prompt: Optional[str],
+        cache_prefix: Optional[str] = None,
     ) -> dict[str, Any]:
         """
-        Internal: Make synchronous gateway call using asyncio.run().
+        Internal: Make synchronous gateway call.
 
         Pattern: Async-to-sync bridge for protocol compliance.
+        Pooled mode reuses the provider's loop thread and keep-alive client;
+        otherwise a fresh loop and client are created with asyncio.run().
 
         Args:
             prompt: User prompt
             max_tokens: Max response tokens
             temperature: Sampling temperature
             system_prompt: Optional system prompt
+            cache_prefix: Optional run-stable leading part of ``prompt``
 
         Returns:
             Raw gateway response dict
         """
+        if self._pooled:
+            messages = self._build_messages(prompt, system_prompt, cache_prefix)
+            return self._get_pool().call(
+                lambda client: self._chat_completion(client, messages, max_tokens, temperature)
+            )
         return asyncio.run(
-            self._call_gateway_async(prompt, max_tokens, temperature, system_prompt)
+            self._call_gateway_async(prompt, max_tokens, temperature, system_prompt, cache_prefix)
         )
 
     async def _call_gateway_async(
@@ -185,43 +229,112 @@ class GatewayProvider:
         max_tokens: int,
         temperature: float,
         system_prompt: Optional[str],
+        cache_prefix: Optional[str] = None,
     ) -> dict[str, Any]:
         """
         Internal: Make async gateway call.
 
-        Converts prompt to OpenAI-compatible messages format.
+        Converts prompt to OpenAI-compatible messages format. In pooled mode
+        the request runs on the provider's loop so concurrent callers share
+        one connection pool.
 
         Args:
             prompt: User prompt
             max_tokens: Max response tokens
             temperature: Sampling temperature
             system_prompt: Optional system prompt
+            cache_prefix: Optional run-stable leading part of ``prompt``
 
         Returns:
             Raw gateway response dict
         """
-        # Convert to messages format
+        messages = self._build_messages(prompt, system_prompt, cache_prefix)
+
+        if self._pooled:
+            return await self._get_pool().call_async(
+                lambda client: self._chat_completion(client, messages, max_tokens, temperature)
+            )
+
+        async with self._create_client() as client:
+            return await self._chat_completion(client, messages, max_tokens, temperature)
+
+    @staticmethod
+    def _build_messages(
+        prompt: str,
+        system_prompt: Optional[str],
+        cache_prefix: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Convert prompt (+ optional system prompt) to messages format.
+
+        With a cache prefix, system and user contents become text-part lists
+        carrying cache_control, which the gateway forwards to providers that
+        support prompt caching.
+        """
         messages: list[dict[str, Any]] = []
+        use_cache = bool(cache_prefix) and prompt_cache_enabled()
 
         # Add system message if provided
         if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+            messages.append({
+                "role": "system",
+                "content": build_system_blocks(system_prompt) if use_cache else system_prompt,
+            })
 
         # Add user message
-        messages.append({"role": "user", "content": prompt})
-
-        # Make gateway call
+        messages.append({
+            "role": "user",
+            "content": build_user_content(prompt, cache_prefix) if use_cache else prompt,
+        })
+        return messages
+
+    def _create_client(self) -> LLMGatewayClient:
+        """Build an LLMGatewayClient for this provider's URL and timeout."""
         client_kwargs: dict[str, Any] = {"base_url": self._gateway_url}
         if self._timeout is not None:
             client_kwargs["timeout"] = self._timeout
+        return LLMGatewayClient(**client_kwargs)
 
-        async with LLMGatewayClient(**client_kwargs) as client:
-            return await client.chat_completion(
-                model=self._model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-            )
+    async def _chat_completion(
+        self,
+        client: LLMGatewayClient,
+        messages: list[dict[str, Any]],
+        max_tokens: int,
+        temperature: float,
+    ) -> dict[str, Any]:
+        """Issue one chat completion on an open client."""
+        return await client.chat_completion(
+            model=self._model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+    def _get_pool(self) -> PooledAsyncClient[LLMGatewayClient]:
+        """Return the provider's pooled client, creating it on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = PooledAsyncClient(self._create_client)
+            return self._pool
+
+    def close(self) -> None:
+        """
+        Release the pooled gateway client and its event loop thread.
+
+        No-op when not pooled or never called; a later call reopens the pool.
+        """
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+
+    def __enter__(self) -> "GatewayProvider":
+        """Enter context."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Exit context - release pooled client."""
+        self.close()
 
     def _parse_response(self, response: dict[str, Any]) -> LLMResponse:
         """
@@ -248,10 +361,8 @@ class GatewayProvider:
         # Extract finish reason
         finish_reason = choices[0].get("finish_reason")
 
-        # Extract usage
-        usage = response.get("usage", {})
-        input_tokens = usage.get("prompt_tokens", 0)
-        output_tokens = usage.get("completion_tokens", 0)
+        # Extract usage (including prompt-cache hits when reported)
+        usage = TokenUsage.from_openai(response.get("usage"))
 
         # Get model from response (fallback to configured model)
         model: str = response.get("model") or self._model
@@ -259,9 +370,11 @@ class GatewayProvider:
         return LLMResponse(
             content=content,
             model=model,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
             stop_reason=finish_reason,
+            cache_read_input_tokens=usage.cache_read_input_tokens,
+            cache_creation_input_tokens=usage.cache_creation_input_tokens,
         )
 
     @property
@@ -273,3 +386,8 @@ class GatewayProvider:
     def provider_name(self) -> str:
         """Returns 'gateway'."""
         return "gateway"
+
+    @property
+    def pooled(self) -> bool:
+        """True when calls share one loop thread and keep-alive client."""
+        return self._pooled
@@ -0,0 +1,485 @@
+"""
+LLM Rate Limiter - shared request and token budgets for every LLM caller.
+
+Provider limits are per organisation, not per code path: requests/min,
+input tokens/min and output tokens/min are counted across every caller in
+the process (and, optionally, every process sharing a state file). Before
+this module each entry point only reacted to 429s with backoff; callers now
+reserve capacity *before* sending and wait proactively instead.
+
+Model:
+- One token bucket per configured limit, refilled continuously at
+  ``limit / 60`` units per second with a burst of one minute's worth.
+- A call reserves 1 request, its estimated input tokens and its max output
+  tokens; once the response arrives ``settle()`` replaces the estimates
+  with actual usage (refunding unused output tokens, or charging overruns
+  so later callers wait).
+- ``acquire()`` blocks (sync callers) and ``acquire_async()`` awaits (async
+  callers); both take all buckets atomically, never partially. With a
+  shared state file the async variants do their file locking and I/O on a
+  worker thread, never on the event loop.
+- Concurrency governor: with a max in-flight limit, a reservation also
+  holds one call slot until it is settled or released. Waiters are served
+  in arrival order, sync and async alike. The slot count is per process
+  (a crashed process must not strand slots in a shared file).
+
+Configuration (environment, 0 or unset = unlimited):
+    LLM_RATE_LIMIT_RPM          requests per minute
+    LLM_RATE_LIMIT_INPUT_TPM    input tokens per minute
+    LLM_RATE_LIMIT_OUTPUT_TPM   output tokens per minute
+    LLM_RATE_LIMIT_TPM          combined input+output tokens per minute
+    LLM_MAX_CONCURRENT_CALLS    LLM calls in flight at once (per process)
+    LLM_RATE_LIMIT_STATE_FILE   share buckets across processes (fcntl lock)
+
+Usage:
+    limiter = get_rate_limiter()
+    reservation = limiter.acquire_for_prompt(prompt, max_tokens, system_prompt)
+    try:
+        response = provider_call(...)
+    except Exception:
+        limiter.release(reservation)
+        raise
+    limiter.settle(reservation, response.input_tokens, response.output_tokens)
+
+Reference: GUIDELINES p. 2309 (rate limits are an operational reality)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Final, Iterator, Optional, Tuple, Union
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+    FCNTL_AVAILABLE = False
+
+
+# =============================================================================
+# Module Constants (S1192 compliance)
+# =============================================================================
+
+CHARS_PER_TOKEN_ESTIMATE: Final[int] = 4
+BUCKET_WINDOW_SECONDS: Final[float] = 60.0
+MIN_WAIT_SECONDS: Final[float] = 0.005
+
+REQUESTS_BUCKET: Final[str] = "requests"
+INPUT_TOKENS_BUCKET: Final[str] = "input_tokens"
+OUTPUT_TOKENS_BUCKET: Final[str] = "output_tokens"
+TOKENS_BUCKET: Final[str] = "tokens"
+
+ENV_RPM: Final[str] = "LLM_RATE_LIMIT_RPM"
+ENV_INPUT_TPM: Final[str] = "LLM_RATE_LIMIT_INPUT_TPM"
+ENV_OUTPUT_TPM: Final[str] = "LLM_RATE_LIMIT_OUTPUT_TPM"
+ENV_TPM: Final[str] = "LLM_RATE_LIMIT_TPM"
+ENV_MAX_CONCURRENT: Final[str] = "LLM_MAX_CONCURRENT_CALLS"
+ENV_STATE_FILE: Final[str] = "LLM_RATE_LIMIT_STATE_FILE"
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Cheap pre-call token estimate (~4 characters per token)."""
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN_ESTIMATE)
+
+
+def estimate_messages_tokens(messages: list[dict[str, Any]]) -> int:
+    """Token estimate for chat messages (string contents and text blocks)."""
+    total = 0
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            total += estimate_tokens(content)
+        elif isinstance(content, list):
+            total += sum(
+                estimate_tokens(block.get("text"))
+                for block in content
+                if isinstance(block, dict) and isinstance(block.get("text"), str)
+            )
+    return total
+
+
+def _env_limit(name: str) -> Optional[int]:
+    """Read a positive integer limit from the environment (None = unlimited)."""
+    value = int(os.getenv(name, "0") or "0")
+    return value if value > 0 else None
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class RateLimits:
+    """Per-minute limits and in-flight cap; None (or <= 0) leaves that dimension unlimited."""
+
+    requests_per_minute: Optional[int] = None
+    input_tokens_per_minute: Optional[int] = None
+    output_tokens_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+    max_concurrent_calls: Optional[int] = None
+
+    @classmethod
+    def from_env(cls) -> "RateLimits":
+        """Build limits from LLM_RATE_LIMIT_* environment variables."""
+        return cls(
+            requests_per_minute=_env_limit(ENV_RPM),
+            input_tokens_per_minute=_env_limit(ENV_INPUT_TPM),
+            output_tokens_per_minute=_env_limit(ENV_OUTPUT_TPM),
+            tokens_per_minute=_env_limit(ENV_TPM),
+            max_concurrent_calls=_env_limit(ENV_MAX_CONCURRENT),
+        )
+
+    def capacities(self) -> Dict[str, float]:
+        """Bucket name -> capacity for every configured limit."""
+        configured = {
+            REQUESTS_BUCKET: self.requests_per_minute,
+            INPUT_TOKENS_BUCKET: self.input_tokens_per_minute,
+            OUTPUT_TOKENS_BUCKET: self.output_tokens_per_minute,
+            TOKENS_BUCKET: self.tokens_per_minute,
+        }
+        return {name: float(limit) for name, limit in configured.items() if limit and limit > 0}
+
+    @property
+    def enabled(self) -> bool:
+        """True when at least one limit is configured."""
+        return bool(self.capacities()) or bool(self.max_concurrent_calls and self.max_concurrent_calls > 0)
+
+
+@dataclass
+class Reservation:
+    """Capacity taken by one call; settled or released exactly once."""
+
+    input_tokens: int
+    output_tokens: int
+    settled: bool = field(default=False, compare=False)
+    holds_slot: bool = field(default=False, compare=False)
+
+
+# =============================================================================
+# Concurrency Gate
+# =============================================================================
+
+
+class _ConcurrencyGate:
+    """
+    Cap on calls in flight, shared by threads and event loops.
+
+    A freed slot is handed straight to the oldest waiter (a threading.Event
+    for sync callers, a future on the waiter's loop for async ones), so
+    neither kind of caller polls or starves the other.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._waiters: Deque[Union[threading.Event, Tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = deque()
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return self._in_flight
+
+    def _try_enter_locked(self) -> bool:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return True
+        return False
+
+    def enter(self) -> None:
+        """Block until a slot is free, then take it."""
+        with self._lock:
+            if self._try_enter_locked():
+                return
+            event = threading.Event()
+            self._waiters.append(event)
+        event.wait()
+
+    async def enter_async(self) -> None:
+        """Await a free slot, then take it."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._try_enter_locked():
+                return
+            future = loop.create_future()
+            waiter = (loop, future)
+            self._waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.exit()  # the slot arrived as we were cancelled
+            else:
+                with self._lock:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+                # otherwise a hand-off is pending and _hand_off returns the slot
+            raise
+
+    def _hand_off(self, future: asyncio.Future) -> None:
+        if future.cancelled():
+            self.exit()
+        else:
+            future.set_result(None)
+
+    def exit(self) -> None:
+        """Give a slot back, or pass it to the oldest waiter."""
+        with self._lock:
+            if not self._waiters:
+                self._in_flight -= 1
+                return
+            waiter = self._waiters.popleft()
+        if isinstance(waiter, threading.Event):
+            waiter.set()
+        else:
+            loop, future = waiter
+            loop.call_soon_threadsafe(self._hand_off, future)
+
+
+# =============================================================================
+# Rate Limiter
+# =============================================================================
+
+
+class LLMRateLimiter:
+    """
+    Token-bucket governor for requests, input tokens and output tokens,
+    plus an optional cap on calls in flight.
+
+    Thread-safe and usable from any event loop. With ``state_file`` the
+    bucket levels live in a JSON file guarded by an exclusive ``fcntl``
+    lock, so separate worker processes share one budget.
+    """
+
+    def __init__(
+        self,
+        limits: RateLimits,
+        state_file: Optional[Union[str, Path]] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the limiter with full buckets.
+
+        Args:
+            limits: Per-minute limits to enforce
+            state_file: Optional path for cross-process shared state
+            clock: Wall-clock source (wall time so processes agree)
+            sleep: Blocking sleep used by acquire()
+        """
+        self.limits = limits
+        self._capacities = limits.capacities()
+        self._state_file = Path(state_file) if state_file and FCNTL_AVAILABLE else None
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Dict[str, float]] = {}
+        max_concurrent = limits.max_concurrent_calls
+        self._gate = _ConcurrencyGate(max_concurrent) if max_concurrent and max_concurrent > 0 else None
+
+    @property
+    def enabled(self) -> bool:
+        """False when no limit is configured (acquire is then a no-op)."""
+        return bool(self._capacities) or self._gate is not None
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently holding a slot (0 without a concurrency limit)."""
+        return self._gate.in_flight if self._gate is not None else 0
+
+    # -------------------------------------------------------------------------
+    # Bucket state
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def _locked_buckets(self) -> Iterator[Dict[str, Dict[str, float]]]:
+        """Yield bucket state under the thread lock (and file lock if shared)."""
+        with self._lock:
+            if self._state_file is None:
+                yield self._buckets
+                return
+            self._state_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._state_file, "a+", encoding="utf-8") as handle:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                try:
+                    handle.seek(0)
+                    raw = handle.read()
+                    buckets = json.loads(raw) if raw.strip() else {}
+                    yield buckets
+                    handle.seek(0)
+                    handle.truncate()
+                    json.dump(buckets, handle)
+                    handle.flush()
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _refill(self, buckets: Dict[str, Dict[str, float]], now: float) -> None:
+        """Top up every bucket for the time elapsed since its last update."""
+        for name, capacity in self._capacities.items():
+            bucket = buckets.setdefault(name, {"level": capacity, "updated": now})
+            elapsed = max(0.0, now - bucket["updated"])
+            rate = capacity / BUCKET_WINDOW_SECONDS
+            bucket["level"] = min(capacity, bucket["level"] + elapsed * rate)
+            bucket["updated"] = now
+
+    def _demand(self, input_tokens: int, output_tokens: int) -> Dict[str, float]:
+        """Units each bucket must supply; one call never exceeds a full bucket."""
+        wanted = {
+            REQUESTS_BUCKET: 1.0,
+            INPUT_TOKENS_BUCKET: float(input_tokens),
+            OUTPUT_TOKENS_BUCKET: float(output_tokens),
+            TOKENS_BUCKET: float(input_tokens + output_tokens),
+        }
+        return {name: min(wanted[name], capacity) for name, capacity in self._capacities.items()}
+
+    def _try_take(self, demand: Dict[str, float]) -> float:
+        """Take ``demand`` from all buckets, or return seconds until it would fit."""
+        if not demand:
+            return 0.0
+        with self._locked_buckets() as buckets:
+            self._refill(buckets, self._clock())
+            wait = 0.0
+            for name, amount in demand.items():
+                deficit = amount - buckets[name]["level"]
+                if deficit > 0:
+                    rate = self._capacities[name] / BUCKET_WINDOW_SECONDS
+                    wait = max(wait, deficit / rate)
+            if wait > 0:
+                return max(wait, MIN_WAIT_SECONDS)
+            for name, amount in demand.items():
+                buckets[name]["level"] -= amount
+            return 0.0
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    async def _off_loop(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run bucket I/O on a worker thread when it locks and rewrites the state file."""
+        if self._state_file is None:
+            return fn(*args)
+        return await asyncio.to_thread(fn, *args)
+
+    def acquire(self, input_tokens: int, output_tokens: int = 0) -> Reservation:
+        """Block until one request with these token estimates fits, then reserve it."""
+        reservation = Reservation(input_tokens, output_tokens)
+        if not self.enabled:
+            return reservation
+        if self._gate is not None:
+            self._gate.enter()
+            reservation.holds_slot = True
+        try:
+            demand = self._demand(input_tokens, output_tokens)
+            while (wait := self._try_take(demand)) > 0:
+                self._sleep(wait)
+        except BaseException:
+            self._release_slot(reservation)
+            raise
+        return reservation
+
+    async def acquire_async(self, input_tokens: int, output_tokens: int = 0) -> Reservation:
+        """Async variant of acquire(); waits without blocking the event loop."""
+        reservation = Reservation(input_tokens, output_tokens)
+        if not self.enabled:
+            return reservation
+        if self._gate is not None:
+            await self._gate.enter_async()
+            reservation.holds_slot = True
+        try:
+            demand = self._demand(input_tokens, output_tokens)
+            while (wait := await self._off_loop(self._try_take, demand)) > 0:
+                await asyncio.sleep(wait)
+        except BaseException:
+            self._release_slot(reservation)
+            raise
+        return reservation
+
+    def _release_slot(self, reservation: Reservation) -> None:
+        if reservation.holds_slot:
+            reservation.holds_slot = False
+            self._gate.exit()  # type: ignore[union-attr]
+
+    def acquire_for_prompt(
+        self,
+        prompt: str,
+        max_tokens: int,
+        system_prompt: Optional[str] = None,
+    ) -> Reservation:
+        """acquire() with input estimated from the prompt and output = max_tokens."""
+        return self.acquire(estimate_tokens(prompt) + estimate_tokens(system_prompt), max_tokens)
+
+    def settle(self, reservation: Reservation, input_tokens: int, output_tokens: int) -> None:
+        """Replace a reservation's estimates with actual usage and free its slot."""
+        if reservation.settled:
+            return
+        reservation.settled = True
+        self._release_slot(reservation)
+        if not self._capacities:
+            return
+        delta_in = input_tokens - reservation.input_tokens
+        delta_out = output_tokens - reservation.output_tokens
+        deltas = {
+            INPUT_TOKENS_BUCKET: delta_in,
+            OUTPUT_TOKENS_BUCKET: delta_out,
+            TOKENS_BUCKET: delta_in + delta_out,
+        }
+        with self._locked_buckets() as buckets:
+            self._refill(buckets, self._clock())
+            for name, delta in deltas.items():
+                if name in self._capacities:
+                    # Overruns drive the level negative so later callers wait
+                    bucket = buckets[name]
+                    bucket["level"] = min(self._capacities[name], bucket["level"] - delta)
+
+    def release(self, reservation: Reservation) -> None:
+        """Settle a failed call: input counted as sent, no output produced."""
+        self.settle(reservation, reservation.input_tokens, 0)
+
+    async def settle_async(self, reservation: Reservation, input_tokens: int, output_tokens: int) -> None:
+        """settle() for async callers (state-file I/O off the event loop)."""
+        await self._off_loop(self.settle, reservation, input_tokens, output_tokens)
+
+    async def release_async(self, reservation: Reservation) -> None:
+        """release() for async callers (state-file I/O off the event loop)."""
+        await self._off_loop(self.release, reservation)
+
+
+# =============================================================================
+# Process-wide limiter
+# =============================================================================
+
+_DEFAULT_LIMITER: Optional[LLMRateLimiter] = None
+_DEFAULT_LIMITER_LOCK = threading.Lock()
+
+
+def get_rate_limiter() -> LLMRateLimiter:
+    """Return the process-wide limiter, built from the environment on first use."""
+    global _DEFAULT_LIMITER
+    if _DEFAULT_LIMITER is None:
+        with _DEFAULT_LIMITER_LOCK:
+            if _DEFAULT_LIMITER is None:
+                _DEFAULT_LIMITER = LLMRateLimiter(
+                    RateLimits.from_env(),
+                    state_file=os.getenv(ENV_STATE_FILE) or None,
+                )
+    return _DEFAULT_LIMITER
+
+
+def set_rate_limiter(limiter: Optional[LLMRateLimiter]) -> None:
+    """Install a process-wide limiter (None = rebuild from env on next use)."""
+    global _DEFAULT_LIMITER
+    with _DEFAULT_LIMITER_LOCK:
+        _DEFAULT_LIMITER = limiter
@@ -3,20 +3,60 @@ Retry logic wrapper for LLM calls with exponential backoff.
 
 Handles transient failures with configurable retry attempts,
 backoff strategies, and progressive constraint tightening.
+
+Shared retry engine (sync ``retry_call`` / async ``retry_call_async``)
+used by the LLM wrappers below and by every HTTP client in
+workflows.shared.clients:
+- Jitter: decorrelated by default, so concurrent workers that fail
+  together do not retry in lock-step and re-create the load spike
+- Retry-After: a server hint (seconds or HTTP-date) on the error's
+  ``retry_after`` attribute overrides a shorter backoff, capped at
+  ``RetryConfig.max_retry_after`` seconds
+- Deadline budget: an operation stops retrying once the next sleep would
+  overrun ``RetryConfig.deadline`` seconds
+- Circuit breaker: after ``failure_threshold`` consecutive failed
+  operations calls fail fast with CircuitOpenError for ``reset_timeout``
+  seconds, then a single trial call is let through (half-open)
 """
 
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
 import time
 import logging
-from typing import Optional, Callable, TypeVar, Any
+import math
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Optional, Callable, TypeVar, Any, Awaitable
 from dataclasses import dataclass
 
-from .providers.base import LLMProvider, LLMResponse, LLMError
+if TYPE_CHECKING:
+    from .providers.base import LLMProvider, LLMResponse
 
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Jitter strategies for RetryConfig.jitter
+JITTER_NONE = "none"
+JITTER_FULL = "full"
+JITTER_DECORRELATED = "decorrelated"
+DECORRELATED_JITTER_MULTIPLIER = 3.0
+
+# Circuit breaker states
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+# Longest server Retry-After hint honoured, in seconds
+DEFAULT_MAX_RETRY_AFTER = 300.0
+
+# Default total retry budget (seconds) for the HTTP clients in workflows.shared.clients
+DEFAULT_RETRY_DEADLINE = 120.0
+
 
 @dataclass
 class RetryConfig:
@@ -26,6 +66,10 @@ class RetryConfig:
     initial_delay: float = 1.0
     max_delay: float = 60.0
     constraint_tightening_factor: float = 0.8
+    jitter: str = JITTER_DECORRELATED
+    deadline: Optional[float] = None
+    respect_retry_after: bool = True
+    max_retry_after: float = DEFAULT_MAX_RETRY_AFTER
     
     def get_delay(self, attempt: int) -> float:
         """
@@ -40,6 +84,35 @@ class RetryConfig:
         delay = self.initial_delay * (self.backoff_factor ** attempt)
         return min(delay, self.max_delay)
     
+    def next_delay(
+        self,
+        attempt: int,
+        previous_delay: float,
+        rng: Optional[random.Random] = None,
+    ) -> float:
+        """
+        Calculate the jittered delay before the next attempt.
+        
+        - none: get_delay(attempt)
+        - full: uniform(0, get_delay(attempt))
+        - decorrelated: uniform(initial_delay, previous_delay * 3), capped
+        
+        Args:
+            attempt: Attempt number that just failed (0-indexed)
+            previous_delay: Delay used before this attempt (initial_delay first)
+            rng: Random source (module random when omitted)
+            
+        Returns:
+            Delay in seconds, capped at max_delay
+        """
+        source: Any = rng or random
+        if self.jitter == JITTER_NONE:
+            return self.get_delay(attempt)
+        if self.jitter == JITTER_FULL:
+            return source.uniform(0.0, self.get_delay(attempt))
+        upper = max(self.initial_delay, previous_delay * DECORRELATED_JITTER_MULTIPLIER)
+        return min(self.max_delay, source.uniform(self.initial_delay, upper))
+    
     def get_adjusted_max_tokens(self, original: int, attempt: int) -> int:
         """
         Calculate adjusted max_tokens for retry attempts.
@@ -66,17 +139,347 @@ class RetryConfig:
 
 
 class RetryExhaustedError(Exception):
-    """Raised when all retry attempts have been exhausted."""
+    """Raised when all retry attempts (or the deadline budget) have been exhausted."""
     
-    def __init__(self, attempts: int, last_error: Exception):
+    def __init__(self, attempts: int, last_error: Exception, deadline_exceeded: bool = False):
         self.attempts = attempts
         self.last_error = last_error
+        self.deadline_exceeded = deadline_exceeded
+        reason = "deadline budget exhausted" if deadline_exceeded else "Retry exhausted"
         super().__init__(
-            f"Retry exhausted after {attempts} attempts. "
+            f"{reason} after {attempts} attempts. "
             f"Last error: {last_error}"
         )
 
 
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit breaker is open."""
+    
+    def __init__(self, name: str, retry_in: float):
+        self.name = name
+        self.retry_in = retry_in
+        super().__init__(
+            f"Circuit '{name}' is open; failing fast (retry in {retry_in:.1f}s)"
+        )
+
+
+# =============================================================================
+# Retry-After parsing
+# =============================================================================
+
+
+def parse_retry_after(value: Any, now: Optional[datetime] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header value into seconds.
+    
+    Args:
+        value: Header value - delta-seconds ("120") or an HTTP-date
+        now: Reference time for HTTP-dates (UTC now when omitted)
+        
+    Returns:
+        Non-negative finite seconds, or None when absent/unparseable
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        # "inf" / "nan" parse as floats but cannot be slept on
+        return max(0.0, seconds) if math.isfinite(seconds) else None
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+def retry_after_from_response(response: Any) -> Optional[float]:
+    """Read Retry-After (seconds) from an HTTP response's headers, if any."""
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        return None
+    try:
+        return parse_retry_after(headers.get("Retry-After"))
+    except Exception:
+        return None
+
+
+# =============================================================================
+# Circuit Breaker
+# =============================================================================
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one downstream dependency.
+    
+    Counts failed *operations* (after their retries), not attempts, so one
+    slow recovery does not trip it mid-operation. Thread-safe; one instance
+    may be shared by every client talking to the same service.
+    
+    Pattern: Circuit breaker (GUIDELINES p. 2145, Newman p. 352-360)
+    """
+    
+    def __init__(
+        self,
+        name: str = "default",
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+    
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        with self._lock:
+            return self._state_locked()
+    
+    def _state_locked(self) -> str:
+        if self._opened_at is None:
+            return CIRCUIT_CLOSED
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return CIRCUIT_HALF_OPEN
+        return CIRCUIT_OPEN
+    
+    def before_call(self) -> bool:
+        """
+        Admit a call or fail fast.
+        
+        Returns:
+            True if the call was admitted as the half-open trial; its owner
+            must end it with record_success, record_failure or release_trial
+        
+        Raises:
+            CircuitOpenError: While open, or while a half-open trial is running
+        """
+        with self._lock:
+            state = self._state_locked()
+            if state == CIRCUIT_CLOSED:
+                return False
+            if state == CIRCUIT_HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            retry_in = max(0.0, self._opened_at + self.reset_timeout - self._clock())  # type: ignore[operator]
+        raise CircuitOpenError(self.name, retry_in)
+    
+    def record_success(self) -> None:
+        """Close the circuit and reset the failure count."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+    
+    def record_failure(self) -> None:
+        """Count a failed operation; open (or re-open) the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._trial_in_flight = False
+    
+    def release_trial(self) -> None:
+        """End a half-open trial without a verdict (e.g. the call was cancelled)."""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+# =============================================================================
+# Retry Engine
+# =============================================================================
+
+
+class _RetryRun:
+    """Per-operation retry bookkeeping shared by retry_call and retry_call_async."""
+    
+    def __init__(
+        self,
+        config: RetryConfig,
+        retry_on: tuple[type[Exception], ...],
+        is_retryable: Optional[Callable[[Exception], bool]],
+        breaker: Optional[CircuitBreaker],
+        on_retry: Optional[Callable[[int, Exception, float], None]],
+        clock: Callable[[], float],
+        rng: Optional[random.Random],
+    ):
+        self.config = config
+        self.retry_on = retry_on
+        self.is_retryable = is_retryable
+        self.breaker = breaker
+        self.on_retry = on_retry
+        self.clock = clock
+        self.rng = rng
+        self.started = clock()
+        self.previous_delay = config.initial_delay
+        self.holds_trial = False
+    
+    def start(self) -> None:
+        """Fail fast when the circuit is open."""
+        if self.breaker is not None:
+            self.holds_trial = self.breaker.before_call()
+    
+    def succeeded(self) -> None:
+        if self.breaker is not None:
+            self.breaker.record_success()
+            self.holds_trial = False
+    
+    def abandon(self) -> None:
+        """Release a half-open trial the operation never gave a verdict on."""
+        if self.holds_trial:
+            self.breaker.release_trial()  # type: ignore[union-attr]
+            self.holds_trial = False
+    
+    def retryable(self, error: Exception) -> bool:
+        """True when the error is transient (retry_on match and predicate)."""
+        if not isinstance(error, self.retry_on):
+            return False
+        return self.is_retryable is None or self.is_retryable(error)
+    
+    def delay_after(self, attempt: int, error: Exception) -> float:
+        """
+        Delay before the next attempt.
+        
+        Raises:
+            RetryExhaustedError: When attempts or the deadline budget are spent
+        """
+        if attempt >= self.config.max_attempts - 1:
+            raise self._exhausted(attempt + 1, error, deadline_exceeded=False)
+        
+        delay = self.config.next_delay(attempt, self.previous_delay, self.rng)
+        retry_after = getattr(error, "retry_after", None)
+        if (
+            self.config.respect_retry_after
+            and isinstance(retry_after, (int, float))
+            and math.isfinite(retry_after)
+        ):
+            delay = max(delay, min(float(retry_after), self.config.max_retry_after))
+        
+        if self.config.deadline is not None:
+            elapsed = self.clock() - self.started
+            if elapsed + delay > self.config.deadline:
+                raise self._exhausted(attempt + 1, error, deadline_exceeded=True)
+        
+        self.previous_delay = delay
+        if self.on_retry:
+            self.on_retry(attempt, error, delay)
+        return delay
+    
+    def failed(self, error: Exception) -> None:
+        """Record a transient operation failure on the breaker."""
+        if self.breaker is not None:
+            self.breaker.record_failure()
+            self.holds_trial = False
+    
+    def _exhausted(self, attempts: int, error: Exception, deadline_exceeded: bool) -> RetryExhaustedError:
+        self.failed(error)
+        return RetryExhaustedError(attempts, error, deadline_exceeded=deadline_exceeded)
+
+
+def retry_call(
+    fn: Callable[[int], T],
+    config: Optional[RetryConfig] = None,
+    retry_on: tuple[type[Exception], ...] = (Exception,),
+    is_retryable: Optional[Callable[[Exception], bool]] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    on_retry: Optional[Callable[[int, Exception, float], None]] = None,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+    rng: Optional[random.Random] = None,
+) -> T:
+    """
+    Run ``fn(attempt)`` with jittered retries, deadline budget and circuit breaker.
+    
+    Args:
+        fn: Callable taking the 0-indexed attempt number
+        config: Retry configuration (defaults if not provided)
+        retry_on: Exception types considered for retry
+        is_retryable: Optional predicate narrowing retry_on (e.g. by status code)
+        breaker: Optional circuit breaker for the dependency
+        on_retry: Optional callback (attempt, error, delay) before each sleep
+        sleep: Blocking sleep function
+        clock: Monotonic clock for the deadline budget
+        rng: Random source for jitter
+        
+    Returns:
+        fn's result from the first successful attempt
+        
+    Raises:
+        RetryExhaustedError: When attempts or the deadline are exhausted
+        CircuitOpenError: When the breaker is open
+        Exception: Non-retryable errors from fn, unchanged
+    """
+    run = _RetryRun(config or RetryConfig(), retry_on, is_retryable, breaker, on_retry, clock, rng)
+    run.start()
+    attempt = 0
+    try:
+        while True:
+            try:
+                result = fn(attempt)
+            except Exception as e:
+                if not run.retryable(e):
+                    # The dependency answered; only transient failures trip the breaker
+                    run.succeeded()
+                    raise
+                sleep(run.delay_after(attempt, e))
+                attempt += 1
+                continue
+            run.succeeded()
+            return result
+    finally:
+        # KeyboardInterrupt and the like must not leave a half-open trial held
+        run.abandon()
+
+
+async def retry_call_async(
+    fn: Callable[[int], Awaitable[T]],
+    config: Optional[RetryConfig] = None,
+    retry_on: tuple[type[Exception], ...] = (Exception,),
+    is_retryable: Optional[Callable[[Exception], bool]] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    on_retry: Optional[Callable[[int, Exception, float], None]] = None,
+    clock: Callable[[], float] = time.monotonic,
+    rng: Optional[random.Random] = None,
+) -> T:
+    """
+    Async variant of retry_call: awaits ``fn(attempt)`` and sleeps with asyncio.sleep.
+    
+    Same arguments, return value and exceptions as retry_call.
+    """
+    run = _RetryRun(config or RetryConfig(), retry_on, is_retryable, breaker, on_retry, clock, rng)
+    run.start()
+    attempt = 0
+    try:
+        while True:
+            try:
+                result = await fn(attempt)
+            except Exception as e:
+                if not run.retryable(e):
+                    # The dependency answered; only transient failures trip the breaker
+                    run.succeeded()
+                    raise
+                await asyncio.sleep(run.delay_after(attempt, e))
+                attempt += 1
+                continue
+            run.succeeded()
+            return result
+    finally:
+        # A cancelled half-open trial must not leave the circuit stuck
+        run.abandon()
+
+
 def call_llm_with_retry(
     provider: LLMProvider,
     prompt: str,
@@ -85,12 +488,18 @@ def call_llm_with_retry(
     system_prompt: Optional[str] = None,
     config: Optional[RetryConfig] = None,
     on_retry: Optional[Callable[[int, Exception, float], None]] = None,
+    breaker: Optional[CircuitBreaker] = None,
 ) -> LLMResponse:
     """
     Call LLM provider with automatic retry logic.
     
-    Implements exponential backoff and progressive constraint tightening
-    on retry attempts. Retries on LLMError exceptions.
+    Implements jittered backoff (RetryConfig.jitter), an optional deadline
+    budget and progressive constraint tightening on retry attempts.
+    Retries on LLMError exceptions.
+    
+    Every attempt is governed up front by the process-wide rate limiter
+    (workflows.shared.rate_limiter), which the built-in providers acquire
+    inside call(); backoff here only handles failures that still occur.
     
     Args:
         provider: LLM provider to use
@@ -100,12 +509,14 @@ def call_llm_with_retry(
         system_prompt: Optional system prompt
         config: Retry configuration (uses defaults if not provided)
         on_retry: Optional callback called on retry (attempt, error, delay)
+        breaker: Optional circuit breaker shared by callers of this provider
         
     Returns:
         LLMResponse from successful call
         
     Raises:
         RetryExhaustedError: If all retry attempts fail
+        CircuitOpenError: If the breaker is open
         
     Example:
         >>> provider = AnthropicProvider(api_key="...")
@@ -117,61 +528,55 @@ def call_llm_with_retry(
         ...     config=config,
         ... )
     """
+    # Deferred: providers import the HTTP clients, which import this module
+    from .providers.base import LLMError
+    
     if config is None:
         config = RetryConfig()
     
-    last_error: Optional[Exception] = None
-    
-    for attempt in range(config.max_attempts):
-        try:
-            # Adjust max_tokens for retry attempts
-            adjusted_max_tokens = config.get_adjusted_max_tokens(max_tokens, attempt)
-            
-            if attempt > 0:
-                logger.info(
-                    f"Retry attempt {attempt + 1}/{config.max_attempts} "
-                    f"(max_tokens adjusted: {max_tokens} -> {adjusted_max_tokens})"
-                )
-            
-            # Make the LLM call
-            response = provider.call(
-                prompt=prompt,
-                max_tokens=adjusted_max_tokens,
-                temperature=temperature,
-                system_prompt=system_prompt,
-            )
-            
+    def _attempt(attempt: int) -> LLMResponse:
+        # Adjust max_tokens for retry attempts
+        adjusted_max_tokens = config.get_adjusted_max_tokens(max_tokens, attempt)
+        
+        if attempt > 0:
             logger.info(
-                f"LLM call successful (attempt {attempt + 1}, "
-                f"tokens: {response.total_tokens})"
-            )
-            
-            return response
-            
-        except LLMError as e:
-            last_error = e
-            
-            # If this was the last attempt, raise
-            if attempt >= config.max_attempts - 1:
-                break
-            
-            # Calculate delay and wait
-            delay = config.get_delay(attempt)
-            
-            logger.warning(
-                f"LLM call failed (attempt {attempt + 1}/{config.max_attempts}): {e}. "
-                f"Retrying in {delay:.1f}s..."
+                f"Retry attempt {attempt + 1}/{config.max_attempts} "
+                f"(max_tokens adjusted: {max_tokens} -> {adjusted_max_tokens})"
             )
-            
-            # Call retry callback if provided
-            if on_retry:
-                on_retry(attempt, e, delay)
-            
-            time.sleep(delay)
+        
+        # Make the LLM call
+        response = provider.call(
+            prompt=prompt,
+            max_tokens=adjusted_max_tokens,
+            temperature=temperature,
+            system_prompt=system_prompt,
+        )
+        
+        logger.info(
+            f"LLM call successful (attempt {attempt + 1}, "
+            f"tokens: {response.total_tokens})"
+        )
+        
+        return response
+    
+    def _log_retry(attempt: int, error: Exception, delay: float) -> None:
+        logger.warning(
+            f"LLM call failed (attempt {attempt + 1}/{config.max_attempts}): {error}. "
+            f"Retrying in {delay:.1f}s..."
+        )
+        
+        # Call retry callback if provided
+        if on_retry:
+            on_retry(attempt, error, delay)
     
-    # All attempts exhausted
-    # Cast last_error to Exception (guaranteed non-None after loop)
-    raise RetryExhaustedError(config.max_attempts, last_error if last_error is not None else Exception("Unknown error"))
+    return retry_call(
+        _attempt,
+        config=config,
+        retry_on=(LLMError,),
+        breaker=breaker,
+        on_retry=_log_retry,
+        sleep=time.sleep,
+    )
 
 
 def _handle_retry_failure(
@@ -231,22 +636,15 @@ def call_with_retry(
         config = RetryConfig()
     
     def wrapper(*args: Any, **kwargs: Any) -> T:
-        last_error: Optional[Exception] = None
+        def _log_retry(attempt: int, error: Exception, delay: float) -> None:
+            _handle_retry_failure(func, attempt, error, delay, on_retry)
         
-        for attempt in range(config.max_attempts):
-            try:
-                return func(*args, **kwargs)
-            except retry_on as e:
-                last_error = e
-                
-                if attempt >= config.max_attempts - 1:
-                    break
-                
-                delay = config.get_delay(attempt)
-                _handle_retry_failure(func, attempt, e, delay, on_retry)
-                time.sleep(delay)
-        
-        # Cast last_error to Exception (guaranteed non-None after loop)
-        raise RetryExhaustedError(config.max_attempts, last_error if last_error is not None else Exception("Unknown error"))
+        return retry_call(
+            lambda _attempt: func(*args, **kwargs),
+            config=config,
+            retry_on=retry_on,
+            on_retry=_log_retry,
+            sleep=time.sleep,
+        )
     
     return wrapper
@@ -0,0 +1,323 @@
+"""
+Streaming support for LLM calls: incremental JSON validation and latency metrics.
+
+With streaming, a malformed JSON answer is detected while it is being
+generated instead of after all of its output tokens have been paid for, and
+every call reports time-to-first-token (TTFT) and output tokens/sec.
+
+- IncrementalJSONValidator: structural JSON checker fed one text chunk at a
+  time; tolerates a short preamble (prose, ```json fence, BEGIN_JSON) and
+  anything after the top-level value (closing fence, END_JSON, checksum)
+- StreamMonitor: feeds chunks to the validator, times the stream and raises
+  StreamAbortedError on the first irrecoverable structure error
+- StreamMetrics: TTFT / duration / tokens-per-second for one streamed call
+
+Set LLM_STREAMING_ENABLED=true to stream call_llm requests.
+
+References:
+- Anthropic API docs: Streaming Messages (server-sent events)
+- RFC 8259: JSON grammar
+"""
+
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Callable, Final, List, Optional
+
+STREAMING_ENV: Final[str] = "LLM_STREAMING_ENABLED"
+DEFAULT_MAX_PREAMBLE_CHARS: Final[int] = 2000
+CHARS_PER_TOKEN_ESTIMATE: Final[int] = 4
+
+_OBJECT: Final[str] = "object"
+_ARRAY: Final[str] = "array"
+
+# Parser expectations between tokens
+_KEY_OR_END: Final[str] = "key or '}'"
+_KEY: Final[str] = "key"
+_COLON: Final[str] = "':'"
+_VALUE_OR_END: Final[str] = "value or ']'"
+_VALUE: Final[str] = "value"
+_COMMA_OR_END: Final[str] = "',' or closing bracket"
+
+_SCALAR_CHARS: Final[frozenset] = frozenset("0123456789+-.eEtruefalsn")
+_SCALAR_RE: Final[re.Pattern] = re.compile(
+    r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null"
+)
+_CLOSERS: Final[dict] = {"}": _OBJECT, "]": _ARRAY}
+
+
+def streaming_enabled() -> bool:
+    """True when LLM_STREAMING_ENABLED=true."""
+    return os.getenv(STREAMING_ENV, "false").lower() == "true"
+
+
+class StreamAbortedError(Exception):
+    """Raised when a streamed response is abandoned because it cannot be valid JSON."""
+
+    def __init__(self, reason: str, partial_text: str, metrics: "StreamMetrics"):
+        super().__init__(f"Stream aborted: {reason}")
+        self.reason = reason
+        self.partial_text = partial_text
+        self.metrics = metrics
+
+
+@dataclass
+class StreamMetrics:
+    """Latency and throughput of one streamed call."""
+    chapter_num: int = 0
+    ttft_seconds: Optional[float] = None
+    duration_seconds: float = 0.0
+    output_tokens: int = 0
+    output_chars: int = 0
+    aborted: bool = False
+    abort_reason: Optional[str] = None
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Output tokens per second after the first token arrived."""
+        if self.ttft_seconds is None:
+            return 0.0
+        generating = self.duration_seconds - self.ttft_seconds
+        return self.output_tokens / generating if generating > 0 else 0.0
+
+    def describe(self) -> str:
+        """One-line summary for progress output."""
+        ttft = "n/a" if self.ttft_seconds is None else f"{self.ttft_seconds:.2f}s"
+        summary = (
+            f"TTFT {ttft}, {self.output_tokens:,} output tokens in "
+            f"{self.duration_seconds:.2f}s ({self.tokens_per_second:.1f} tokens/s)"
+        )
+        if self.aborted:
+            summary += f", aborted: {self.abort_reason}"
+        return summary
+
+
+class IncrementalJSONValidator:
+    """
+    Structural JSON validator fed one chunk at a time.
+
+    Tracks bracket nesting, string/escape state and the expected next token,
+    so an error is reported at the first character that cannot be part of
+    valid JSON (single-quoted or unquoted keys, trailing commas, mismatched
+    brackets, raw newlines inside strings, invalid literals).
+
+    Text before the JSON value is an allowed preamble of up to
+    ``max_preamble_chars``. A ``{`` or ``[`` at the start of a line commits
+    to the value. One after prose on the same line ("Here is the analysis:
+    {...") is tentative: if it turns out not to be JSON within the preamble
+    budget ("Use {braces} freely"), scanning resumes as preamble instead of
+    failing. Text after the top-level value is ignored.
+
+    Usage:
+        >>> validator = IncrementalJSONValidator()
+        >>> validator.feed('{"a": [1, ')
+        >>> validator.feed("2]}")
+        >>> validator.complete
+        True
+    """
+
+    def __init__(self, max_preamble_chars: int = DEFAULT_MAX_PREAMBLE_CHARS):
+        self.max_preamble_chars = max_preamble_chars
+        self.error: Optional[str] = None
+        self.complete = False
+        self._offset = 0
+        self._started = False
+        self._tentative = False
+        self._line_start = True
+        self._stack: List[str] = []
+        self._expect = _VALUE
+        self._in_string = False
+        self._escape = False
+        self._scalar = ""
+
+    @property
+    def started(self) -> bool:
+        """True once the top-level JSON value has begun."""
+        return self._started
+
+    def feed(self, chunk: str) -> Optional[str]:
+        """
+        Validate the next chunk.
+
+        Returns:
+            The error message once the stream is irrecoverable, else None
+        """
+        for ch in chunk:
+            if self.error is not None or self.complete:
+                break
+            self._consume(ch)
+            self._offset += 1
+        return self.error
+
+    # ------------------------------------------------------------------
+
+    def _fail(self, message: str) -> None:
+        if self._tentative and self._offset < self.max_preamble_chars:
+            # A bracket inside prose, not the response's JSON value
+            self._resume_preamble()
+            return
+        self.error = f"{message} at offset {self._offset}"
+
+    def _resume_preamble(self) -> None:
+        self._started = False
+        self._tentative = False
+        self._line_start = False
+        self._stack = []
+        self._expect = _VALUE
+        self._in_string = False
+        self._escape = False
+        self._scalar = ""
+
+    def _consume(self, ch: str) -> None:
+        if not self._started:
+            self._consume_preamble(ch)
+        elif self._in_string:
+            self._consume_string(ch)
+        else:
+            if self._scalar:
+                if ch in _SCALAR_CHARS:
+                    self._scalar += ch
+                    return
+                if not self._end_scalar():
+                    return
+            self._consume_structure(ch)
+
+    def _consume_preamble(self, ch: str) -> None:
+        if ch in "{[":
+            self._started = True
+            self._tentative = not self._line_start
+            self._open(ch)
+            return
+        if ch == "\n":
+            self._line_start = True
+        elif not ch.isspace():
+            self._line_start = False
+        if self._offset + 1 > self.max_preamble_chars:
+            self._fail(f"No JSON value within {self.max_preamble_chars} chars")
+
+    def _consume_string(self, ch: str) -> None:
+        if self._escape:
+            self._escape = False
+        elif ch == "\\":
+            self._escape = True
+        elif ch == '"':
+            self._in_string = False
+            self._after_value_or_key()
+        elif ord(ch) < 0x20:
+            self._fail("Unescaped control character in string")
+
+    def _consume_structure(self, ch: str) -> None:
+        if ch in " \t\r\n":
+            return
+        expect = self._expect
+        if ch == '"' and expect in (_KEY_OR_END, _KEY, _VALUE_OR_END, _VALUE):
+            self._in_string = True
+        elif ch in "{[" and expect in (_VALUE_OR_END, _VALUE):
+            self._open(ch)
+        elif ch in _SCALAR_CHARS and expect in (_VALUE_OR_END, _VALUE):
+            self._scalar = ch
+        elif ch in _CLOSERS and expect in (_KEY_OR_END, _VALUE_OR_END, _COMMA_OR_END):
+            self._close(ch)
+        elif ch == ":" and expect == _COLON:
+            self._expect = _VALUE
+        elif ch == "," and expect == _COMMA_OR_END:
+            self._expect = _KEY if self._stack[-1] == _OBJECT else _VALUE
+        else:
+            self._fail(f"Unexpected {ch!r} (expected {expect})")
+
+    def _open(self, ch: str) -> None:
+        if ch == "{":
+            self._stack.append(_OBJECT)
+            self._expect = _KEY_OR_END
+        else:
+            self._stack.append(_ARRAY)
+            self._expect = _VALUE_OR_END
+
+    def _close(self, ch: str) -> None:
+        if self._stack[-1] != _CLOSERS[ch]:
+            self._fail(f"Mismatched {ch!r} closing {self._stack[-1]}")
+            return
+        self._stack.pop()
+        if self._stack:
+            self._expect = _COMMA_OR_END
+        else:
+            self.complete = True
+
+    def _end_scalar(self) -> bool:
+        token, self._scalar = self._scalar, ""
+        if not _SCALAR_RE.fullmatch(token):
+            self._fail(f"Invalid literal {token!r}")
+            return False
+        self._expect = _COMMA_OR_END
+        return True
+
+    def _after_value_or_key(self) -> None:
+        if self._expect in (_KEY_OR_END, _KEY):
+            self._expect = _COLON
+        else:
+            self._expect = _COMMA_OR_END
+
+
+class StreamMonitor:
+    """
+    Observes a text stream: timing, accumulated text and optional JSON checks.
+
+    Usage:
+        >>> monitor = StreamMonitor(expect_json=True)
+        >>> for text in stream.text_stream:
+        ...     monitor.feed(text)          # raises StreamAbortedError
+        >>> metrics = monitor.finish(output_tokens=usage.output_tokens)
+    """
+
+    def __init__(
+        self,
+        expect_json: bool = False,
+        chapter_num: int = 0,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self._clock = clock
+        self._start = clock()
+        self._chunks: List[str] = []
+        self.validator = IncrementalJSONValidator() if expect_json else None
+        self.metrics = StreamMetrics(chapter_num=chapter_num)
+
+    @property
+    def text(self) -> str:
+        """Text received so far."""
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> None:
+        """Record a chunk; raise StreamAbortedError if the JSON is now irrecoverable."""
+        if not chunk:
+            return
+        if self.metrics.ttft_seconds is None:
+            self.metrics.ttft_seconds = self._clock() - self._start
+        self._chunks.append(chunk)
+        self.metrics.output_chars += len(chunk)
+        if self.validator is not None and self.validator.feed(chunk):
+            reason = self.validator.error
+            self.finish(aborted_reason=reason)
+            raise StreamAbortedError(reason, self.text, self.metrics)
+
+    def finish(
+        self,
+        output_tokens: Optional[int] = None,
+        aborted_reason: Optional[str] = None,
+    ) -> StreamMetrics:
+        """
+        Close the measurement.
+
+        Args:
+            output_tokens: Provider-reported output tokens; estimated from the
+                received characters when unknown (e.g. aborted streams)
+            aborted_reason: Why the stream was abandoned, if it was
+        """
+        self.metrics.duration_seconds = self._clock() - self._start
+        if output_tokens is None:
+            output_tokens = self.metrics.output_chars // CHARS_PER_TOKEN_ESTIMATE
+        self.metrics.output_tokens = output_tokens
+        if aborted_reason is not None:
+            self.metrics.aborted = True
+            self.metrics.abort_reason = aborted_reason
+        return self.metrics